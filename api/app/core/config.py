@@ -51,6 +51,18 @@ class Settings(BaseSettings):
     LOCAL_MODEL_DEVICE: str = os.getenv("LOCAL_MODEL_DEVICE", "cuda")  # cpu, cuda, auto
     LOCAL_MODEL_MAX_NEW_TOKENS: int = int(os.getenv("LOCAL_MODEL_MAX_NEW_TOKENS", "512"))
     LOCAL_MODEL_TEMPERATURE: float = float(os.getenv("LOCAL_MODEL_TEMPERATURE", "0.7"))
+    # 프리픽스 KV 캐시 최대 항목 수 (기본값 0: 비활성화, 사용하려면 양수로 설정)
+    LOCAL_MODEL_PREFIX_CACHE_SIZE: int = int(os.getenv("LOCAL_MODEL_PREFIX_CACHE_SIZE", "0"))
+    LOCAL_MODEL_PREFIX_CACHE_BLOCK_SIZE: int = int(
+        os.getenv("LOCAL_MODEL_PREFIX_CACHE_BLOCK_SIZE", "32")
+    )
+
+    # LocalLLM과 QLoRA 서비스가 하나의 베이스 모델을 공유 (QLoRA는 양자화 없이 로드)
+    SHARE_BASE_MODEL: bool = os.getenv("SHARE_BASE_MODEL", "false").lower() == "true"
+
+    # QLoRA 멀티 어댑터 서빙 ("이름=경로" 쉼표 구분, 하나의 베이스 모델 위에 로드)
+    QLORA_ADAPTERS: str = os.getenv("QLORA_ADAPTERS", "")
+    QLORA_MAX_LOADED_ADAPTERS: int = int(os.getenv("QLORA_MAX_LOADED_ADAPTERS", "4"))
 
     # 데이터베이스 설정 (Neon PostgreSQL)
     DATABASE_URL: str = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
@@ -66,6 +78,20 @@ class Settings(BaseSettings):
         """PostgreSQL 연결 문자열 반환."""
         return self.DATABASE_URL
 
+    @property
+    def qlora_adapter_paths(self) -> dict[str, str]:
+        """QLORA_ADAPTERS를 {이름: 경로} 딕셔너리로 파싱."""
+        adapters: dict[str, str] = {}
+        for item in self.QLORA_ADAPTERS.split(","):
+            if not item.strip():
+                continue
+            name, _, path = item.partition("=")
+            if not path:
+                msg = f"QLORA_ADAPTERS 항목은 '이름=경로' 형식이어야 합니다: {item}"
+                raise ValueError(msg)
+            adapters[name.strip()] = path.strip()
+        return adapters
+
     @property
     def is_local_llm(self) -> bool:
         """로컬 LLM 사용 여부."""
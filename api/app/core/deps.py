@@ -1,35 +1,49 @@
 """의존성 주입 모듈."""
 
-from typing import Any, Optional
-
-from langchain_community.vectorstores import PGVector
-from langchain_openai import OpenAIEmbeddings
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
 from .config import settings
 from ..data.documents import RAG_DOCUMENTS
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import PGVector
+    from langchain_openai import OpenAIEmbeddings
+
 # 벡터스토어 캐시
-_vectorstore: Optional[PGVector] = None
+_vectorstore: Optional["PGVector"] = None
 
 # LLM 캐시
 _llm: Optional[Any] = None
 
+# 로컬 LLM 원본 인스턴스 (LocalLLM, 로컬 모델 사용 시)
+_local_llm: Optional[Any] = None
+
 # QLoRA 서비스 캐시
 _qlora_service: Optional[Any] = None
 
+# 시작 오케스트레이터 (lifespan에서 설정)
+_orchestrator: Optional[Any] = None
+
+# 병렬 초기화 시 중복 로드 방지
+_vectorstore_lock = threading.Lock()
+_llm_lock = threading.Lock()
 
-def get_embeddings() -> OpenAIEmbeddings:
+
+def get_embeddings() -> "OpenAIEmbeddings":
     """OpenAI 임베딩 인스턴스 반환.
 
     OpenAI API를 사용하여 텍스트 임베딩 생성.
     """
+    from langchain_openai import OpenAIEmbeddings
+
     return OpenAIEmbeddings(
         model=settings.OPENAI_EMBEDDING_MODEL,
         openai_api_key=settings.OPENAI_API_KEY,
     )
 
 
-def get_vectorstore() -> Optional[PGVector]:
+def get_vectorstore() -> Optional["PGVector"]:
     """PGVector 벡터스토어를 초기화하고 반환합니다.
 
     Returns:
@@ -40,6 +54,19 @@ def get_vectorstore() -> Optional[PGVector]:
     if _vectorstore is not None:
         return _vectorstore
 
+    with _vectorstore_lock:
+        if _vectorstore is not None:
+            return _vectorstore
+        return _create_vectorstore()
+
+
+def _create_vectorstore() -> Optional["PGVector"]:
+    """PGVector 벡터스토어 생성 (락 보유 상태에서 호출)."""
+    global _vectorstore
+
+    # langchain_community는 import 비용이 커서 벡터스토어 생성 시점에 로드
+    from langchain_community.vectorstores import PGVector
+
     try:
         embeddings = get_embeddings()
         _vectorstore = PGVector.from_documents(
@@ -74,6 +101,16 @@ def get_llm() -> Any:
     if _llm is not None:
         return _llm
 
+    with _llm_lock:
+        if _llm is None:
+            _llm = _create_llm()
+    return _llm
+
+
+def _create_llm() -> Any:
+    """설정에 맞는 LLM 생성 (락 보유 상태에서 호출)."""
+    global _local_llm
+
     if settings.is_local_llm:
         # 로컬 Mi:dm 모델 사용
         from ..llm.config import LocalModelConfig
@@ -86,29 +123,43 @@ def get_llm() -> Any:
             temperature=settings.LOCAL_MODEL_TEMPERATURE,
             torch_dtype="bfloat16",  # Mi:dm은 bfloat16 사용
             trust_remote_code=False,
+            prefix_cache_size=settings.LOCAL_MODEL_PREFIX_CACHE_SIZE,
+            prefix_cache_block_size=settings.LOCAL_MODEL_PREFIX_CACHE_BLOCK_SIZE,
+            share_base_model=settings.SHARE_BASE_MODEL,
         )
         local_llm = LocalLLM(config)
         local_llm.load()
-        _llm = local_llm.to_langchain()
+        _local_llm = local_llm
+        llm = local_llm.to_langchain()
         print(f"✅ 로컬 LLM 로드 완료: {settings.LOCAL_MODEL_PATH}")
-    else:
-        # OpenAI 사용
-        from langchain_openai import ChatOpenAI
-
-        _llm = ChatOpenAI(
-            model_name=settings.OPENAI_MODEL,
-            temperature=settings.OPENAI_TEMPERATURE,
-            openai_api_key=settings.OPENAI_API_KEY,
-        )
-        print(f"✅ OpenAI LLM 초기화: {settings.OPENAI_MODEL}")
+        return llm
 
-    return _llm
+    # OpenAI 사용
+    from langchain_openai import ChatOpenAI
+
+    llm = ChatOpenAI(
+        model_name=settings.OPENAI_MODEL,
+        temperature=settings.OPENAI_TEMPERATURE,
+        openai_api_key=settings.OPENAI_API_KEY,
+    )
+    print(f"✅ OpenAI LLM 초기화: {settings.OPENAI_MODEL}")
+    return llm
+
+
+def get_local_llm() -> Optional[Any]:
+    """로컬 LLM 원본 인스턴스(LocalLLM)를 반환합니다.
+
+    Returns:
+        LocalLLM 인스턴스 또는 None (OpenAI 사용 시/로드 전)
+    """
+    return _local_llm
 
 
 def reset_llm() -> None:
     """LLM 캐시 초기화."""
-    global _llm
+    global _llm, _local_llm
     _llm = None
+    _local_llm = None
 
 
 def get_qlora_service() -> Optional[Any]:
@@ -140,3 +191,54 @@ def reset_qlora_service() -> None:
         except Exception:
             pass
     _qlora_service = None
+
+
+def get_orchestrator() -> Optional[Any]:
+    """시작 오케스트레이터를 반환합니다.
+
+    Returns:
+        StartupOrchestrator 인스턴스 또는 None
+    """
+    return _orchestrator
+
+
+def set_orchestrator(orchestrator: Any) -> None:
+    """시작 오케스트레이터를 설정합니다.
+
+    Args:
+        orchestrator: StartupOrchestrator 인스턴스
+    """
+    global _orchestrator
+    _orchestrator = orchestrator
+
+
+def reset_orchestrator() -> None:
+    """시작 오케스트레이터 초기화."""
+    global _orchestrator
+    _orchestrator = None
+
+
+def is_component_ready(name: str) -> bool:
+    """컴포넌트 준비 여부를 반환합니다.
+
+    오케스트레이터 없이 앱을 사용하는 경우(지연 초기화)에는 항상 True입니다.
+
+    Args:
+        name: 컴포넌트 이름 (vectorstore, llm, qlora)
+    """
+    if _orchestrator is None:
+        return True
+    return _orchestrator.is_ready(name)
+
+
+async def ensure_component_ready(name: str) -> bool:
+    """컴포넌트 준비 여부를 반환하고, 초기화에 실패했으면 다시 시도합니다.
+
+    오케스트레이터 없이 앱을 사용하는 경우(지연 초기화)에는 항상 True입니다.
+
+    Args:
+        name: 컴포넌트 이름 (vectorstore, llm, qlora)
+    """
+    if _orchestrator is None:
+        return True
+    return await _orchestrator.ensure_ready(name)
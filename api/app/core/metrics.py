@@ -0,0 +1,397 @@
+"""요청 단계별 지연 시간/처리량 계측 및 Prometheus 노출.
+
+- `Histogram`, `Counter`: 스레드 안전한 최소 구현의 Prometheus 메트릭
+- `StageTimingTracer`: LangChain `BaseTracer` 기반 콜백 핸들러.
+  체인/프롬프트/LLM/파서/리트리버 실행마다 소요 시간을 기록하고,
+  스트리밍 토큰 이벤트로 첫 토큰까지의 시간(TTFT)과 초당 토큰 수를 계산합니다.
+- `GenerationTimer`: `transformers`의 `generate(streamer=...)`에 넘겨
+  로컬 모델의 prefill(TTFT)과 decode 처리량을 측정합니다.
+- `RequestContextMiddleware`: 요청마다 `X-Request-ID`를 부여하고 HTTP 지연 시간을 기록합니다.
+
+`/metrics` 엔드포인트는 `render_metrics()`의 Prometheus 텍스트 포맷을 반환합니다.
+"""
+
+import bisect
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from langchain_core.tracers.base import BaseTracer
+from langchain_core.tracers.schemas import Run
+
+# 현재 요청 id (미들웨어가 설정, 로그/트레이서에서 참조)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# 지연 시간 기본 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 처리량 버킷 (tokens/s)
+THROUGHPUT_BUCKETS = (1, 5, 10, 20, 30, 50, 75, 100, 150, 250, 500, 1000)
+# 라우트에 매칭되지 않은 요청의 path 라벨 (404 스캔 등으로 라벨 수가 늘어나지 않도록 고정)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{k}="{_escape(v)}"' for k, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    """단조 증가 카운터."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """카운터 초기화.
+
+        Args:
+            name: 메트릭 이름
+            documentation: HELP 설명
+            labelnames: 라벨 이름 리스트
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """카운터 증가."""
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """Prometheus 텍스트 포맷 라인."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}_total{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    """누적 버킷 히스토그램."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """히스토그램 초기화.
+
+        Args:
+            name: 메트릭 이름
+            documentation: HELP 설명
+            buckets: 버킷 상한 리스트 (오름차순)
+            labelnames: 라벨 이름 리스트
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        # 라벨 값 -> (버킷별 개수(+Inf 포함), 합계)
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """값 기록."""
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> list[str]:
+        """Prometheus 텍스트 포맷 라인."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip([*self.buckets, float("inf")], counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    labels = _format_labels(self.labelnames, key, f'le="{le}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {total[0]}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    labelnames=("method", "path", "status"),
+)
+STAGE_LATENCY = Histogram(
+    "chat_stage_latency_seconds",
+    "체인 단계별 실행 시간 (retriever, prompt, llm, parser, chain)",
+    labelnames=("stage", "name"),
+)
+RETRIEVAL_LATENCY = Histogram(
+    "chat_retrieval_latency_seconds",
+    "문서 검색 지연 시간",
+)
+QUEUE_WAIT = Histogram(
+    "chat_queue_wait_seconds",
+    "생성 요청이 실행 스레드를 얻기까지 대기한 시간",
+    labelnames=("service",),
+)
+TIME_TO_FIRST_TOKEN = Histogram(
+    "chat_time_to_first_token_seconds",
+    "생성 시작부터 첫 토큰까지의 시간 (prefill)",
+    labelnames=("service",),
+)
+DECODE_LATENCY = Histogram(
+    "chat_decode_seconds",
+    "첫 토큰 이후 생성 완료까지의 시간 (decode)",
+    labelnames=("service",),
+)
+TOKENS_PER_SECOND = Histogram(
+    "chat_tokens_per_second",
+    "decode 구간 초당 생성 토큰 수",
+    buckets=THROUGHPUT_BUCKETS,
+    labelnames=("service",),
+)
+RUN_ERRORS = Counter(
+    "chat_run_errors",
+    "실패한 체인 단계 수",
+    labelnames=("stage",),
+)
+
+_ALL_METRICS: list[Any] = [
+    HTTP_REQUEST_DURATION,
+    STAGE_LATENCY,
+    RETRIEVAL_LATENCY,
+    QUEUE_WAIT,
+    TIME_TO_FIRST_TOKEN,
+    DECODE_LATENCY,
+    TOKENS_PER_SECOND,
+    RUN_ERRORS,
+]
+
+
+def render_metrics() -> str:
+    """등록된 모든 메트릭을 Prometheus 텍스트 포맷으로 반환."""
+    lines: list[str] = []
+    for metric in _ALL_METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def observe_generation(
+    service: str,
+    started_at: float,
+    first_token_at: Optional[float],
+    finished_at: float,
+    new_tokens: int,
+) -> None:
+    """생성 1회의 TTFT/decode 시간/처리량을 기록합니다.
+
+    Args:
+        service: 서비스 라벨 (예: local_llm, qlora, openai)
+        started_at: 생성 시작 시각 (`time.perf_counter()`)
+        first_token_at: 첫 토큰 생성 시각 (측정하지 못했으면 None)
+        finished_at: 생성 완료 시각
+        new_tokens: 생성된 토큰 수
+    """
+    if first_token_at is None:
+        return
+    TIME_TO_FIRST_TOKEN.observe(first_token_at - started_at, service=service)
+    decode = finished_at - first_token_at
+    DECODE_LATENCY.observe(decode, service=service)
+    # 첫 토큰은 prefill에 포함되므로 이후 토큰만 decode 처리량에 반영
+    if new_tokens > 1 and decode > 0:
+        TOKENS_PER_SECOND.observe((new_tokens - 1) / decode, service=service)
+
+
+class GenerationTimer:
+    """`model.generate(streamer=...)`용 타이밍 스트리머.
+
+    `generate`는 먼저 프롬프트 토큰으로 `put`을 한 번 호출하고,
+    이후 생성 토큰마다 `put`을 호출합니다. 두 번째 `put` 시각이 첫 토큰 시각입니다.
+    배치 크기 1에서만 사용할 수 있습니다.
+    """
+
+    def __init__(self, service: str) -> None:
+        """타이머 초기화.
+
+        Args:
+            service: 서비스 라벨
+        """
+        self.service = service
+        self.started_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.new_tokens = 0
+        self._prompt_seen = False
+
+    def put(self, value: Any) -> None:
+        """토큰 수신 (transformers 스트리머 인터페이스)."""
+        if not self._prompt_seen:
+            self._prompt_seen = True
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.new_tokens += int(getattr(value, "numel", lambda: 1)())
+
+    def end(self) -> None:
+        """생성 종료 (transformers 스트리머 인터페이스)."""
+        observe_generation(
+            self.service,
+            self.started_at,
+            self.first_token_at,
+            time.perf_counter(),
+            self.new_tokens,
+        )
+
+
+class StageTimingTracer(BaseTracer):
+    """실행(run)별 소요 시간을 메트릭으로 기록하는 트레이서.
+
+    요청마다 새 인스턴스를 만들어 `config={"callbacks": [tracer]}`로 전달합니다.
+    실행 입력/출력을 저장하거나 외부로 전송하지 않으므로 운영 환경에서 상시 사용할 수 있습니다.
+    """
+
+    def __init__(self, service: str = "chain", request_id: Optional[str] = None) -> None:
+        """트레이서 초기화.
+
+        Args:
+            service: LLM 생성 메트릭에 붙일 서비스 라벨
+            request_id: 요청 id (None이면 현재 컨텍스트의 요청 id)
+        """
+        super().__init__()
+        self.service = service
+        self.request_id = request_id or request_id_var.get()
+        self.timings: dict[UUID, dict[str, Any]] = {}
+        self._first_token_at: dict[UUID, float] = {}
+        self._token_counts: dict[UUID, int] = {}
+
+    def _persist_run(self, run: Run) -> None:
+        """실행 결과는 저장하지 않습니다 (메트릭만 기록)."""
+
+    def _record(self, run: Run) -> None:
+        if run.end_time is None:
+            return
+        duration = (run.end_time - run.start_time).total_seconds()
+        # run_type: chain, prompt, llm, parser, retriever, tool ...
+        stage = run.run_type
+        self.timings[run.id] = {
+            "name": run.name,
+            "stage": stage,
+            "duration_seconds": duration,
+            "parent_run_id": run.parent_run_id,
+        }
+        STAGE_LATENCY.observe(duration, stage=stage, name=run.name)
+        if run.error is not None:
+            RUN_ERRORS.inc(stage=stage)
+
+    def _on_llm_new_token(self, run: Run, token: str, chunk: Any) -> None:
+        self._first_token_at.setdefault(run.id, time.perf_counter())
+        self._token_counts[run.id] = self._token_counts.get(run.id, 0) + 1
+
+    def _on_llm_end(self, run: Run) -> None:
+        self._record(run)
+        first_token_at = self._first_token_at.pop(run.id, None)
+        tokens = self._token_counts.pop(run.id, 0)
+        if first_token_at is not None and run.end_time is not None:
+            # 시작 시각은 datetime이므로 경과 시간으로 환산
+            duration = (run.end_time - run.start_time).total_seconds()
+            finished_at = time.perf_counter()
+            observe_generation(
+                self.service,
+                finished_at - duration,
+                first_token_at,
+                finished_at,
+                tokens,
+            )
+
+    def _on_llm_error(self, run: Run) -> None:
+        self._first_token_at.pop(run.id, None)
+        self._token_counts.pop(run.id, None)
+        self._record(run)
+
+    def _on_chain_end(self, run: Run) -> None:
+        self._record(run)
+
+    def _on_chain_error(self, run: Run) -> None:
+        self._record(run)
+
+    def _on_tool_end(self, run: Run) -> None:
+        self._record(run)
+
+    def _on_retriever_end(self, run: Run) -> None:
+        self._record(run)
+        if run.end_time is not None:
+            RETRIEVAL_LATENCY.observe((run.end_time - run.start_time).total_seconds())
+
+    def _on_retriever_error(self, run: Run) -> None:
+        self._record(run)
+
+
+class RequestContextMiddleware:
+    """요청 id 부여 및 HTTP 지연 시간 기록 ASGI 미들웨어.
+
+    클라이언트가 보낸 `X-Request-ID`가 있으면 그대로 사용하고, 없으면 새로 생성하여
+    응답 헤더에 돌려줍니다.
+    """
+
+    def __init__(self, app: Any) -> None:
+        """미들웨어 초기화.
+
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+        """
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        """ASGI 진입점."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope.get("headers", []):
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope.get("method", ""),
+                path=path,
+                status=str(status_code),
+            )
+            request_id_var.reset(token)
@@ -0,0 +1,206 @@
+"""애플리케이션 시작 오케스트레이터 - 병렬 초기화 및 준비 상태 관리.
+
+서로 독립적인 초기화 작업(벡터스토어, LLM, QLoRA 등)을 이벤트 루프 밖의
+스레드에서 동시에 실행하고, 컴포넌트별 준비 상태를 추적합니다.
+서버는 초기화 완료를 기다리지 않고 바로 요청을 받으며, 각 엔드포인트는
+필요한 컴포넌트가 준비되었는지 확인한 뒤 처리합니다.
+초기화에 실패한 컴포넌트(예: 시작 시 DB 미기동)는 요청이 들어올 때
+`retry_interval` 간격으로 다시 초기화를 시도합니다.
+
+사용 예시:
+    orchestrator = StartupOrchestrator()
+    orchestrator.register("vectorstore", get_vectorstore)
+    orchestrator.register("llm", get_llm)
+    orchestrator.register("qlora", init_qlora, depends_on=["llm"])
+    task = asyncio.create_task(orchestrator.run())
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+
+
+class ComponentStatus(str, Enum):
+    """컴포넌트 초기화 상태."""
+
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class ComponentState:
+    """컴포넌트별 초기화 상태 및 소요 시간."""
+
+    name: str
+    status: ComponentStatus = ComponentStatus.PENDING
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """초기화 소요 시간 (진행 중이면 현재까지의 경과 시간)."""
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def to_dict(self) -> dict[str, Any]:
+        """상태를 딕셔너리로 반환."""
+        return {
+            "status": self.status.value,
+            "error": self.error,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+class StartupOrchestrator:
+    """독립적인 초기화 작업을 병렬로 실행하는 오케스트레이터."""
+
+    def __init__(self, retry_interval: float = 5.0) -> None:
+        """오케스트레이터 초기화.
+
+        Args:
+            retry_interval: 실패한 컴포넌트의 재초기화 시도 최소 간격 (초)
+        """
+        self.retry_interval = retry_interval
+        self._initializers: dict[str, tuple[Callable[[], Any], list[str]]] = {}
+        self._states: dict[str, ComponentState] = {}
+        self._events: dict[str, asyncio.Event] = {}
+        self._retry_locks: dict[str, asyncio.Lock] = {}
+
+    def register(
+        self,
+        name: str,
+        initializer: Callable[[], Any],
+        depends_on: Optional[list[str]] = None,
+    ) -> None:
+        """초기화 작업을 등록합니다.
+
+        Args:
+            name: 컴포넌트 이름
+            initializer: 동기 초기화 함수 (스레드에서 실행, 예외 발생 시 실패 처리)
+            depends_on: 먼저 준비되어야 하는 컴포넌트 이름 리스트
+        """
+        deps = list(depends_on or [])
+        unknown = [dep for dep in deps if dep not in self._initializers]
+        if unknown:
+            msg = f"등록되지 않은 의존 컴포넌트입니다: {unknown}"
+            raise ValueError(msg)
+        self._initializers[name] = (initializer, deps)
+        self._states[name] = ComponentState(name=name)
+        self._events[name] = asyncio.Event()
+        self._retry_locks[name] = asyncio.Lock()
+
+    async def run(self) -> None:
+        """등록된 모든 초기화 작업을 동시에 실행합니다."""
+        await asyncio.gather(*(self._run_one(name) for name in self._initializers))
+
+    async def _run_one(self, name: str) -> None:
+        initializer, deps = self._initializers[name]
+        state = self._states[name]
+        try:
+            for dep in deps:
+                await self._events[dep].wait()
+                if self._states[dep].status != ComponentStatus.READY:
+                    state.status = ComponentStatus.FAILED
+                    state.error = f"의존 컴포넌트 초기화 실패: {dep}"
+                    return
+
+            state.status = ComponentStatus.LOADING
+            state.started_at = time.perf_counter()
+            print(f"🔄 [{name}] 초기화 시작", flush=True)
+            await asyncio.to_thread(initializer)
+            state.status = ComponentStatus.READY
+            state.finished_at = time.perf_counter()
+            print(f"✅ [{name}] 준비 완료 ({state.duration_seconds:.1f}s)", flush=True)
+        except Exception as e:
+            state.status = ComponentStatus.FAILED
+            state.error = str(e)
+            state.finished_at = time.perf_counter()
+            print(f"⚠️ [{name}] 초기화 실패: {e}", flush=True)
+        finally:
+            self._events[name].set()
+
+    async def ensure_ready(self, name: str) -> bool:
+        """컴포넌트가 준비되었는지 확인하고, 실패 상태면 초기화를 다시 시도합니다.
+
+        마지막 시도 후 `retry_interval`이 지나지 않았거나 시작 시 초기화가 진행 중이면
+        재시도하지 않고 False를 반환합니다. 다른 요청이 재시도 중이면 그 결과를 기다리며,
+        실패한 의존 컴포넌트도 함께 재시도합니다.
+
+        Args:
+            name: 컴포넌트 이름
+
+        Returns:
+            준비 완료 여부
+        """
+        state = self._states.get(name)
+        if state is None:
+            return False
+        lock = self._retry_locks[name]
+        if state.status != ComponentStatus.FAILED and not lock.locked():
+            return self.is_ready(name)
+        if (
+            state.status == ComponentStatus.FAILED
+            and state.finished_at is not None
+            and time.perf_counter() - state.finished_at < self.retry_interval
+        ):
+            return False
+
+        async with lock:
+            # 대기하는 동안 다른 요청이 재시도했을 수 있음
+            if state.status == ComponentStatus.FAILED:
+                for dep in self._initializers[name][1]:
+                    await self.ensure_ready(dep)
+                state.error = None
+                state.finished_at = None
+                await self._run_one(name)
+        return self.is_ready(name)
+
+    def is_ready(self, name: str) -> bool:
+        """컴포넌트가 준비되었는지 확인 (등록되지 않은 컴포넌트는 False)."""
+        state = self._states.get(name)
+        return state is not None and state.status == ComponentStatus.READY
+
+    def status(self, name: str) -> Optional[ComponentStatus]:
+        """컴포넌트 상태 (등록되지 않았으면 None)."""
+        state = self._states.get(name)
+        return state.status if state is not None else None
+
+    async def wait_ready(self, name: str, timeout: Optional[float] = None) -> bool:
+        """컴포넌트 초기화가 끝날 때까지 기다립니다.
+
+        Args:
+            name: 컴포넌트 이름
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            준비 완료 여부 (실패하거나 시간 초과 시 False)
+        """
+        try:
+            await asyncio.wait_for(self._events[name].wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.is_ready(name)
+
+    @property
+    def any_ready(self) -> bool:
+        """준비된 컴포넌트가 하나라도 있는지 여부."""
+        return any(s.status == ComponentStatus.READY for s in self._states.values())
+
+    @property
+    def all_settled(self) -> bool:
+        """모든 컴포넌트의 초기화가 (성공/실패와 무관하게) 끝났는지 여부."""
+        return all(
+            s.status in (ComponentStatus.READY, ComponentStatus.FAILED)
+            for s in self._states.values()
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """컴포넌트별 상태를 반환합니다."""
+        return {name: state.to_dict() for name, state in self._states.items()}
@@ -1,10 +1,36 @@
 """LLM 모델 관리 모듈.
 
 이 모듈은 다양한 LLM 백엔드(로컬 모델, OpenAI 등)를 통합 관리합니다.
+백엔드는 torch/transformers 등 무거운 패키지를 import하므로
+처음 접근할 때 로드합니다.
 """
 
-from .base import BaseLLM
-from .factory import LLMFactory, get_llm
+from typing import TYPE_CHECKING
+
+from langchain_core._import_utils import import_attr
+
+if TYPE_CHECKING:
+    from .base import BaseLLM
+    from .factory import LLMFactory, get_llm
 
 __all__ = ["BaseLLM", "LLMFactory", "get_llm"]
 
+_dynamic_imports = {
+    "BaseLLM": "base",
+    "LLMFactory": "factory",
+    "get_llm": "factory",
+}
+
+
+def __getattr__(attr_name: str) -> object:
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {attr_name!r}"
+        raise AttributeError(msg)
+    result = import_attr(attr_name, module_name, __spec__.parent)
+    globals()[attr_name] = result
+    return result
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -70,6 +70,20 @@ class LocalModelConfig(LLMConfig):
         default=False,
         description="4bit 양자화 로드"
     )
+    share_base_model: bool = Field(
+        default=False,
+        description="다른 서비스(QLoRA)와 베이스 모델 공유 여부"
+    )
+    prefix_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="프리픽스 KV 캐시 최대 항목 수 (0이면 비활성화)"
+    )
+    prefix_cache_block_size: int = Field(
+        default=32,
+        gt=0,
+        description="프리픽스 KV 캐시 해시 블록 크기 (토큰 수)"
+    )
 
 
 class OllamaConfig(LLMConfig):
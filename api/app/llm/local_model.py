@@ -1,13 +1,19 @@
 """로컬 HuggingFace 모델 로더 - Mi:dm 2.0 Mini 지원."""
 
 import asyncio
-from typing import Any, Optional
+import time
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Callable, Optional
 
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
+from langchain_core.language_models.llms import LLM
+from transformers import pipeline
 
+from ..core.metrics import QUEUE_WAIT, GenerationTimer
 from .base import BaseLLM
 from .config import LocalModelConfig
+from .model_cache import load_pretrained, release
+from .prefix_cache import PrefixKVCache, generate_with_prefix_cache
 
 
 class LocalLLM(BaseLLM):
@@ -31,6 +37,13 @@ class LocalLLM(BaseLLM):
         super().__init__(model_name=config.model_path)
         self.config = config
         self._pipeline: Optional[Any] = None
+        self._generation_guard: Optional[Callable[[], AbstractContextManager[Any]]] = None
+        self._prefix_cache: Optional[PrefixKVCache] = None
+        if config.prefix_cache_size > 0:
+            self._prefix_cache = PrefixKVCache(
+                max_entries=config.prefix_cache_size,
+                block_size=config.prefix_cache_block_size,
+            )
 
     def load(self) -> None:
         """모델을 메모리에 로드합니다."""
@@ -52,39 +65,32 @@ class LocalLLM(BaseLLM):
         else:
             torch_dtype = torch.float32
 
-        # 토크나이저 로드
-        self._tokenizer = AutoTokenizer.from_pretrained(
-            self.config.model_path,
-            trust_remote_code=self.config.trust_remote_code,
-        )
-
-        # 패딩 토큰 설정 (없으면 EOS 토큰 사용)
-        if self._tokenizer.pad_token is None:
-            self._tokenizer.pad_token = self._tokenizer.eos_token
-
-        # 모델 로드
-        load_kwargs = {
-            "pretrained_model_name_or_path": self.config.model_path,
-            "trust_remote_code": self.config.trust_remote_code,
-            "torch_dtype": torch_dtype,
-        }
-
         # 양자화 설정
+        quantization_config = None
         if self.config.load_in_4bit:
             from transformers import BitsAndBytesConfig
-            load_kwargs["quantization_config"] = BitsAndBytesConfig(
+            quantization_config = BitsAndBytesConfig(
                 load_in_4bit=True,
                 bnb_4bit_compute_dtype=torch_dtype,
             )
         elif self.config.load_in_8bit:
             from transformers import BitsAndBytesConfig
-            load_kwargs["quantization_config"] = BitsAndBytesConfig(
+            quantization_config = BitsAndBytesConfig(
                 load_in_8bit=True,
             )
-        else:
-            load_kwargs["device_map"] = device_map
 
-        self._model = AutoModelForCausalLM.from_pretrained(**load_kwargs)
+        # 모델/토크나이저 로드 (safetensors mmap, 같은 설정이면 공유 캐시 재사용)
+        self._model, self._tokenizer = load_pretrained(
+            self.config.model_path,
+            device_map=None if quantization_config is not None else device_map,
+            torch_dtype=torch_dtype,
+            quantization_config=quantization_config,
+            trust_remote_code=self.config.trust_remote_code,
+        )
+
+        # 패딩 토큰 설정 (없으면 EOS 토큰 사용)
+        if self._tokenizer.pad_token is None:
+            self._tokenizer.pad_token = self._tokenizer.eos_token
 
         # 파이프라인 생성
         self._pipeline = pipeline(
@@ -101,6 +107,19 @@ class LocalLLM(BaseLLM):
 
         print(f"✅ 모델 로드 완료: {self.config.model_path}")
 
+    def set_generation_guard(
+        self, guard: Optional[Callable[[], AbstractContextManager[Any]]]
+    ) -> None:
+        """생성 시 진입할 컨텍스트 매니저 팩토리를 설정합니다.
+
+        베이스 모델을 QLoRA 서비스와 공유할 때, 생성 중에는 LoRA 어댑터가
+        비활성화되도록 어댑터 레지스트리의 베이스 모드를 지정하는 데 사용합니다.
+
+        Args:
+            guard: 인자 없이 호출하면 컨텍스트 매니저를 반환하는 함수 (None이면 해제)
+        """
+        self._generation_guard = guard
+
     def generate(self, prompt: str, **kwargs: Any) -> str:
         """텍스트를 생성합니다.
 
@@ -118,16 +137,60 @@ class LocalLLM(BaseLLM):
         max_new_tokens = kwargs.get("max_tokens", self.config.max_tokens)
         temperature = kwargs.get("temperature", self.config.temperature)
 
-        # 파이프라인 실행
-        outputs = self._pipeline(
-            prompt,
-            max_new_tokens=max_new_tokens,
-            temperature=temperature,
-            return_full_text=False,  # 프롬프트 제외하고 생성된 텍스트만 반환
-        )
+        guard = self._generation_guard() if self._generation_guard else nullcontext()
+        with guard:
+            if self._prefix_cache is not None:
+                return self._generate_with_prefix_cache(prompt, max_new_tokens, temperature)
+
+            # 파이프라인 실행
+            outputs = self._pipeline(
+                prompt,
+                max_new_tokens=max_new_tokens,
+                temperature=temperature,
+                return_full_text=False,  # 프롬프트 제외하고 생성된 텍스트만 반환
+                streamer=GenerationTimer("local_llm"),
+            )
 
         return outputs[0]["generated_text"].strip()
 
+    def _generate_with_prefix_cache(
+        self, prompt: str, max_new_tokens: int, temperature: float
+    ) -> str:
+        """프리픽스 KV 캐시를 사용해 텍스트를 생성합니다.
+
+        파이프라인 대신 `model.generate`를 직접 호출하여 캐시된 프리픽스 이후 토큰만 prefill합니다.
+        """
+        inputs = self._tokenizer(prompt, return_tensors="pt")
+        inputs = {k: v.to(self._model.device) for k, v in inputs.items()}
+
+        with torch.no_grad():
+            sequences = generate_with_prefix_cache(
+                self._model,
+                inputs,
+                self._prefix_cache,
+                max_new_tokens=max_new_tokens,
+                do_sample=True,
+                temperature=temperature,
+                top_p=0.9,
+                repetition_penalty=1.1,
+                pad_token_id=self._tokenizer.pad_token_id,
+                streamer=GenerationTimer("local_llm"),
+            )
+
+        input_length = inputs["input_ids"].shape[1]
+        generated_text = self._tokenizer.decode(
+            sequences[0][input_length:],
+            skip_special_tokens=True,
+        )
+        return generated_text.strip()
+
+    @property
+    def prefix_cache_stats(self) -> Optional[dict[str, Any]]:
+        """프리픽스 KV 캐시 통계 (캐시 비활성화 시 None)."""
+        if self._prefix_cache is None:
+            return None
+        return self._prefix_cache.stats.to_dict()
+
     async def agenerate(self, prompt: str, **kwargs: Any) -> str:
         """비동기로 텍스트를 생성합니다.
 
@@ -139,10 +202,13 @@ class LocalLLM(BaseLLM):
             생성된 텍스트
         """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.generate(prompt, **kwargs)
-        )
+        submitted_at = time.perf_counter()
+
+        def run() -> str:
+            QUEUE_WAIT.observe(time.perf_counter() - submitted_at, service="local_llm")
+            return self.generate(prompt, **kwargs)
+
+        return await loop.run_in_executor(None, run)
 
     def to_langchain(self) -> Any:
         """LangChain 호환 LLM 객체로 변환.
@@ -153,6 +219,10 @@ class LocalLLM(BaseLLM):
         if not self.is_loaded:
             self.load()
 
+        # 프리픽스 캐시/모델 공유 가드는 generate()에서 처리하므로 generate()를 감싸서 반환
+        if self._prefix_cache is not None or self.config.share_base_model:
+            return _LocalLangChainLLM(local_llm=self)
+
         from langchain_huggingface import HuggingFacePipeline
 
         return HuggingFacePipeline(pipeline=self._pipeline)
@@ -160,6 +230,7 @@ class LocalLLM(BaseLLM):
     def unload(self) -> None:
         """모델을 메모리에서 해제합니다."""
         if self._model is not None:
+            release(self._model)
             del self._model
             del self._tokenizer
             del self._pipeline
@@ -171,4 +242,25 @@ class LocalLLM(BaseLLM):
             self._model = None
             self._tokenizer = None
             self._pipeline = None
+            if self._prefix_cache is not None:
+                self._prefix_cache.clear()
             print("🗑️ 모델 메모리 해제 완료")
+
+
+class _LocalLangChainLLM(LLM):
+    """LocalLLM.generate()를 호출하는 LangChain 래퍼."""
+
+    local_llm: Any
+
+    @property
+    def _llm_type(self) -> str:
+        return "local_llm"
+
+    def _call(
+        self,
+        prompt: str,
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> str:
+        return self.local_llm.generate(prompt, **kwargs)
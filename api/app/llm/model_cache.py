@@ -0,0 +1,119 @@
+"""베이스 모델 공유 캐시 - 같은 가중치를 한 번만 로드.
+
+`LocalLLM`과 `QLoRAService`가 같은 경로/정밀도/양자화 설정으로 모델을 요청하면
+동일한 모델 객체를 돌려줍니다. 두 서비스가 동시에 초기화되더라도 키별 락으로
+실제 로드는 한 번만 수행됩니다.
+
+safetensors 파일이 있으면 `use_safetensors=True`, `low_cpu_mem_usage=True`로 로드하여
+체크포인트를 메모리 맵(mmap)으로 읽고 중간 복사본 없이 가중치를 올립니다.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+# (모델 경로, 디바이스 맵, dtype, 양자화 설정) -> (모델, 토크나이저)
+_models: dict[tuple[str, ...], tuple[Any, Any]] = {}
+_locks: dict[tuple[str, ...], threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def _cache_key(
+    model_path: str,
+    device_map: Any,
+    torch_dtype: Any,
+    quantization_config: Optional[Any],
+    trust_remote_code: bool,
+) -> tuple[str, ...]:
+    quant = quantization_config.to_json_string() if quantization_config is not None else ""
+    return (
+        str(Path(model_path).resolve()),
+        str(device_map),
+        str(torch_dtype),
+        quant,
+        str(trust_remote_code),
+    )
+
+
+def has_safetensors(model_path: str) -> bool:
+    """모델 디렉토리에 safetensors 체크포인트가 있는지 확인."""
+    return any(Path(model_path).glob("*.safetensors"))
+
+
+def load_pretrained(
+    model_path: str,
+    device_map: Any = None,
+    torch_dtype: Any = None,
+    quantization_config: Optional[Any] = None,
+    trust_remote_code: bool = False,
+    require_cached: bool = False,
+) -> tuple[Any, Any]:
+    """CausalLM 모델과 토크나이저를 로드하거나 캐시에서 반환합니다.
+
+    Args:
+        model_path: 모델 경로
+        device_map: `from_pretrained`의 device_map
+        torch_dtype: 모델 dtype
+        quantization_config: BitsAndBytes 양자화 설정 (없으면 None)
+        trust_remote_code: 원격 코드 신뢰 여부
+        require_cached: True면 같은 설정으로 이미 로드된 모델만 반환
+            (다른 서비스와 모델을 공유할 때 두 번째 복사본을 조용히 로드하지 않도록)
+
+    Returns:
+        (모델, 토크나이저) 튜플. 같은 설정이면 항상 같은 객체
+
+    Raises:
+        LookupError: `require_cached`인데 같은 설정으로 로드된 모델이 없는 경우
+    """
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    key = _cache_key(model_path, device_map, torch_dtype, quantization_config, trust_remote_code)
+    with _registry_lock:
+        lock = _locks.setdefault(key, threading.Lock())
+        if require_cached and key not in _models:
+            loaded = [cached for cached in _models if cached[0] == key[0]]
+            msg = (
+                f"공유할 베이스 모델이 로드되어 있지 않습니다: {model_path} "
+                f"(요청 설정: device_map={key[1]}, dtype={key[2]}, 양자화={key[3] or '없음'}; "
+                f"로드된 설정: {[cached[1:] for cached in loaded] or '없음'})"
+            )
+            raise LookupError(msg)
+
+    with lock:
+        if key in _models:
+            print(f"♻️ 로드된 베이스 모델 재사용: {model_path}", flush=True)
+            return _models[key]
+
+        tokenizer = AutoTokenizer.from_pretrained(
+            model_path,
+            trust_remote_code=trust_remote_code,
+        )
+
+        load_kwargs: dict[str, Any] = {
+            "trust_remote_code": trust_remote_code,
+            "torch_dtype": torch_dtype,
+            "low_cpu_mem_usage": True,
+        }
+        if device_map is not None:
+            load_kwargs["device_map"] = device_map
+        if quantization_config is not None:
+            load_kwargs["quantization_config"] = quantization_config
+        if has_safetensors(model_path):
+            load_kwargs["use_safetensors"] = True
+
+        model = AutoModelForCausalLM.from_pretrained(model_path, **load_kwargs)
+        _models[key] = (model, tokenizer)
+        return model, tokenizer
+
+
+def release(model: Any) -> None:
+    """캐시에서 모델을 제거합니다 (다른 참조가 없으면 메모리 해제 대상이 됨).
+
+    Args:
+        model: `load_pretrained`가 반환한 모델 (또는 그 모델을 감싼 PeftModel)
+    """
+    base = getattr(model, "get_base_model", lambda: model)()
+    with _registry_lock:
+        for key, (cached, _) in list(_models.items()):
+            if cached is model or cached is base:
+                del _models[key]
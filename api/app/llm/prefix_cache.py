@@ -0,0 +1,258 @@
+"""프롬프트 프리픽스 KV 캐시 - 반복되는 프롬프트 앞부분의 prefill 재사용.
+
+RAG 프롬프트의 고정 지시문이나 멀티턴 대화의 이전 히스토리처럼
+요청 간에 공유되는 토큰 프리픽스의 `past_key_values`를 저장해 두고,
+다음 요청에서 가장 긴 일치 프리픽스부터 생성을 이어갑니다.
+
+토큰 시퀀스는 `block_size` 단위 블록으로 나뉘고, 각 블록의 키는
+이전 블록 키와 현재 블록 토큰 id를 연결한 해시입니다. 따라서 키 하나가
+해당 위치까지의 프리픽스 전체를 식별합니다.
+
+사용 예시:
+    cache = PrefixKVCache(max_entries=16, block_size=32)
+    sequences = generate_with_prefix_cache(model, inputs, cache, max_new_tokens=64)
+    print(cache.stats.to_dict())
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+
+@dataclass
+class PrefixCacheStats:
+    """프리픽스 캐시 통계."""
+
+    lookups: int = 0
+    hits: int = 0
+    prompt_tokens: int = 0
+    reused_tokens: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """조회 대비 적중 비율."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def token_hit_rate(self) -> float:
+        """전체 프롬프트 토큰 중 prefill을 건너뛴 토큰 비율."""
+        return self.reused_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """통계를 딕셔너리로 반환."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hit_rate,
+            "prompt_tokens": self.prompt_tokens,
+            "reused_tokens": self.reused_tokens,
+            "token_hit_rate": self.token_hit_rate,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+
+class PrefixKVCache:
+    """토큰 id 프리픽스 해시를 키로 하는 LRU `past_key_values` 캐시.
+
+    항목 하나는 특정 프롬프트의 블록 경계까지의 KV 텐서를 보관하며,
+    그 항목이 포함하는 모든 블록 프리픽스 키가 인덱스에 등록됩니다.
+    그래서 공통 지시문만 공유하는 다른 질문도 같은 항목의 앞부분을 재사용할 수 있습니다.
+    """
+
+    def __init__(self, max_entries: int = 16, block_size: int = 32) -> None:
+        """프리픽스 캐시 초기화.
+
+        Args:
+            max_entries: 보관할 최대 KV 항목 수 (초과 시 LRU 제거)
+            block_size: 프리픽스 해시 블록 크기 (토큰 수)
+        """
+        if max_entries <= 0:
+            msg = f"max_entries는 1 이상이어야 합니다: {max_entries}"
+            raise ValueError(msg)
+        if block_size <= 0:
+            msg = f"block_size는 1 이상이어야 합니다: {block_size}"
+            raise ValueError(msg)
+        self.max_entries = max_entries
+        self.block_size = block_size
+        self.stats = PrefixCacheStats()
+
+        # 항목 키(마지막 블록 키) -> (프리픽스 길이, past_key_values, 블록 키 목록)
+        self._entries: OrderedDict[str, tuple[int, Any, list[str]]] = OrderedDict()
+        # 블록 프리픽스 키 -> (항목 키, 프리픽스 길이)
+        self._index: dict[str, tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """저장된 항목 수."""
+        return len(self._entries)
+
+    def _block_keys(self, token_ids: Sequence[int], namespace: str = "") -> list[str]:
+        """완전한 블록마다 누적 프리픽스 해시 키를 계산.
+
+        `namespace`(예: LoRA 어댑터 이름)가 다르면 같은 토큰이라도 다른 키가 됩니다.
+        """
+        keys: list[str] = []
+        prev = namespace.encode()
+        n_blocks = len(token_ids) // self.block_size
+        for i in range(n_blocks):
+            block = token_ids[i * self.block_size : (i + 1) * self.block_size]
+            h = hashlib.blake2b(prev, digest_size=16)
+            h.update(",".join(map(str, block)).encode())
+            prev = h.digest()
+            keys.append(prev.hex())
+        return keys
+
+    def lookup(
+        self, token_ids: Sequence[int], namespace: str = ""
+    ) -> tuple[int, Optional[Any]]:
+        """가장 긴 캐시된 프리픽스를 찾습니다.
+
+        모델이 최소 한 토큰은 직접 처리해야 하므로 마지막 토큰은 재사용 대상에서 제외합니다.
+
+        Args:
+            token_ids: 프롬프트 토큰 id 시퀀스
+            namespace: KV가 달라지는 모델 변형 구분자 (예: 어댑터 이름)
+
+        Returns:
+            (재사용 토큰 수, 해당 길이로 잘린 past_key_values 복사본) 튜플.
+            일치하는 프리픽스가 없으면 (0, None)
+        """
+        keys = self._block_keys(token_ids[: len(token_ids) - 1], namespace)
+        with self._lock:
+            self.stats.lookups += 1
+            self.stats.prompt_tokens += len(token_ids)
+            for key in reversed(keys):
+                hit = self._index.get(key)
+                if hit is None:
+                    continue
+                entry_key, length = hit
+                past = self._entries[entry_key][1]
+                self._entries.move_to_end(entry_key)
+                self.stats.hits += 1
+                self.stats.reused_tokens += length
+                break
+            else:
+                return 0, None
+
+        # generate()가 캐시를 제자리에서 확장하므로 복사본을 넘깁니다.
+        return length, _crop_past_key_values(copy.deepcopy(past), length)
+
+    def store(
+        self, token_ids: Sequence[int], past_key_values: Any, namespace: str = ""
+    ) -> None:
+        """프롬프트의 블록 경계까지 KV를 저장합니다.
+
+        Args:
+            token_ids: 프롬프트 토큰 id 시퀀스
+            past_key_values: 최소 프롬프트 길이 이상을 포함하는 KV 캐시
+                (generate 결과의 캐시를 그대로 넘겨도 됩니다)
+            namespace: KV가 달라지는 모델 변형 구분자 (예: 어댑터 이름)
+        """
+        keys = self._block_keys(token_ids[: len(token_ids) - 1], namespace)
+        if not keys:
+            return
+        entry_key = keys[-1]
+        length = len(keys) * self.block_size
+
+        with self._lock:
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+                return
+
+        past = _crop_past_key_values(past_key_values, length)
+
+        with self._lock:
+            self._entries[entry_key] = (length, past, keys)
+            # 같은 블록 프리픽스는 가장 최근에 저장된 항목이 가져갑니다.
+            for i, key in enumerate(keys):
+                self._index[key] = (entry_key, (i + 1) * self.block_size)
+            self.stats.stores += 1
+
+            while len(self._entries) > self.max_entries:
+                evicted_key, (_, _, evicted_keys) = self._entries.popitem(last=False)
+                self._drop_index(evicted_key, evicted_keys)
+                self.stats.evictions += 1
+
+    def _drop_index(self, entry_key: str, keys: list[str]) -> None:
+        """제거된 항목의 인덱스 키를 정리합니다 (락 보유 상태에서 호출).
+
+        같은 블록 프리픽스를 포함하는 다른 항목이 남아 있으면 가장 최근 항목으로 다시 연결합니다.
+        """
+        for i, key in enumerate(keys):
+            owner = self._index.get(key)
+            if owner is None or owner[0] != entry_key:
+                continue
+            del self._index[key]
+            for other_key in reversed(self._entries):
+                if key in self._entries[other_key][2]:
+                    self._index[key] = (other_key, (i + 1) * self.block_size)
+                    break
+
+    def clear(self) -> None:
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+            self.stats = PrefixCacheStats()
+
+
+def _crop_past_key_values(past_key_values: Any, length: int) -> Any:
+    """KV 캐시를 앞쪽 `length` 토큰으로 자릅니다.
+
+    `transformers`의 `Cache` 객체(`crop` 지원)와 레거시 튜플 형식을 모두 처리합니다.
+    """
+    if hasattr(past_key_values, "crop"):
+        excess = past_key_values.get_seq_length() - length
+        if excess > 0:
+            # 음수 인자는 뒤에서부터 해당 토큰 수만큼 제거
+            past_key_values.crop(-excess)
+        return past_key_values
+    return tuple(
+        tuple(t[..., :length, :].contiguous() for t in layer) for layer in past_key_values
+    )
+
+
+def generate_with_prefix_cache(
+    model: Any,
+    inputs: dict[str, Any],
+    prefix_cache: PrefixKVCache,
+    namespace: str = "",
+    **generate_kwargs: Any,
+) -> Any:
+    """프리픽스 캐시를 사용해 `model.generate`를 실행합니다.
+
+    가장 긴 캐시 프리픽스의 KV를 `past_key_values`로 넘겨 나머지 토큰만 prefill하고,
+    생성이 끝나면 이번 프롬프트의 KV를 캐시에 저장합니다.
+    배치 크기가 1이 아니면 캐시 없이 일반 생성을 수행합니다.
+
+    Args:
+        model: HuggingFace CausalLM (또는 PeftModel)
+        inputs: 토크나이저 출력 (`input_ids`, `attention_mask`)
+        prefix_cache: 사용할 프리픽스 캐시
+        namespace: KV가 달라지는 모델 변형 구분자 (예: 어댑터 이름)
+        **generate_kwargs: `generate`에 전달할 추가 인자
+
+    Returns:
+        프롬프트를 포함한 생성 토큰 시퀀스 텐서
+    """
+    input_ids = inputs["input_ids"]
+    if input_ids.shape[0] != 1:
+        return model.generate(**inputs, **generate_kwargs)
+
+    token_ids = input_ids[0].tolist()
+    _, past = prefix_cache.lookup(token_ids, namespace)
+
+    kwargs = dict(generate_kwargs, use_cache=True, return_dict_in_generate=True)
+    if past is not None:
+        kwargs["past_key_values"] = past
+
+    outputs = model.generate(**inputs, **kwargs)
+    if getattr(outputs, "past_key_values", None) is not None:
+        prefix_cache.store(token_ids, outputs.past_key_values, namespace)
+    return outputs.sequences
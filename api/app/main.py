@@ -1,28 +1,73 @@
 """FastAPI 애플리케이션 메인 모듈."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from .core.config import settings
 from .core.deps import (
     get_llm,
+    get_local_llm,
     get_vectorstore,
     reset_llm,
+    reset_orchestrator,
     reset_vectorstore,
+    set_orchestrator,
     set_qlora_service,
     reset_qlora_service,
 )
+from .core.metrics import RequestContextMiddleware, render_metrics
+from .core.startup import StartupOrchestrator
 from .routers import chat_router
 from .services.rag import QLoRAService
 
 
+def _init_vectorstore() -> None:
+    """벡터스토어 초기화 (실패 시 예외)."""
+    if get_vectorstore() is None:
+        msg = "벡터스토어에 연결할 수 없습니다."
+        raise RuntimeError(msg)
+
+
+def _init_qlora() -> None:
+    """QLoRA 서비스 초기화."""
+    qlora_service = QLoRAService(
+        model_path=settings.LOCAL_MODEL_PATH,
+        adapter_path=None,
+        device=settings.LOCAL_MODEL_DEVICE,
+        prefix_cache_size=settings.LOCAL_MODEL_PREFIX_CACHE_SIZE,
+        prefix_cache_block_size=settings.LOCAL_MODEL_PREFIX_CACHE_BLOCK_SIZE,
+        adapter_paths=settings.qlora_adapter_paths,
+        max_loaded_adapters=settings.QLORA_MAX_LOADED_ADAPTERS,
+        share_base_model=settings.SHARE_BASE_MODEL,
+    )
+    # 베이스 모델을 공유하면 LocalLLM은 어댑터를 끈 상태로 생성해야 함
+    # (모델을 PEFT로 감싸는 동안에도 생성하지 않도록 로드 전에 설정)
+    local_llm = get_local_llm()
+    if settings.SHARE_BASE_MODEL and local_llm is not None:
+        local_llm.set_generation_guard(qlora_service.base_model_guard)
+
+    # 모델 로드 (출력이 나오도록)
+    try:
+        qlora_service._load_model()
+    except BaseException:
+        if settings.SHARE_BASE_MODEL and local_llm is not None:
+            local_llm.set_generation_guard(None)
+        raise
+    set_qlora_service(qlora_service)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리.
 
-    시작 시 벡터스토어/LLM 초기화, 종료 시 정리.
+    시작 시 벡터스토어/LLM/QLoRA를 이벤트 루프 밖에서 병렬로 초기화하고,
+    초기화 완료를 기다리지 않고 바로 요청을 받습니다. 각 엔드포인트는
+    필요한 컴포넌트가 준비되었는지 확인합니다 (`/api/health`에서 상태 확인).
+    종료 시 정리.
     """
     # 시작 시
     print(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} 시작...")
@@ -31,38 +76,33 @@ async def lifespan(app: FastAPI):
     # 설정 검증
     settings.validate_config()
 
-    # 벡터스토어 초기화 (미리 로드)
-    get_vectorstore()
-
-    # LLM 초기화 (미리 로드)
-    get_llm()
+    orchestrator = StartupOrchestrator()
+    orchestrator.register("vectorstore", _init_vectorstore)
+    orchestrator.register("llm", get_llm)
 
     # QLoRA 서비스 초기화 (로컬 모델 사용 시에만)
+    set_qlora_service(None)
     if settings.is_local_llm:
-        try:
-            print("🔄 QLoRA 서비스 초기화 중...", flush=True)
-            qlora_service = QLoRAService(
-                model_path=settings.LOCAL_MODEL_PATH,
-                adapter_path=None,
-                device=settings.LOCAL_MODEL_DEVICE,
-            )
-            # 모델 로드 (출력이 나오도록)
-            qlora_service._load_model()
-            set_qlora_service(qlora_service)
-            print("✅ QLoRA 서비스 초기화 완료", flush=True)
-
-        except Exception as e:
-            print(f"⚠️ QLoRA 서비스 초기화 실패: {e}", flush=True)
-            print("   QLoRA 기능은 사용할 수 없습니다.", flush=True)
-            set_qlora_service(None)
+        # 모델 공유 시 LocalLLM이 로드한 모델을 재사용하도록 LLM 이후에 초기화
+        orchestrator.register(
+            "qlora",
+            _init_qlora,
+            depends_on=["llm"] if settings.SHARE_BASE_MODEL else None,
+        )
     else:
         print("ℹ️  QLoRA 서비스는 로컬 모델 사용 시에만 사용 가능합니다.", flush=True)
-        set_qlora_service(None)
+
+    set_orchestrator(orchestrator)
+    startup_task = asyncio.create_task(orchestrator.run())
 
     yield
 
     # 종료 시
     print("👋 서버를 종료합니다...")
+    if not startup_task.done():
+        # 실행 중인 로드 스레드는 중단할 수 없으므로 대기만 취소
+        startup_task.cancel()
+    reset_orchestrator()
     reset_qlora_service()
     reset_llm()
     reset_vectorstore()
@@ -90,8 +130,12 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Request-ID"],
     )
 
+    # 요청 id 부여 및 HTTP 지연 시간 계측
+    app.add_middleware(RequestContextMiddleware)
+
     # 라우터 등록
     app.include_router(chat_router)
 
@@ -107,6 +151,15 @@ def create_app() -> FastAPI:
             "docs": "/docs",
         }
 
+    # Prometheus 메트릭 엔드포인트
+    @app.get("/metrics", tags=["root"], response_class=PlainTextResponse)
+    def metrics():
+        """단계별 지연 시간, TTFT, 초당 토큰 수, 대기 시간 메트릭 (Prometheus 텍스트 포맷)."""
+        return PlainTextResponse(
+            render_metrics(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     return app
 
 
@@ -1,5 +1,7 @@
 """챗봇 관련 Pydantic 모델."""
 
+from typing import Literal, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -18,6 +20,10 @@ class ChatRequest(BaseModel):
         default_factory=list,
         description="이전 대화 기록"
     )
+    adapter: Optional[str] = Field(
+        default=None,
+        description="QLoRA 채팅에 사용할 LoRA 어댑터 이름 (None이면 기본 어댑터)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -44,11 +50,31 @@ class ChatResponse(BaseModel):
         }
 
 
+class ComponentHealth(BaseModel):
+    """컴포넌트별 초기화 상태."""
+
+    status: str = Field(..., description="초기화 상태 (pending, loading, ready, failed)")
+    error: Optional[str] = Field(default=None, description="초기화 실패 사유")
+    duration_seconds: Optional[float] = Field(default=None, description="초기화 소요 시간 (초)")
+
+
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델."""
 
-    status: str = Field(..., description="서버 상태")
+    status: str = Field(..., description="서버 상태 (starting, healthy, degraded)")
     vectorstore_connected: bool = Field(..., description="벡터스토어 연결 상태")
+    ready: bool = Field(default=True, description="요청을 처리할 수 있는 컴포넌트가 하나 이상 준비되었는지 여부")
+    components: dict[str, ComponentHealth] = Field(
+        default_factory=dict,
+        description="컴포넌트별 준비 상태 (vectorstore, llm, qlora)"
+    )
+
+
+class AdapterRegisterRequest(BaseModel):
+    """LoRA 어댑터 등록 요청 모델."""
+
+    name: str = Field(..., description="어댑터 이름")
+    path: str = Field(..., description="PEFT 어댑터 디렉토리 경로")
 
 
 class TrainingDataItem(BaseModel):
@@ -72,6 +98,10 @@ class TrainingRequest(BaseModel):
     logging_steps: int = Field(default=10, description="로깅 간격")
     save_steps: int = Field(default=500, description="저장 간격")
     max_seq_length: int = Field(default=2048, description="최대 시퀀스 길이")
+    padding_strategy: Literal["max_length", "dynamic", "packing"] = Field(
+        default="max_length",
+        description="패딩 전략 (max_length: 고정 길이, dynamic: 길이 버킷팅 + 동적 패딩, packing: 시퀀스 패킹)",
+    )
 
 
 class TrainingResponse(BaseModel):
@@ -3,8 +3,14 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 
 from ..core.config import settings
-from ..core.deps import get_vectorstore, get_qlora_service
+from ..core.deps import (
+    ensure_component_ready,
+    get_orchestrator,
+    get_qlora_service,
+    get_vectorstore,
+)
 from ..models.chat import (
+    AdapterRegisterRequest,
     ChatRequest,
     ChatResponse,
     HealthResponse,
@@ -16,17 +22,50 @@ from ..services.rag import RAGService, QLoRAService
 router = APIRouter(prefix="/api", tags=["chat"])
 
 
+async def _require_ready(*components: str) -> None:
+    """필요한 컴포넌트가 아직 준비되지 않았으면 503을 반환합니다.
+
+    시작 시 초기화에 실패한 컴포넌트는 여기서 다시 초기화를 시도하므로,
+    DB 등이 나중에 복구되면 재시작 없이 요청을 처리합니다.
+    """
+    pending = [name for name in components if not await ensure_component_ready(name)]
+    if pending:
+        raise HTTPException(
+            status_code=503,
+            detail=f"서비스 초기화 중입니다. 준비되지 않은 컴포넌트: {', '.join(pending)}",
+            headers={"Retry-After": "5"},
+        )
+
+
 @router.get("/health", response_model=HealthResponse)
 def health_check():
     """헬스체크 엔드포인트.
 
     Returns:
-        서버 및 벡터스토어 연결 상태
+        서버 상태, 벡터스토어 연결 상태 및 컴포넌트별 준비 상태
     """
-    vectorstore = get_vectorstore()
+    orchestrator = get_orchestrator()
+    if orchestrator is None:
+        vectorstore = get_vectorstore()
+        return HealthResponse(
+            status="healthy",
+            vectorstore_connected=vectorstore is not None,
+        )
+
+    # 초기화 중인 컴포넌트를 여기서 로드하지 않도록 준비된 경우에만 조회
+    components = orchestrator.snapshot()
+    if orchestrator.all_settled:
+        failed = any(c["status"] == "failed" for c in components.values())
+        status = "degraded" if failed else "healthy"
+    else:
+        status = "starting"
     return HealthResponse(
-        status="healthy",
-        vectorstore_connected=vectorstore is not None,
+        status=status,
+        vectorstore_connected=(
+            orchestrator.is_ready("vectorstore") and get_vectorstore() is not None
+        ),
+        ready=orchestrator.any_ready,
+        components=components,
     )
 
 
@@ -43,6 +82,7 @@ async def chat(request: ChatRequest):
     Raises:
         HTTPException: 벡터스토어 연결 실패 또는 처리 오류
     """
+    await _require_ready("vectorstore", "llm")
     try:
         # 벡터스토어 가져오기
         vectorstore = get_vectorstore()
@@ -83,6 +123,7 @@ async def qlora_chat(request: ChatRequest):
     Raises:
         HTTPException: 모델 로드 실패 또는 처리 오류
     """
+    await _require_ready("qlora")
     try:
         # 전역 QLoRA 서비스 사용
         qlora_service = get_qlora_service()
@@ -92,12 +133,14 @@ async def qlora_chat(request: ChatRequest):
                 detail="QLoRA 서비스가 초기화되지 않았습니다."
             )
 
-        response = await qlora_service.achat(request.message)
+        response = await qlora_service.achat(request.message, adapter=request.adapter)
 
         return ChatResponse(response=response)
 
     except HTTPException:
         raise
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         import traceback
         print(f"❌ QLoRA 오류 발생: {str(e)}")
@@ -108,6 +151,64 @@ async def qlora_chat(request: ChatRequest):
         )
 
 
+@router.get("/qlora/prefix-cache")
+def qlora_prefix_cache_stats():
+    """QLoRA 서비스의 프리픽스 KV 캐시 적중률을 반환합니다.
+
+    Returns:
+        캐시 통계 (캐시 비활성화 시 enabled=False)
+
+    Raises:
+        HTTPException: QLoRA 서비스가 초기화되지 않은 경우
+    """
+    qlora_service = get_qlora_service()
+    if qlora_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="QLoRA 서비스가 초기화되지 않았습니다."
+        )
+    stats = qlora_service.prefix_cache_stats
+    if stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **stats}
+
+
+@router.get("/qlora/adapters")
+def qlora_adapters():
+    """등록된 LoRA 어댑터 상태와 로드/전환 지연 시간 통계를 반환합니다.
+
+    Raises:
+        HTTPException: QLoRA 서비스가 초기화되지 않은 경우
+    """
+    qlora_service = get_qlora_service()
+    if qlora_service is None or qlora_service.adapter_stats is None:
+        raise HTTPException(
+            status_code=503,
+            detail="QLoRA 서비스가 초기화되지 않았습니다."
+        )
+    return qlora_service.adapter_stats
+
+
+@router.post("/qlora/adapters")
+def register_qlora_adapter(request: AdapterRegisterRequest):
+    """LoRA 어댑터를 등록합니다. 실제 로드는 해당 어댑터의 첫 요청 시 수행됩니다.
+
+    Raises:
+        HTTPException: 서비스 미초기화 또는 어댑터 경로 오류
+    """
+    qlora_service = get_qlora_service()
+    if qlora_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="QLoRA 서비스가 초기화되지 않았습니다."
+        )
+    try:
+        qlora_service.register_adapter(request.name, request.path)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "registered", "name": request.name}
+
+
 def _train_qlora_model(request: TrainingRequest) -> None:
     """백그라운드에서 QLoRA 모델 학습 실행."""
     try:
@@ -143,6 +244,7 @@ def _train_qlora_model(request: TrainingRequest) -> None:
             logging_steps=request.logging_steps,
             save_steps=request.save_steps,
             max_seq_length=request.max_seq_length,
+            padding_strategy=request.padding_strategy,
         )
     except Exception as e:
         import traceback
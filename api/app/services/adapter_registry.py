@@ -0,0 +1,322 @@
+"""LoRA 어댑터 레지스트리 - 하나의 베이스 모델에서 여러 어댑터 서빙.
+
+베이스 모델 가중치는 한 번만 메모리에 올리고, PEFT 어댑터들을 이름으로 등록해
+요청마다 원하는 어댑터로 라우팅합니다.
+
+- 어댑터는 처음 사용될 때 `PeftModel.load_adapter`로 로드됩니다 (가중치 재로드 없음).
+- 같은 어댑터를 쓰는 요청들은 동시에 실행되고, 다른 어댑터로의 전환은
+  진행 중인 요청이 끝난 뒤 `set_adapter`로 수행됩니다.
+- 로드된 어댑터 수가 `max_loaded`를 넘으면 가장 오래 사용되지 않은 어댑터를 제거합니다.
+- 서로 다른 어댑터 요청을 한 배치로 처리할 때는 PEFT의 `adapter_names` 인자를 사용합니다.
+- `BASE_ADAPTER`("__base__")를 사용하면 어댑터 없이 베이스 모델 그대로 실행합니다
+  (베이스 모델을 다른 서비스와 공유할 때 사용).
+
+사용 예시:
+    registry = AdapterRegistry(peft_model, max_loaded=4, pinned=["default"])
+    registry.register("chat", "./adapters/chat_training")
+    with registry.use("chat") as model:
+        outputs = model.generate(**inputs)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# 어댑터를 모두 비활성화한 베이스 모델 모드 (PEFT의 mixed batch 표기와 동일)
+BASE_ADAPTER = "__base__"
+
+
+@dataclass
+class AdapterMetrics:
+    """어댑터 로드/전환 지연 시간 통계."""
+
+    loads: int = 0
+    load_seconds_total: float = 0.0
+    load_seconds_last: float = 0.0
+    switches: int = 0
+    switch_seconds_total: float = 0.0
+    switch_seconds_last: float = 0.0
+    evictions: int = 0
+    requests: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """통계를 딕셔너리로 반환."""
+        return {
+            "loads": self.loads,
+            "load_seconds_total": self.load_seconds_total,
+            "load_seconds_last": self.load_seconds_last,
+            "load_seconds_avg": self.load_seconds_total / self.loads if self.loads else 0.0,
+            "switches": self.switches,
+            "switch_seconds_total": self.switch_seconds_total,
+            "switch_seconds_last": self.switch_seconds_last,
+            "switch_seconds_avg": (
+                self.switch_seconds_total / self.switches if self.switches else 0.0
+            ),
+            "evictions": self.evictions,
+            "requests": dict(self.requests),
+        }
+
+
+class AdapterRegistry:
+    """하나의 `PeftModel` 위에 여러 LoRA 어댑터를 관리하는 레지스트리."""
+
+    def __init__(
+        self,
+        model: Any,
+        max_loaded: int = 4,
+        pinned: Optional[list[str]] = None,
+    ) -> None:
+        """어댑터 레지스트리 초기화.
+
+        Args:
+            model: 베이스 모델을 감싼 `PeftModel` (이미 로드된 어댑터는 그대로 유지)
+            max_loaded: 동시에 메모리에 올릴 최대 어댑터 수
+            pinned: LRU 제거 대상에서 제외할 어댑터 이름 리스트
+        """
+        if max_loaded <= 0:
+            msg = f"max_loaded는 1 이상이어야 합니다: {max_loaded}"
+            raise ValueError(msg)
+        self.model = model
+        self.max_loaded = max_loaded
+        self.pinned = set(pinned or [])
+        self.metrics = AdapterMetrics()
+
+        self._paths: dict[str, str] = {}
+        # 로드된 어댑터 이름 (LRU 순서)
+        self._loaded: OrderedDict[str, None] = OrderedDict(
+            (name, None) for name in getattr(model, "peft_config", {})
+        )
+        self._active: Optional[str] = getattr(model, "active_adapter", None)
+        # 활성 어댑터로 진입한 요청 수 (전환은 0일 때만 가능)
+        self._in_use = 0
+        # 어댑터별 사용 중인 요청 수 (0보다 크면 제거 불가)
+        self._refs: dict[str, int] = {}
+        # 진행 중인 mixed batch 수 (베이스 모드 전환은 0일 때만 가능)
+        self._mixed_in_use = 0
+        self._cond = threading.Condition()
+
+    @property
+    def active_adapter(self) -> Optional[str]:
+        """현재 활성화된 어댑터 이름."""
+        return self._active
+
+    @property
+    def loaded_adapters(self) -> list[str]:
+        """메모리에 로드된 어댑터 이름 (오래된 순)."""
+        return list(self._loaded)
+
+    @property
+    def registered_adapters(self) -> list[str]:
+        """등록된 (로드 여부와 무관한) 모든 어댑터 이름."""
+        return sorted(set(self._paths) | set(self._loaded))
+
+    def register(self, name: str, path: str) -> None:
+        """어댑터 경로를 이름으로 등록합니다 (실제 로드는 첫 사용 시).
+
+        Args:
+            name: 어댑터 이름
+            path: PEFT 어댑터 디렉토리 경로
+
+        Raises:
+            FileNotFoundError: 어댑터 경로가 없는 경우
+        """
+        if not (Path(path) / "adapter_config.json").exists():
+            msg = f"어댑터 설정(adapter_config.json)을 찾을 수 없습니다: {path}"
+            raise FileNotFoundError(msg)
+        with self._cond:
+            self._paths[name] = path
+
+    def _ensure_loaded(self, name: str, keep: frozenset[str] = frozenset()) -> None:
+        """어댑터가 로드되어 있지 않으면 로드합니다 (락 보유 상태에서 호출).
+
+        `keep`에 있는 어댑터는 자리 확보를 위한 제거 대상에서 제외합니다.
+        """
+        if name in self._loaded:
+            self._loaded.move_to_end(name)
+            return
+        if name not in self._paths:
+            msg = f"등록되지 않은 어댑터입니다: {name}"
+            raise KeyError(msg)
+
+        self._evict_for(1, keep=keep)
+        start = time.perf_counter()
+        self.model.load_adapter(self._paths[name], adapter_name=name)
+        elapsed = time.perf_counter() - start
+
+        self._loaded[name] = None
+        self.metrics.loads += 1
+        self.metrics.load_seconds_total += elapsed
+        self.metrics.load_seconds_last = elapsed
+        print(f"📂 LoRA 어댑터 로드: {name} ({elapsed:.2f}s)", flush=True)
+
+    def _evict_for(self, needed: int, keep: frozenset[str] = frozenset()) -> None:
+        """새 어댑터 `needed`개를 위한 자리를 LRU 순으로 비웁니다 (락 보유 상태에서 호출).
+
+        고정/활성/사용 중인 어댑터만 남아 자리를 만들 수 없으면 `max_loaded`를
+        일시적으로 넘겨 로드하고, 이후 요청에서 다시 정리합니다.
+        """
+        for name in list(self._loaded):
+            if len(self._loaded) + needed <= self.max_loaded:
+                return
+            if (
+                name in self.pinned
+                or name == self._active
+                or name in keep
+                or self._refs.get(name, 0) > 0
+            ):
+                continue
+            self.model.delete_adapter(name)
+            del self._loaded[name]
+            self.metrics.evictions += 1
+            print(f"🗑️ LoRA 어댑터 제거 (LRU): {name}", flush=True)
+
+    def _acquire(self, names: list[str]) -> None:
+        """어댑터 사용 카운트 증가 (락 보유 상태에서 호출)."""
+        for name in names:
+            self._refs[name] = self._refs.get(name, 0) + 1
+            self.metrics.requests[name] = self.metrics.requests.get(name, 0) + 1
+
+    def _release(self, names: list[str]) -> None:
+        """어댑터 사용 카운트 감소 (락 보유 상태에서 호출)."""
+        for name in names:
+            self._refs[name] -= 1
+
+    def _switch(self, name: str) -> None:
+        """활성 어댑터를 전환합니다 (락 보유 + 사용 중인 요청 없음 상태에서 호출)."""
+        if self._active == name:
+            return
+        start = time.perf_counter()
+        if name == BASE_ADAPTER:
+            self.model.base_model.disable_adapter_layers()
+        else:
+            if self._active == BASE_ADAPTER:
+                self.model.base_model.enable_adapter_layers()
+            self.model.set_adapter(name)
+        elapsed = time.perf_counter() - start
+
+        self._active = name
+        self.metrics.switches += 1
+        self.metrics.switch_seconds_total += elapsed
+        self.metrics.switch_seconds_last = elapsed
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """지정한 어댑터가 활성화된 모델을 사용합니다.
+
+        같은 어댑터 요청은 동시에 진입할 수 있고, 다른 어댑터 요청은
+        현재 사용 중인 요청이 모두 끝난 뒤 전환하여 진입합니다.
+
+        Args:
+            name: 어댑터 이름
+
+        Yields:
+            어댑터가 활성화된 모델
+
+        Raises:
+            KeyError: 등록되지 않은 어댑터인 경우
+        """
+        with self._cond:
+            is_base = name == BASE_ADAPTER
+            if not is_base and name not in self._loaded and name not in self._paths:
+                msg = f"등록되지 않은 어댑터입니다: {name}"
+                raise KeyError(msg)
+            self._cond.wait_for(
+                lambda: self._active == name
+                or (self._in_use == 0 and not (is_base and self._mixed_in_use))
+            )
+            if self._active != name:
+                if not is_base:
+                    self._ensure_loaded(name)
+                self._switch(name)
+            elif not is_base:
+                self._loaded.move_to_end(name)
+            self._in_use += 1
+            self._acquire([] if is_base else [name])
+
+        try:
+            yield self.model
+        finally:
+            with self._cond:
+                self._in_use -= 1
+                self._release([] if is_base else [name])
+                self._cond.notify_all()
+
+    @contextmanager
+    def use_many(self, names: list[str]) -> Iterator[Any]:
+        """여러 어댑터를 한 배치에서 사용하도록 모두 로드합니다.
+
+        `model.generate(..., adapter_names=names)`로 행마다 다른 어댑터를 적용할 수 있으며,
+        활성 어댑터 전환이 없으므로 다른 요청과 동시에 사용할 수 있습니다.
+
+        Args:
+            names: 배치의 행별 어댑터 이름 리스트
+
+        Yields:
+            모든 어댑터가 로드된 모델
+        """
+        unique = list(dict.fromkeys(names))
+        # 어댑터를 적용하지 않는 행 (BASE_ADAPTER)은 로드 대상이 아님
+        unique = [name for name in unique if name != BASE_ADAPTER]
+        if len(unique) > self.max_loaded:
+            msg = (
+                f"한 배치의 어댑터 수({len(unique)})가 "
+                f"max_loaded({self.max_loaded})를 초과합니다."
+            )
+            raise ValueError(msg)
+        with self._cond:
+            # 베이스 모드에서는 어댑터 레이어가 꺼져 있으므로 먼저 어댑터 모드로 복귀
+            # (모든 행이 베이스면 베이스 모드 그대로 실행)
+            self._cond.wait_for(
+                lambda: not unique or self._active != BASE_ADAPTER or self._in_use == 0
+            )
+            missing = [name for name in unique if name not in self._loaded]
+            keep = frozenset(unique)
+            self._evict_for(len(missing), keep=keep)
+            for name in unique:
+                self._ensure_loaded(name, keep=keep)
+            if self._active == BASE_ADAPTER and unique:
+                self._switch(unique[0])
+            self._mixed_in_use += 1
+            self._acquire(unique)
+
+        try:
+            yield self.model
+        finally:
+            with self._cond:
+                self._mixed_in_use -= 1
+                self._release(unique)
+                self._cond.notify_all()
+
+    def evict(self, name: str) -> None:
+        """어댑터를 메모리에서 제거합니다 (등록 정보는 유지).
+
+        Args:
+            name: 어댑터 이름
+
+        Raises:
+            ValueError: 고정(pinned)되었거나 현재 활성화된 어댑터인 경우
+        """
+        with self._cond:
+            if name not in self._loaded:
+                return
+            if name in self.pinned or name == self._active or self._refs.get(name, 0) > 0:
+                msg = f"고정, 활성화 또는 사용 중인 어댑터는 제거할 수 없습니다: {name}"
+                raise ValueError(msg)
+            self.model.delete_adapter(name)
+            del self._loaded[name]
+            self.metrics.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """레지스트리 상태와 지연 시간 통계를 반환합니다."""
+        with self._cond:
+            return {
+                "active_adapter": self._active,
+                "loaded_adapters": list(self._loaded),
+                "registered_adapters": sorted(set(self._paths) | set(self._loaded)),
+                "max_loaded": self.max_loaded,
+                **self.metrics.to_dict(),
+            }
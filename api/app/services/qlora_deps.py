@@ -0,0 +1,30 @@
+"""QLoRA 서비스가 사용하는 무거운 패키지 (torch, transformers, peft, datasets).
+
+import 비용이 크므로 `rag` 모듈은 이 모듈을 처음 필요할 때 `import_attr`로 로드합니다
+(OpenAI만 사용할 때는 로드하지 않음).
+"""
+
+import torch
+from datasets import Dataset
+from peft import LoraConfig, PeftModel, get_peft_model, prepare_model_for_kbit_training
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    BitsAndBytesConfig,
+    Trainer,
+    TrainingArguments,
+)
+
+__all__ = [
+    "AutoModelForCausalLM",
+    "AutoTokenizer",
+    "BitsAndBytesConfig",
+    "Dataset",
+    "LoraConfig",
+    "PeftModel",
+    "Trainer",
+    "TrainingArguments",
+    "get_peft_model",
+    "prepare_model_for_kbit_training",
+    "torch",
+]
@@ -2,46 +2,72 @@
 
 import asyncio
 import os
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
-
-# QLoRA 관련 import는 조건부로 처리 (OpenAI 사용 시 불필요)
-try:
-    import torch
-    from datasets import Dataset
-    from peft import LoraConfig, PeftModel, get_peft_model, prepare_model_for_kbit_training
-    from transformers import (
-        AutoModelForCausalLM,
-        AutoTokenizer,
-        BitsAndBytesConfig,
-        TrainingArguments,
-        Trainer,
-        DataCollatorForLanguageModeling,
-    )
-    QLORA_AVAILABLE = True
-except ImportError:
-    QLORA_AVAILABLE = False
-    # QLoRA 관련 타입 힌트를 위한 더미 클래스
-    torch = None  # type: ignore
-    Dataset = None  # type: ignore
-    LoraConfig = None  # type: ignore
-    PeftModel = None  # type: ignore
-    get_peft_model = None  # type: ignore
-    prepare_model_for_kbit_training = None  # type: ignore
-    AutoModelForCausalLM = None  # type: ignore
-    AutoTokenizer = None  # type: ignore
-    BitsAndBytesConfig = None  # type: ignore
-    TrainingArguments = None  # type: ignore
-    Trainer = None  # type: ignore
-    DataCollatorForLanguageModeling = None  # type: ignore
-
-from langchain_community.vectorstores import PGVector
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from langchain_core._import_utils import import_attr
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnablePassthrough
 
 from ..core.config import settings
 from ..core.deps import get_llm
+from ..core.metrics import QUEUE_WAIT, GenerationTimer, StageTimingTracer
+from ..llm.model_cache import has_safetensors, load_pretrained
+from ..llm.prefix_cache import PrefixKVCache, generate_with_prefix_cache
+from .adapter_registry import BASE_ADAPTER, AdapterRegistry
+
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import PGVector
+    from peft import LoraConfig
+
+# QLoRA 관련 패키지는 처음 사용할 때 로드 (OpenAI 사용 시 불필요, import 비용이 큼)
+_QLORA_DEPS_MODULE = "qlora_deps"
+_dynamic_imports = {
+    "torch": _QLORA_DEPS_MODULE,
+    "Dataset": _QLORA_DEPS_MODULE,
+    "LoraConfig": _QLORA_DEPS_MODULE,
+    "PeftModel": _QLORA_DEPS_MODULE,
+    "get_peft_model": _QLORA_DEPS_MODULE,
+    "prepare_model_for_kbit_training": _QLORA_DEPS_MODULE,
+    "AutoModelForCausalLM": _QLORA_DEPS_MODULE,
+    "AutoTokenizer": _QLORA_DEPS_MODULE,
+    "BitsAndBytesConfig": _QLORA_DEPS_MODULE,
+    "TrainingArguments": _QLORA_DEPS_MODULE,
+    "Trainer": _QLORA_DEPS_MODULE,
+}
+
+
+def _qlora_available() -> bool:
+    """torch, transformers, peft, datasets를 모두 import할 수 있는지 확인합니다."""
+    try:
+        import_attr("torch", _QLORA_DEPS_MODULE, __spec__.parent)
+    except ImportError:
+        return False
+    return True
+
+
+def __getattr__(attr_name: str) -> Any:
+    """QLORA_AVAILABLE과 QLoRA 관련 이름을 처음 접근할 때 로드합니다."""
+    if attr_name == "QLORA_AVAILABLE":
+        return _qlora_available()
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {attr_name!r}"
+        raise AttributeError(msg)
+    if not _qlora_available():
+        # 패키지가 없으면 None (기존 조건부 import와 동일)
+        return None
+    result = import_attr(attr_name, module_name, __spec__.parent)
+    globals()[attr_name] = result
+    return result
+
+
+# PeftModel이 생성/로드하는 기본 어댑터 이름
+DEFAULT_ADAPTER = "default"
 
 
 class RAGService:
@@ -62,7 +88,7 @@ class RAGService:
     #
     # 답변:"""
 
-    def __init__(self, vectorstore: PGVector, llm: Any = None) -> None:
+    def __init__(self, vectorstore: "PGVector", llm: Any = None) -> None:
         """RAG 서비스 초기화.
 
         Args:
@@ -145,7 +171,14 @@ class RAGService:
         Returns:
             RAG 기반 응답 문자열
         """
-        return await self.chain.ainvoke(message)
+        # 단계별 지연 시간/TTFT 계측 (요청마다 새 트레이서)
+        # 스트리밍으로 실행해야 토큰 이벤트가 발생해 TTFT/초당 토큰 수가 기록됨
+        tracer = StageTimingTracer(service=settings.LLM_PROVIDER)
+        chunks = [
+            chunk
+            async for chunk in self.chain.astream(message, config={"callbacks": [tracer]})
+        ]
+        return "".join(chunks)
 
 
 class QLoRAService:
@@ -164,6 +197,12 @@ class QLoRAService:
         lora_alpha: int = 32,
         lora_dropout: float = 0.05,
         target_modules: Optional[list[str]] = None,
+        prefix_cache_size: int = 0,
+        prefix_cache_block_size: int = 32,
+        load_in_4bit: bool = True,
+        adapter_paths: Optional[dict[str, str]] = None,
+        max_loaded_adapters: int = 4,
+        share_base_model: bool = False,
     ) -> None:
         """QLoRA 서비스 초기화.
 
@@ -175,6 +214,13 @@ class QLoRAService:
             lora_alpha: LoRA alpha
             lora_dropout: LoRA dropout
             target_modules: LoRA를 적용할 모듈 리스트 (None이면 자동 감지)
+            prefix_cache_size: 프리픽스 KV 캐시 최대 항목 수 (0이면 비활성화)
+            prefix_cache_block_size: 프리픽스 KV 캐시 해시 블록 크기 (토큰 수)
+            load_in_4bit: 4-bit 양자화 로드 여부 (False면 CPU 등에서 전체 정밀도로 로드)
+            adapter_paths: 추가로 서빙할 LoRA 어댑터 {이름: 경로} (첫 요청 시 로드)
+            max_loaded_adapters: 베이스 모델 위에 동시에 올릴 최대 어댑터 수 (초과 시 LRU 제거)
+            share_base_model: LocalLLM과 같은 bfloat16 베이스 모델 객체를 공유할지 여부
+                (True면 양자화하지 않으며, LocalLLM은 `__base__` 모드로 어댑터 없이 생성)
         """
         self.model_path = model_path
         self.adapter_path = adapter_path
@@ -183,26 +229,45 @@ class QLoRAService:
         self.lora_alpha = lora_alpha
         self.lora_dropout = lora_dropout
         self.target_modules = target_modules
+        self.share_base_model = share_base_model
+        # 공유 모델은 LocalLLM과 같은 비양자화 가중치여야 함
+        self.load_in_4bit = load_in_4bit and not share_base_model
+        self.adapter_paths = dict(adapter_paths or {})
+        self.max_loaded_adapters = max_loaded_adapters
 
         self.model: Optional[Any] = None  # AutoModelForCausalLM 타입 힌트 (조건부 import)
         self.tokenizer: Optional[Any] = None  # AutoTokenizer 타입 힌트 (조건부 import)
         self._is_loaded = False
+        self.adapters: Optional[AdapterRegistry] = None
+        # 모델을 PEFT로 감싸는 중인지, 감싸기 전 모델로 생성 중인 요청 수
+        self._wrap_cond = threading.Condition()
+        self._wrapping = False
+        self._unwrapped_users = 0
+
+        # 반복되는 프롬프트 프리픽스의 KV 재사용
+        self.prefix_cache: Optional[PrefixKVCache] = None
+        if prefix_cache_size > 0:
+            self.prefix_cache = PrefixKVCache(
+                max_entries=prefix_cache_size,
+                block_size=prefix_cache_block_size,
+            )
 
     def _load_model(self) -> None:
         """QLoRA 모델 로드."""
-        if not QLORA_AVAILABLE:
+        if not _qlora_available():
             raise ImportError(
                 "QLoRA 기능을 사용하려면 torch, transformers, peft, datasets 패키지가 필요합니다. "
                 "pip install torch transformers peft datasets bitsandbytes"
             )
         if self._is_loaded:
             return
+        import torch
+        from peft import LoraConfig
+        from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
 
         print(f"🔄 QLoRA 모델 로딩 중: {self.model_path}")
 
         # 디바이스 설정
-        if not QLORA_AVAILABLE or torch is None:
-            raise ImportError("torch가 설치되지 않았습니다.")
         if self.device == "auto":
             device_map = "auto"
         elif self.device == "cuda" and torch.cuda.is_available():
@@ -211,33 +276,50 @@ class QLoRAService:
             device_map = "cpu"
 
         # 4-bit 양자화 설정
-        bnb_config = BitsAndBytesConfig(
-            load_in_4bit=True,
-            bnb_4bit_use_double_quant=True,
-            bnb_4bit_quant_type="nf4",
-            bnb_4bit_compute_dtype=torch.bfloat16,
-        )
+        bnb_config = None
+        if self.load_in_4bit:
+            bnb_config = BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_use_double_quant=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=torch.bfloat16,
+            )
 
-        # 토크나이저 로드
-        self.tokenizer = AutoTokenizer.from_pretrained(
-            self.model_path,
-            trust_remote_code=False,
-        )
+        # 모델/토크나이저 로드 (4-bit 양자화, 비활성화 시 CPU는 float32)
+        if bnb_config is None and device_map == "cpu" and not self.share_base_model:
+            torch_dtype = torch.float32
+        else:
+            torch_dtype = torch.bfloat16
+        if self.share_base_model:
+            # LocalLLM이 로드한 같은 모델 객체를 재사용
+            # (설정이 달라 두 번째 복사본을 로드하게 되면 LookupError)
+            self.model, self.tokenizer = load_pretrained(
+                self.model_path,
+                device_map=device_map,
+                torch_dtype=torch_dtype,
+                trust_remote_code=False,
+                require_cached=True,
+            )
+        else:
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.model_path,
+                trust_remote_code=False,
+            )
+            self.model = AutoModelForCausalLM.from_pretrained(
+                self.model_path,
+                quantization_config=bnb_config,
+                device_map=device_map,
+                trust_remote_code=False,
+                torch_dtype=torch_dtype,
+                low_cpu_mem_usage=True,
+                use_safetensors=has_safetensors(self.model_path) or None,
+            )
 
         # 패딩 토큰 설정
         if self.tokenizer.pad_token is None:
             self.tokenizer.pad_token = self.tokenizer.eos_token
             self.tokenizer.pad_token_id = self.tokenizer.eos_token_id
 
-        # 모델 로드 (4-bit 양자화)
-        self.model = AutoModelForCausalLM.from_pretrained(
-            self.model_path,
-            quantization_config=bnb_config,
-            device_map=device_map,
-            trust_remote_code=False,
-            torch_dtype=torch.bfloat16,
-        )
-
         # LoRA 설정
         if self.target_modules is None:
             # 일반적인 모델 구조에 맞춰 자동 설정
@@ -252,11 +334,30 @@ class QLoRAService:
             task_type="CAUSAL_LM",
         )
 
+        # 공유 모델을 감싸는 동안에는 베이스 모델 생성이 진행되지 않도록 대기
+        with self._wrap_cond:
+            self._wrap_cond.wait_for(lambda: self._unwrapped_users == 0)
+            self._wrapping = True
+        try:
+            self._wrap_model(lora_config)
+        finally:
+            with self._wrap_cond:
+                self._wrapping = False
+                self._wrap_cond.notify_all()
+
+        self._is_loaded = True
+        print(f"✅ QLoRA 모델 로드 완료: {self.model_path}")
+
+    def _wrap_model(self, lora_config: "LoraConfig") -> None:
+        """모델에 LoRA 어댑터를 붙이고 어댑터 레지스트리를 만듭니다."""
+        from peft import PeftModel, get_peft_model, prepare_model_for_kbit_training
+
         # 기존 어댑터가 있으면 로드, 없으면 새로 생성
         if self.adapter_path and Path(self.adapter_path).exists():
             print(f"📂 기존 LoRA 어댑터 로드: {self.adapter_path}")
             # 양자화된 모델 준비
-            self.model = prepare_model_for_kbit_training(self.model)
+            if self.load_in_4bit:
+                self.model = prepare_model_for_kbit_training(self.model)
             # 기존 어댑터 로드
             self.model = PeftModel.from_pretrained(
                 self.model,
@@ -264,82 +365,219 @@ class QLoRAService:
             )
         else:
             # 양자화된 모델 준비
-            self.model = prepare_model_for_kbit_training(self.model)
+            if self.load_in_4bit:
+                self.model = prepare_model_for_kbit_training(self.model)
             # 새 LoRA 어댑터 추가
             self.model = get_peft_model(self.model, lora_config)
             print("✅ 새 LoRA 어댑터 생성 완료")
 
-        self._is_loaded = True
-        print(f"✅ QLoRA 모델 로드 완료: {self.model_path}")
+        # 기본 어댑터는 고정하고, 추가 어댑터는 같은 베이스 모델 위에 필요할 때 로드
+        self.adapters = AdapterRegistry(
+            self.model,
+            max_loaded=self.max_loaded_adapters,
+            pinned=[DEFAULT_ADAPTER],
+        )
+        for name, path in self.adapter_paths.items():
+            self.adapters.register(name, path)
+
+    @contextmanager
+    def base_model_guard(self) -> Iterator[None]:
+        """공유 베이스 모델을 어댑터 없이 사용하는 동안 진입하는 컨텍스트.
+
+        LocalLLM의 생성 가드로 설정합니다 (`LocalLLM.set_generation_guard`). 모델을
+        PEFT로 감싸는 중이면 끝날 때까지 기다리고, 감싼 뒤에는 어댑터 레지스트리의
+        베이스 모드로 진입합니다. 감싸기 전에 진입한 생성이 끝나야 감싸기를 시작합니다.
+        """
+        with self._wrap_cond:
+            self._wrap_cond.wait_for(lambda: not self._wrapping)
+            adapters = self.adapters
+            if adapters is None:
+                self._unwrapped_users += 1
+
+        if adapters is not None:
+            with adapters.use(BASE_ADAPTER):
+                yield
+            return
+        try:
+            yield
+        finally:
+            with self._wrap_cond:
+                self._unwrapped_users -= 1
+                self._wrap_cond.notify_all()
+
+    def register_adapter(self, name: str, path: str) -> None:
+        """서빙할 LoRA 어댑터를 등록합니다 (첫 요청 시 베이스 모델 위에 로드).
+
+        Args:
+            name: 어댑터 이름
+            path: PEFT 어댑터 디렉토리 경로
+        """
+        self.adapter_paths[name] = path
+        if self.adapters is not None:
+            self.adapters.register(name, path)
+
+    def _tokenize(self, messages: list[str]) -> dict[str, Any]:
+        """메시지를 토큰화하고 모델 디바이스로 이동합니다."""
+        if not _qlora_available():
+            raise ImportError("torch가 설치되지 않았습니다.")
+        import torch
+
+        # 배치 생성 시 프롬프트 끝이 맞도록 왼쪽 패딩
+        # (학습 후 저장되는 공유 토크나이저 설정은 바꾸지 않도록 호출마다 지정)
+        inputs = self.tokenizer(
+            messages,
+            return_tensors="pt",
+            padding=True,
+            padding_side="left",
+            truncation=True,
+            max_length=2048,
+        )
+        if self.device == "cuda" and torch.cuda.is_available():
+            inputs = {k: v.to("cuda") for k, v in inputs.items()}
+        return inputs
+
+    def _generate_kwargs(self, max_new_tokens: int, temperature: float) -> dict[str, Any]:
+        """생성 파라미터."""
+        return {
+            "max_new_tokens": max_new_tokens,
+            "temperature": temperature,
+            "do_sample": True,
+            "top_p": 0.9,
+            "repetition_penalty": 1.1,
+            "pad_token_id": self.tokenizer.pad_token_id,
+            "eos_token_id": self.tokenizer.eos_token_id,
+        }
+
+    def _decode(self, inputs: dict[str, Any], outputs: Any) -> list[str]:
+        """입력 프롬프트를 제외한 생성 부분만 디코딩합니다."""
+        input_length = inputs["input_ids"].shape[1]
+        return [
+            self.tokenizer.decode(row[input_length:], skip_special_tokens=True).strip()
+            for row in outputs
+        ]
 
-    def chat(self, message: str, max_new_tokens: int = 512, temperature: float = 0.7) -> str:
+    def chat(
+        self,
+        message: str,
+        max_new_tokens: int = 512,
+        temperature: float = 0.7,
+        adapter: Optional[str] = None,
+    ) -> str:
         """QLoRA 모델로 대화 생성.
 
         Args:
             message: 사용자 메시지
             max_new_tokens: 최대 생성 토큰 수
             temperature: 생성 온도
+            adapter: 사용할 LoRA 어댑터 이름 (None이면 기본 어댑터)
 
         Returns:
             생성된 응답 문자열
+
+        Raises:
+            KeyError: 등록되지 않은 어댑터인 경우
         """
         if not self._is_loaded:
             self._load_model()
 
-        # 토큰화
-        inputs = self.tokenizer(
-            message,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=2048,
-        )
+        import torch
+
+        adapter = adapter or DEFAULT_ADAPTER
+        inputs = self._tokenize([message])
+        generate_kwargs = self._generate_kwargs(max_new_tokens, temperature)
+        # TTFT/decode 처리량 계측
+        generate_kwargs["streamer"] = GenerationTimer("qlora")
+
+        # 생성 (어댑터 전환은 레지스트리가 처리, 베이스 가중치는 재로드하지 않음)
+        with self.adapters.use(adapter) as model, torch.no_grad():
+            model.eval()
+            if self.prefix_cache is not None:
+                outputs = generate_with_prefix_cache(
+                    model, inputs, self.prefix_cache, namespace=adapter, **generate_kwargs
+                )
+            else:
+                outputs = model.generate(**inputs, **generate_kwargs)
 
-        # 디바이스로 이동
-        if not QLORA_AVAILABLE or torch is None:
-            raise ImportError("torch가 설치되지 않았습니다.")
-        if self.device == "cuda" and torch.cuda.is_available():
-            inputs = {k: v.to("cuda") for k, v in inputs.items()}
+        return self._decode(inputs, outputs)[0]
 
-        # 생성
-        self.model.eval()
-        with torch.no_grad():
-            outputs = self.model.generate(
-                **inputs,
-                max_new_tokens=max_new_tokens,
-                temperature=temperature,
-                do_sample=True,
-                top_p=0.9,
-                repetition_penalty=1.1,
-                pad_token_id=self.tokenizer.pad_token_id,
-                eos_token_id=self.tokenizer.eos_token_id,
-            )
+    def chat_batch(
+        self,
+        messages: list[str],
+        adapters: Optional[list[Optional[str]]] = None,
+        max_new_tokens: int = 512,
+        temperature: float = 0.7,
+    ) -> list[str]:
+        """여러 메시지를 한 배치로 생성합니다. 행마다 다른 어댑터를 사용할 수 있습니다.
 
-        # 디코딩 (입력 프롬프트 제외하고 생성된 부분만)
-        input_length = inputs["input_ids"].shape[1]
-        generated_text = self.tokenizer.decode(
-            outputs[0][input_length:],
-            skip_special_tokens=True,
-        )
+        Args:
+            messages: 사용자 메시지 리스트
+            adapters: 메시지별 어댑터 이름 리스트 (None 항목은 기본 어댑터)
+            max_new_tokens: 최대 생성 토큰 수
+            temperature: 생성 온도
+
+        Returns:
+            메시지별 생성된 응답 리스트
+        """
+        if not self._is_loaded:
+            self._load_model()
+
+        names = [name or DEFAULT_ADAPTER for name in (adapters or [None] * len(messages))]
+        if len(names) != len(messages):
+            msg = "messages와 adapters의 길이가 같아야 합니다."
+            raise ValueError(msg)
 
-        return generated_text.strip()
+        import torch
 
-    async def achat(self, message: str, max_new_tokens: int = 512, temperature: float = 0.7) -> str:
+        inputs = self._tokenize(messages)
+        generate_kwargs = self._generate_kwargs(max_new_tokens, temperature)
+        with self.adapters.use_many(names) as model, torch.no_grad():
+            model.eval()
+            outputs = model.generate(**inputs, adapter_names=names, **generate_kwargs)
+
+        return self._decode(inputs, outputs)
+
+    async def achat(
+        self,
+        message: str,
+        max_new_tokens: int = 512,
+        temperature: float = 0.7,
+        adapter: Optional[str] = None,
+    ) -> str:
         """비동기 QLoRA 모델로 대화 생성.
 
         Args:
             message: 사용자 메시지
             max_new_tokens: 최대 생성 토큰 수
             temperature: 생성 온도
+            adapter: 사용할 LoRA 어댑터 이름 (None이면 기본 어댑터)
 
         Returns:
             생성된 응답 문자열
         """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.chat(message, max_new_tokens, temperature)
-        )
+        submitted_at = time.perf_counter()
+
+        def run() -> str:
+            QUEUE_WAIT.observe(time.perf_counter() - submitted_at, service="qlora")
+            return self.chat(message, max_new_tokens, temperature, adapter)
+
+        return await loop.run_in_executor(None, run)
+
+    @property
+    def adapter_stats(self) -> Optional[dict[str, Any]]:
+        """어댑터 레지스트리 상태 및 로드/전환 지연 시간 (모델 로드 전에는 None)."""
+        if self.adapters is None:
+            return None
+        return self.adapters.stats()
+
+    @contextmanager
+    def _training_step(self) -> Iterator[None]:
+        """기본 어댑터를 활성화하고 학습 스텝 하나 동안 점유합니다."""
+        with self.adapters.use(DEFAULT_ADAPTER):
+            yield
+        # 가중치가 바뀌었으므로 캐시된 KV는 더 이상 유효하지 않음
+        if self.prefix_cache is not None:
+            self.prefix_cache.clear()
 
     def train(
         self,
@@ -353,7 +591,8 @@ class QLoRAService:
         logging_steps: int = 10,
         save_steps: int = 500,
         max_seq_length: int = 2048,
-    ) -> None:
+        padding_strategy: str = "max_length",
+    ) -> dict[str, Any]:
         """QLoRA 방식으로 모델 파인튜닝.
 
         Args:
@@ -367,6 +606,13 @@ class QLoRAService:
             logging_steps: 로깅 간격
             save_steps: 저장 간격
             max_seq_length: 최대 시퀀스 길이
+            padding_strategy: 패딩 전략
+                - "max_length": 모든 예제를 max_seq_length까지 패딩 (기존 동작)
+                - "dynamic": 길이별 버킷팅 + 배치 내 최장 길이까지만 패딩
+                - "packing": 예제를 이어 붙여 max_seq_length 시퀀스로 패킹 (예제 경계 어텐션 차단)
+
+        Returns:
+            처리량 리포트 (tokens_per_second, padding_ratio 등)
         """
         if not self._is_loaded:
             self._load_model()
@@ -389,34 +635,33 @@ class QLoRAService:
             return {"text": prompt}
 
         # 데이터셋 생성
-        if not QLORA_AVAILABLE or Dataset is None:
+        if not _qlora_available():
             raise ImportError("datasets 패키지가 설치되지 않았습니다.")
-        dataset = Dataset.from_list(training_data)
-        dataset = dataset.map(format_prompt)
-
-        # 토큰화 함수
-        def tokenize_function(examples: dict[str, list[str]]) -> dict[str, list[list[int]]]:
-            """토큰화 함수."""
-            return self.tokenizer(
-                examples["text"],
-                truncation=True,
-                max_length=max_seq_length,
-                padding="max_length",
-            )
-
-        tokenized_dataset = dataset.map(
-            tokenize_function,
-            batched=True,
-            remove_columns=dataset.column_names,
+        import torch
+        from datasets import Dataset
+        from transformers import Trainer, TrainingArguments
+
+        from .training_pipeline import (
+            PaddingStrategy,
+            StepLockCallback,
+            ThroughputCallback,
+            prepare_training_data,
         )
 
-        # 데이터 콜레이터
-        data_collator = DataCollatorForLanguageModeling(
-            tokenizer=self.tokenizer,
-            mlm=False,
+        strategy = PaddingStrategy(padding_strategy)
+        texts = [format_prompt(example)["text"] for example in training_data]
+        prepared = prepare_training_data(
+            self.tokenizer,
+            texts,
+            max_seq_length=max_seq_length,
+            padding_strategy=strategy,
+            mask_dtype=self.model.dtype,
         )
+        tokenized_dataset = Dataset.from_list(prepared.records)
+        print(f"🧩 패딩 전략: {strategy.value} (학습 시퀀스 수: {len(tokenized_dataset)})", flush=True)
 
-        # 학습 인자 설정
+        # 학습 인자 설정 (fp16/paged 8bit 옵티마이저는 CUDA에서만 사용)
+        use_cuda = torch.cuda.is_available() and self.device != "cpu"
         training_args = TrainingArguments(
             output_dir=output_dir,
             num_train_epochs=num_epochs,
@@ -427,24 +672,32 @@ class QLoRAService:
             logging_steps=logging_steps,
             save_steps=save_steps,
             save_total_limit=3,
-            fp16=True,
-            optim="paged_adamw_8bit",
+            fp16=use_cuda,
+            optim="paged_adamw_8bit" if use_cuda and self.load_in_4bit else "adamw_torch",
             lr_scheduler_type="cosine",
             report_to="none",
             remove_unused_columns=False,
+            **prepared.training_arguments,
         )
 
+        # 기본 어댑터는 스텝 동안에만 점유 (스텝 사이에는 다른 어댑터/베이스 모델 요청 처리)
+        step_lock = StepLockCallback(self._training_step)
+
         # 트레이너 생성
         trainer = Trainer(
             model=self.model,
             args=training_args,
             train_dataset=tokenized_dataset,
-            data_collator=data_collator,
+            data_collator=prepared.collator,
+            callbacks=[ThroughputCallback(prepared.stats), step_lock],
         )
 
-        # 학습 실행
+        # 학습 실행 (기본 어댑터를 활성화한 상태로 학습)
         print("📚 학습 시작...")
-        trainer.train()
+        try:
+            trainer.train()
+        finally:
+            step_lock.release()
 
         # 모델 저장
         print(f"💾 모델 저장 중: {output_dir}")
@@ -452,6 +705,14 @@ class QLoRAService:
         self.tokenizer.save_pretrained(output_dir)
         print(f"✅ 학습 완료! 모델이 저장되었습니다: {output_dir}")
 
+        report = prepared.stats.to_dict()
+        print(
+            f"📈 처리량: {report['tokens_per_second']:.1f} tokens/s, "
+            f"패딩 비율: {report['padding_ratio']:.1%}",
+            flush=True,
+        )
+        return report
+
     def save_adapter(self, adapter_path: str) -> None:
         """LoRA 어댑터만 저장.
 
@@ -461,8 +722,10 @@ class QLoRAService:
         if not self._is_loaded:
             raise ValueError("모델이 로드되지 않았습니다. 먼저 _load_model()을 호출하세요.")
 
-        if not QLORA_AVAILABLE or PeftModel is None:
+        if not _qlora_available():
             raise ImportError("peft 패키지가 설치되지 않았습니다.")
+        from peft import PeftModel
+
         if isinstance(self.model, PeftModel):
             self.model.save_pretrained(adapter_path)
             print(f"✅ LoRA 어댑터 저장 완료: {adapter_path}")
@@ -475,10 +738,23 @@ class QLoRAService:
             del self.model
             del self.tokenizer
 
-            if QLORA_AVAILABLE and torch is not None and torch.cuda.is_available():
-                torch.cuda.empty_cache()
+            if _qlora_available():
+                import torch
+
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
 
             self.model = None
             self.tokenizer = None
+            self.adapters = None
             self._is_loaded = False
+            if self.prefix_cache is not None:
+                self.prefix_cache.clear()
             print("🗑️ QLoRA 모델 메모리 해제 완료")
+
+    @property
+    def prefix_cache_stats(self) -> Optional[dict[str, Any]]:
+        """프리픽스 KV 캐시 통계 (캐시 비활성화 시 None)."""
+        if self.prefix_cache is None:
+            return None
+        return self.prefix_cache.stats.to_dict()
@@ -0,0 +1,388 @@
+"""QLoRA 학습 데이터 파이프라인 - 동적 패딩 및 시퀀스 패킹.
+
+`QLoRAService.train`에서 사용하는 토큰화/콜레이터/처리량 측정 구성요소입니다.
+
+패딩 전략:
+    - max_length: 모든 예제를 `max_seq_length`까지 패딩 (기존 동작)
+    - dynamic: 길이가 비슷한 예제끼리 묶고 배치 내 최장 길이까지만 패딩
+    - packing: 여러 예제를 `max_seq_length` 시퀀스로 이어 붙이고,
+      예제 경계를 넘는 어텐션을 블록 대각 마스크로 차단
+"""
+
+import time
+from contextlib import AbstractContextManager, ExitStack
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Any, Callable, Optional, Sequence
+
+import torch
+from transformers import TrainerCallback, TrainingArguments
+
+
+class PaddingStrategy(str, Enum):
+    """학습 데이터 패딩 전략."""
+
+    MAX_LENGTH = "max_length"
+    DYNAMIC = "dynamic"
+    PACKING = "packing"
+
+
+@dataclass
+class TrainingThroughputStats:
+    """학습 처리량 및 패딩 통계."""
+
+    real_tokens: int = 0
+    padded_tokens: int = 0
+    batches: int = 0
+    examples: int = 0
+    train_seconds: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """패딩을 포함한 전체 토큰 수."""
+        return self.real_tokens + self.padded_tokens
+
+    @property
+    def padding_ratio(self) -> float:
+        """전체 토큰 중 패딩 토큰 비율."""
+        return self.padded_tokens / self.total_tokens if self.total_tokens else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """초당 처리한 실제(패딩 제외) 토큰 수."""
+        return self.real_tokens / self.train_seconds if self.train_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """통계를 딕셔너리로 반환."""
+        return {
+            "real_tokens": self.real_tokens,
+            "padded_tokens": self.padded_tokens,
+            "padding_ratio": self.padding_ratio,
+            "batches": self.batches,
+            "examples": self.examples,
+            "train_seconds": self.train_seconds,
+            "tokens_per_second": self.tokens_per_second,
+        }
+
+
+def tokenize_texts(
+    tokenizer: Any, texts: Sequence[str], max_seq_length: int, add_eos: bool = True
+) -> list[list[int]]:
+    """텍스트를 패딩 없이 토큰화합니다.
+
+    Args:
+        tokenizer: HuggingFace 토크나이저
+        texts: 학습 텍스트 리스트
+        max_seq_length: 최대 시퀀스 길이 (EOS 포함)
+        add_eos: 예제 끝에 EOS 토큰을 붙일지 여부 (패킹 시 예제 구분에 필요)
+
+    Returns:
+        예제별 토큰 id 리스트
+    """
+    eos_id = tokenizer.eos_token_id
+    add_eos = add_eos and eos_id is not None
+    encoded = tokenizer(
+        list(texts),
+        truncation=True,
+        max_length=max_seq_length - 1 if add_eos else max_seq_length,
+    )["input_ids"]
+    if not add_eos:
+        return [list(ids) for ids in encoded]
+    return [list(ids) + [eos_id] for ids in encoded]
+
+
+def pack_sequences(
+    sequences: Sequence[Sequence[int]], max_seq_length: int
+) -> list[list[list[int]]]:
+    """예제들을 `max_seq_length` 이하의 팩으로 묶습니다 (First-Fit Decreasing).
+
+    Args:
+        sequences: 예제별 토큰 id 리스트
+        max_seq_length: 팩 하나의 최대 토큰 수
+
+    Returns:
+        팩 리스트. 각 팩은 원래 예제(토큰 id 리스트)들의 리스트
+    """
+    order = sorted(range(len(sequences)), key=lambda i: len(sequences[i]), reverse=True)
+    packs: list[list[list[int]]] = []
+    remaining: list[int] = []
+    for i in order:
+        seq = list(sequences[i][:max_seq_length])
+        for p, space in enumerate(remaining):
+            if len(seq) <= space:
+                packs[p].append(seq)
+                remaining[p] -= len(seq)
+                break
+        else:
+            packs.append([seq])
+            remaining.append(max_seq_length - len(seq))
+    return packs
+
+
+class DynamicPaddingCollator:
+    """배치 내 최장 길이까지만 패딩하는 콜레이터.
+
+    패딩 위치의 라벨은 -100으로 설정하여 손실 계산에서 제외합니다.
+    """
+
+    def __init__(
+        self,
+        pad_token_id: int,
+        stats: Optional[TrainingThroughputStats] = None,
+        pad_to_multiple_of: Optional[int] = 8,
+        max_length: Optional[int] = None,
+        mask_pad_token_labels: bool = False,
+    ) -> None:
+        """콜레이터 초기화.
+
+        Args:
+            pad_token_id: 패딩 토큰 id
+            stats: 패딩 통계를 누적할 객체
+            pad_to_multiple_of: 패딩 길이를 이 값의 배수로 맞춤 (텐서 코어 정렬)
+            max_length: 패딩 길이 상한 (`pad_to_multiple_of`로 맞춰도 넘지 않음)
+            mask_pad_token_labels: 패딩 토큰과 같은 id의 토큰도 라벨을 -100으로 설정
+                (`DataCollatorForLanguageModeling`과 같은 동작, 패드 토큰이 EOS인 경우 포함)
+        """
+        self.pad_token_id = pad_token_id
+        self.stats = stats if stats is not None else TrainingThroughputStats()
+        self.pad_to_multiple_of = pad_to_multiple_of
+        self.max_length = max_length
+        self.mask_pad_token_labels = mask_pad_token_labels
+
+    def _padded_length(self, length: int) -> int:
+        if self.pad_to_multiple_of:
+            m = self.pad_to_multiple_of
+            padded = (length + m - 1) // m * m
+            if self.max_length is not None:
+                padded = max(min(padded, self.max_length), length)
+            return padded
+        return length
+
+    def __call__(self, features: list[dict[str, Any]]) -> dict[str, torch.Tensor]:
+        """배치 생성."""
+        lengths = [len(f["input_ids"]) for f in features]
+        width = self._padded_length(max(lengths))
+
+        input_ids = torch.full((len(features), width), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(features), width), dtype=torch.long)
+        labels = torch.full((len(features), width), -100, dtype=torch.long)
+        for row, (feature, length) in enumerate(zip(features, lengths)):
+            ids = torch.as_tensor(feature["input_ids"], dtype=torch.long)
+            input_ids[row, :length] = ids
+            attention_mask[row, :length] = 1
+            labels[row, :length] = ids
+        if self.mask_pad_token_labels:
+            labels[input_ids == self.pad_token_id] = -100
+
+        self.stats.real_tokens += sum(lengths)
+        self.stats.padded_tokens += width * len(features) - sum(lengths)
+        self.stats.batches += 1
+        self.stats.examples += len(features)
+        return {"input_ids": input_ids, "attention_mask": attention_mask, "labels": labels}
+
+
+class PackedSequenceCollator(DynamicPaddingCollator):
+    """패킹된 시퀀스용 콜레이터.
+
+    각 팩 안에서 예제마다 `position_ids`를 0부터 다시 시작하고,
+    예제 경계를 넘지 못하는 블록 대각 인과(causal) 4D 어텐션 마스크를 만듭니다.
+    예제 첫 토큰의 라벨은 이전 예제의 마지막 토큰에서 예측되므로 -100으로 제외합니다.
+    """
+
+    def __init__(
+        self,
+        pad_token_id: int,
+        stats: Optional[TrainingThroughputStats] = None,
+        pad_to_multiple_of: Optional[int] = 8,
+        mask_dtype: torch.dtype = torch.float32,
+        max_length: Optional[int] = None,
+    ) -> None:
+        """콜레이터 초기화.
+
+        Args:
+            pad_token_id: 패딩 토큰 id
+            stats: 패딩 통계를 누적할 객체
+            pad_to_multiple_of: 패딩 길이를 이 값의 배수로 맞춤
+            mask_dtype: 가산(additive) 어텐션 마스크 dtype (모델 연산 dtype과 일치해야 함)
+            max_length: 패딩 길이 상한 (`pad_to_multiple_of`로 맞춰도 넘지 않음)
+        """
+        super().__init__(pad_token_id, stats, pad_to_multiple_of, max_length)
+        self.mask_dtype = mask_dtype
+
+    def __call__(self, features: list[dict[str, Any]]) -> dict[str, torch.Tensor]:
+        """배치 생성."""
+        lengths = [len(f["input_ids"]) for f in features]
+        width = self._padded_length(max(lengths))
+        batch = len(features)
+
+        input_ids = torch.full((batch, width), self.pad_token_id, dtype=torch.long)
+        labels = torch.full((batch, width), -100, dtype=torch.long)
+        position_ids = torch.zeros((batch, width), dtype=torch.long)
+        allowed = torch.zeros((batch, width, width), dtype=torch.bool)
+        causal = torch.ones((width, width), dtype=torch.bool).tril()
+
+        for row, feature in enumerate(features):
+            start = 0
+            for seq_len in feature["seq_lens"]:
+                end = start + seq_len
+                ids = torch.as_tensor(feature["input_ids"][start:end], dtype=torch.long)
+                input_ids[row, start:end] = ids
+                labels[row, start + 1 : end] = ids[1:]
+                position_ids[row, start:end] = torch.arange(seq_len)
+                allowed[row, start:end, start:end] = causal[:seq_len, :seq_len]
+                start = end
+            # 패딩 위치는 자기 자신만 보도록 하여 softmax NaN 방지
+            pad = torch.arange(start, width)
+            allowed[row, pad, pad] = True
+
+        attention_mask = torch.zeros((batch, 1, width, width), dtype=self.mask_dtype)
+        attention_mask.masked_fill_(~allowed.unsqueeze(1), torch.finfo(self.mask_dtype).min)
+
+        self.stats.real_tokens += sum(lengths)
+        self.stats.padded_tokens += width * batch - sum(lengths)
+        self.stats.batches += 1
+        self.stats.examples += sum(len(f["seq_lens"]) for f in features)
+        return {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "position_ids": position_ids,
+            "labels": labels,
+        }
+
+
+class ThroughputCallback(TrainerCallback):
+    """학습 시간을 측정해 처리량 통계를 완성하는 콜백."""
+
+    def __init__(self, stats: TrainingThroughputStats) -> None:
+        """콜백 초기화.
+
+        Args:
+            stats: 콜레이터와 공유하는 통계 객체
+        """
+        self.stats = stats
+        self._start: Optional[float] = None
+
+    def on_train_begin(self, args: Any, state: Any, control: Any, **kwargs: Any) -> None:
+        self._start = time.perf_counter()
+
+    def on_train_end(self, args: Any, state: Any, control: Any, **kwargs: Any) -> None:
+        if self._start is not None:
+            self.stats.train_seconds = time.perf_counter() - self._start
+
+
+class StepLockCallback(TrainerCallback):
+    """옵티마이저 스텝마다 `lock()` 컨텍스트에 진입했다가 스텝이 끝나면 빠져나오는 콜백.
+
+    학습 전체 대신 스텝 단위로 모델을 점유하므로, 스텝 사이에는 같은 모델을 쓰는
+    추론 요청이 처리됩니다 (예: `lambda: registry.use("default")`).
+    """
+
+    def __init__(self, lock: Callable[[], AbstractContextManager[Any]]) -> None:
+        """콜백 초기화.
+
+        Args:
+            lock: 스텝마다 진입할 컨텍스트 매니저를 만드는 함수
+        """
+        self.lock = lock
+        self._held = ExitStack()
+
+    def on_step_begin(self, args: Any, state: Any, control: Any, **kwargs: Any) -> None:
+        self._held.enter_context(self.lock())
+
+    def on_step_end(self, args: Any, state: Any, control: Any, **kwargs: Any) -> None:
+        self.release()
+
+    def on_train_end(self, args: Any, state: Any, control: Any, **kwargs: Any) -> None:
+        self.release()
+
+    def release(self) -> None:
+        """점유 중인 컨텍스트가 있으면 빠져나옵니다 (학습이 예외로 중단된 경우에도 호출)."""
+        self._held.close()
+
+
+def length_grouping_arguments() -> dict[str, Any]:
+    """길이 기반 버킷팅을 켜는 `TrainingArguments` 인자를 반환합니다.
+
+    transformers 5.x는 `train_sampling_strategy`, 4.x는 `group_by_length`를 사용합니다.
+    """
+    names = {f.name for f in fields(TrainingArguments)}
+    if "train_sampling_strategy" in names:
+        return {"train_sampling_strategy": "group_by_length", "length_column_name": "length"}
+    return {"group_by_length": True, "length_column_name": "length"}
+
+
+@dataclass
+class PreparedTrainingData:
+    """학습용으로 준비된 데이터셋 레코드와 콜레이터."""
+
+    records: list[dict[str, Any]]
+    collator: Any
+    stats: TrainingThroughputStats
+    training_arguments: dict[str, Any] = field(default_factory=dict)
+
+
+def prepare_training_data(
+    tokenizer: Any,
+    texts: Sequence[str],
+    max_seq_length: int,
+    padding_strategy: PaddingStrategy,
+    mask_dtype: torch.dtype = torch.float32,
+) -> PreparedTrainingData:
+    """패딩 전략에 맞게 데이터셋 레코드와 콜레이터를 준비합니다.
+
+    Args:
+        tokenizer: HuggingFace 토크나이저
+        texts: 포맷팅된 학습 텍스트 리스트
+        max_seq_length: 최대 시퀀스 길이
+        padding_strategy: 패딩 전략
+        mask_dtype: 패킹 모드 어텐션 마스크 dtype
+
+    Returns:
+        데이터셋 레코드, 콜레이터, 통계 및 추가 `TrainingArguments` 인자
+    """
+    stats = TrainingThroughputStats()
+    pad_token_id = tokenizer.pad_token_id
+
+    if padding_strategy == PaddingStrategy.MAX_LENGTH:
+        sequences = tokenize_texts(tokenizer, texts, max_seq_length, add_eos=False)
+        records = [{"input_ids": ids} for ids in sequences]
+        # 항상 max_seq_length까지 패딩 (pad_to_multiple_of로 길이 고정)
+        # 기존 DataCollatorForLanguageModeling처럼 패드 토큰 라벨은 손실에서 제외
+        collator = DynamicPaddingCollator(
+            pad_token_id,
+            stats,
+            pad_to_multiple_of=max_seq_length,
+            max_length=max_seq_length,
+            mask_pad_token_labels=True,
+        )
+        return PreparedTrainingData(records, collator, stats)
+
+    if padding_strategy == PaddingStrategy.DYNAMIC:
+        sequences = tokenize_texts(tokenizer, texts, max_seq_length)
+        records = [{"input_ids": ids, "length": len(ids)} for ids in sequences]
+        return PreparedTrainingData(
+            records,
+            DynamicPaddingCollator(pad_token_id, stats, max_length=max_seq_length),
+            stats,
+            length_grouping_arguments(),
+        )
+
+    if padding_strategy == PaddingStrategy.PACKING:
+        sequences = tokenize_texts(tokenizer, texts, max_seq_length)
+        records = [
+            {
+                "input_ids": [tok for seq in pack for tok in seq],
+                "seq_lens": [len(seq) for seq in pack],
+            }
+            for pack in pack_sequences(sequences, max_seq_length)
+        ]
+        return PreparedTrainingData(
+            records,
+            PackedSequenceCollator(
+                pad_token_id, stats, mask_dtype=mask_dtype, max_length=max_seq_length
+            ),
+            stats,
+        )
+
+    msg = f"지원하지 않는 패딩 전략입니다: {padding_strategy}"
+    raise ValueError(msg)
@@ -0,0 +1,54 @@
+"""API 테스트 공통 픽스처.
+
+네트워크 없이 CPU에서 실행되도록 작은 GPT-2 모델을 무작위 초기화로 만들고,
+단어 단위 토크나이저를 메모리에서 구성합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# `app` 패키지를 import할 수 있도록 api 디렉터리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+VOCAB = ["<pad>", "<eos>", "<unk>"] + [f"w{i}" for i in range(61)]
+
+
+@pytest.fixture
+def tiny_model():
+    """무작위 초기화된 2층 GPT-2 (hf-internal-testing/tiny-random-gpt2와 같은 규모)."""
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    torch.manual_seed(0)
+    config = transformers.GPT2Config(
+        vocab_size=len(VOCAB),
+        n_positions=128,
+        n_embd=32,
+        n_layer=2,
+        n_head=2,
+        pad_token_id=0,
+        eos_token_id=1,
+        bos_token_id=1,
+    )
+    return transformers.GPT2LMHeadModel(config).eval()
+
+
+@pytest.fixture
+def tiny_tokenizer():
+    """`w0 w1 ...` 형식의 텍스트를 처리하는 단어 단위 토크나이저."""
+    tokenizers = pytest.importorskip("tokenizers")
+    transformers = pytest.importorskip("transformers")
+
+    model = tokenizers.models.WordLevel(
+        {token: i for i, token in enumerate(VOCAB)}, unk_token="<unk>"
+    )
+    tokenizer = tokenizers.Tokenizer(model)
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.WhitespaceSplit()
+    return transformers.PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        pad_token="<pad>",
+        eos_token="<eos>",
+        unk_token="<unk>",
+    )
@@ -0,0 +1,234 @@
+"""LoRA 어댑터 레지스트리 및 어댑터 API 테스트."""
+
+import json
+import threading
+
+import pytest
+
+from app.services.adapter_registry import BASE_ADAPTER, AdapterRegistry
+
+
+class FakeBaseModel:
+    def __init__(self) -> None:
+        self.adapter_layers_enabled = True
+
+    def disable_adapter_layers(self) -> None:
+        self.adapter_layers_enabled = False
+
+    def enable_adapter_layers(self) -> None:
+        self.adapter_layers_enabled = True
+
+
+class FakePeftModel:
+    """어댑터 로드/제거/전환 호출을 기록하는 `PeftModel` 대역."""
+
+    def __init__(self) -> None:
+        self.peft_config = {"default": {}}
+        self.active_adapter = "default"
+        self.base_model = FakeBaseModel()
+        self.calls: list[tuple[str, str]] = []
+
+    def load_adapter(self, path: str, adapter_name: str) -> None:
+        self.calls.append(("load", adapter_name))
+        self.peft_config[adapter_name] = {"path": path}
+
+    def delete_adapter(self, adapter_name: str) -> None:
+        self.calls.append(("delete", adapter_name))
+        del self.peft_config[adapter_name]
+
+    def set_adapter(self, adapter_name: str) -> None:
+        self.calls.append(("set", adapter_name))
+        self.active_adapter = adapter_name
+
+
+def _adapter_dir(tmp_path, name):
+    path = tmp_path / name
+    path.mkdir()
+    (path / "adapter_config.json").write_text(json.dumps({"r": 8}))
+    return str(path)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = AdapterRegistry(FakePeftModel(), max_loaded=3, pinned=["default"])
+    for name in ("a", "b", "c"):
+        registry.register(name, _adapter_dir(tmp_path, name))
+    return registry
+
+
+def test_register_requires_adapter_config(registry, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        registry.register("missing", str(tmp_path))
+    with pytest.raises(KeyError):
+        with registry.use("missing"):
+            pass
+
+
+def test_lru_eviction(registry):
+    with registry.use("a"):
+        pass
+    with registry.use("b"):
+        pass
+    # "a"를 최근 사용으로 갱신
+    with registry.use("a") as model:
+        assert model.active_adapter == "a"
+
+    # 자리가 없으면 가장 오래 사용되지 않은 "b"를 제거 (고정된 default는 유지)
+    with registry.use("c"):
+        pass
+
+    assert registry.loaded_adapters == ["default", "a", "c"]
+    assert ("delete", "b") in registry.model.calls
+    assert registry.metrics.evictions == 1
+    assert registry.metrics.loads == 3
+    # 제거된 어댑터는 다시 사용할 때 재로드
+    with registry.use("b"):
+        pass
+    assert registry.loaded_adapters == ["default", "c", "b"]
+    assert registry.metrics.loads == 4
+
+
+def test_active_and_in_use_adapters_are_not_evicted(registry):
+    with registry.use("a"):
+        with pytest.raises(ValueError, match="a"):
+            registry.evict("a")
+    with pytest.raises(ValueError, match="default"):
+        registry.evict("default")
+
+
+def test_use_many_loads_all_and_keeps_them(registry):
+    with registry.use("a"):
+        pass
+    # 활성 어댑터는 제거 대상이 아니므로 default로 되돌림
+    with registry.use("default"):
+        pass
+
+    with registry.use_many(["b", "c", "b", BASE_ADAPTER]) as model:
+        # 배치의 어댑터는 모두 로드되고, 자리를 위해 "a"가 제거됨
+        assert set(model.peft_config) == {"default", "b", "c"}
+        # 배치에서 사용 중인 어댑터는 제거할 수 없음
+        with pytest.raises(ValueError):
+            registry.evict("b")
+
+    registry.evict("b")
+    assert registry.loaded_adapters == ["default", "c"]
+    assert registry.metrics.requests == {"a": 1, "default": 1, "b": 1, "c": 1}
+
+
+def test_use_many_rejects_too_many_adapters(registry):
+    with pytest.raises(ValueError, match="max_loaded"):
+        with registry.use_many(["a", "b", "c", "default"]):
+            pass
+
+
+def test_use_many_leaves_base_mode(registry):
+    with registry.use(BASE_ADAPTER) as model:
+        assert not model.base_model.adapter_layers_enabled
+
+    with registry.use_many(["a"]) as model:
+        assert model.base_model.adapter_layers_enabled
+        assert registry.active_adapter == "a"
+
+
+def test_use_many_base_rows_stay_in_base_mode():
+    model = FakePeftModel()
+    model.peft_config = {}
+    registry = AdapterRegistry(model, max_loaded=2)
+    with registry.use(BASE_ADAPTER):
+        pass
+
+    with registry.use_many([BASE_ADAPTER, BASE_ADAPTER]) as model:
+        assert not model.base_model.adapter_layers_enabled
+        assert registry.active_adapter == BASE_ADAPTER
+    assert model.calls == []
+
+
+def test_switch_waits_for_requests_on_other_adapter(registry):
+    entered = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def hold_a() -> None:
+        with registry.use("a"):
+            entered.set()
+            release.wait(5)
+            order.append("a done")
+
+    def use_b() -> None:
+        with registry.use("b"):
+            order.append("b")
+
+    holder = threading.Thread(target=hold_a)
+    holder.start()
+    entered.wait(5)
+    waiter = threading.Thread(target=use_b)
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()
+
+    release.set()
+    holder.join(5)
+    waiter.join(5)
+    assert order == ["a done", "b"]
+
+
+class FakeQLoRAService:
+    def __init__(self, registry: AdapterRegistry) -> None:
+        self.adapters = registry
+
+    @property
+    def adapter_stats(self):
+        return self.adapters.stats()
+
+    def register_adapter(self, name: str, path: str) -> None:
+        self.adapters.register(name, path)
+
+
+@pytest.fixture
+def client(registry):
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.core import deps
+    from app.routers import chat_router
+
+    app = FastAPI()
+    app.include_router(chat_router)
+    deps.set_qlora_service(FakeQLoRAService(registry))
+    yield TestClient(app)
+    deps.reset_qlora_service()
+
+
+def test_adapter_endpoints(client, tmp_path):
+    response = client.post(
+        "/api/qlora/adapters",
+        json={"name": "d", "path": _adapter_dir(tmp_path, "d")},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"status": "registered", "name": "d"}
+
+    response = client.post(
+        "/api/qlora/adapters", json={"name": "e", "path": str(tmp_path / "missing")}
+    )
+    assert response.status_code == 400
+
+    stats = client.get("/api/qlora/adapters").json()
+    assert stats["registered_adapters"] == ["a", "b", "c", "d", "default"]
+    assert stats["loaded_adapters"] == ["default"]
+    assert stats["max_loaded"] == 3
+
+
+def test_adapter_endpoints_without_service():
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.core import deps
+    from app.routers import chat_router
+
+    app = FastAPI()
+    app.include_router(chat_router)
+    deps.reset_qlora_service()
+
+    assert TestClient(app).get("/api/qlora/adapters").status_code == 503
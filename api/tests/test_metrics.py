@@ -0,0 +1,65 @@
+"""메트릭 및 요청 미들웨어 테스트."""
+
+import asyncio
+from itertools import cycle
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from app.core import metrics
+from app.core.config import settings
+from app.services.rag import RAGService
+
+
+def _count(histogram: metrics.Histogram, **labels: str) -> int:
+    key = tuple(labels.get(n, "") for n in histogram.labelnames)
+    series = histogram._series.get(key)
+    return sum(series[0]) if series is not None else 0
+
+
+def test_achat_records_time_to_first_token():
+    llm = GenericFakeChatModel(messages=cycle([AIMessage(content="안녕 하세요 반갑습니다")]))
+    service = RAGService(vectorstore=None, llm=llm)
+    ttft_before = _count(metrics.TIME_TO_FIRST_TOKEN, service=settings.LLM_PROVIDER)
+    tps_before = _count(metrics.TOKENS_PER_SECOND, service=settings.LLM_PROVIDER)
+
+    response = asyncio.run(service.achat("hi"))
+
+    assert response == "안녕 하세요 반갑습니다"
+    assert _count(metrics.TIME_TO_FIRST_TOKEN, service=settings.LLM_PROVIDER) == (
+        ttft_before + 1
+    )
+    assert _count(metrics.TOKENS_PER_SECOND, service=settings.LLM_PROVIDER) == (
+        tps_before + 1
+    )
+
+
+def test_unmatched_routes_share_one_label():
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.add_middleware(metrics.RequestContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    response = client.get("/items/1", headers={"X-Request-ID": "req-1"})
+    assert response.headers["x-request-id"] == "req-1"
+    for i in range(3):
+        assert client.get(f"/scan/{i}.php").status_code == 404
+
+    rendered = metrics.render_metrics()
+    assert 'path="/items/{item_id}"' in rendered
+    assert f'path="{metrics.UNMATCHED_ROUTE}"' in rendered
+    assert "/scan/" not in rendered
+    assert _count(
+        metrics.HTTP_REQUEST_DURATION,
+        method="GET",
+        path=metrics.UNMATCHED_ROUTE,
+        status="404",
+    ) >= 3
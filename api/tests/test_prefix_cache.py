@@ -0,0 +1,104 @@
+"""프리픽스 KV 캐시 테스트 (CPU, 작은 무작위 모델)."""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from app.llm.prefix_cache import PrefixKVCache, generate_with_prefix_cache  # noqa: E402
+
+
+def _past(model, token_ids):
+    with torch.no_grad():
+        return model(torch.tensor([token_ids]), use_cache=True).past_key_values
+
+
+def _layer_tensors(past):
+    """KV 캐시의 모든 텐서를 복사해 비교용으로 반환합니다."""
+    if hasattr(past, "layers"):
+        return [t.clone() for layer in past.layers for t in (layer.keys, layer.values)]
+    return [t.clone() for layer in past for t in layer]
+
+
+def test_lookup_longest_prefix_across_blocks(tiny_model):
+    cache = PrefixKVCache(max_entries=4, block_size=4)
+    prompt = list(range(3, 14))  # 11 토큰 -> 마지막 토큰 제외 2블록(8토큰) 저장
+    cache.store(prompt, _past(tiny_model, prompt))
+
+    # 첫 블록만 공유
+    length, past = cache.lookup(prompt[:6] + [40, 41, 42])
+    assert length == 4
+    assert past.get_seq_length() == 4
+    # 두 블록 모두 공유 (블록 경계를 넘어 가장 긴 프리픽스)
+    length, past = cache.lookup(prompt[:9] + [40])
+    assert length == 8
+    assert past.get_seq_length() == 8
+    # 마지막 토큰은 모델이 직접 처리해야 하므로 8토큰 프롬프트는 1블록만 재사용
+    assert cache.lookup(prompt[:8])[0] == 4
+    # 첫 블록이 다르면 적중 없음
+    assert cache.lookup([40] + prompt[1:]) == (0, None)
+    # 네임스페이스가 다르면 적중 없음
+    assert cache.lookup(prompt, namespace="adapter")[0] == 0
+
+    assert cache.stats.lookups == 5
+    assert cache.stats.hits == 3
+    assert cache.stats.reused_tokens == 16
+
+
+def test_lru_eviction(tiny_model):
+    cache = PrefixKVCache(max_entries=2, block_size=4)
+    prompts = [[i] * 5 for i in (3, 4, 5)]
+    cache.store(prompts[0], _past(tiny_model, prompts[0]))
+    cache.store(prompts[1], _past(tiny_model, prompts[1]))
+    # 첫 항목을 최근 사용으로 갱신 -> 다음 저장 시 두 번째 항목이 제거됨
+    assert cache.lookup(prompts[0])[0] == 4
+
+    cache.store(prompts[2], _past(tiny_model, prompts[2]))
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.lookup(prompts[1]) == (0, None)
+    assert cache.lookup(prompts[0])[0] == 4
+    assert cache.lookup(prompts[2])[0] == 4
+
+
+def test_cached_generation_matches_uncached(tiny_model):
+    cache = PrefixKVCache(max_entries=4, block_size=4)
+    shared = list(range(3, 13))
+    kwargs = {"max_new_tokens": 6, "do_sample": False, "pad_token_id": 0}
+
+    for suffix in ([20, 21], [20, 21], [30, 31, 32]):
+        input_ids = torch.tensor([shared + suffix])
+        inputs = {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
+        expected = tiny_model.generate(**inputs, **kwargs)
+
+        sequences = generate_with_prefix_cache(tiny_model, inputs, cache, **kwargs)
+
+        assert torch.equal(sequences, expected)
+
+    # 두 번째/세 번째 요청은 공유 프리픽스를 재사용
+    assert cache.stats.hits == 2
+
+
+def test_lookup_does_not_mutate_stored_cache(tiny_model):
+    cache = PrefixKVCache(max_entries=4, block_size=4)
+    prompt = list(range(3, 12))
+    cache.store(prompt, _past(tiny_model, prompt))
+    stored = cache._entries[next(iter(cache._entries))][1]
+    snapshot = _layer_tensors(stored)
+
+    _, past = cache.lookup(prompt)
+    # 반환된 복사본을 사용한 생성은 캐시를 제자리에서 확장합니다
+    input_ids = torch.tensor([prompt])
+    tiny_model.generate(
+        input_ids=input_ids,
+        attention_mask=torch.ones_like(input_ids),
+        past_key_values=past,
+        max_new_tokens=3,
+        do_sample=False,
+        pad_token_id=0,
+    )
+
+    assert past.get_seq_length() > 8
+    assert stored.get_seq_length() == 8
+    for before, after in zip(snapshot, _layer_tensors(stored)):
+        assert torch.equal(before, after)
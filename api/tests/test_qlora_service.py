@@ -0,0 +1,70 @@
+"""QLoRA 서비스 테스트 (CPU, 작은 무작위 모델)."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("torch")
+
+from app.services.rag import QLoRAService  # noqa: E402
+
+
+def test_tokenize_pads_left_without_changing_tokenizer(tiny_tokenizer):
+    service = QLoRAService(model_path="unused", device="cpu")
+    service.tokenizer = tiny_tokenizer
+
+    inputs = service._tokenize(["w1 w2 w3", "w4"])
+
+    assert inputs["input_ids"].tolist() == [[4, 5, 6], [0, 0, 7]]
+    assert inputs["attention_mask"].tolist() == [[1, 1, 1], [0, 0, 1]]
+    # 학습 후 저장되는 토크나이저는 오른쪽 패딩을 유지해야 함
+    assert tiny_tokenizer.padding_side == "right"
+
+
+@pytest.fixture
+def shared_tiny_model(tiny_model, tiny_tokenizer, tmp_path, monkeypatch):
+    """LocalLLM이 로드한 것처럼 공유 모델 캐시에 등록된 작은 모델."""
+    import torch
+
+    from app.llm import model_cache
+
+    key = model_cache._cache_key(str(tmp_path), "cpu", torch.bfloat16, None, False)
+    monkeypatch.setitem(model_cache._models, key, (tiny_model, tiny_tokenizer))
+    return str(tmp_path)
+
+
+def _shared_service(model_path):
+    return QLoRAService(
+        model_path=model_path,
+        device="cpu",
+        target_modules=["c_attn"],
+        share_base_model=True,
+    )
+
+
+def test_shared_model_must_already_be_loaded(tmp_path):
+    pytest.importorskip("peft")
+    service = _shared_service(str(tmp_path))
+
+    with pytest.raises(LookupError, match="공유할 베이스 모델"):
+        service._load_model()
+
+
+def test_base_model_guard_blocks_wrapping(shared_tiny_model):
+    pytest.importorskip("peft")
+    from app.services.adapter_registry import BASE_ADAPTER
+
+    service = _shared_service(shared_tiny_model)
+    loader = threading.Thread(target=service._load_model)
+
+    # 감싸기 전에 시작한 생성이 끝날 때까지 모델을 감싸지 않음
+    with service.base_model_guard():
+        loader.start()
+        loader.join(timeout=0.2)
+        assert loader.is_alive()
+        assert service.adapters is None
+    loader.join(timeout=10)
+
+    assert service.adapters is not None
+    with service.base_model_guard():
+        assert service.adapters.active_adapter == BASE_ADAPTER
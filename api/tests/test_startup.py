@@ -0,0 +1,117 @@
+"""시작 오케스트레이터 및 준비 상태 게이팅 테스트."""
+
+import asyncio
+
+import pytest
+
+from app.core.startup import ComponentStatus, StartupOrchestrator
+
+
+class FlakyInitializer:
+    """처음 `failures`번은 실패하고 이후 성공하는 초기화 함수."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self) -> None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            msg = "connection refused"
+            raise RuntimeError(msg)
+
+
+def test_failed_component_is_retried_on_demand():
+    async def main() -> None:
+        orchestrator = StartupOrchestrator(retry_interval=0)
+        init_db = FlakyInitializer(failures=2)
+        init_service = FlakyInitializer(failures=0)
+        orchestrator.register("db", init_db)
+        orchestrator.register("service", init_service, depends_on=["db"])
+        await orchestrator.run()
+
+        assert orchestrator.status("db") == ComponentStatus.FAILED
+        assert orchestrator.status("service") == ComponentStatus.FAILED
+        assert init_service.calls == 0
+
+        # 아직 DB가 내려가 있음
+        assert not await orchestrator.ensure_ready("service")
+        # DB가 복구되면 의존 컴포넌트와 함께 준비 완료
+        assert await orchestrator.ensure_ready("service")
+        assert orchestrator.status("db") == ComponentStatus.READY
+        assert orchestrator.snapshot()["db"]["error"] is None
+        assert init_db.calls == 3
+        assert init_service.calls == 1
+
+    asyncio.run(main())
+
+
+def test_retries_are_throttled_and_coalesced():
+    async def main() -> None:
+        orchestrator = StartupOrchestrator(retry_interval=60)
+        init_db = FlakyInitializer(failures=1)
+        orchestrator.register("db", init_db)
+        await orchestrator.run()
+
+        # 마지막 시도 직후에는 재시도하지 않음
+        assert not await orchestrator.ensure_ready("db")
+        assert init_db.calls == 1
+
+        orchestrator.retry_interval = 0
+        results = await asyncio.gather(
+            *(orchestrator.ensure_ready("db") for _ in range(5))
+        )
+        assert all(results)
+        assert init_db.calls == 2
+
+    asyncio.run(main())
+
+
+def test_chat_recovers_when_db_comes_up_after_boot(monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app import main
+    from app.core import deps
+    from app.routers import chat, chat_router
+
+    store = object()
+    db_up = False
+
+    def get_vectorstore():
+        return store if db_up else None
+
+    class FakeRAGService:
+        def __init__(self, vectorstore) -> None:
+            assert vectorstore is store
+
+        async def achat(self, message: str) -> str:
+            return f"echo: {message}"
+
+    monkeypatch.setattr(main, "get_vectorstore", get_vectorstore)
+    monkeypatch.setattr(chat, "get_vectorstore", get_vectorstore)
+    monkeypatch.setattr(chat, "RAGService", FakeRAGService)
+
+    orchestrator = StartupOrchestrator(retry_interval=0)
+    orchestrator.register("vectorstore", main._init_vectorstore)
+    orchestrator.register("llm", lambda: None)
+    asyncio.run(orchestrator.run())
+    assert orchestrator.status("vectorstore") == ComponentStatus.FAILED
+
+    app = FastAPI()
+    app.include_router(chat_router)
+    deps.set_orchestrator(orchestrator)
+    try:
+        client = TestClient(app)
+        response = client.post("/api/chat", json={"message": "hi"})
+        assert response.status_code == 503
+        assert "vectorstore" in response.json()["detail"]
+
+        db_up = True
+        response = client.post("/api/chat", json={"message": "hi"})
+        assert response.status_code == 200
+        assert response.json()["response"] == "echo: hi"
+        assert orchestrator.status("vectorstore") == ComponentStatus.READY
+    finally:
+        deps.reset_orchestrator()
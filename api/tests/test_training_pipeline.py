@@ -0,0 +1,181 @@
+"""학습 데이터 파이프라인 테스트 (CPU, 작은 무작위 모델)."""
+
+from contextlib import contextmanager
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from app.services.training_pipeline import (  # noqa: E402
+    DynamicPaddingCollator,
+    PackedSequenceCollator,
+    PaddingStrategy,
+    StepLockCallback,
+    ThroughputCallback,
+    pack_sequences,
+    prepare_training_data,
+)
+
+TEXTS = [" ".join(f"w{i % 61}" for i in range(n)) for n in (3, 11, 6, 2, 9, 5, 1)]
+
+
+def test_pack_sequences_first_fit_decreasing():
+    sequences = [[7] * n for n in (5, 9, 2, 7, 3, 4, 12)]
+
+    packs = pack_sequences(sequences, max_seq_length=10)
+
+    assert all(sum(len(seq) for seq in pack) <= 10 for pack in packs)
+    # 가장 긴 예제부터 배치되고, 최대 길이를 넘는 예제는 잘림
+    assert [len(seq) for seq in packs[0]] == [10]
+    assert [[len(seq) for seq in pack] for pack in packs[1:]] == [
+        [9],
+        [7, 3],
+        [5, 4],
+        [2],
+    ]
+    assert sorted(len(seq) for pack in packs for seq in pack) == [2, 3, 4, 5, 7, 9, 10]
+
+
+def test_dynamic_padding_labels():
+    collator = DynamicPaddingCollator(pad_token_id=0, pad_to_multiple_of=4)
+
+    batch = collator([{"input_ids": [5, 6, 7, 8, 9]}, {"input_ids": [5, 6]}])
+
+    assert batch["input_ids"].shape == (2, 8)
+    assert batch["labels"].tolist() == [
+        [5, 6, 7, 8, 9, -100, -100, -100],
+        [5, 6, -100, -100, -100, -100, -100, -100],
+    ]
+    assert batch["attention_mask"].sum().item() == 7
+    assert collator.stats.real_tokens == 7
+    assert collator.stats.padded_tokens == 9
+
+
+def test_padding_never_exceeds_max_length():
+    collator = DynamicPaddingCollator(pad_token_id=0, pad_to_multiple_of=8, max_length=10)
+
+    batch = collator([{"input_ids": [5] * 9}, {"input_ids": [5] * 3}])
+
+    assert batch["input_ids"].shape == (2, 10)
+
+
+def test_max_length_mode_masks_pad_labels():
+    collator = DynamicPaddingCollator(
+        pad_token_id=0, pad_to_multiple_of=6, max_length=6, mask_pad_token_labels=True
+    )
+
+    batch = collator([{"input_ids": [5, 6, 0]}, {"input_ids": [7]}])
+
+    assert batch["labels"].tolist() == [
+        [5, 6, -100, -100, -100, -100],
+        [7, -100, -100, -100, -100, -100],
+    ]
+
+
+def test_packed_mask_isolates_sequences(tiny_model):
+    first, second = [5, 6, 7, 8], [9, 10, 11]
+    collator = PackedSequenceCollator(pad_token_id=0, pad_to_multiple_of=8)
+
+    batch = collator([{"input_ids": first + second, "seq_lens": [4, 3]}])
+
+    allowed = batch["attention_mask"][0, 0] == 0
+    # 두 번째 예제는 첫 번째 예제를 볼 수 없고, 그 반대도 마찬가지
+    assert not allowed[4:7, :4].any()
+    assert not allowed[:4, 4:].any()
+    assert allowed[4:7, 4:7].equal(torch.ones(3, 3, dtype=torch.bool).tril())
+    assert batch["position_ids"][0].tolist() == [0, 1, 2, 3, 0, 1, 2, 0]
+    # 패딩과 각 예제의 첫 토큰은 손실에서 제외
+    assert batch["labels"][0].tolist() == [-100, 6, 7, 8, -100, 10, 11, -100]
+
+    # 패킹된 두 번째 예제의 로짓은 단독으로 실행한 결과와 같아야 함
+    with torch.no_grad():
+        packed = tiny_model(
+            input_ids=batch["input_ids"],
+            attention_mask=batch["attention_mask"],
+            position_ids=batch["position_ids"],
+        ).logits
+        alone = tiny_model(input_ids=torch.tensor([second])).logits
+    assert torch.allclose(packed[0, 4:7], alone[0], atol=1e-5)
+
+
+@pytest.mark.parametrize("strategy", list(PaddingStrategy))
+def test_training_step_on_cpu(tiny_model, tiny_tokenizer, tmp_path, strategy):
+    datasets = pytest.importorskip("datasets")
+    from transformers import Trainer, TrainingArguments
+
+    prepared = prepare_training_data(
+        tiny_tokenizer, TEXTS, max_seq_length=16, padding_strategy=strategy
+    )
+    args = TrainingArguments(
+        output_dir=str(tmp_path),
+        max_steps=2,
+        per_device_train_batch_size=2,
+        learning_rate=1e-3,
+        report_to="none",
+        remove_unused_columns=False,
+        use_cpu=True,
+        save_strategy="no",
+        **prepared.training_arguments,
+    )
+    trainer = Trainer(
+        model=tiny_model.train(),
+        args=args,
+        train_dataset=datasets.Dataset.from_list(prepared.records),
+        data_collator=prepared.collator,
+        callbacks=[ThroughputCallback(prepared.stats)],
+    )
+    before = [p.detach().clone() for p in tiny_model.parameters()]
+
+    result = trainer.train()
+
+    assert torch.isfinite(torch.tensor(result.training_loss))
+    assert any(
+        not torch.equal(b, p.detach()) for b, p in zip(before, tiny_model.parameters())
+    )
+    stats = prepared.stats
+    assert stats.batches >= 2
+    assert stats.train_seconds > 0
+    if strategy == PaddingStrategy.PACKING:
+        assert stats.padding_ratio < 0.5
+
+
+def test_step_lock_is_held_only_during_steps(tiny_model, tiny_tokenizer, tmp_path):
+    datasets = pytest.importorskip("datasets")
+    from transformers import Trainer, TrainingArguments
+
+    events = []
+
+    @contextmanager
+    def lock():
+        events.append("enter")
+        yield
+        events.append("exit")
+
+    prepared = prepare_training_data(
+        tiny_tokenizer, TEXTS, max_seq_length=16, padding_strategy=PaddingStrategy.DYNAMIC
+    )
+    args = TrainingArguments(
+        output_dir=str(tmp_path),
+        max_steps=2,
+        per_device_train_batch_size=1,
+        gradient_accumulation_steps=2,
+        report_to="none",
+        remove_unused_columns=False,
+        use_cpu=True,
+        save_strategy="no",
+    )
+    step_lock = StepLockCallback(lock)
+    trainer = Trainer(
+        model=tiny_model.train(),
+        args=args,
+        train_dataset=datasets.Dataset.from_list(prepared.records),
+        data_collator=prepared.collator,
+        callbacks=[step_lock],
+    )
+
+    trainer.train()
+    step_lock.release()
+
+    # 그래디언트 누적 스텝 전체를 한 번에 점유하고, 스텝 사이에는 놓아줌
+    assert events == ["enter", "exit"] * 2
@@ -37,7 +37,9 @@ from langchain_core.tracers.context import (
     _tracing_v2_is_enabled,
     tracing_v2_callback_var,
 )
+from langchain_core.tracers.core import _TracerCore
 from langchain_core.tracers.langchain import LangChainTracer
+from langchain_core.tracers.sampling import TRACE_SAMPLE_KEY, new_sample_value
 from langchain_core.tracers.stdout import ConsoleCallbackHandler
 from langchain_core.utils.env import env_var_is_set
 from langchain_core.utils.uuid import uuid7
@@ -2472,6 +2474,13 @@ def _configure(
                 for handler in callback_manager.handlers
             ):
                 callback_manager.add_handler(var_handler, inheritable)
+    # Draw the sample value of a new trace once, so that all nested runs inherit
+    # the same sampling decision.
+    if TRACE_SAMPLE_KEY not in callback_manager.inheritable_metadata and any(
+        isinstance(handler, _TracerCore) and handler.sampler is not None
+        for handler in callback_manager.handlers
+    ):
+        callback_manager.add_metadata({TRACE_SAMPLE_KEY: new_sample_value()})
     return callback_manager
 
 
@@ -13,10 +13,39 @@ from langchain_core.messages import (
     HumanMessage,
     get_buffer_string,
 )
+from langchain_core.messages.utils import count_tokens_approximately
 from langchain_core.runnables.config import run_in_executor
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+
+
+def _select_recent_messages(
+    messages: Sequence[BaseMessage],
+    k: int | None,
+    max_tokens: int | None,
+    token_counter: Callable[[Sequence[BaseMessage]], int] | None,
+) -> list[BaseMessage]:
+    """Select the longest suffix of `messages` that fits in the given window.
+
+    Only the selected messages (plus the one that overflows the token budget) are
+    visited, so the cost is proportional to the window rather than the history.
+    """
+    if k is not None:
+        if k <= 0:
+            return []
+        messages = messages[-k:]
+    if max_tokens is None:
+        return list(messages)
+    counter = token_counter or count_tokens_approximately
+    total = 0
+    start = len(messages)
+    while start > 0:
+        total += counter([messages[start - 1]])
+        if total > max_tokens:
+            break
+        start -= 1
+    return list(messages[start:])
 
 
 class BaseChatMessageHistory(ABC):
@@ -32,6 +61,17 @@ class BaseChatMessageHistory(ABC):
     * aget_messages: async variant for getting messages
     * clear: sync variant for clearing messages
     * aclear: async variant for clearing messages
+    * get_recent_messages: sync variant for getting a bounded window of the most
+        recent messages
+    * aget_recent_messages: async variant for getting a bounded window of the most
+        recent messages
+    * get_message_count: sync variant for getting the number of stored messages
+    * aget_message_count: async variant for getting the number of stored messages
+
+    The windowed and count methods have default implementations based on `messages`,
+    so they still load the whole history. Implementations backed by a persistence
+    layer can over-ride them to read less, e.g. with a `LIMIT` query or a stored
+    counter.
 
     add_messages contains a default implementation that calls add_message
     for each message in the sequence. This is provided for backwards compatibility
@@ -111,6 +151,79 @@ class BaseChatMessageHistory(ABC):
         """
         return await run_in_executor(None, lambda: self.messages)
 
+    def get_recent_messages(
+        self,
+        k: int | None = None,
+        *,
+        max_tokens: int | None = None,
+        token_counter: Callable[[Sequence[BaseMessage]], int] | None = None,
+    ) -> list[BaseMessage]:
+        """Get a bounded window of the most recent messages, oldest first.
+
+        The default implementation loads all `messages` and slices them. Can
+        over-ride this method to read only the window from the underlying
+        persistence layer.
+
+        Args:
+            k: Maximum number of messages to return. If `None`, the number of
+                messages is not limited.
+            max_tokens: Maximum total number of tokens of the returned messages. The
+                window is the longest suffix of the history that fits the budget. If
+                `None`, the number of tokens is not limited.
+            token_counter: Function that counts the tokens of a list of messages.
+                Defaults to `count_tokens_approximately`.
+
+        Returns:
+            The most recent messages.
+        """
+        return _select_recent_messages(self.messages, k, max_tokens, token_counter)
+
+    async def aget_recent_messages(
+        self,
+        k: int | None = None,
+        *,
+        max_tokens: int | None = None,
+        token_counter: Callable[[Sequence[BaseMessage]], int] | None = None,
+    ) -> list[BaseMessage]:
+        """Async version of getting a bounded window of the most recent messages.
+
+        Args:
+            k: Maximum number of messages to return. If `None`, the number of
+                messages is not limited.
+            max_tokens: Maximum total number of tokens of the returned messages. If
+                `None`, the number of tokens is not limited.
+            token_counter: Function that counts the tokens of a list of messages.
+                Defaults to `count_tokens_approximately`.
+
+        Returns:
+            The most recent messages.
+        """
+        return await run_in_executor(
+            None,
+            lambda: self.get_recent_messages(
+                k, max_tokens=max_tokens, token_counter=token_counter
+            ),
+        )
+
+    def get_message_count(self) -> int:
+        """Get the number of messages in the store.
+
+        The count is also the append cursor of the history: the index that the
+        next added message will have.
+
+        Returns:
+            The number of messages.
+        """
+        return len(self.messages)
+
+    async def aget_message_count(self) -> int:
+        """Async version of getting the number of messages in the store.
+
+        Returns:
+            The number of messages.
+        """
+        return await run_in_executor(None, self.get_message_count)
+
     def add_user_message(self, message: HumanMessage | str) -> None:
         """Convenience method for adding a human message string to the store.
 
@@ -220,6 +333,38 @@ class InMemoryChatMessageHistory(BaseChatMessageHistory, BaseModel):
         """
         return self.messages
 
+    async def aget_recent_messages(
+        self,
+        k: int | None = None,
+        *,
+        max_tokens: int | None = None,
+        token_counter: Callable[[Sequence[BaseMessage]], int] | None = None,
+    ) -> list[BaseMessage]:
+        """Async version of getting a bounded window of the most recent messages.
+
+        Args:
+            k: Maximum number of messages to return. If `None`, the number of
+                messages is not limited.
+            max_tokens: Maximum total number of tokens of the returned messages. If
+                `None`, the number of tokens is not limited.
+            token_counter: Function that counts the tokens of a list of messages.
+                Defaults to `count_tokens_approximately`.
+
+        Returns:
+            The most recent messages.
+        """
+        return self.get_recent_messages(
+            k, max_tokens=max_tokens, token_counter=token_counter
+        )
+
+    async def aget_message_count(self) -> int:
+        """Async version of getting the number of messages in the store.
+
+        Returns:
+            The number of messages.
+        """
+        return len(self.messages)
+
     def add_message(self, message: BaseMessage) -> None:
         """Add a self-created message to the store.
 
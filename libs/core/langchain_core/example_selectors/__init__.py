@@ -14,6 +14,7 @@ if TYPE_CHECKING:
         LengthBasedExampleSelector,
     )
     from langchain_core.example_selectors.semantic_similarity import (
+        LengthBasedSemanticSimilarityExampleSelector,
         MaxMarginalRelevanceExampleSelector,
         SemanticSimilarityExampleSelector,
         sorted_values,
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
 __all__ = (
     "BaseExampleSelector",
     "LengthBasedExampleSelector",
+    "LengthBasedSemanticSimilarityExampleSelector",
     "MaxMarginalRelevanceExampleSelector",
     "SemanticSimilarityExampleSelector",
     "sorted_values",
@@ -30,6 +32,7 @@ __all__ = (
 _dynamic_imports = {
     "BaseExampleSelector": "base",
     "LengthBasedExampleSelector": "length_based",
+    "LengthBasedSemanticSimilarityExampleSelector": "semantic_similarity",
     "MaxMarginalRelevanceExampleSelector": "semantic_similarity",
     "SemanticSimilarityExampleSelector": "semantic_similarity",
     "sorted_values": "semantic_similarity",
@@ -1,9 +1,11 @@
 """Select examples based on length."""
 
 import re
+from bisect import bisect_left
 from collections.abc import Callable
+from itertools import accumulate
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from typing_extensions import Self
 
 from langchain_core.example_selectors.base import BaseExampleSelector
@@ -32,6 +34,14 @@ class LengthBasedExampleSelector(BaseExampleSelector, BaseModel):
     example_text_lengths: list[int] = Field(default_factory=list)
     """Length of each example."""
 
+    _cumulative_lengths: list[int] = PrivateAttr(default_factory=list)
+
+    def _get_cumulative_lengths(self) -> list[int]:
+        # Rebuilt if `example_text_lengths` was changed outside of `add_example`
+        if len(self._cumulative_lengths) != len(self.example_text_lengths):
+            self._cumulative_lengths = list(accumulate(self.example_text_lengths))
+        return self._cumulative_lengths
+
     def add_example(self, example: dict[str, str]) -> None:
         """Add new example to list.
 
@@ -39,9 +49,14 @@ class LengthBasedExampleSelector(BaseExampleSelector, BaseModel):
             example: A dictionary with keys as input variables
                 and values as their values.
         """
+        cumulative_lengths = self._get_cumulative_lengths()
         self.examples.append(example)
         string_example = self.example_prompt.format(**example)
-        self.example_text_lengths.append(self.get_text_length(string_example))
+        length = self.get_text_length(string_example)
+        self.example_text_lengths.append(length)
+        cumulative_lengths.append(
+            cumulative_lengths[-1] + length if cumulative_lengths else length
+        )
 
     async def aadd_example(self, example: dict[str, str]) -> None:
         """Async add new example to list.
@@ -73,16 +88,17 @@ class LengthBasedExampleSelector(BaseExampleSelector, BaseModel):
         """
         inputs = " ".join(input_variables.values())
         remaining_length = self.max_length - self.get_text_length(inputs)
-        i = 0
-        examples = []
-        while remaining_length > 0 and i < len(self.examples):
-            new_length = remaining_length - self.example_text_lengths[i]
-            if new_length < 0:
-                break
-            examples.append(self.examples[i])
-            remaining_length = new_length
+        if remaining_length <= 0:
+            return []
+        # The examples are added in order while they fit, so the selection is
+        # the longest prefix whose total length fits in the remaining length.
+        cumulative_lengths = self._get_cumulative_lengths()
+        hi = min(len(self.examples), len(cumulative_lengths))
+        i = bisect_left(cumulative_lengths, remaining_length, hi=hi)
+        # Selection stops as soon as there is no length left
+        if i < hi and cumulative_lengths[i] == remaining_length:
             i += 1
-        return examples
+        return self.examples[:i]
 
     async def aselect_examples(self, input_variables: dict[str, str]) -> list[dict]:
         """Async select which examples to use based on the input lengths.
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from langchain_core.example_selectors.base import BaseExampleSelector
+from langchain_core.example_selectors.length_based import _get_length_based
+from langchain_core.prompts.prompt import PromptTemplate
 from langchain_core.vectorstores import VectorStore
 
 if TYPE_CHECKING:
@@ -42,12 +46,81 @@ class _VectorStoreExampleSelector(BaseExampleSelector, BaseModel, ABC):
     the input variables instead of all variables."""
     vectorstore_kwargs: dict[str, Any] | None = None
     """Extra arguments passed to similarity_search function of the `VectorStore`."""
+    query_cache_size: int = 0
+    """Max number of input embeddings to cache, least recently used evicted first.
+
+    If positive, the inputs are embedded with the embeddings of the `VectorStore`
+    and searched by vector, so an input seen recently is not embedded again. This
+    requires a `VectorStore` that exposes its `embeddings` and supports search by
+    vector, such as `InMemoryVectorStore`. If the `VectorStore` has no embeddings,
+    the inputs are searched by text.
+    """
+
+    _query_embeddings: dict[str, list[float]] = PrivateAttr(default_factory=dict)
+    # Selectors are shared between threads, e.g. by a prompt used in a batch
+    _query_embeddings_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
     )
 
+    def _get_cached_query_embedding(self, query: str) -> list[float] | None:
+        with self._query_embeddings_lock:
+            embedding = self._query_embeddings.pop(query, None)
+            if embedding is not None:
+                # Move to the end, as the most recently used
+                self._query_embeddings[query] = embedding
+        return embedding
+
+    def _cache_query_embedding(self, query: str, embedding: list[float]) -> None:
+        with self._query_embeddings_lock:
+            self._query_embeddings[query] = embedding
+            while len(self._query_embeddings) > self.query_cache_size:
+                del self._query_embeddings[next(iter(self._query_embeddings))]
+
+    def _embed_query(self, query: str) -> list[float] | None:
+        """Embed the query with the cache, or return `None` to search by text."""
+        embeddings = self.vectorstore.embeddings
+        if self.query_cache_size <= 0 or embeddings is None:
+            return None
+        embedding = self._get_cached_query_embedding(query)
+        if embedding is None:
+            embedding = embeddings.embed_query(query)
+            self._cache_query_embedding(query, embedding)
+        return embedding
+
+    async def _aembed_query(self, query: str) -> list[float] | None:
+        """Async embed the query with the cache, or return `None` to search by text."""
+        embeddings = self.vectorstore.embeddings
+        if self.query_cache_size <= 0 or embeddings is None:
+            return None
+        embedding = self._get_cached_query_embedding(query)
+        if embedding is None:
+            embedding = await embeddings.aembed_query(query)
+            self._cache_query_embedding(query, embedding)
+        return embedding
+
+    def _similarity_search(self, query: str, k: int) -> list[Document]:
+        vectorstore_kwargs = self.vectorstore_kwargs or {}
+        embedding = self._embed_query(query)
+        if embedding is None:
+            return self.vectorstore.similarity_search(query, k=k, **vectorstore_kwargs)
+        return self.vectorstore.similarity_search_by_vector(
+            embedding, k=k, **vectorstore_kwargs
+        )
+
+    async def _asimilarity_search(self, query: str, k: int) -> list[Document]:
+        vectorstore_kwargs = self.vectorstore_kwargs or {}
+        embedding = await self._aembed_query(query)
+        if embedding is None:
+            return await self.vectorstore.asimilarity_search(
+                query, k=k, **vectorstore_kwargs
+            )
+        return await self.vectorstore.asimilarity_search_by_vector(
+            embedding, k=k, **vectorstore_kwargs
+        )
+
     @staticmethod
     def _example_to_text(example: dict[str, str], input_keys: list[str] | None) -> str:
         if input_keys:
@@ -107,11 +180,8 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
             The selected examples.
         """
         # Get the docs with the highest similarity.
-        vectorstore_kwargs = self.vectorstore_kwargs or {}
-        example_docs = self.vectorstore.similarity_search(
-            self._example_to_text(input_variables, self.input_keys),
-            k=self.k,
-            **vectorstore_kwargs,
+        example_docs = self._similarity_search(
+            self._example_to_text(input_variables, self.input_keys), self.k
         )
         return self._documents_to_examples(example_docs)
 
@@ -125,11 +195,8 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
             The selected examples.
         """
         # Get the docs with the highest similarity.
-        vectorstore_kwargs = self.vectorstore_kwargs or {}
-        example_docs = await self.vectorstore.asimilarity_search(
-            self._example_to_text(input_variables, self.input_keys),
-            k=self.k,
-            **vectorstore_kwargs,
+        example_docs = await self._asimilarity_search(
+            self._example_to_text(input_variables, self.input_keys), self.k
         )
         return self._documents_to_examples(example_docs)
 
@@ -144,6 +211,7 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
         *,
         example_keys: list[str] | None = None,
         vectorstore_kwargs: dict | None = None,
+        query_cache_size: int = 0,
         **vectorstore_cls_kwargs: Any,
     ) -> SemanticSimilarityExampleSelector:
         """Create k-shot example selector using example list and embeddings.
@@ -160,6 +228,7 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
             example_keys: If provided, keys to filter examples to.
             vectorstore_kwargs: Extra arguments passed to similarity_search function
                 of the `VectorStore`.
+            query_cache_size: Number of input embeddings to cache.
             vectorstore_cls_kwargs: optional kwargs containing url for vector store
 
         Returns:
@@ -175,6 +244,7 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
             input_keys=input_keys,
             example_keys=example_keys,
             vectorstore_kwargs=vectorstore_kwargs,
+            query_cache_size=query_cache_size,
         )
 
     @classmethod
@@ -188,6 +258,7 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
         *,
         example_keys: list[str] | None = None,
         vectorstore_kwargs: dict | None = None,
+        query_cache_size: int = 0,
         **vectorstore_cls_kwargs: Any,
     ) -> SemanticSimilarityExampleSelector:
         """Async create k-shot example selector using example list and embeddings.
@@ -204,6 +275,7 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
             example_keys: If provided, keys to filter examples to.
             vectorstore_kwargs: Extra arguments passed to similarity_search function
                 of the `VectorStore`.
+            query_cache_size: Number of input embeddings to cache.
             vectorstore_cls_kwargs: optional kwargs containing url for vector store
 
         Returns:
@@ -219,6 +291,7 @@ class SemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
             input_keys=input_keys,
             example_keys=example_keys,
             vectorstore_kwargs=vectorstore_kwargs,
+            query_cache_size=query_cache_size,
         )
 
 
@@ -241,11 +314,16 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
         Returns:
             The selected examples.
         """
-        example_docs = self.vectorstore.max_marginal_relevance_search(
-            self._example_to_text(input_variables, self.input_keys),
-            k=self.k,
-            fetch_k=self.fetch_k,
-        )
+        query = self._example_to_text(input_variables, self.input_keys)
+        embedding = self._embed_query(query)
+        if embedding is None:
+            example_docs = self.vectorstore.max_marginal_relevance_search(
+                query, k=self.k, fetch_k=self.fetch_k
+            )
+        else:
+            example_docs = self.vectorstore.max_marginal_relevance_search_by_vector(
+                embedding, k=self.k, fetch_k=self.fetch_k
+            )
         return self._documents_to_examples(example_docs)
 
     async def aselect_examples(self, input_variables: dict[str, str]) -> list[dict]:
@@ -257,11 +335,17 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
         Returns:
             The selected examples.
         """
-        example_docs = await self.vectorstore.amax_marginal_relevance_search(
-            self._example_to_text(input_variables, self.input_keys),
-            k=self.k,
-            fetch_k=self.fetch_k,
-        )
+        query = self._example_to_text(input_variables, self.input_keys)
+        embedding = await self._aembed_query(query)
+        if embedding is None:
+            example_docs = await self.vectorstore.amax_marginal_relevance_search(
+                query, k=self.k, fetch_k=self.fetch_k
+            )
+        else:
+            vectorstore = self.vectorstore
+            example_docs = await vectorstore.amax_marginal_relevance_search_by_vector(
+                embedding, k=self.k, fetch_k=self.fetch_k
+            )
         return self._documents_to_examples(example_docs)
 
     @classmethod
@@ -275,6 +359,7 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
         fetch_k: int = 20,
         example_keys: list[str] | None = None,
         vectorstore_kwargs: dict | None = None,
+        query_cache_size: int = 0,
         **vectorstore_cls_kwargs: Any,
     ) -> MaxMarginalRelevanceExampleSelector:
         """Create k-shot example selector using example list and embeddings.
@@ -292,6 +377,7 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
             example_keys: If provided, keys to filter examples to.
             vectorstore_kwargs: Extra arguments passed to similarity_search function
                 of the `VectorStore`.
+            query_cache_size: Number of input embeddings to cache.
             vectorstore_cls_kwargs: optional kwargs containing url for vector store
 
         Returns:
@@ -308,6 +394,7 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
             input_keys=input_keys,
             example_keys=example_keys,
             vectorstore_kwargs=vectorstore_kwargs,
+            query_cache_size=query_cache_size,
         )
 
     @classmethod
@@ -322,6 +409,7 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
         fetch_k: int = 20,
         example_keys: list[str] | None = None,
         vectorstore_kwargs: dict | None = None,
+        query_cache_size: int = 0,
         **vectorstore_cls_kwargs: Any,
     ) -> MaxMarginalRelevanceExampleSelector:
         """Create k-shot example selector using example list and embeddings.
@@ -339,6 +427,250 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
             example_keys: If provided, keys to filter examples to.
             vectorstore_kwargs: Extra arguments passed to similarity_search function
                 of the `VectorStore`.
+            query_cache_size: Number of input embeddings to cache.
+            vectorstore_cls_kwargs: optional kwargs containing url for vector store
+
+        Returns:
+            The ExampleSelector instantiated, backed by a vector store.
+        """
+        string_examples = [cls._example_to_text(eg, input_keys) for eg in examples]
+        vectorstore = await vectorstore_cls.afrom_texts(
+            string_examples, embeddings, metadatas=examples, **vectorstore_cls_kwargs
+        )
+        return cls(
+            vectorstore=vectorstore,
+            k=k,
+            fetch_k=fetch_k,
+            input_keys=input_keys,
+            example_keys=example_keys,
+            vectorstore_kwargs=vectorstore_kwargs,
+            query_cache_size=query_cache_size,
+        )
+
+
+class LengthBasedSemanticSimilarityExampleSelector(_VectorStoreExampleSelector):
+    """Select the most similar examples that fit in a maximum prompt length.
+
+    The `fetch_k` examples most similar to the input are fetched in a single search,
+    then taken from the most similar down while they fit in `max_length`, next to
+    the input. An example that does not fit is skipped for a shorter, less similar
+    one, until `k` examples are selected.
+
+    The length of each example is computed once and reused across selections. With
+    a `get_text_length` counting tokens, `max_length` is a token budget.
+
+    Example:
+        ```python
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+        from langchain_core.example_selectors import (
+            LengthBasedSemanticSimilarityExampleSelector,
+        )
+        from langchain_core.prompts import PromptTemplate
+        from langchain_core.vectorstores import InMemoryVectorStore
+
+        selector = LengthBasedSemanticSimilarityExampleSelector.from_examples(
+            [{"input": "2 + 2", "output": "4"}, {"input": "2 * 3", "output": "6"}],
+            DeterministicFakeEmbedding(size=32),
+            InMemoryVectorStore,
+            example_prompt=PromptTemplate.from_template("{input}: {output}"),
+            max_length=100,
+            query_cache_size=128,
+        )
+        selector.select_examples({"input": "3 + 3"})
+        ```
+    """
+
+    example_prompt: PromptTemplate
+    """Prompt template used to format the examples."""
+    get_text_length: Callable[[str], int] = _get_length_based
+    """Function to measure prompt length. Defaults to word count."""
+    max_length: int = 2048
+    """Max length for the input and the selected examples."""
+    fetch_k: int = 20
+    """Number of the most similar examples to choose from."""
+
+    _example_lengths: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def _get_example_length(self, example: dict) -> int:
+        return self.get_text_length(self.example_prompt.format(**example))
+
+    def _select_within_length(
+        self, input_variables: dict[str, str], documents: list[Document]
+    ) -> list[dict]:
+        inputs = " ".join(input_variables.values())
+        remaining_length = self.max_length - self.get_text_length(inputs)
+        selected: list[dict] = []
+        for document, example in zip(
+            documents, self._documents_to_examples(documents), strict=True
+        ):
+            if len(selected) == self.k or remaining_length <= 0:
+                break
+            length = (
+                None if document.id is None else self._example_lengths.get(document.id)
+            )
+            if length is None:
+                length = self._get_example_length(example)
+                if document.id is not None:
+                    self._example_lengths[document.id] = length
+            if length <= remaining_length:
+                selected.append(example)
+                remaining_length -= length
+        return selected
+
+    def add_example(self, example: dict[str, str]) -> str:
+        """Add a new example to vectorstore.
+
+        Args:
+            example: A dictionary with keys as input variables
+                and values as their values.
+
+        Returns:
+            The ID of the added example.
+        """
+        example_id = super().add_example(example)
+        if self.example_keys:
+            example = {k: example[k] for k in self.example_keys}
+        self._example_lengths[example_id] = self._get_example_length(example)
+        return example_id
+
+    async def aadd_example(self, example: dict[str, str]) -> str:
+        """Async add a new example to vectorstore.
+
+        Args:
+            example: A dictionary with keys as input variables
+                and values as their values.
+
+        Returns:
+            The ID of the added example.
+        """
+        example_id = await super().aadd_example(example)
+        if self.example_keys:
+            example = {k: example[k] for k in self.example_keys}
+        self._example_lengths[example_id] = self._get_example_length(example)
+        return example_id
+
+    def select_examples(self, input_variables: dict[str, str]) -> list[dict]:
+        """Select the most similar examples that fit in the maximum length.
+
+        Args:
+            input_variables: The input variables to use for search.
+
+        Returns:
+            The selected examples, most similar first.
+        """
+        example_docs = self._similarity_search(
+            self._example_to_text(input_variables, self.input_keys), self.fetch_k
+        )
+        return self._select_within_length(input_variables, example_docs)
+
+    async def aselect_examples(self, input_variables: dict[str, str]) -> list[dict]:
+        """Asynchronously select the most similar examples that fit in the length.
+
+        Args:
+            input_variables: The input variables to use for search.
+
+        Returns:
+            The selected examples, most similar first.
+        """
+        example_docs = await self._asimilarity_search(
+            self._example_to_text(input_variables, self.input_keys), self.fetch_k
+        )
+        return self._select_within_length(input_variables, example_docs)
+
+    @classmethod
+    def from_examples(
+        cls,
+        examples: list[dict],
+        embeddings: Embeddings,
+        vectorstore_cls: type[VectorStore],
+        *,
+        example_prompt: PromptTemplate,
+        max_length: int = 2048,
+        get_text_length: Callable[[str], int] = _get_length_based,
+        k: int = 4,
+        fetch_k: int = 20,
+        input_keys: list[str] | None = None,
+        example_keys: list[str] | None = None,
+        vectorstore_kwargs: dict | None = None,
+        query_cache_size: int = 0,
+        **vectorstore_cls_kwargs: Any,
+    ) -> LengthBasedSemanticSimilarityExampleSelector:
+        """Create an example selector using example list and embeddings.
+
+        Args:
+            examples: List of examples to use in the prompt.
+            embeddings: An initialized embedding API interface, e.g. OpenAIEmbeddings().
+            vectorstore_cls: A vector store DB interface class, e.g.
+                InMemoryVectorStore.
+            example_prompt: Prompt template used to format the examples.
+            max_length: Max length for the input and the selected examples.
+            get_text_length: Function to measure prompt length.
+            k: Max number of examples to select.
+            fetch_k: Number of the most similar examples to choose from.
+            input_keys: If provided, the search is based on the input variables
+                instead of all variables.
+            example_keys: If provided, keys to filter examples to.
+            vectorstore_kwargs: Extra arguments passed to similarity_search function
+                of the `VectorStore`.
+            query_cache_size: Number of input embeddings to cache.
+            vectorstore_cls_kwargs: optional kwargs containing url for vector store
+
+        Returns:
+            The ExampleSelector instantiated, backed by a vector store.
+        """
+        string_examples = [cls._example_to_text(eg, input_keys) for eg in examples]
+        vectorstore = vectorstore_cls.from_texts(
+            string_examples, embeddings, metadatas=examples, **vectorstore_cls_kwargs
+        )
+        return cls(
+            vectorstore=vectorstore,
+            example_prompt=example_prompt,
+            max_length=max_length,
+            get_text_length=get_text_length,
+            k=k,
+            fetch_k=fetch_k,
+            input_keys=input_keys,
+            example_keys=example_keys,
+            vectorstore_kwargs=vectorstore_kwargs,
+            query_cache_size=query_cache_size,
+        )
+
+    @classmethod
+    async def afrom_examples(
+        cls,
+        examples: list[dict],
+        embeddings: Embeddings,
+        vectorstore_cls: type[VectorStore],
+        *,
+        example_prompt: PromptTemplate,
+        max_length: int = 2048,
+        get_text_length: Callable[[str], int] = _get_length_based,
+        k: int = 4,
+        fetch_k: int = 20,
+        input_keys: list[str] | None = None,
+        example_keys: list[str] | None = None,
+        vectorstore_kwargs: dict | None = None,
+        query_cache_size: int = 0,
+        **vectorstore_cls_kwargs: Any,
+    ) -> LengthBasedSemanticSimilarityExampleSelector:
+        """Async create an example selector using example list and embeddings.
+
+        Args:
+            examples: List of examples to use in the prompt.
+            embeddings: An initialized embedding API interface, e.g. OpenAIEmbeddings().
+            vectorstore_cls: A vector store DB interface class, e.g.
+                InMemoryVectorStore.
+            example_prompt: Prompt template used to format the examples.
+            max_length: Max length for the input and the selected examples.
+            get_text_length: Function to measure prompt length.
+            k: Max number of examples to select.
+            fetch_k: Number of the most similar examples to choose from.
+            input_keys: If provided, the search is based on the input variables
+                instead of all variables.
+            example_keys: If provided, keys to filter examples to.
+            vectorstore_kwargs: Extra arguments passed to similarity_search function
+                of the `VectorStore`.
+            query_cache_size: Number of input embeddings to cache.
             vectorstore_cls_kwargs: optional kwargs containing url for vector store
 
         Returns:
@@ -350,9 +682,13 @@ class MaxMarginalRelevanceExampleSelector(_VectorStoreExampleSelector):
         )
         return cls(
             vectorstore=vectorstore,
+            example_prompt=example_prompt,
+            max_length=max_length,
+            get_text_length=get_text_length,
             k=k,
             fetch_k=fetch_k,
             input_keys=input_keys,
             example_keys=example_keys,
             vectorstore_kwargs=vectorstore_kwargs,
+            query_cache_size=query_cache_size,
         )
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import uuid
 import warnings
+from collections import deque
 from itertools import islice
 from typing import (
     TYPE_CHECKING,
@@ -20,10 +22,12 @@ from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 from langchain_core.exceptions import LangChainException
 from langchain_core.indexing.base import DocumentIndex, RecordManager
+from langchain_core.runnables.config import ContextThreadPoolExecutor, run_in_executor
 from langchain_core.vectorstores import VectorStore
 
 if TYPE_CHECKING:
     from collections.abc import (
+        AsyncGenerator,
         AsyncIterable,
         AsyncIterator,
         Callable,
@@ -31,6 +35,7 @@ if TYPE_CHECKING:
         Iterator,
         Sequence,
     )
+    from concurrent.futures import Executor, Future
 
 # Magic UUID to use as a namespace for hashing.
 # Used to try and generate a unique UUID for each document
@@ -260,6 +265,445 @@ def _delete(
         raise TypeError(msg)
 
 
+class _PendingBatch:
+    """A batch whose vector store write may still be in flight."""
+
+    __slots__ = ("ids", "source_ids", "uids_to_refresh", "write")
+
+    def __init__(
+        self,
+        ids: list[str],
+        source_ids: Sequence[str | None],
+        uids_to_refresh: list[str],
+        write: Any,
+    ) -> None:
+        self.ids = ids
+        self.source_ids = source_ids
+        self.uids_to_refresh = uids_to_refresh
+        # Future / Task of the vector store write, or None if nothing to write.
+        self.write = write
+
+
+def _hash_batch(
+    doc_batch: list[Document],
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+) -> tuple[list[Document], int]:
+    """Hash and deduplicate a batch.
+
+    Returns:
+        The deduplicated hashed documents and the number of duplicates removed.
+    """
+    hashed_docs = list(
+        _deduplicate_in_order(
+            [_get_document_with_hash(doc, key_encoder=key_encoder) for doc in doc_batch]
+        )
+    )
+    return hashed_docs, len(doc_batch) - len(hashed_docs)
+
+
+def _get_source_ids(
+    hashed_docs: list[Document],
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+) -> list[str | None]:
+    """Assign source ids, checking they are present when cleanup requires them."""
+    source_ids = [source_id_assigner(doc) for doc in hashed_docs]
+    if cleanup in {"incremental", "scoped_full"}:
+        for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
+            if source_id is None:
+                msg = (
+                    f"Source IDs are required when cleanup mode is "
+                    f"incremental or scoped_full. "
+                    f"Document that starts with "
+                    f"content: {hashed_doc.page_content[:100]} "
+                    f"was not assigned as source id."
+                )
+                raise ValueError(msg)
+    return source_ids
+
+
+def _plan_batch(
+    hashed_docs: list[Document],
+    exists_batch: Sequence[bool],
+    *,
+    force_update: bool,
+) -> tuple[list[str], list[Document], list[str], int]:
+    """Split a batch into documents to write and documents to refresh.
+
+    Returns:
+        The ids and documents to write, the ids whose timestamp only needs a
+        refresh, and how many of the written documents are updates.
+    """
+    uids: list[str] = []
+    docs_to_index: list[Document] = []
+    uids_to_refresh: list[str] = []
+    num_seen = 0
+    for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
+        hashed_id = cast("str", hashed_doc.id)
+        if doc_exists:
+            if force_update:
+                num_seen += 1
+            else:
+                uids_to_refresh.append(hashed_id)
+                continue
+        uids.append(hashed_id)
+        docs_to_index.append(hashed_doc)
+    return uids, docs_to_index, uids_to_refresh, num_seen
+
+
+def _iter_hashed_batches(
+    executor: Executor,
+    batches: Iterable[list[Document]],
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    prefetch: int,
+) -> Iterator[tuple[list[Document], int]]:
+    """Hash batches on `executor`, keeping up to `prefetch` batches ahead."""
+    futures: deque[Future[tuple[list[Document], int]]] = deque()
+    for doc_batch in batches:
+        futures.append(executor.submit(_hash_batch, doc_batch, key_encoder))
+        if len(futures) > prefetch:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
+
+
+def _index_pipelined(
+    doc_iterator: Iterator[Document],
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    *,
+    batch_size: int,
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup_batch_size: int,
+    force_update: bool,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    upsert_kwargs: dict[str, Any] | None,
+    max_concurrency: int,
+) -> IndexingResult:
+    """Pipelined implementation of `index`.
+
+    Batches are hashed on a thread pool ahead of time. While up to
+    `max_concurrency` vector store writes are in flight, the existence check of
+    the next batch runs on the calling thread. Record manager calls are only made
+    from the calling thread, and each batch's records are committed in input
+    order once its write completes, so the resulting records, counts and cleanup
+    are the same as with the sequential implementation:
+
+    * Ids belonging to batches that are not committed yet are treated as
+        existing, as they would be once those batches are committed.
+    * With incremental cleanup, all in-flight batches are committed before the
+        next batch is written, and ids deleted by their cleanup are treated as
+        missing.
+    """
+    index_start_dt = record_manager.get_time()
+    result: IndexingResult = {
+        "num_added": 0,
+        "num_updated": 0,
+        "num_skipped": 0,
+        "num_deleted": 0,
+    }
+    scoped_full_cleanup_source_ids: set[str] = set()
+    in_flight: deque[_PendingBatch] = deque()
+    in_flight_ids: dict[str, int] = {}
+
+    def commit(batch: _PendingBatch) -> set[str]:
+        """Wait for the batch's write, then update records and clean up."""
+        if batch.write is not None:
+            batch.write.result()
+        if batch.uids_to_refresh:
+            record_manager.update(batch.uids_to_refresh, time_at_least=index_start_dt)
+        record_manager.update(
+            batch.ids, group_ids=batch.source_ids, time_at_least=index_start_dt
+        )
+        for id_ in batch.ids:
+            if in_flight_ids[id_] == 1:
+                del in_flight_ids[id_]
+            else:
+                in_flight_ids[id_] -= 1
+
+        deleted: set[str] = set()
+        if cleanup == "incremental":
+            source_ids_ = cast("Sequence[str]", batch.source_ids)
+            while uids_to_delete := record_manager.list_keys(
+                group_ids=source_ids_, before=index_start_dt, limit=cleanup_batch_size
+            ):
+                _delete(destination, uids_to_delete)
+                record_manager.delete_keys(uids_to_delete)
+                result["num_deleted"] += len(uids_to_delete)
+                deleted.update(uids_to_delete)
+        return deleted
+
+    def write(uids: list[str], docs_to_index: list[Document]) -> None:
+        if isinstance(destination, VectorStore):
+            destination.add_documents(
+                docs_to_index,
+                ids=uids,
+                batch_size=batch_size,
+                **(upsert_kwargs or {}),
+            )
+        else:
+            destination.upsert(docs_to_index, **(upsert_kwargs or {}))
+
+    with (
+        ContextThreadPoolExecutor(max_workers=max_concurrency) as hash_executor,
+        ContextThreadPoolExecutor(max_workers=max_concurrency) as write_executor,
+    ):
+        try:
+            for hashed_docs, num_duplicates in _iter_hashed_batches(
+                hash_executor,
+                _batch(batch_size, doc_iterator),
+                key_encoder,
+                prefetch=max_concurrency,
+            ):
+                result["num_skipped"] += num_duplicates
+                source_ids = _get_source_ids(hashed_docs, source_id_assigner, cleanup)
+                if cleanup == "scoped_full":
+                    scoped_full_cleanup_source_ids.update(cast("list[str]", source_ids))
+                ids = [cast("str", doc.id) for doc in hashed_docs]
+
+                # Overlaps with the writes of the batches still in flight.
+                exists_batch = record_manager.exists(ids)
+                pending = [id_ in in_flight_ids for id_ in ids]
+
+                if cleanup == "incremental":
+                    deleted: set[str] = set()
+                    while in_flight:
+                        deleted |= commit(in_flight.popleft())
+                    exists_batch = [
+                        is_pending or (doc_exists and id_ not in deleted)
+                        for id_, doc_exists, is_pending in zip(
+                            ids, exists_batch, pending, strict=False
+                        )
+                    ]
+                else:
+                    exists_batch = [
+                        doc_exists or is_pending
+                        for doc_exists, is_pending in zip(
+                            exists_batch, pending, strict=False
+                        )
+                    ]
+                    while len(in_flight) >= max_concurrency:
+                        commit(in_flight.popleft())
+
+                uids, docs_to_index, uids_to_refresh, num_seen = _plan_batch(
+                    hashed_docs, exists_batch, force_update=force_update
+                )
+                result["num_skipped"] += len(uids_to_refresh)
+                result["num_added"] += len(docs_to_index) - num_seen
+                result["num_updated"] += num_seen
+
+                future = (
+                    write_executor.submit(write, uids, docs_to_index)
+                    if docs_to_index
+                    else None
+                )
+                in_flight.append(
+                    _PendingBatch(ids, source_ids, uids_to_refresh, future)
+                )
+                for id_ in ids:
+                    in_flight_ids[id_] = in_flight_ids.get(id_, 0) + 1
+
+            while in_flight:
+                commit(in_flight.popleft())
+        finally:
+            # On failure, do not start writes that are still queued.
+            for batch in in_flight:
+                if batch.write is not None:
+                    batch.write.cancel()
+
+    if cleanup == "full" or (
+        cleanup == "scoped_full" and scoped_full_cleanup_source_ids
+    ):
+        delete_group_ids: Sequence[str] | None = None
+        if cleanup == "scoped_full":
+            delete_group_ids = list(scoped_full_cleanup_source_ids)
+        while uids_to_delete := record_manager.list_keys(
+            group_ids=delete_group_ids, before=index_start_dt, limit=cleanup_batch_size
+        ):
+            _delete(destination, uids_to_delete)
+            record_manager.delete_keys(uids_to_delete)
+            result["num_deleted"] += len(uids_to_delete)
+
+    return result
+
+
+async def _aiter_hashed_batches(
+    batches: AsyncIterator[list[Document]],
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    prefetch: int,
+) -> AsyncGenerator[tuple[list[Document], int], None]:
+    """Hash batches in the default executor, keeping `prefetch` batches ahead."""
+    futures: deque[asyncio.Future[tuple[list[Document], int]]] = deque()
+    try:
+        async for doc_batch in batches:
+            futures.append(
+                asyncio.ensure_future(
+                    run_in_executor(None, _hash_batch, doc_batch, key_encoder)
+                )
+            )
+            if len(futures) > prefetch:
+                yield await futures.popleft()
+        while futures:
+            yield await futures.popleft()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def _aindex_pipelined(
+    async_doc_iterator: AsyncIterator[Document],
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    *,
+    batch_size: int,
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup_batch_size: int,
+    force_update: bool,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    upsert_kwargs: dict[str, Any] | None,
+    max_concurrency: int,
+) -> IndexingResult:
+    """Pipelined implementation of `aindex`.
+
+    Same scheduling as `_index_pipelined`, with writes running as tasks.
+    """
+    index_start_dt = await record_manager.aget_time()
+    result: IndexingResult = {
+        "num_added": 0,
+        "num_updated": 0,
+        "num_skipped": 0,
+        "num_deleted": 0,
+    }
+    scoped_full_cleanup_source_ids: set[str] = set()
+    in_flight: deque[_PendingBatch] = deque()
+    in_flight_ids: dict[str, int] = {}
+
+    async def commit(batch: _PendingBatch) -> set[str]:
+        """Wait for the batch's write, then update records and clean up."""
+        if batch.write is not None:
+            await batch.write
+        if batch.uids_to_refresh:
+            await record_manager.aupdate(
+                batch.uids_to_refresh, time_at_least=index_start_dt
+            )
+        await record_manager.aupdate(
+            batch.ids, group_ids=batch.source_ids, time_at_least=index_start_dt
+        )
+        for id_ in batch.ids:
+            if in_flight_ids[id_] == 1:
+                del in_flight_ids[id_]
+            else:
+                in_flight_ids[id_] -= 1
+
+        deleted: set[str] = set()
+        if cleanup == "incremental":
+            source_ids_ = cast("Sequence[str]", batch.source_ids)
+            while uids_to_delete := await record_manager.alist_keys(
+                group_ids=source_ids_, before=index_start_dt, limit=cleanup_batch_size
+            ):
+                await _adelete(destination, uids_to_delete)
+                await record_manager.adelete_keys(uids_to_delete)
+                result["num_deleted"] += len(uids_to_delete)
+                deleted.update(uids_to_delete)
+        return deleted
+
+    async def write(uids: list[str], docs_to_index: list[Document]) -> None:
+        if isinstance(destination, VectorStore):
+            await destination.aadd_documents(
+                docs_to_index,
+                ids=uids,
+                batch_size=batch_size,
+                **(upsert_kwargs or {}),
+            )
+        else:
+            await destination.aupsert(docs_to_index, **(upsert_kwargs or {}))
+
+    hashed_batches = _aiter_hashed_batches(
+        _abatch(batch_size, async_doc_iterator),
+        key_encoder,
+        prefetch=max_concurrency,
+    )
+    try:
+        async for hashed_docs, num_duplicates in hashed_batches:
+            result["num_skipped"] += num_duplicates
+            source_ids = _get_source_ids(hashed_docs, source_id_assigner, cleanup)
+            if cleanup == "scoped_full":
+                scoped_full_cleanup_source_ids.update(cast("list[str]", source_ids))
+            ids = [cast("str", doc.id) for doc in hashed_docs]
+
+            # Overlaps with the writes of the batches still in flight.
+            exists_batch = await record_manager.aexists(ids)
+            pending = [id_ in in_flight_ids for id_ in ids]
+
+            if cleanup == "incremental":
+                deleted: set[str] = set()
+                while in_flight:
+                    deleted |= await commit(in_flight.popleft())
+                exists_batch = [
+                    is_pending or (doc_exists and id_ not in deleted)
+                    for id_, doc_exists, is_pending in zip(
+                        ids, exists_batch, pending, strict=False
+                    )
+                ]
+            else:
+                exists_batch = [
+                    doc_exists or is_pending
+                    for doc_exists, is_pending in zip(
+                        exists_batch, pending, strict=False
+                    )
+                ]
+                while len(in_flight) >= max_concurrency:
+                    await commit(in_flight.popleft())
+
+            uids, docs_to_index, uids_to_refresh, num_seen = _plan_batch(
+                hashed_docs, exists_batch, force_update=force_update
+            )
+            result["num_skipped"] += len(uids_to_refresh)
+            result["num_added"] += len(docs_to_index) - num_seen
+            result["num_updated"] += num_seen
+
+            task = (
+                asyncio.ensure_future(write(uids, docs_to_index))
+                if docs_to_index
+                else None
+            )
+            in_flight.append(_PendingBatch(ids, source_ids, uids_to_refresh, task))
+            for id_ in ids:
+                in_flight_ids[id_] = in_flight_ids.get(id_, 0) + 1
+
+        while in_flight:
+            await commit(in_flight.popleft())
+    finally:
+        # On failure, cancel the writes that were not committed.
+        tasks = [batch.write for batch in in_flight if batch.write is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await hashed_batches.aclose()
+
+    if cleanup == "full" or (
+        cleanup == "scoped_full" and scoped_full_cleanup_source_ids
+    ):
+        delete_group_ids: Sequence[str] | None = None
+        if cleanup == "scoped_full":
+            delete_group_ids = list(scoped_full_cleanup_source_ids)
+        while uids_to_delete := await record_manager.alist_keys(
+            group_ids=delete_group_ids, before=index_start_dt, limit=cleanup_batch_size
+        ):
+            await _adelete(destination, uids_to_delete)
+            await record_manager.adelete_keys(uids_to_delete)
+            result["num_deleted"] += len(uids_to_delete)
+
+    return result
+
+
 # PUBLIC API
 
 
@@ -289,6 +733,7 @@ def index(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> IndexingResult:
     """Index data from the loader into the vector store.
 
@@ -371,6 +816,12 @@ def index(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: Enables pipelined indexing when set. Documents are
+            hashed on a pool of `max_concurrency` workers, the record manager
+            existence check for the next batch overlaps with the writes of the
+            previous ones, and up to `max_concurrency` vector store writes are in
+            flight at a time. The resulting index, cleanup and counts are the same
+            as with the default sequential mode, which is used when `None`.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -382,6 +833,7 @@ def index(
         ValueError: If `VectorStore` does not have
             "delete" and "add_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
+        ValueError: If `max_concurrency` is less than 1.
         TypeError: If `vectorstore` is not a `VectorStore` or a DocumentIndex.
         AssertionError: If `source_id` is None when cleanup mode is incremental.
             (should be unreachable code).
@@ -404,6 +856,10 @@ def index(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None and max_concurrency < 1:
+        msg = f"max_concurrency should be at least 1. Got {max_concurrency}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -442,6 +898,21 @@ def index(
 
     source_id_assigner = _get_source_id_assigner(source_id_key)
 
+    if max_concurrency is not None:
+        return _index_pipelined(
+            doc_iterator,
+            record_manager,
+            destination,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_assigner=source_id_assigner,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            key_encoder=key_encoder,
+            upsert_kwargs=upsert_kwargs,
+            max_concurrency=max_concurrency,
+        )
+
     # Mark when the update started.
     index_start_dt = record_manager.get_time()
     num_added = 0
@@ -628,6 +1099,7 @@ async def aindex(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> IndexingResult:
     """Async index data from the loader into the vector store.
 
@@ -710,6 +1182,12 @@ async def aindex(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: Enables pipelined indexing when set. Documents are
+            hashed on a pool of `max_concurrency` workers, the record manager
+            existence check for the next batch overlaps with the writes of the
+            previous ones, and up to `max_concurrency` vector store writes are in
+            flight at a time. The resulting index, cleanup and counts are the same
+            as with the default sequential mode, which is used when `None`.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -721,6 +1199,7 @@ async def aindex(
         ValueError: If `VectorStore` does not have
             "adelete" and "aadd_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
+        ValueError: If `max_concurrency` is less than 1.
         TypeError: If `vector_store` is not a `VectorStore` or DocumentIndex.
         AssertionError: If `source_id_key` is None when cleanup mode is
             incremental or `scoped_full` (should be unreachable).
@@ -743,6 +1222,10 @@ async def aindex(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None and max_concurrency < 1:
+        msg = f"max_concurrency should be at least 1. Got {max_concurrency}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -792,6 +1275,21 @@ async def aindex(
 
     source_id_assigner = _get_source_id_assigner(source_id_key)
 
+    if max_concurrency is not None:
+        return await _aindex_pipelined(
+            async_doc_iterator,
+            record_manager,
+            destination,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_assigner=source_id_assigner,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            key_encoder=key_encoder,
+            upsert_kwargs=upsert_kwargs,
+            max_concurrency=max_concurrency,
+        )
+
     # Mark when the update started.
     index_start_dt = await record_manager.aget_time()
     num_added = 0
@@ -62,7 +62,7 @@ from langchain_core.outputs import (
 )
 from langchain_core.outputs.chat_generation import merge_chat_generation_chunks
 from langchain_core.prompt_values import ChatPromptValue, PromptValue, StringPromptValue
-from langchain_core.rate_limiters import BaseRateLimiter
+from langchain_core.rate_limiters import BaseRateLimiter, WeightedRateLimiter
 from langchain_core.runnables import RunnableMap, RunnablePassthrough
 from langchain_core.runnables.config import ensure_config, run_in_executor
 from langchain_core.tracers._streaming import _StreamingCallbackHandler
@@ -71,10 +71,12 @@ from langchain_core.utils.function_calling import (
     convert_to_openai_tool,
 )
 from langchain_core.utils.pydantic import TypeBaseModel, is_basemodel_subclass
+from langchain_core.utils.singleflight import SingleFlight
 from langchain_core.utils.utils import LC_ID_PREFIX, from_env
 
 if TYPE_CHECKING:
     import uuid
+    from collections.abc import Awaitable
 
     from langchain_core.output_parsers.base import OutputParserLike
     from langchain_core.runnables import Runnable, RunnableConfig
@@ -224,6 +226,28 @@ async def agenerate_from_stream(
     return await run_in_executor(None, generate_from_stream, iter(chunks))
 
 
+def _acquire_rate_limiter(
+    rate_limiter: BaseRateLimiter, messages: list[BaseMessage]
+) -> None:
+    """Acquire from the rate limiter, weighting the call by its input if supported."""
+    if isinstance(rate_limiter, WeightedRateLimiter):
+        rate_limiter.acquire(blocking=True, weight=rate_limiter.get_weight(messages))
+    else:
+        rate_limiter.acquire(blocking=True)
+
+
+async def _aacquire_rate_limiter(
+    rate_limiter: BaseRateLimiter, messages: list[BaseMessage]
+) -> None:
+    """Async acquire from the rate limiter, weighting the call if supported."""
+    if isinstance(rate_limiter, WeightedRateLimiter):
+        await rate_limiter.aacquire(
+            blocking=True, weight=rate_limiter.get_weight(messages)
+        )
+    else:
+        await rate_limiter.aacquire(blocking=True)
+
+
 def _format_ls_structured_output(ls_structured_output_format: dict | None) -> dict:
     if ls_structured_output_format:
         try:
@@ -525,7 +549,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             chunks: list[ChatGenerationChunk] = []
 
             if self.rate_limiter:
-                self.rate_limiter.acquire(blocking=True)
+                _acquire_rate_limiter(self.rate_limiter, messages)
 
             try:
                 input_messages = _normalize_messages(messages)
@@ -651,7 +675,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         )
 
         if self.rate_limiter:
-            await self.rate_limiter.aacquire(blocking=True)
+            await _aacquire_rate_limiter(self.rate_limiter, messages)
 
         chunks: list[ChatGenerationChunk] = []
 
@@ -772,6 +796,33 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 converted_generations.append(gen)
         return converted_generations
 
+    def _convert_shared_result(
+        self,
+        result: ChatResult,
+        run_manager: CallbackManagerForLLMRun | AsyncCallbackManagerForLLMRun | None,
+    ) -> ChatResult:
+        """Convert the result of a generation made by a concurrent identical call.
+
+        The result is copied and converted like a cache hit, so that each caller
+        gets its own messages, with their own ids, and the cost is only counted once.
+
+        Args:
+            result: The result of the generation.
+            run_manager: The run manager of the call that waited for the generation.
+
+        Returns:
+            The result for the call that waited for the generation.
+
+        """
+        generations = self._convert_cached_generations(
+            [generation.model_copy(deep=True) for generation in result.generations]
+        )
+        for idx, generation in enumerate(generations):
+            generation.message.id = (
+                f"{LC_ID_PREFIX}-{run_manager.run_id}-{idx}" if run_manager else None
+            )
+        return ChatResult(generations=generations)
+
     def _get_invocation_params(
         self,
         stop: list[str] | None = None,
@@ -1155,11 +1206,42 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 msg = "Asked to cache, but no cache found at `langchain.cache`."
                 raise ValueError(msg)
 
+        if check_cache and llm_cache:
+            # Concurrent calls that missed the cache share the same generation
+            leader = False
+
+            def generate() -> ChatResult:
+                nonlocal leader
+                leader = True
+                return self._generate_and_cache(
+                    messages,
+                    stop,
+                    run_manager,
+                    (llm_cache, prompt, llm_string),
+                    **kwargs,
+                )
+
+            result = _CACHE_SINGLE_FLIGHT.run(
+                (id(llm_cache), prompt, llm_string), generate
+            )
+            if leader:
+                return result
+            return self._convert_shared_result(result, run_manager)
+        return self._generate_and_cache(messages, stop, run_manager, None, **kwargs)
+
+    def _generate_and_cache(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        run_manager: CallbackManagerForLLMRun | None,
+        cache: tuple[BaseCache, str, str] | None,
+        **kwargs: Any,
+    ) -> ChatResult:
         # Apply the rate limiter after checking the cache, since
         # we usually don't want to rate limit cache lookups, but
         # we do want to rate limit API requests.
         if self.rate_limiter:
-            self.rate_limiter.acquire(blocking=True)
+            _acquire_rate_limiter(self.rate_limiter, messages)
 
         # If stream is not explicitly set, check if implicitly requested by
         # astream_events() or astream_log(). Bail out if _stream not implemented
@@ -1243,7 +1325,8 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 **result.llm_output,
                 **result.generations[0].message.response_metadata,
             }
-        if check_cache and llm_cache:
+        if cache:
+            llm_cache, prompt, llm_string = cache
             llm_cache.update(prompt, llm_string, result.generations)
         return result
 
@@ -1273,11 +1356,44 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 msg = "Asked to cache, but no cache found at `langchain.cache`."
                 raise ValueError(msg)
 
+        if check_cache and llm_cache:
+            # Concurrent calls that missed the cache share the same generation
+            leader = False
+
+            def agenerate() -> Awaitable[ChatResult]:
+                nonlocal leader
+                leader = True
+                return self._agenerate_and_cache(
+                    messages,
+                    stop,
+                    run_manager,
+                    (llm_cache, prompt, llm_string),
+                    **kwargs,
+                )
+
+            result = await _CACHE_SINGLE_FLIGHT.arun(
+                (id(llm_cache), prompt, llm_string), agenerate
+            )
+            if leader:
+                return result
+            return self._convert_shared_result(result, run_manager)
+        return await self._agenerate_and_cache(
+            messages, stop, run_manager, None, **kwargs
+        )
+
+    async def _agenerate_and_cache(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        run_manager: AsyncCallbackManagerForLLMRun | None,
+        cache: tuple[BaseCache, str, str] | None,
+        **kwargs: Any,
+    ) -> ChatResult:
         # Apply the rate limiter after checking the cache, since
         # we usually don't want to rate limit cache lookups, but
         # we do want to rate limit API requests.
         if self.rate_limiter:
-            await self.rate_limiter.aacquire(blocking=True)
+            await _aacquire_rate_limiter(self.rate_limiter, messages)
 
         # If stream is not explicitly set, check if implicitly requested by
         # astream_events() or astream_log(). Bail out if _astream not implemented
@@ -1361,7 +1477,8 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 **result.llm_output,
                 **result.generations[0].message.response_metadata,
             }
-        if check_cache and llm_cache:
+        if cache:
+            llm_cache, prompt, llm_string = cache
             await llm_cache.aupdate(prompt, llm_string, result.generations)
         return result
 
@@ -1760,6 +1877,9 @@ def _gen_info_and_msg_metadata(
     }
 
 
+_CACHE_SINGLE_FLIGHT = SingleFlight()
+"""Coalesces the concurrent generations of chat models for the same cache key."""
+
 _MAX_CLEANUP_DEPTH = 100
 
 
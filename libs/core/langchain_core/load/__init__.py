@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from langchain_core._import_utils import import_attr
 
 if TYPE_CHECKING:
+    from langchain_core.load.binary import dumpb, loadb
     from langchain_core.load.dump import dumpd, dumps
     from langchain_core.load.load import loads
     from langchain_core.load.serializable import Serializable
@@ -15,9 +16,11 @@ if TYPE_CHECKING:
 # the `from langchain_core.load.load import load` absolute import should also work.
 from langchain_core.load.load import load
 
-__all__ = ("Serializable", "dumpd", "dumps", "load", "loads")
+__all__ = ("Serializable", "dumpb", "dumpd", "dumps", "load", "loadb", "loads")
 
 _dynamic_imports = {
+    "dumpb": "binary",
+    "loadb": "binary",
     "dumpd": "dump",
     "dumps": "dump",
     "loads": "load",
@@ -0,0 +1,575 @@
+"""Compact binary serialization of LangChain objects.
+
+The binary format holds the same data as the JSON produced by `dumps`, so anything
+that can be serialized with `dumps` can be serialized with `dumpb`, and loading
+it back gives the same objects as `loads`. It is several times smaller:
+
+- Values are tagged with a single byte, and lengths and integers are varints.
+- The `id` of each serialized class and each dictionary key is written once per
+    stream and referenced by index afterwards, instead of repeating the
+    `lc`/`type`/`id`/`kwargs` envelope of each object.
+- Lists of floats, such as embeddings, are written as raw little-endian float64
+    arrays.
+- The payload can optionally be compressed with zstd, which requires the
+    `zstandard` package.
+
+A stream starts with a header holding a magic number, the format version and
+flags, followed by any number of values. `dumpb` and `loadb` handle a single
+value; `BinaryWriter` and `iter_loadb` write and read many values, e.g. a chat
+history or a cache file, sharing the interned ids and keys.
+
+!!! warning
+    `loadb` and `iter_loadb` are vulnerable to remote code execution like `loads`.
+    Never use with untrusted input.
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+
+from typing_extensions import Self
+
+from langchain_core._api import beta
+from langchain_core.load.dump import _dump_pydantic_models
+from langchain_core.load.load import Reviver
+from langchain_core.load.serializable import Serializable, to_json_not_implemented
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+try:
+    import zstandard
+except ImportError:
+    _HAS_ZSTANDARD = False
+else:
+    _HAS_ZSTANDARD = True
+
+_MAGIC = b"LCB"
+_VERSION = 1
+_FLAG_ZSTD = 1
+_HEADER = struct.Struct("<3sBB")
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_DICT = 7
+_FLOATS = 8
+_OBJECT = 9
+
+_VARINT_MASK = 0x7F
+_VARINT_MORE = 0x80
+_FLOAT64 = struct.Struct("<d")
+_BIG_ENDIAN = sys.byteorder == "big"
+_STREAM_CHUNK_SIZE = 1 << 16
+
+
+def _check_zstandard() -> None:
+    if not _HAS_ZSTANDARD:
+        msg = (
+            "Compressing or decompressing binary payloads requires zstandard. "
+            "Please install it with `pip install zstandard`."
+        )
+        raise ImportError(msg)
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dictionary key the same way `json.dumps` does."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    msg = f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    raise TypeError(msg)
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.keys: dict[str, int] = {}
+        self.types: dict[tuple[str, ...], int] = {}
+        self.out = bytearray()
+
+    def encode(self, obj: Any) -> bytes:
+        """Encode a value, like `dumps` would serialize it."""
+        num_keys, num_types = len(self.keys), len(self.types)
+        try:
+            self._value(_dump_pydantic_models(obj))
+        except TypeError:
+            # Forget the keys and types of the failed attempt, they were not written
+            self._truncate(num_keys, num_types)
+            self.out.clear()
+            self._value(to_json_not_implemented(obj))
+        data = bytes(self.out)
+        self.out.clear()
+        return data
+
+    def _truncate(self, num_keys: int, num_types: int) -> None:
+        self.keys = {k: i for k, i in self.keys.items() if i < num_keys}
+        self.types = {k: i for k, i in self.types.items() if i < num_types}
+
+    def _varint(self, n: int) -> None:
+        out = self.out
+        while n > _VARINT_MASK:
+            out.append((n & _VARINT_MASK) | _VARINT_MORE)
+            n >>= 7
+        out.append(n)
+
+    def _str(self, value: str) -> None:
+        data = value.encode("utf-8", "surrogatepass")
+        self._varint(len(data))
+        self.out += data
+
+    def _key(self, key: str) -> None:
+        index = self.keys.get(key)
+        if index is not None:
+            self._varint(index << 1 | 1)
+            return
+        self.keys[key] = len(self.keys)
+        data = key.encode("utf-8", "surrogatepass")
+        self._varint(len(data) << 1)
+        self.out += data
+
+    def _value(self, obj: Any) -> None:
+        out = self.out
+        type_ = type(obj)
+        if type_ is str:
+            out.append(_STR)
+            self._str(obj)
+        elif obj is None:
+            out.append(_NONE)
+        elif obj is True:
+            out.append(_TRUE)
+        elif obj is False:
+            out.append(_FALSE)
+        elif type_ is int:
+            out.append(_INT)
+            self._varint(obj << 1 if obj >= 0 else (-obj << 1) - 1)
+        elif type_ is float:
+            out.append(_FLOAT)
+            out += _FLOAT64.pack(obj)
+        elif isinstance(obj, dict):
+            self._dict(obj)
+        elif isinstance(obj, (list, tuple)):
+            if obj and all(type(x) is float for x in obj):
+                out.append(_FLOATS)
+                self._varint(len(obj))
+                floats = array("d", obj)
+                if _BIG_ENDIAN:
+                    floats.byteswap()
+                out += floats.tobytes()
+            else:
+                out.append(_LIST)
+                self._varint(len(obj))
+                for item in obj:
+                    self._value(item)
+        elif isinstance(obj, str):
+            out.append(_STR)
+            self._str(str(obj))
+        elif isinstance(obj, int):
+            self._value(int(obj))
+        elif isinstance(obj, float):
+            self._value(float(obj))
+        elif isinstance(obj, Serializable):
+            self._serialized(cast("dict[str, Any]", obj.to_json()))
+        else:
+            self._dict(cast("dict[str, Any]", to_json_not_implemented(obj)))
+
+    def _dict(self, obj: dict[Any, Any]) -> None:
+        self.out.append(_DICT)
+        self._varint(len(obj))
+        for key, value in obj.items():
+            self._key(_json_key(key))
+            self._value(value)
+
+    def _serialized(self, obj: dict[str, Any]) -> None:
+        if not (
+            obj.get("type") == "constructor"
+            and obj.get("lc") == 1
+            and len(obj) == 4  # noqa: PLR2004
+            and "kwargs" in obj
+            and isinstance(obj.get("id"), list)
+            and isinstance(obj["kwargs"], dict)
+        ):
+            self._dict(obj)
+            return
+        self.out.append(_OBJECT)
+        id_ = tuple(obj["id"])
+        index = self.types.get(id_)
+        if index is not None:
+            self._varint(index << 1 | 1)
+        else:
+            self.types[id_] = len(self.types)
+            self._varint(len(id_) << 1)
+            for part in id_:
+                self._str(part)
+        self._dict(obj["kwargs"])
+
+
+class _Decoder:
+    def __init__(self, reviver: Reviver) -> None:
+        self.reviver = reviver
+        self.keys: list[str] = []
+        self.types: list[list[str]] = []
+        self.data = b""
+        self.pos = 0
+
+    def _varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        byte = data[pos]
+        pos += 1
+        n = byte & _VARINT_MASK
+        shift = 7
+        while byte & _VARINT_MORE:
+            byte = data[pos]
+            pos += 1
+            n |= (byte & _VARINT_MASK) << shift
+            shift += 7
+        self.pos = pos
+        return n
+
+    def _bytes(self, size: int) -> bytes:
+        start = self.pos
+        end = start + size
+        if end > len(self.data):
+            raise IndexError(start)
+        self.pos = end
+        return self.data[start:end]
+
+    def _str(self) -> str:
+        return self._bytes(self._varint()).decode("utf-8", "surrogatepass")
+
+    def _key(self) -> str:
+        n = self._varint()
+        if n & 1:
+            return self.keys[n >> 1]
+        key = self._bytes(n >> 1).decode("utf-8", "surrogatepass")
+        self.keys.append(key)
+        return key
+
+    def _dict(self) -> dict[str, Any]:
+        value = {}
+        for _ in range(self._varint()):
+            key = self._key()
+            value[key] = self.value()
+        return value
+
+    def value(self) -> Any:
+        """Decode the next value, raising `IndexError` if the data is incomplete."""
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            return self._str()
+        if tag == _DICT:
+            return self.reviver(self._dict())
+        if tag == _OBJECT:
+            n = self._varint()
+            if n & 1:
+                id_ = self.types[n >> 1]
+            else:
+                id_ = [self._str() for _ in range(n >> 1)]
+                self.types.append(id_)
+            if self.data[self.pos] != _DICT:
+                msg = "Invalid binary payload: expected the kwargs of an object."
+                raise ValueError(msg)
+            self.pos += 1
+            kwargs = self.reviver(self._dict())
+            return self.reviver(
+                {"lc": 1, "type": "constructor", "id": list(id_), "kwargs": kwargs}
+            )
+        if tag == _LIST:
+            return [self.value() for _ in range(self._varint())]
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            n = self._varint()
+            return -((n + 1) >> 1) if n & 1 else n >> 1
+        if tag == _FLOAT:
+            return _FLOAT64.unpack(self._bytes(8))[0]
+        if tag == _FLOATS:
+            floats = array("d")
+            floats.frombytes(self._bytes(self._varint() * 8))
+            if _BIG_ENDIAN:
+                floats.byteswap()
+            return floats.tolist()
+        msg = f"Invalid binary payload: unknown tag {tag}."
+        raise ValueError(msg)
+
+
+def _header(*, compress: bool) -> bytes:
+    return _HEADER.pack(_MAGIC, _VERSION, _FLAG_ZSTD if compress else 0)
+
+
+def _parse_header(header: bytes) -> bool:
+    """Validate a header and return whether the payload is compressed."""
+    if len(header) < _HEADER.size:
+        msg = "Invalid binary payload: missing header."
+        raise ValueError(msg)
+    magic, version, flags = _HEADER.unpack(header[: _HEADER.size])
+    if magic != _MAGIC:
+        msg = "Invalid binary payload: not a LangChain binary payload."
+        raise ValueError(msg)
+    if version != _VERSION:
+        msg = f"Unsupported binary payload version {version}, expected {_VERSION}."
+        raise ValueError(msg)
+    return bool(flags & _FLAG_ZSTD)
+
+
+@beta()
+class BinaryWriter:
+    """Write a stream of LangChain objects in the compact binary format.
+
+    Class ids and dictionary keys are interned across all the values of the stream.
+    Read the stream back with `iter_loadb`.
+
+    Example:
+        ```python
+        from langchain_core.load.binary import BinaryWriter, iter_loadb
+
+        with open("history.lcb", "wb") as f, BinaryWriter(f) as writer:
+            for message in messages:
+                writer.write(message)
+
+        with open("history.lcb", "rb") as f:
+            messages = list(iter_loadb(f))
+        ```
+    """
+
+    def __init__(self, fp: BinaryIO, *, compress: bool = False) -> None:
+        """Create a BinaryWriter and write the header of the stream.
+
+        Args:
+            fp: The binary file to write to. It is not closed by `close`.
+            compress: Whether to compress the values with zstd.
+
+        Raises:
+            ImportError: If `compress` is `True` and `zstandard` is not installed.
+        """
+        if compress:
+            _check_zstandard()
+        fp.write(_header(compress=compress))
+        self._fp = fp
+        self._compressor = (
+            zstandard.ZstdCompressor().stream_writer(fp, closefd=False)
+            if compress
+            else None
+        )
+        self._encoder = _Encoder()
+
+    def write(self, obj: Any) -> None:
+        """Write a value to the stream.
+
+        Args:
+            obj: The value to write.
+        """
+        data = self._encoder.encode(obj)
+        if self._compressor is not None:
+            self._compressor.write(data)
+        else:
+            self._fp.write(data)
+
+    def close(self) -> None:
+        """Finish the stream. Must be called when writing compressed values."""
+        if self._compressor is not None:
+            self._compressor.close()  # type: ignore[no-untyped-call]
+            self._compressor = None
+
+    def __enter__(self) -> Self:
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the stream."""
+        self.close()
+
+
+@beta()
+def dumpb(obj: Any, *, compress: bool = False) -> bytes:
+    """Return a compact binary representation of an object.
+
+    Args:
+        obj: The object to dump.
+        compress: Whether to compress the payload with zstd.
+
+    Returns:
+        The binary representation of the object.
+
+    Raises:
+        ImportError: If `compress` is `True` and `zstandard` is not installed.
+    """
+    data = _Encoder().encode(obj)
+    if compress:
+        _check_zstandard()
+        data = zstandard.ZstdCompressor().compress(data)
+    return _header(compress=compress) + data
+
+
+@beta()
+def loadb(
+    data: bytes,
+    *,
+    secrets_map: dict[str, str] | None = None,
+    valid_namespaces: list[str] | None = None,
+    secrets_from_env: bool = True,
+    additional_import_mappings: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+    ignore_unserializable_fields: bool = False,
+) -> Any:
+    """Revive a LangChain object from its binary representation.
+
+    !!! warning
+        This function is vulnerable to remote code execution. Never use with untrusted
+        input.
+
+    Args:
+        data: A payload created by `dumpb`.
+        secrets_map: A map of secrets to load.
+
+            If a secret is not found in the map, it will be loaded from the environment
+            if `secrets_from_env` is `True`.
+        valid_namespaces: A list of additional namespaces (modules)
+            to allow to be deserialized.
+        secrets_from_env: Whether to load secrets from the environment.
+        additional_import_mappings: A dictionary of additional namespace mappings
+
+            You can use this to override default mappings or add new mappings.
+        ignore_unserializable_fields: Whether to ignore unserializable fields.
+
+    Returns:
+        Revived LangChain objects.
+
+    Raises:
+        ValueError: If the payload is invalid, truncated or holds more than one
+            value.
+        ImportError: If the payload is compressed and `zstandard` is not installed.
+    """
+    body = memoryview(data)[_HEADER.size :]
+    if _parse_header(data):
+        _check_zstandard()
+        body = memoryview(zstandard.ZstdDecompressor().decompress(body))
+    decoder = _Decoder(
+        Reviver(
+            secrets_map,
+            valid_namespaces,
+            secrets_from_env,
+            additional_import_mappings,
+            ignore_unserializable_fields=ignore_unserializable_fields,
+        )
+    )
+    decoder.data = body.tobytes()
+    try:
+        value = decoder.value()
+    except IndexError:
+        msg = "Invalid binary payload: truncated."
+        raise ValueError(msg) from None
+    if decoder.pos != len(decoder.data):
+        msg = (
+            "Invalid binary payload: trailing data. Use `iter_loadb` to read "
+            "a stream of values."
+        )
+        raise ValueError(msg)
+    return value
+
+
+@beta()
+def iter_loadb(
+    fp: BinaryIO,
+    *,
+    secrets_map: dict[str, str] | None = None,
+    valid_namespaces: list[str] | None = None,
+    secrets_from_env: bool = True,
+    additional_import_mappings: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+    ignore_unserializable_fields: bool = False,
+) -> Iterator[Any]:
+    """Revive LangChain objects from a binary stream, one value at a time.
+
+    !!! warning
+        This function is vulnerable to remote code execution. Never use with untrusted
+        input.
+
+    The stream is read in chunks, so only the value being decoded is held in memory.
+
+    Args:
+        fp: A binary file holding a payload created by `dumpb` or `BinaryWriter`.
+        secrets_map: A map of secrets to load.
+
+            If a secret is not found in the map, it will be loaded from the environment
+            if `secrets_from_env` is `True`.
+        valid_namespaces: A list of additional namespaces (modules)
+            to allow to be deserialized.
+        secrets_from_env: Whether to load secrets from the environment.
+        additional_import_mappings: A dictionary of additional namespace mappings
+
+            You can use this to override default mappings or add new mappings.
+        ignore_unserializable_fields: Whether to ignore unserializable fields.
+
+    Yields:
+        Revived LangChain objects, in the order they were written.
+
+    Raises:
+        ValueError: If the stream is invalid or truncated.
+        ImportError: If the stream is compressed and `zstandard` is not installed.
+    """
+    reader: BinaryIO | io.BufferedIOBase = fp
+    if _parse_header(fp.read(_HEADER.size)):
+        _check_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(fp, closefd=False)
+    decoder = _Decoder(
+        Reviver(
+            secrets_map,
+            valid_namespaces,
+            secrets_from_env,
+            additional_import_mappings,
+            ignore_unserializable_fields=ignore_unserializable_fields,
+        )
+    )
+    data = b""
+    read_size = _STREAM_CHUNK_SIZE
+    while True:
+        chunk = reader.read(read_size)
+        decoder.data = data = data + chunk
+        decoder.pos = 0
+        while decoder.pos < len(data):
+            start = decoder.pos
+            num_keys, num_types = len(decoder.keys), len(decoder.types)
+            try:
+                value = decoder.value()
+            except IndexError:
+                # Wait for the rest of the value and decode it again
+                decoder.pos = start
+                del decoder.keys[num_keys:]
+                del decoder.types[num_types:]
+                break
+            yield value
+        data = data[decoder.pos :]
+        if not chunk:
+            if data:
+                msg = "Invalid binary payload: truncated."
+                raise ValueError(msg)
+            return
+        # Grow the reads while a single value does not fit, to keep decoding linear
+        read_size = max(_STREAM_CHUNK_SIZE, len(data))
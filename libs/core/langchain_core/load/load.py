@@ -49,6 +49,21 @@ ALL_SERIALIZABLE_MAPPINGS = {
     **_JS_SERIALIZABLE_MAPPING,
 }
 
+# Classes resolved from an import path, shared by all revivers. Only successful
+# resolutions are cached, so errors are raised every time.
+_IMPORTED_CLASSES: dict[tuple[str, ...], Any] = {}
+
+
+def _import_class(import_path: tuple[str, ...]) -> Any:
+    try:
+        return _IMPORTED_CLASSES[import_path]
+    except KeyError:
+        pass
+    mod = importlib.import_module(".".join(import_path[:-1]))
+    cls = getattr(mod, import_path[-1])
+    _IMPORTED_CLASSES[import_path] = cls
+    return cls
+
 
 class Reviver:
     """Reviver for JSON objects."""
@@ -96,6 +111,41 @@ class Reviver:
             else ALL_SERIALIZABLE_MAPPINGS
         )
         self.ignore_unserializable_fields = ignore_unserializable_fields
+        # Validated and resolved classes, by serialized id.
+        self._classes: dict[tuple[str, ...], type[Serializable]] = {}
+
+    def _resolve_class(self, value: dict[str, Any]) -> type[Serializable]:
+        [*namespace, name] = value["id"]
+        mapping_key = tuple(value["id"])
+
+        if (
+            namespace[0] not in self.valid_namespaces
+            # The root namespace ["langchain"] is not a valid identifier.
+            or namespace == ["langchain"]
+        ):
+            msg = f"Invalid namespace: {value}"
+            raise ValueError(msg)
+        # Has explicit import path.
+        if mapping_key in self.import_mappings:
+            import_path = tuple(self.import_mappings[mapping_key])
+        elif namespace[0] in DISALLOW_LOAD_FROM_PATH:
+            msg = (
+                "Trying to deserialize something that cannot "
+                "be deserialized in current version of langchain-core: "
+                f"{mapping_key}."
+            )
+            raise ValueError(msg)
+        # Otherwise, treat namespace as path.
+        else:
+            import_path = (*namespace, name)
+
+        cls = _import_class(import_path)
+
+        # The class must be a subclass of Serializable.
+        if not issubclass(cls, Serializable):
+            msg = f"Invalid namespace: {value}"
+            raise ValueError(msg)  # noqa: TRY004
+        return cls
 
     def __call__(self, value: dict[str, Any]) -> Any:
         """Revive the value.
@@ -113,11 +163,12 @@ class Reviver:
             NotImplementedError: If the object is not implemented and
                 `ignore_unserializable_fields` is False.
         """
-        if (
-            value.get("lc") == 1
-            and value.get("type") == "secret"
-            and value.get("id") is not None
-        ):
+        # Most of the objects in a payload are plain dicts, e.g. kwargs or metadata.
+        if value.get("lc") != 1 or value.get("id") is None:
+            return value
+        type_ = value.get("type")
+
+        if type_ == "secret":
             [key] = value["id"]
             if key in self.secrets_map:
                 return self.secrets_map[key]
@@ -125,11 +176,7 @@ class Reviver:
                 return os.environ[key]
             return None
 
-        if (
-            value.get("lc") == 1
-            and value.get("type") == "not_implemented"
-            and value.get("id") is not None
-        ):
+        if type_ == "not_implemented":
             if self.ignore_unserializable_fields:
                 return None
             msg = (
@@ -138,45 +185,12 @@ class Reviver:
             )
             raise NotImplementedError(msg)
 
-        if (
-            value.get("lc") == 1
-            and value.get("type") == "constructor"
-            and value.get("id") is not None
-        ):
-            [*namespace, name] = value["id"]
+        if type_ == "constructor":
             mapping_key = tuple(value["id"])
-
-            if (
-                namespace[0] not in self.valid_namespaces
-                # The root namespace ["langchain"] is not a valid identifier.
-                or namespace == ["langchain"]
-            ):
-                msg = f"Invalid namespace: {value}"
-                raise ValueError(msg)
-            # Has explicit import path.
-            if mapping_key in self.import_mappings:
-                import_path = self.import_mappings[mapping_key]
-                # Split into module and name
-                import_dir, name = import_path[:-1], import_path[-1]
-                # Import module
-                mod = importlib.import_module(".".join(import_dir))
-            elif namespace[0] in DISALLOW_LOAD_FROM_PATH:
-                msg = (
-                    "Trying to deserialize something that cannot "
-                    "be deserialized in current version of langchain-core: "
-                    f"{mapping_key}."
-                )
-                raise ValueError(msg)
-            # Otherwise, treat namespace as path.
-            else:
-                mod = importlib.import_module(".".join(namespace))
-
-            cls = getattr(mod, name)
-
-            # The class must be a subclass of Serializable.
-            if not issubclass(cls, Serializable):
-                msg = f"Invalid namespace: {value}"
-                raise ValueError(msg)
+            try:
+                cls = self._classes[mapping_key]
+            except KeyError:
+                cls = self._classes[mapping_key] = self._resolve_class(value)
 
             # We don't need to recurse on kwargs
             # as json.loads will do that for us.
@@ -4,8 +4,24 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import os
+import struct
 import threading
 import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from langchain_core.messages import BaseMessage
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+_T = TypeVar("_T")
 
 
 class BaseRateLimiter(abc.ABC):
@@ -244,7 +260,313 @@ class InMemoryRateLimiter(BaseRateLimiter):
         return True
 
 
+class RateLimiterBackend(abc.ABC):
+    """Storage of the state of a `WeightedRateLimiter`.
+
+    The state is a short list of floats that is read and updated atomically.
+    """
+
+    @abc.abstractmethod
+    def transact(self, update: Callable[[list[float]], _T]) -> _T:
+        """Atomically read, update and store the state.
+
+        Args:
+            update: Function called with the current state, which is empty if no
+                state was stored yet. It updates the list in place and returns a
+                result.
+
+        Returns:
+            The result of `update`.
+        """
+
+
+class InMemoryRateLimiterBackend(RateLimiterBackend):
+    """Backend that keeps the state in memory, shared by the threads of a process."""
+
+    def __init__(self) -> None:
+        """Create an InMemoryRateLimiterBackend."""
+        self._state: list[float] = []
+        self._lock = threading.Lock()
+
+    def transact(self, update: Callable[[list[float]], _T]) -> _T:
+        """Atomically read, update and store the state.
+
+        Args:
+            update: Function that updates the state in place and returns a result.
+
+        Returns:
+            The result of `update`.
+        """
+        with self._lock:
+            return update(self._state)
+
+
+_FILE_STATE = struct.Struct("3d")
+"""Request bucket level, token bucket level and time of the last update."""
+
+
+class FileRateLimiterBackend(RateLimiterBackend):
+    """Backend that keeps the state in a file, shared by the processes of a host.
+
+    Updates are serialized with an exclusive `flock` on the file, so all processes
+    that use the same path share one budget. Waiting happens outside of the lock.
+    Only available on POSIX systems.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Create a FileRateLimiterBackend.
+
+        Args:
+            path: The file holding the state. It is created if it does not exist.
+
+        Raises:
+            NotImplementedError: If file locking is not available on the platform.
+        """
+        if fcntl is None:
+            msg = "FileRateLimiterBackend requires fcntl, which is only on POSIX."
+            raise NotImplementedError(msg)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._pid: int | None = None
+
+    def _get_fd(self) -> int:
+        # A descriptor inherited through fork shares its lock with the parent, so
+        # each process opens the file itself.
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def transact(self, update: Callable[[list[float]], _T]) -> _T:
+        """Atomically read, update and store the state.
+
+        Args:
+            update: Function that updates the state in place and returns a result.
+
+        Returns:
+            The result of `update`.
+        """
+        with self._lock:
+            fd = self._get_fd()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(fd, _FILE_STATE.size, 0)
+                state = (
+                    list(_FILE_STATE.unpack(data))
+                    if len(data) == _FILE_STATE.size
+                    else []
+                )
+                result = update(state)
+                if state:
+                    os.pwrite(fd, _FILE_STATE.pack(*state), 0)
+                return result
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+
+
+class WeightedRateLimiter(BaseRateLimiter):
+    """A rate limiter that limits both requests and tokens, without polling.
+
+    The limiter holds two token buckets: one refilled at `requests_per_second`,
+    charged one unit per call, and an optional one refilled at `tokens_per_second`,
+    charged the `weight` of each call, e.g. the number of tokens of a prompt.
+
+    Each call reserves its units as soon as it arrives. A bucket may go into debt,
+    and the call then sleeps exactly until the debt is repaid instead of waking up
+    periodically to check. Since later calls see the debt of earlier ones, calls are
+    served in the order they arrive, whether they come from threads or coroutines.
+
+    When used as the `rate_limiter` of a chat model, each call is weighted with the
+    number of tokens of its input messages, as counted by `token_counter`.
+
+    By default the state is kept in memory. Pass a `FileRateLimiterBackend` to
+    share the budget between the processes of a host.
+
+    Example:
+        ```python
+        from langchain_core.rate_limiters import WeightedRateLimiter
+
+        # 500 requests and 30,000 tokens per minute
+        rate_limiter = WeightedRateLimiter(
+            requests_per_second=500 / 60,
+            tokens_per_second=30_000 / 60,
+            max_bucket_size=10,
+            max_token_bucket_size=10_000,
+        )
+        model = ChatAnthropic(model_name="...", rate_limiter=rate_limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float = 1,
+        max_bucket_size: float = 1,
+        tokens_per_second: float | None = None,
+        max_token_bucket_size: float | None = None,
+        token_counter: Callable[[Sequence[BaseMessage]], int] | None = None,
+        backend: RateLimiterBackend | None = None,
+    ) -> None:
+        """Create a WeightedRateLimiter.
+
+        Both buckets start full.
+
+        Args:
+            requests_per_second: Number of requests added to the request bucket per
+                second.
+            max_bucket_size: Maximum number of requests in the request bucket, i.e.
+                the maximum burst of requests.
+            tokens_per_second: Number of tokens added to the token bucket per
+                second. If `None`, tokens are not limited and weights are ignored.
+            max_token_bucket_size: Maximum number of tokens in the token bucket.
+                Defaults to `tokens_per_second`. Calls with a larger weight are
+                allowed, after waiting for the bucket to be repaid.
+            token_counter: Function that counts the tokens of the input messages of
+                a chat model call. Defaults to `count_tokens_approximately`.
+            backend: Where the state of the limiter is kept. Defaults to an
+                `InMemoryRateLimiterBackend`.
+
+        Raises:
+            ValueError: If a rate or bucket size is not positive.
+        """
+        if requests_per_second <= 0 or max_bucket_size <= 0:
+            msg = "requests_per_second and max_bucket_size must be positive."
+            raise ValueError(msg)
+        if tokens_per_second is not None and tokens_per_second <= 0:
+            msg = "tokens_per_second must be positive."
+            raise ValueError(msg)
+        self.requests_per_second = requests_per_second
+        self.max_bucket_size = max_bucket_size
+        self.tokens_per_second = tokens_per_second
+        self.max_token_bucket_size = (
+            max_token_bucket_size
+            if max_token_bucket_size is not None
+            else tokens_per_second or 0.0
+        )
+        self.token_counter = token_counter
+        self.backend = backend or InMemoryRateLimiterBackend()
+
+    def get_weight(self, messages: Sequence[BaseMessage]) -> float:
+        """Get the weight of a chat model call with the given input messages.
+
+        Args:
+            messages: The input messages.
+
+        Returns:
+            The number of tokens of the messages, or `0` if tokens are not limited.
+        """
+        if self.tokens_per_second is None:
+            return 0
+        if self.token_counter is None:
+            from langchain_core.messages.utils import (  # noqa: PLC0415
+                count_tokens_approximately,
+            )
+
+            return count_tokens_approximately(messages)
+        return self.token_counter(messages)
+
+    def _reserve(self, weight: float, *, reserve_if_waiting: bool) -> float | None:
+        """Reserve a request and `weight` tokens.
+
+        Returns:
+            The number of seconds to wait before the reservation is usable, or `None`
+            if waiting would be needed and `reserve_if_waiting` is `False`, in which
+            case nothing is reserved.
+        """
+        now = time.monotonic()
+        token_rate = self.tokens_per_second
+
+        def update(state: list[float]) -> float | None:
+            if not state:
+                state[:] = [self.max_bucket_size, self.max_token_bucket_size, now]
+            requests, tokens, last = state
+            # The clock is shared by the processes of a host, but may have been
+            # reset since the state was stored.
+            elapsed = max(0.0, now - last)
+            requests = min(
+                self.max_bucket_size, requests + elapsed * self.requests_per_second
+            )
+            requests -= 1
+            wait = max(0.0, -requests / self.requests_per_second)
+            if token_rate is not None:
+                tokens = min(self.max_token_bucket_size, tokens + elapsed * token_rate)
+                tokens -= weight
+                wait = max(wait, -tokens / token_rate)
+            if wait > 0 and not reserve_if_waiting:
+                return None
+            state[:] = [requests, tokens, max(now, last)]
+            return wait
+
+        return self.backend.transact(update)
+
+    def _refund(self, weight: float) -> None:
+        """Give back a reservation that will not be used."""
+
+        def update(state: list[float]) -> None:
+            if state:
+                state[0] = min(self.max_bucket_size, state[0] + 1)
+                if self.tokens_per_second is not None:
+                    state[1] = min(self.max_token_bucket_size, state[1] + weight)
+
+        self.backend.transact(update)
+
+    def acquire(self, *, blocking: bool = True, weight: float = 0) -> bool:
+        """Acquire a request and `weight` tokens from the rate limiter.
+
+        Args:
+            blocking: If `True`, the method blocks until the request and tokens are
+                available. If `False`, the method returns immediately with the
+                result of the attempt.
+            weight: The number of tokens to charge.
+
+        Returns:
+            `True` if the request and tokens were acquired, `False` otherwise.
+        """
+        wait = self._reserve(weight, reserve_if_waiting=blocking)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True, weight: float = 0) -> bool:
+        """Acquire a request and `weight` tokens from the rate limiter. Async version.
+
+        If the caller is cancelled while waiting, the reservation is given back.
+
+        Args:
+            blocking: If `True`, the method waits until the request and tokens are
+                available. If `False`, the method returns immediately with the
+                result of the attempt.
+            weight: The number of tokens to charge.
+
+        Returns:
+            `True` if the request and tokens were acquired, `False` otherwise.
+        """
+        wait = self._reserve(weight, reserve_if_waiting=blocking)
+        if wait is None:
+            return False
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund(weight)
+                raise
+        return True
+
+
 __all__ = [
     "BaseRateLimiter",
+    "FileRateLimiterBackend",
     "InMemoryRateLimiter",
+    "InMemoryRateLimiterBackend",
+    "RateLimiterBackend",
+    "WeightedRateLimiter",
 ]
@@ -245,6 +245,19 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
 
     See `ConfigurableFieldSpec` for more details.
     """
+    max_history_messages: int | None = None
+    """Maximum number of historic messages to pass to the runnable for each call.
+
+    The window is read with `get_recent_messages`, which loads the whole history
+    unless the chat message history over-rides it. If `None`, the whole history is
+    used.
+    """
+    max_history_tokens: int | None = None
+    """Maximum number of tokens of historic messages to pass on for each call.
+
+    Tokens are counted by the chat message history, by default with
+    `count_tokens_approximately`. If `None`, the number of tokens is not limited.
+    """
 
     def __init__(
         self,
@@ -259,6 +272,8 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
         output_messages_key: str | None = None,
         history_messages_key: str | None = None,
         history_factory_config: Sequence[ConfigurableFieldSpec] | None = None,
+        max_history_messages: int | None = None,
+        max_history_tokens: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize `RunnableWithMessageHistory`.
@@ -316,6 +331,12 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
 
                 Specifying these allows you to pass multiple config keys into the
                 `get_session_history` factory.
+            max_history_messages: Maximum number of the most recent historic
+                messages to pass to the runnable for each call. If `None`, the whole
+                history is used.
+            max_history_tokens: Maximum number of tokens of the most recent historic
+                messages to pass to the runnable for each call. If `None`, the number
+                of tokens is not limited.
             **kwargs: Arbitrary additional kwargs to pass to parent class
                 `RunnableBindingBase` init.
 
@@ -368,6 +389,8 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
             bound=bound,
             history_messages_key=history_messages_key,
             history_factory_config=config_specs,
+            max_history_messages=max_history_messages,
+            max_history_tokens=max_history_tokens,
             **kwargs,
         )
         self._history_chain = history_chain
@@ -440,9 +463,7 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
             module_name=self.__class__.__module__,
         )
 
-    def _get_input_messages(
-        self, input_val: str | BaseMessage | Sequence[BaseMessage] | dict
-    ) -> list[BaseMessage]:
+    def _get_input_value(self, input_val: Any) -> Any:
         # If dictionary, try to pluck the single key representing messages
         if isinstance(input_val, dict):
             if self.input_messages_key:
@@ -452,6 +473,12 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
             else:
                 key = "input"
             input_val = input_val[key]
+        return input_val
+
+    def _get_input_messages(
+        self, input_val: str | BaseMessage | Sequence[BaseMessage] | dict
+    ) -> list[BaseMessage]:
+        input_val = self._get_input_value(input_val)
 
         # If value is a string, convert to a human message
         if isinstance(input_val, str):
@@ -511,7 +538,11 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
 
     def _enter_history(self, value: Any, config: RunnableConfig) -> list[BaseMessage]:
         hist: BaseChatMessageHistory = config["configurable"]["message_history"]
-        messages = hist.messages.copy()
+        messages = hist.get_recent_messages(
+            self.max_history_messages, max_tokens=self.max_history_tokens
+        )
+        if cursor := config["configurable"].get("message_history_cursor"):
+            cursor.num_history = len(messages)
 
         if not self.history_messages_key:
             # return all messages
@@ -525,7 +556,11 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
         self, value: dict[str, Any], config: RunnableConfig
     ) -> list[BaseMessage]:
         hist: BaseChatMessageHistory = config["configurable"]["message_history"]
-        messages = (await hist.aget_messages()).copy()
+        messages = await hist.aget_recent_messages(
+            self.max_history_messages, max_tokens=self.max_history_tokens
+        )
+        if cursor := config["configurable"].get("message_history_cursor"):
+            cursor.num_history = len(messages)
 
         if not self.history_messages_key:
             # return all messages
@@ -535,17 +570,38 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
             messages += self._get_input_messages(input_val)
         return messages
 
+    def _get_new_input_messages(
+        self, inputs: dict[str, Any], num_history: int
+    ) -> list[BaseMessage]:
+        # Only deserialize the input messages, without the historic messages that
+        # were prepended to them or passed under the history key.
+        input_val = self._get_input_value(inputs)
+        if not self.history_messages_key and isinstance(input_val, (list, tuple)):
+            # Chat models receive a single list of messages per batch item
+            if len(input_val) == 1 and isinstance(input_val[0], list):
+                input_val = [input_val[0][num_history:]]
+            else:
+                input_val = input_val[num_history:]
+        return self._get_input_messages(load(input_val))
+
     def _exit_history(self, run: Run, config: RunnableConfig) -> None:
         hist: BaseChatMessageHistory = config["configurable"]["message_history"]
 
-        # Get the input messages
-        inputs = load(run.inputs)
-        input_messages = self._get_input_messages(inputs)
-        # If historic messages were prepended to the input messages, remove them to
-        # avoid adding duplicate messages to history.
-        if not self.history_messages_key:
-            historic_messages = config["configurable"]["message_history"].messages
-            input_messages = input_messages[len(historic_messages) :]
+        # Get the input messages. If historic messages were prepended to the input
+        # messages, remove them to avoid adding duplicate messages to history.
+        if cursor := config["configurable"].get("message_history_cursor"):
+            num_history = cursor.num_history
+        elif self.history_messages_key:
+            num_history = 0
+        else:
+            # The history is only written on exit, so it still holds the window
+            # that was loaded on enter.
+            num_history = len(
+                hist.get_recent_messages(
+                    self.max_history_messages, max_tokens=self.max_history_tokens
+                )
+            )
+        input_messages = self._get_new_input_messages(run.inputs, num_history)
 
         # Get the output messages
         output_val = load(run.outputs)
@@ -555,14 +611,19 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
     async def _aexit_history(self, run: Run, config: RunnableConfig) -> None:
         hist: BaseChatMessageHistory = config["configurable"]["message_history"]
 
-        # Get the input messages
-        inputs = load(run.inputs)
-        input_messages = self._get_input_messages(inputs)
-        # If historic messages were prepended to the input messages, remove them to
-        # avoid adding duplicate messages to history.
-        if not self.history_messages_key:
-            historic_messages = await hist.aget_messages()
-            input_messages = input_messages[len(historic_messages) :]
+        # Get the input messages. If historic messages were prepended to the input
+        # messages, remove them to avoid adding duplicate messages to history.
+        if cursor := config["configurable"].get("message_history_cursor"):
+            num_history = cursor.num_history
+        elif self.history_messages_key:
+            num_history = 0
+        else:
+            num_history = len(
+                await hist.aget_recent_messages(
+                    self.max_history_messages, max_tokens=self.max_history_tokens
+                )
+            )
+        input_messages = self._get_new_input_messages(run.inputs, num_history)
 
         # Get the output messages
         output_val = load(run.outputs)
@@ -613,9 +674,23 @@ class RunnableWithMessageHistory(RunnableBindingBase):  # type: ignore[no-redef]
                 **{key: configurable[key] for key in expected_keys}
             )
         config["configurable"]["message_history"] = message_history
+        config["configurable"]["message_history_cursor"] = _HistoryCursor()
         return config
 
 
+class _HistoryCursor:
+    """Number of historic messages loaded by a single call.
+
+    Shared by reference between entering and exiting the history of a call, so
+    that only the new messages are written back without re-reading the history.
+    """
+
+    __slots__ = ("num_history",)
+
+    def __init__(self) -> None:
+        self.num_history = 0
+
+
 def _get_parameter_names(callable_: GetSessionHistoryCallable) -> list[str]:
     """Get the parameter names of the `Callable`."""
     sig = inspect.signature(callable_)
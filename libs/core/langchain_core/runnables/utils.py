@@ -689,6 +689,14 @@ class _RootEventFilter:
 
     def include_event(self, event: StreamEvent, root_type: str) -> bool:
         """Determine whether to include an event."""
+        return self.include_run(event["name"], root_type, event.get("tags"))
+
+    def include_run(self, name: str, run_type: str, tags: list[str] | None) -> bool:
+        """Determine whether to include the events of a run.
+
+        The filters only look at the name, type and tags of a run, which are fixed
+        when it starts, so this can be evaluated once per run.
+        """
         if (
             self.include_names is None
             and self.include_types is None
@@ -698,19 +706,19 @@ class _RootEventFilter:
         else:
             include = False
 
-        event_tags = event.get("tags") or []
+        event_tags = tags or []
 
         if self.include_names is not None:
-            include = include or event["name"] in self.include_names
+            include = include or name in self.include_names
         if self.include_types is not None:
-            include = include or root_type in self.include_types
+            include = include or run_type in self.include_types
         if self.include_tags is not None:
             include = include or any(tag in self.include_tags for tag in event_tags)
 
         if self.exclude_names is not None:
-            include = include and event["name"] not in self.exclude_names
+            include = include and name not in self.exclude_names
         if self.exclude_types is not None:
-            include = include and root_type not in self.exclude_types
+            include = include and run_type not in self.exclude_types
         if self.exclude_tags is not None:
             include = include and all(
                 tag not in self.exclude_tags for tag in event_tags
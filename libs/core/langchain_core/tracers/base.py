@@ -44,7 +44,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
 
     def _end_trace(self, run: Run) -> None:
         """End a trace for a run."""
-        if not run.parent_run_id:
+        if not run.parent_run_id and self._should_persist(run):
             self._persist_run(run)
         self.run_map.pop(str(run.id))
         self._on_run_update(run)
@@ -60,7 +60,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         metadata: dict[str, Any] | None = None,
         name: str | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Start a trace for an LLM run.
 
         Args:
@@ -74,8 +74,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         chat_model_run = self._create_chat_model_run(
             serialized=serialized,
             messages=messages,
@@ -101,7 +103,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         metadata: dict[str, Any] | None = None,
         name: str | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Start a trace for an LLM run.
 
         Args:
@@ -115,8 +117,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         llm_run = self._create_llm_run(
             serialized=serialized,
             prompts=prompts,
@@ -140,7 +144,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         run_id: UUID,
         parent_run_id: UUID | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Run on new LLM token. Only available when streaming is enabled.
 
         Args:
@@ -151,8 +155,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_event(run_id):
+            return None
         # "chat_model" is only used for the experimental new streaming_events format.
         # This change should not affect any existing tracers.
         llm_run = self._llm_run_with_token_event(
@@ -171,7 +177,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         *,
         run_id: UUID,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Run on retry.
 
         Args:
@@ -180,15 +186,19 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_event(run_id):
+            return None
         return self._llm_run_with_retry_event(
             retry_state=retry_state,
             run_id=run_id,
         )
 
     @override
-    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> Run:
+    def on_llm_end(
+        self, response: LLMResult, *, run_id: UUID, **kwargs: Any
+    ) -> Run | None:
         """End a trace for an LLM run.
 
         Args:
@@ -197,8 +207,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         # "chat_model" is only used for the experimental new streaming_events format.
         # This change should not affect any existing tracers.
         llm_run = self._complete_llm_run(
@@ -215,7 +227,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         *,
         run_id: UUID,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Handle an error for an LLM run.
 
         Args:
@@ -224,8 +236,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         # "chat_model" is only used for the experimental new streaming_events format.
         # This change should not affect any existing tracers.
         llm_run = self._errored_llm_run(
@@ -248,7 +262,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         run_type: str | None = None,
         name: str | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Start a trace for a chain run.
 
         Args:
@@ -263,8 +277,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         chain_run = self._create_chain_run(
             serialized=serialized,
             inputs=inputs,
@@ -288,7 +304,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         run_id: UUID,
         inputs: dict[str, Any] | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """End a trace for a chain run.
 
         Args:
@@ -298,8 +314,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         chain_run = self._complete_chain_run(
             outputs=outputs,
             run_id=run_id,
@@ -317,7 +335,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         inputs: dict[str, Any] | None = None,
         run_id: UUID,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Handle an error for a chain run.
 
         Args:
@@ -327,8 +345,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         chain_run = self._errored_chain_run(
             error=error,
             run_id=run_id,
@@ -350,7 +370,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         name: str | None = None,
         inputs: dict[str, Any] | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Start a trace for a tool run.
 
         Args:
@@ -365,8 +385,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         tool_run = self._create_tool_run(
             serialized=serialized,
             input_str=input_str,
@@ -383,7 +405,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         return tool_run
 
     @override
-    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> Run:
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> Run | None:
         """End a trace for a tool run.
 
         Args:
@@ -392,8 +414,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         tool_run = self._complete_tool_run(
             output=output,
             run_id=run_id,
@@ -409,7 +433,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         *,
         run_id: UUID,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Handle an error for a tool run.
 
         Args:
@@ -418,8 +442,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         tool_run = self._errored_tool_run(
             error=error,
             run_id=run_id,
@@ -439,7 +465,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         metadata: dict[str, Any] | None = None,
         name: str | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Run when the Retriever starts running.
 
         Args:
@@ -453,8 +479,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         retrieval_run = self._create_retrieval_run(
             serialized=serialized,
             query=query,
@@ -476,7 +504,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
         *,
         run_id: UUID,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Run when Retriever errors.
 
         Args:
@@ -485,8 +513,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         retrieval_run = self._errored_retrieval_run(
             error=error,
             run_id=run_id,
@@ -498,7 +528,7 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
     @override
     def on_retriever_end(
         self, documents: Sequence[Document], *, run_id: UUID, **kwargs: Any
-    ) -> Run:
+    ) -> Run | None:
         """Run when the Retriever ends running.
 
         Args:
@@ -507,8 +537,10 @@ class BaseTracer(_TracerCore, BaseCallbackHandler, ABC):
             **kwargs: Additional arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_end(run_id):
+            return None
         retrieval_run = self._complete_retrieval_run(
             documents=documents,
             run_id=run_id,
@@ -551,7 +583,7 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         Ending a trace will run concurrently with each _on_[run_type]_end method.
         No _on_[run_type]_end callback should depend on operations in _end_trace.
         """
-        if not run.parent_run_id:
+        if not run.parent_run_id and self._should_persist(run):
             await self._persist_run(run)
         self.run_map.pop(str(run.id))
         await self._on_run_update(run)
@@ -569,6 +601,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         name: str | None = None,
         **kwargs: Any,
     ) -> Any:
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         chat_model_run = self._create_chat_model_run(
             serialized=serialized,
             messages=messages,
@@ -598,6 +632,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         metadata: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return
         llm_run = self._create_llm_run(
             serialized=serialized,
             prompts=prompts,
@@ -620,6 +656,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         parent_run_id: UUID | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_event(run_id):
+            return
         llm_run = self._llm_run_with_token_event(
             token=token,
             run_id=run_id,
@@ -636,6 +674,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_event(run_id):
+            return
         self._llm_run_with_retry_event(
             retry_state=retry_state,
             run_id=run_id,
@@ -651,6 +691,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         tags: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         llm_run = self._complete_llm_run(
             response=response,
             run_id=run_id,
@@ -668,6 +710,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         tags: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         llm_run = self._errored_llm_run(
             error=error,
             run_id=run_id,
@@ -689,6 +733,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         name: str | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return
         chain_run = self._create_chain_run(
             serialized=serialized,
             inputs=inputs,
@@ -712,6 +758,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         inputs: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         chain_run = self._complete_chain_run(
             outputs=outputs,
             run_id=run_id,
@@ -729,6 +777,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         chain_run = self._errored_chain_run(
             error=error,
             inputs=inputs,
@@ -751,6 +801,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         inputs: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return
         tool_run = self._create_tool_run(
             serialized=serialized,
             input_str=input_str,
@@ -772,6 +824,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         tool_run = self._complete_tool_run(
             output=output,
             run_id=run_id,
@@ -789,6 +843,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         tags: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         tool_run = self._errored_tool_run(
             error=error,
             run_id=run_id,
@@ -809,6 +865,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         name: str | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return
         retriever_run = self._create_retrieval_run(
             serialized=serialized,
             query=query,
@@ -834,6 +892,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         tags: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         retrieval_run = self._errored_retrieval_run(
             error=error,
             run_id=run_id,
@@ -854,6 +914,8 @@ class AsyncBaseTracer(_TracerCore, AsyncCallbackHandler, ABC):
         tags: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
+        if self._skip_run_end(run_id):
+            return
         retrieval_run = self._complete_retrieval_run(
             documents=documents,
             run_id=run_id,
@@ -0,0 +1,325 @@
+"""A tracer that exports finished runs in batches from a background thread."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import urllib.request
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+from uuid import UUID
+
+from langchain_core.load.dump import default
+from langchain_core.tracers.base import BaseTracer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from langchain_core.tracers.schemas import Run
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    return default(obj)
+
+
+def dumps_run(run: dict[str, Any]) -> str:
+    """Serialize an exported run to a JSON string.
+
+    Args:
+        run: The run, as passed to `RunSink.export`.
+
+    Returns:
+        The run as a single-line JSON string.
+    """
+    return json.dumps(run, default=_json_default, ensure_ascii=False)
+
+
+class RunSink(ABC):
+    """Destination that a `BatchExportTracer` exports finished runs to."""
+
+    @abstractmethod
+    def export(self, runs: Sequence[dict[str, Any]]) -> None:
+        """Export a batch of runs.
+
+        Called from the background thread of the exporter, one batch at a time.
+
+        Args:
+            runs: The runs, as dictionaries. Child runs are exported as separate
+                entries that reference their parent with `parent_run_id`.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources held by the sink."""
+
+
+class JSONLRunSink(RunSink):
+    """Sink that appends runs to a file, one JSON object per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Create a JSONLRunSink.
+
+        Args:
+            path: The file to append runs to. It is created if it does not exist.
+        """
+        self.path = Path(path)
+        self._file: TextIO | None = None
+
+    def export(self, runs: Sequence[dict[str, Any]]) -> None:
+        """Append a batch of runs to the file.
+
+        Args:
+            runs: The runs to append.
+        """
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write("".join(dumps_run(run) + "\n" for run in runs))
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class HTTPRunSink(RunSink):
+    """Sink that POSTs each batch of runs as a JSON array to an HTTP endpoint."""
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """Create an HTTPRunSink.
+
+        Args:
+            url: The URL of the endpoint.
+            headers: Additional headers to send with each request.
+            timeout: Timeout of each request, in seconds.
+        """
+        self.url = url
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.timeout = timeout
+
+    def export(self, runs: Sequence[dict[str, Any]]) -> None:
+        """POST a batch of runs to the endpoint.
+
+        Args:
+            runs: The runs to send.
+
+        Raises:
+            urllib.error.URLError: If the request fails or the endpoint responds with
+                an error status.
+        """
+        body = ("[" + ",".join(dumps_run(run) for run in runs) + "]").encode()
+        request = urllib.request.Request(  # noqa: S310
+            self.url, data=body, headers=self.headers, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):  # noqa: S310
+            pass
+
+
+def _iter_runs(run: Run) -> Iterator[Run]:
+    stack = [run]
+    while stack:
+        run_ = stack.pop()
+        yield run_
+        stack.extend(reversed(run_.child_runs))
+
+
+class _BatchExporter:
+    """Queue and background worker of a `BatchExportTracer`.
+
+    Kept separate from the tracer so that the worker thread does not keep the
+    tracer alive.
+    """
+
+    def __init__(
+        self,
+        sink: RunSink,
+        *,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        include_child_runs: bool,
+    ) -> None:
+        self.sink = sink
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.include_child_runs = include_child_runs
+        # Appending to and popping from a deque are atomic, so the callback path
+        # never waits on the worker.
+        self.queue: deque[Run] = deque()
+        self.wakeup = threading.Event()
+        self.export_lock = threading.Lock()
+        self.lock = threading.Lock()
+        self.worker: threading.Thread | None = None
+        self.closed = False
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def put(self, run: Run) -> None:
+        if self.closed or len(self.queue) >= self.max_queue_size:
+            with self.lock:
+                self.dropped += 1
+            return
+        self.queue.append(run)
+        if self.worker is None:
+            self._start_worker()
+        if len(self.queue) >= self.batch_size:
+            self.wakeup.set()
+
+    def _start_worker(self) -> None:
+        with self.lock:
+            if self.worker is None:
+                self.worker = threading.Thread(
+                    target=self._work, name="langchain-batch-export", daemon=True
+                )
+                self.worker.start()
+
+    def _work(self) -> None:
+        while not self.closed:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        with self.export_lock:
+            while self.queue:
+                batch: list[Run] = []
+                while self.queue and len(batch) < self.batch_size:
+                    batch.append(self.queue.popleft())
+                self._export(batch)
+
+    def _export(self, batch: list[Run]) -> None:
+        try:
+            runs = [
+                run_.model_dump(exclude={"child_runs"})
+                for run in batch
+                for run_ in (_iter_runs(run) if self.include_child_runs else (run,))
+            ]
+            self.sink.export(runs)
+        except Exception:
+            logger.warning("Failed to export %d runs.", len(batch), exc_info=True)
+            with self.lock:
+                self.failed += len(batch)
+        else:
+            with self.lock:
+                self.exported += len(batch)
+
+    def shutdown(self, timeout: float | None) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.wakeup.set()
+        if self.worker is not None and self.worker is not threading.current_thread():
+            self.worker.join(timeout)
+        self.flush()
+        try:
+            self.sink.close()
+        except Exception:
+            logger.warning("Failed to close run sink.", exc_info=True)
+
+
+class BatchExportTracer(BaseTracer):
+    """Tracer that exports finished runs to a sink from a background thread.
+
+    Finishing a root run only appends it to a bounded queue. Converting the runs
+    to dictionaries and writing them to the sink happens on a background thread,
+    in batches of up to `batch_size` root runs, whenever the queue holds a full
+    batch or every `flush_interval` seconds. When the queue is full, new runs are
+    dropped and counted in `dropped_runs` rather than blocking the caller.
+
+    The queue is flushed when `shutdown` is called, when the tracer is garbage
+    collected, and at interpreter exit.
+
+    Example:
+        ```python
+        from langchain_core.tracers.batch_export import (
+            BatchExportTracer,
+            JSONLRunSink,
+        )
+
+        tracer = BatchExportTracer(JSONLRunSink("runs.jsonl"))
+        chain.invoke(..., config={"callbacks": [tracer]})
+        tracer.flush()
+        ```
+    """
+
+    name: str = "batch_export_tracer"
+
+    def __init__(
+        self,
+        sink: RunSink,
+        *,
+        max_queue_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        include_child_runs: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """Create a BatchExportTracer.
+
+        Args:
+            sink: The sink to export runs to.
+            max_queue_size: Maximum number of root runs waiting to be exported.
+            batch_size: Maximum number of root runs exported in a single batch.
+            flush_interval: Maximum number of seconds a run waits in the queue
+                before it is exported.
+            include_child_runs: Whether to export the child runs of each root run.
+            **kwargs: Additional keyword arguments.
+        """
+        super().__init__(**kwargs)
+        self.sink = sink
+        self._exporter = _BatchExporter(
+            sink,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            include_child_runs=include_child_runs,
+        )
+        self._finalizer = weakref.finalize(self, self._exporter.shutdown, None)
+
+    @property
+    def exported_runs(self) -> int:
+        """Number of root runs exported to the sink."""
+        return self._exporter.exported
+
+    @property
+    def dropped_runs(self) -> int:
+        """Number of root runs dropped because the queue was full or closed."""
+        return self._exporter.dropped
+
+    @property
+    def failed_runs(self) -> int:
+        """Number of root runs in batches that the sink failed to export."""
+        return self._exporter.failed
+
+    def _persist_run(self, run: Run) -> None:
+        self._exporter.put(run)
+
+    def flush(self) -> None:
+        """Export all queued runs, blocking until the sink has received them."""
+        self._exporter.flush()
+
+    def shutdown(self) -> None:
+        """Stop the background thread, export all queued runs and close the sink.
+
+        Runs that finish after shutdown are dropped.
+        """
+        self._finalizer()
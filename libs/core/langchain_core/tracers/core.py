@@ -15,6 +15,7 @@ from typing import (
 
 from langchain_core.exceptions import TracerException
 from langchain_core.load import dumpd
+from langchain_core.tracers.sampling import TRACE_SAMPLE_KEY, sample_value_from_id
 from langchain_core.tracers.schemas import Run
 
 if TYPE_CHECKING:
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
         GenerationChunk,
         LLMResult,
     )
+    from langchain_core.tracers.sampling import TraceSampler
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,7 @@ class _TracerCore(ABC):
         _schema_format: Literal[
             "original", "streaming_events", "original+chat"
         ] = "original",
+        sampler: TraceSampler | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the tracer.
@@ -68,6 +71,8 @@ class _TracerCore(ABC):
                   for streaming events.
                 - 'original+chat' is a format that is the same as 'original'
                   except it does NOT raise an attribute error on_chat_model_start
+            sampler: Decides which traces are recorded and persisted. If `None`,
+                all traces are.
             **kwargs: Additional keyword arguments that will be passed to
                 the superclass.
         """
@@ -77,6 +82,12 @@ class _TracerCore(ABC):
         """Map of run ID to run. Cleared on run end."""
         self.order_map: dict[UUID, tuple[UUID, str]] = {}
         """Map of run ID to (trace_id, dotted_order). Cleared when tracer GCed."""
+        self.sampler = sampler
+        self._unsampled_runs: set[UUID] = set()
+        """IDs of the started runs of traces that were not sampled."""
+        self._tail_sampled_runs: set[UUID] = set()
+        """IDs of the started root runs that are only persisted if kept by the
+        tail sampling decision."""
 
     @abstractmethod
     def _persist_run(self, run: Run) -> Coroutine[Any, Any, None] | None:
@@ -100,6 +111,51 @@ class _TracerCore(ABC):
         except:  # noqa: E722
             return msg
 
+    def _skip_run_start(
+        self,
+        run_id: UUID,
+        parent_run_id: UUID | None,
+        metadata: dict[str, Any] | None,
+    ) -> bool:
+        """Decide whether a starting run is skipped by the sampler."""
+        if self.sampler is None:
+            return False
+        if parent_run_id is not None and parent_run_id in self._unsampled_runs:
+            self._unsampled_runs.add(run_id)
+            return True
+        is_root = parent_run_id is None or parent_run_id not in self.order_map
+        sample_value = (metadata or {}).get(TRACE_SAMPLE_KEY)
+        if sample_value is None:
+            if not is_root:
+                return False
+            sample_value = sample_value_from_id(run_id)
+        if self.sampler.is_sampled(sample_value):
+            return False
+        if self.sampler.tail_sampling:
+            if is_root:
+                self._tail_sampled_runs.add(run_id)
+            return False
+        self._unsampled_runs.add(run_id)
+        return True
+
+    def _skip_run_event(self, run_id: UUID) -> bool:
+        """Whether an event of a run is skipped by the sampler."""
+        return bool(self._unsampled_runs) and run_id in self._unsampled_runs
+
+    def _skip_run_end(self, run_id: UUID) -> bool:
+        """Whether the end of a run is skipped by the sampler."""
+        if self._unsampled_runs and run_id in self._unsampled_runs:
+            self._unsampled_runs.discard(run_id)
+            return True
+        return False
+
+    def _should_persist(self, run: Run) -> bool:
+        """Make the tail sampling decision for a finished root run."""
+        if not self._tail_sampled_runs or run.id not in self._tail_sampled_runs:
+            return True
+        self._tail_sampled_runs.discard(run.id)
+        return self.sampler is None or self.sampler.should_keep(run)
+
     def _start_trace(self, run: Run) -> Coroutine[Any, Any, None] | None:  # type: ignore[return]
         current_dotted_order = run.start_time.strftime("%Y%m%dT%H%M%S%fZ") + str(run.id)
         if run.parent_run_id:
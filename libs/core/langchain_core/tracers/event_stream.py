@@ -73,6 +73,10 @@ class RunInfo(TypedDict):
     """The inputs to the run."""
     parent_run_id: UUID | None
     """The ID of the parent run."""
+    parent_ids: list[str]
+    """The IDs of the ancestors of the run, from the root to the immediate parent."""
+    interested: bool
+    """Whether the events of the run pass the event filters."""
 
 
 def _assign_name(name: str | None, serialized: dict[str, Any] | None) -> str:
@@ -138,6 +142,12 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         self.receive_stream = memory_stream.get_receive_stream()
 
     def _get_parent_ids(self, run_id: UUID) -> list[str]:
+        """Get the parent IDs of a run cast to strings."""
+        if (run_info := self.run_map.get(run_id)) is not None:
+            return run_info["parent_ids"]
+        return self._walk_parent_ids(run_id)
+
+    def _walk_parent_ids(self, run_id: UUID) -> list[str]:
         """Get the parent IDs of a run (non-recursively) cast to strings."""
         parent_ids = []
 
@@ -198,7 +208,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             # run has finished, don't issue any stream events
             yield cast("T", first)
             return
-        if tap is sentinel:
+        if tap is sentinel and run_info["interested"]:
             # if we are the first to tap, issue stream events
             event: StandardStreamEvent = {
                 "event": f"on_{run_info['run_type']}_stream",
@@ -207,19 +217,16 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
                 "data": {},
-                "parent_ids": self._get_parent_ids(run_id),
+                "parent_ids": run_info["parent_ids"],
             }
-            self._send({**event, "data": {"chunk": first}}, run_info["run_type"])
+            self.send_stream.send_nowait({**event, "data": {"chunk": first}})
             yield cast("T", first)
             # consume the rest of the output
             async for chunk in output:
-                self._send(
-                    {**event, "data": {"chunk": chunk}},
-                    run_info["run_type"],
-                )
+                self.send_stream.send_nowait({**event, "data": {"chunk": chunk}})
                 yield chunk
         else:
-            # otherwise just pass through
+            # otherwise (already tapped or filtered out) just pass through
             yield cast("T", first)
             # consume the rest of the output
             async for chunk in output:
@@ -248,7 +255,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             # run has finished, don't issue any stream events
             yield cast("T", first)
             return
-        if tap is sentinel:
+        if tap is sentinel and run_info["interested"]:
             # if we are the first to tap, issue stream events
             event: StandardStreamEvent = {
                 "event": f"on_{run_info['run_type']}_stream",
@@ -257,19 +264,16 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
                 "data": {},
-                "parent_ids": self._get_parent_ids(run_id),
+                "parent_ids": run_info["parent_ids"],
             }
-            self._send({**event, "data": {"chunk": first}}, run_info["run_type"])
+            self.send_stream.send_nowait({**event, "data": {"chunk": first}})
             yield cast("T", first)
             # consume the rest of the output
             for chunk in output:
-                self._send(
-                    {**event, "data": {"chunk": chunk}},
-                    run_info["run_type"],
-                )
+                self.send_stream.send_nowait({**event, "data": {"chunk": chunk}})
                 yield chunk
         else:
-            # otherwise just pass through
+            # otherwise (already tapped or filtered out) just pass through
             yield cast("T", first)
             # consume the rest of the output
             for chunk in output:
@@ -285,14 +289,27 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_: str,
         run_type: str,
         **kwargs: Any,
-    ) -> None:
-        """Update the run info."""
+    ) -> RunInfo:
+        """Update the run info.
+
+        The parent IDs and whether the run passes the event filters are computed
+        once here, so events of runs that are filtered out are never built.
+        """
+        if parent_run_id is None:
+            parent_ids = []
+        elif (parent_info := self.run_map.get(parent_run_id)) is not None:
+            parent_ids = [*parent_info["parent_ids"], str(parent_run_id)]
+        else:
+            parent_ids = [*self._walk_parent_ids(parent_run_id), str(parent_run_id)]
+
         info: RunInfo = {
             "tags": tags or [],
             "metadata": metadata or {},
             "name": name_,
             "run_type": run_type,
             "parent_run_id": parent_run_id,
+            "parent_ids": parent_ids,
+            "interested": self.root_event_filter.include_run(name_, run_type, tags),
         }
 
         if "inputs" in kwargs:
@@ -304,6 +321,16 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         self.run_map[run_id] = info
         self.parent_map[run_id] = parent_run_id
 
+        if str(run_id) in parent_ids:
+            # The run is its own ancestor; don't issue any events for it.
+            info["interested"] = False
+            msg = (
+                f"Parent ID {run_id} is already in the parent_ids list. "
+                f"This should never happen."
+            )
+            raise AssertionError(msg)
+        return info
+
     @override
     async def on_chat_model_start(
         self,
@@ -321,7 +348,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "chat_model"
 
-        self._write_run_start_info(
+        run_info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -331,7 +358,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs={"messages": messages},
         )
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_chat_model_start",
                 "data": {
@@ -341,9 +370,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": tags or [],
                 "run_id": str(run_id),
                 "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -363,7 +391,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "llm"
 
-        self._write_run_start_info(
+        run_info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -373,7 +401,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs={"prompts": prompts},
         )
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_llm_start",
                 "data": {
@@ -385,9 +415,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": tags or [],
                 "run_id": str(run_id),
                 "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -433,7 +462,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         if run_info is None:
             msg = f"Run ID {run_id} not found in run map."
             raise AssertionError(msg)
-        if self.is_tapped.get(run_id):
+        if self.is_tapped.get(run_id) or not run_info["interested"]:
             return
         if run_info["run_type"] == "chat_model":
             event = "on_chat_model_stream"
@@ -453,7 +482,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             msg = f"Unexpected run type: {run_info['run_type']}"
             raise ValueError(msg)
 
-        self._send(
+        self.send_stream.send_nowait(
             {
                 "event": event,
                 "data": {
@@ -463,9 +492,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_info["run_type"],
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -480,6 +508,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             ValueError: If the run type is not `'llm'` or `'chat_model'`.
         """
         run_info = self.run_map.pop(run_id)
+        if not run_info["interested"]:
+            return
         inputs_ = run_info.get("inputs")
 
         generations: list[list[GenerationChunk]] | list[list[ChatGenerationChunk]]
@@ -516,7 +546,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             msg = f"Unexpected run type: {run_info['run_type']}"
             raise ValueError(msg)
 
-        self._send(
+        self.send_stream.send_nowait(
             {
                 "event": event,
                 "data": {"output": output, "input": inputs_},
@@ -524,9 +554,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_info["run_type"],
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     async def on_chain_start(
@@ -554,7 +583,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             data["input"] = inputs
             kwargs["inputs"] = inputs
 
-        self._write_run_start_info(
+        run_info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -564,7 +593,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             **kwargs,
         )
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": f"on_{run_type_}_start",
                 "data": data,
@@ -572,9 +603,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": tags or [],
                 "run_id": str(run_id),
                 "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type_,
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -599,7 +629,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             "input": inputs,
         }
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": event,
                 "data": data,
@@ -607,9 +639,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     def _get_tool_run_info_with_inputs(self, run_id: UUID) -> tuple[RunInfo, Any]:
@@ -651,7 +682,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """Start a trace for a tool run."""
         name_ = _assign_name(name, serialized)
 
-        self._write_run_start_info(
+        run_info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -661,7 +692,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs=inputs,
         )
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_tool_start",
                 "data": {
@@ -671,9 +704,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": tags or [],
                 "run_id": str(run_id),
                 "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            "tool",
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -689,7 +721,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """Run when tool errors."""
         run_info, inputs = self._get_tool_run_info_with_inputs(run_id)
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_tool_error",
                 "data": {
@@ -700,9 +734,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            "tool",
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -714,7 +747,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """
         run_info, inputs = self._get_tool_run_info_with_inputs(run_id)
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_tool_end",
                 "data": {
@@ -725,9 +760,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            "tool",
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -747,7 +781,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "retriever"
 
-        self._write_run_start_info(
+        run_info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -757,7 +791,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs={"query": query},
         )
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_retriever_start",
                 "data": {
@@ -769,9 +805,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "tags": tags or [],
                 "run_id": str(run_id),
                 "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     @override
@@ -781,7 +816,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """Run when Retriever ends running."""
         run_info = self.run_map.pop(run_id)
 
-        self._send(
+        if not run_info["interested"]:
+            return
+        self.send_stream.send_nowait(
             {
                 "event": "on_retriever_end",
                 "data": {
@@ -792,9 +829,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_info["run_type"],
+                "parent_ids": run_info["parent_ids"],
+            }
         )
 
     def __deepcopy__(self, memo: dict) -> _AstreamEventsCallbackHandler:
@@ -856,7 +892,8 @@ async def _astream_events_implementation_v1(
         with_streamed_output_list=True,
         **kwargs,
     ):
-        run_log += log
+        # The state is only read here, so patch it in place instead of copying it.
+        run_log.extend(log)
 
         if not encountered_start_event:
             # Yield the start event for the root runnable.
@@ -127,7 +127,7 @@ class LangChainTracer(BaseTracer):
         metadata: dict[str, Any] | None = None,
         name: str | None = None,
         **kwargs: Any,
-    ) -> Run:
+    ) -> Run | None:
         """Start a trace for an LLM run.
 
         Args:
@@ -141,8 +141,10 @@ class LangChainTracer(BaseTracer):
             **kwargs: Additional keyword arguments.
 
         Returns:
-            The run.
+            The run, or `None` if the run is not sampled.
         """
+        if self._skip_run_start(run_id, parent_run_id, metadata):
+            return None
         start_time = datetime.now(timezone.utc)
         if metadata:
             kwargs.update({"metadata": metadata})
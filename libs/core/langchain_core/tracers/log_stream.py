@@ -24,6 +24,7 @@ from langchain_core.load import dumps
 from langchain_core.load.load import load
 from langchain_core.outputs import ChatGenerationChunk, GenerationChunk
 from langchain_core.runnables import RunnableConfig, ensure_config
+from langchain_core.runnables.utils import AddableDict
 from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from langchain_core.tracers.base import BaseTracer
 from langchain_core.tracers.memory_stream import _MemoryStream
@@ -178,6 +179,28 @@ class RunLog(RunLogPatch):
         msg = f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'"
         raise TypeError(msg)
 
+    def extend(self, other: RunLogPatch) -> None:
+        """Apply a patch to this `RunLog` in place.
+
+        Unlike `+`, which copies the whole state for every patch, this mutates
+        `state`, so accumulating a stream of patches costs time proportional to
+        the size of the patches rather than to the size of the state times the
+        number of patches. Use it when earlier views of the state are not needed.
+
+        Args:
+            other: The `RunLogPatch` to apply.
+
+        Raises:
+            TypeError: If the other object is not a `RunLogPatch`.
+        """
+        if type(other) is not RunLogPatch:
+            msg = f"unsupported operand type for extend: '{type(other)}'"
+            raise TypeError(msg)
+        # Copy the values so the state doesn't share mutable objects with the patch
+        ops = copy.deepcopy(other.ops)
+        self.state = jsonpatch.apply_patch(self.state, ops, in_place=True)
+        self.ops.extend(other.ops)
+
     @override
     def __repr__(self) -> str:
         return f"RunLog({pformat(self.state)})"
@@ -581,6 +604,61 @@ def _get_standardized_inputs(
     return inputs
 
 
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _escape_path_key(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _append_ops(prev: Any, chunk: Any, new: Any, path: str = "") -> list[dict]:
+    """JSONPatch operations turning `prev` into `new`, where `new = prev + chunk`.
+
+    Produces the same operations as `jsonpatch.JsonPatch.from_diff(prev, new)`
+    without walking the whole accumulated output: strings are replaced, lists get
+    one `add` per appended item, and `AddableDict` values are patched per key of
+    the chunk. Anything else falls back to a full diff.
+    """
+    if prev is None:
+        return [] if new is None else [{"op": "replace", "path": path, "value": new}]
+    if isinstance(prev, str) and isinstance(chunk, str) and type(new) is str:
+        return [{"op": "replace", "path": path, "value": new}] if chunk else []
+    if (
+        type(prev) is list
+        and type(chunk) is list
+        and type(new) is list
+        and len(new) == len(prev) + len(chunk)
+    ):
+        start = len(prev)
+        return [
+            {"op": "add", "path": f"{path}/{start + i}", "value": value}
+            for i, value in enumerate(chunk)
+        ]
+    if (
+        type(prev) is AddableDict
+        and isinstance(chunk, dict)
+        and type(new) is AddableDict
+    ):
+        added: list[dict] = []
+        changed: list[dict] = []
+        for key in chunk:
+            key_path = f"{path}/{_escape_path_key(str(key))}"
+            if key not in prev:
+                added.append({"op": "add", "path": key_path, "value": new[key]})
+            elif prev[key] is None:
+                if new[key] is not None:
+                    changed.append(
+                        {"op": "replace", "path": key_path, "value": new[key]}
+                    )
+            elif chunk[key] is not None:
+                changed.extend(_append_ops(prev[key], chunk[key], new[key], key_path))
+        return added + changed
+    return [
+        {**op, "path": f"{path}{op['path']}"}
+        for op in jsonpatch.JsonPatch.from_diff(prev, new, dumps=dumps)
+    ]
+
+
 def _get_standardized_outputs(
     run: Run, schema_format: Literal["original", "streaming_events", "original+chat"]
 ) -> Any | None:
@@ -712,18 +790,17 @@ async def _astream_log_implementation(
                         {
                             "op": "add",
                             "path": "/streamed_output/-",
-                            # chunk cannot be shared between
+                            # a mutable chunk cannot be shared between
                             # streamed_output and final_output
                             # otherwise jsonpatch.apply will
                             # modify both
-                            "value": copy.deepcopy(chunk),
+                            "value": chunk
+                            if isinstance(chunk, _IMMUTABLE_TYPES)
+                            else copy.deepcopy(chunk),
                         }
                     )
                 patches.extend(
-                    {**op, "path": f"/final_output{op['path']}"}
-                    for op in jsonpatch.JsonPatch.from_diff(
-                        prev_final_output, final_output, dumps=dumps
-                    )
+                    _append_ops(prev_final_output, chunk, final_output, "/final_output")
                 )
                 await stream.send_stream.send(RunLogPatch(*patches))
         finally:
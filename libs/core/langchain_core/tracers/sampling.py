@@ -0,0 +1,140 @@
+"""Sampling of traces for high-throughput applications."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langchain_core.tracers.schemas import Run
+
+TRACE_SAMPLE_KEY = "__trace_sample"
+"""Metadata key holding the sample value of a trace, a float in `[0, 1)`.
+
+It is drawn once when the callbacks of a root run are configured and is inherited
+by all nested runs, so every tracer, nested call and thread makes the same
+decision for the whole trace. Set it in the metadata of a `RunnableConfig` to
+force a decision, e.g. `0.0` to always trace an invocation.
+"""
+
+_DRAW_BITS = 53
+
+
+def new_sample_value() -> float:
+    """Draw a new sample value for a trace.
+
+    Returns:
+        A float in `[0, 1)`.
+    """
+    return random.random()  # noqa: S311
+
+
+def sample_value_from_id(run_id: UUID) -> float:
+    """Derive the sample value of a trace from the ID of its root run.
+
+    Used when no sample value was propagated in the metadata of the run. The ID is
+    hashed first: the low bits of a uuid7 hold a counter that increments within a
+    millisecond, so IDs created together would otherwise get correlated values.
+
+    Args:
+        run_id: The ID of the root run.
+
+    Returns:
+        A float in `[0, 1)`.
+    """
+    digest = hashlib.blake2b(run_id.bytes, digest_size=8).digest()
+    return (int.from_bytes(digest, "big") >> (64 - _DRAW_BITS)) / (1 << _DRAW_BITS)
+
+
+class TraceSampler:
+    """Decides which traces a tracer records and persists.
+
+    Head sampling records only a `sample_rate` fraction of traces. The runs of the
+    other traces are skipped as soon as they start: no `Run` is created, inputs and
+    outputs are not serialized and token events are ignored.
+
+    Tail sampling additionally records the traces that were not head-sampled, but
+    only passes them to `_persist_run` if they turn out to be interesting: if any
+    run in the trace errored (`keep_errors`) or the root run took at least
+    `latency_threshold` seconds. Since the decision is made when the root run ends,
+    tail sampling saves the cost of persisting traces, not of recording them.
+    Tracers that send each run as it starts or ends, such as `LangChainTracer`,
+    only benefit from head sampling.
+
+    Example:
+        ```python
+        from langchain_core.tracers.sampling import TraceSampler
+
+        # Record 1% of traces, plus every trace that failed or took over 5s
+        sampler = TraceSampler(0.01, keep_errors=True, latency_threshold=5.0)
+        tracer = BatchExportTracer(sink, sampler=sampler)
+        ```
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        *,
+        keep_errors: bool = False,
+        latency_threshold: float | None = None,
+    ) -> None:
+        """Create a TraceSampler.
+
+        Args:
+            sample_rate: Fraction of traces that are recorded and persisted, between
+                0 and 1.
+            keep_errors: Whether to also persist traces that were not head-sampled
+                if any of their runs errored.
+            latency_threshold: If set, also persist traces that were not
+                head-sampled if their root run took at least this many seconds.
+
+        Raises:
+            ValueError: If `sample_rate` is not between 0 and 1.
+        """
+        if not 0 <= sample_rate <= 1:
+            msg = f"sample_rate must be between 0 and 1, got {sample_rate}."
+            raise ValueError(msg)
+        self.sample_rate = sample_rate
+        self.keep_errors = keep_errors
+        self.latency_threshold = latency_threshold
+
+    @property
+    def tail_sampling(self) -> bool:
+        """Whether traces that were not head-sampled may still be persisted."""
+        return self.keep_errors or self.latency_threshold is not None
+
+    def is_sampled(self, sample_value: float) -> bool:
+        """Make the head sampling decision for a trace.
+
+        Args:
+            sample_value: The sample value of the trace.
+
+        Returns:
+            Whether the trace is head-sampled.
+        """
+        return sample_value < self.sample_rate
+
+    def should_keep(self, run: Run) -> bool:
+        """Make the tail sampling decision for a finished trace.
+
+        Args:
+            run: The root run of the trace.
+
+        Returns:
+            Whether the trace should be persisted.
+        """
+        if self.keep_errors:
+            stack = [run]
+            while stack:
+                run_ = stack.pop()
+                if run_.error:
+                    return True
+                stack.extend(run_.child_runs)
+        if self.latency_threshold is not None and run.end_time is not None:
+            latency = (run.end_time - run.start_time).total_seconds()
+            if latency >= self.latency_threshold:
+                return True
+        return False
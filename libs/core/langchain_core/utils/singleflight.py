@@ -0,0 +1,140 @@
+"""Coalescing of concurrent identical calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """A call in progress in a thread."""
+
+    __slots__ = ("done", "error", "result", "thread_id")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.thread_id = threading.get_ident()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single call.
+
+    While a call for a key is in progress, later calls with the same key wait for
+    it and receive its result, or raise its exception, instead of making the call
+    again. Once it finishes, the next call with that key makes a new call, so this
+    is meant to sit in front of a cache: it only deduplicates the calls made
+    between a cache miss and the cache update.
+
+    Sync calls are coalesced across threads and async calls across the coroutines
+    of an event loop. The two are independent: a sync call never waits for an
+    async one.
+
+    Example:
+        ```python
+        from langchain_core.utils.singleflight import SingleFlight
+
+        single_flight = SingleFlight()
+
+
+        def embed_query(text: str) -> list[float]:
+            if (vector := cache.get(text)) is None:
+                vector = single_flight.run(text, lambda: embed_and_cache(text))
+            return vector
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create a SingleFlight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._tasks: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future
+        ] = {}
+        self.deduplicated_calls = 0
+        """Number of calls that waited for another call instead of being made."""
+
+    def run(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Call `func`, or wait for the call in progress with the same key.
+
+        Args:
+            key: The key identifying the call, e.g. a cache key.
+            func: The function to call.
+
+        Returns:
+            The result of `func`, possibly from a call made by another thread.
+
+        Raises:
+            BaseException: The exception raised by `func`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            elif call.thread_id == threading.get_ident():
+                # A reentrant call would wait for itself
+                return func()
+            else:
+                self.deduplicated_calls += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast("T", call.result)
+
+        try:
+            result = call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+    async def arun(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await `func()`, or wait for the call in progress with the same key.
+
+        The call runs in a task shared by all the callers, so cancelling one of
+        them does not cancel it for the others.
+
+        Args:
+            key: The key identifying the call, e.g. a cache key.
+            func: The async function to call.
+
+        Returns:
+            The result of `func()`, possibly from a call made by another coroutine.
+
+        Raises:
+            BaseException: The exception raised by `func()`.
+        """
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = asyncio.ensure_future(func())
+                task.add_done_callback(lambda t: self._remove_task(task_key, t))
+            else:
+                self.deduplicated_calls += 1
+        return await asyncio.shield(task)
+
+    def _remove_task(
+        self,
+        task_key: tuple[asyncio.AbstractEventLoop, Hashable],
+        task: asyncio.Future,
+    ) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case all the callers were cancelled
+            task.exception()
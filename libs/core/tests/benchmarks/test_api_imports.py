@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+API_DIR = Path(__file__).parents[4] / "api"
+
+# Importing the API with OpenAI must not load the local model stack
+HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "peft",
+    "datasets",
+    "langchain_community",
+    "langchain_openai",
+)
+
+# Seconds. The API took over 3s to import when the modules above were loaded
+IMPORT_TIME_BUDGET = 2.5
+
+IMPORT_SCRIPT = f"""
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import app.main
+
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def _import_api() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        check=True,
+        capture_output=True,
+        cwd=API_DIR,
+        env={**os.environ, "LLM_PROVIDER": "openai"},
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.skipif(not API_DIR.is_dir(), reason="Requires the api directory.")
+@pytest.mark.benchmark
+def test_api_import_time(benchmark: BenchmarkFixture) -> None:
+    pytest.importorskip("fastapi")
+    pytest.importorskip("pydantic_settings")
+    # Warm up the bytecode cache
+    _import_api()
+
+    result = _import_api()
+
+    assert result["loaded"] == []
+    assert result["seconds"] < IMPORT_TIME_BUDGET
+
+    @benchmark  # type: ignore[misc]
+    def import_in_subprocess() -> None:
+        _import_api()
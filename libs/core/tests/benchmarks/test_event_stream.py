@@ -0,0 +1,61 @@
+import asyncio
+import time
+from itertools import cycle
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+
+NUM_NODES = 50
+
+
+def _agent() -> Runnable:
+    """A 50-node graph with a single streaming chat model in the middle."""
+    model = GenericFakeChatModel(
+        messages=cycle([AIMessage(content=" ".join(["hello", "world"] * 25))])
+    ).with_config({"run_name": "agent_llm"})
+    nodes: list[Runnable] = [
+        RunnableLambda(lambda x: x).with_config(
+            {"run_name": f"node_{i}", "tags": ["node"]}
+        )
+        for i in range(NUM_NODES - 1)
+    ]
+    nodes.insert(NUM_NODES // 2, model)
+    agent = nodes[0]
+    for node in nodes[1:]:
+        agent |= node
+    return agent
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"include_names": ["agent_llm"], "include_types": ["chat_model"]}],
+    ids=["all_events", "one_node"],
+)
+def test_astream_events_throughput(
+    benchmark: BenchmarkFixture, filters: dict[str, Any]
+) -> None:
+    agent = _agent()
+    num_events = 0
+
+    async def consume() -> None:
+        nonlocal num_events
+        async for _ in agent.astream_events("hi", version="v2", **filters):
+            num_events += 1
+
+    @benchmark  # type: ignore[misc]
+    def stream_events() -> None:
+        asyncio.run(consume())
+
+    # Events per second of a single run, for comparing filtered vs unfiltered.
+    num_events = 0
+    start = time.perf_counter()
+    asyncio.run(consume())
+    benchmark.extra_info["events_per_second"] = num_events / (
+        time.perf_counter() - start
+    )
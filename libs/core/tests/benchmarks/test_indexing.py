@@ -0,0 +1,50 @@
+import time
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.indexing import InMemoryRecordManager, index
+from langchain_core.vectorstores import InMemoryVectorStore
+
+
+class SlowEmbedding(DeterministicFakeEmbedding):
+    """Fake embedding with a fixed per-call latency, like a remote provider."""
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(0.005)
+        return super().embed_documents(texts)
+
+
+DOCS = [
+    Document(
+        page_content=f"chunk {i} " + "lorem ipsum dolor sit amet " * 40,
+        metadata={"source": f"file-{i // 20}"},
+    )
+    for i in range(2_000)
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("max_concurrency", [None, 4], ids=["sequential", "pipelined"])
+def test_index_throughput(
+    benchmark: BenchmarkFixture, max_concurrency: int | None
+) -> None:
+    @benchmark  # type: ignore[misc]
+    def index_docs() -> None:
+        record_manager = InMemoryRecordManager(namespace="benchmark")
+        vector_store = InMemoryVectorStore(SlowEmbedding(size=16))
+        result = index(
+            DOCS,
+            record_manager,
+            vector_store,
+            batch_size=100,
+            cleanup="scoped_full",
+            source_id_key="source",
+            key_encoder="blake2b",
+            max_concurrency=max_concurrency,
+        )
+        assert result["num_added"] == len(DOCS)
@@ -0,0 +1,53 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.load import dumpb, dumps, loadb, loads
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+MESSAGES = dumps(
+    [
+        message
+        for i in range(2_500)
+        for message in (
+            HumanMessage(f"question {i}", id=f"h{i}"),
+            AIMessage(
+                f"answer {i}",
+                id=f"a{i}",
+                response_metadata={"model_name": "fake", "finish_reason": "stop"},
+                usage_metadata={
+                    "input_tokens": 10,
+                    "output_tokens": 20,
+                    "total_tokens": 30,
+                },
+            ),
+        )
+    ]
+)
+
+GENERATIONS = dumps(
+    [ChatGeneration(message=AIMessage(f"answer {i}")) for i in range(1_000)]
+)
+
+
+@pytest.mark.benchmark
+def test_loads_messages(benchmark: BenchmarkFixture) -> None:
+    @benchmark  # type: ignore[misc]
+    def load_messages() -> None:
+        assert len(loads(MESSAGES)) == 5_000
+
+
+@pytest.mark.benchmark
+def test_loads_generations(benchmark: BenchmarkFixture) -> None:
+    @benchmark  # type: ignore[misc]
+    def load_generations() -> None:
+        assert len(loads(GENERATIONS)) == 1_000
+
+
+@pytest.mark.benchmark
+def test_loadb_messages(benchmark: BenchmarkFixture) -> None:
+    data = dumpb(loads(MESSAGES))
+
+    @benchmark  # type: ignore[misc]
+    def load_messages() -> None:
+        assert len(loadb(data)) == 5_000
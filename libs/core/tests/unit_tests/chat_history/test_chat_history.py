@@ -1,6 +1,11 @@
 from collections.abc import Sequence
 
-from langchain_core.chat_history import BaseChatMessageHistory
+import pytest
+
+from langchain_core.chat_history import (
+    BaseChatMessageHistory,
+    InMemoryChatMessageHistory,
+)
 from langchain_core.messages import BaseMessage, HumanMessage
 
 
@@ -108,3 +113,64 @@ async def test_async_interface() -> None:
     ]
     await chat_history.aclear()
     assert await chat_history.aget_messages() == []
+
+
+@pytest.mark.parametrize(
+    ("k", "max_tokens", "expected"),
+    [
+        (None, None, ["0", "1", "2", "3"]),
+        (2, None, ["2", "3"]),
+        (10, None, ["0", "1", "2", "3"]),
+        (0, None, []),
+        (None, 3, ["1", "2", "3"]),
+        (2, 3, ["2", "3"]),
+        (None, 0, []),
+    ],
+)
+async def test_get_recent_messages(
+    k: int | None, max_tokens: int | None, expected: list[str]
+) -> None:
+    def token_counter(messages: Sequence[BaseMessage]) -> int:
+        return sum(len(str(m.content)) for m in messages)
+
+    history = InMemoryChatMessageHistory(
+        messages=[HumanMessage(content=str(i)) for i in range(4)]
+    )
+
+    recent = history.get_recent_messages(
+        k, max_tokens=max_tokens, token_counter=token_counter
+    )
+    assert [m.content for m in recent] == expected
+    recent = await history.aget_recent_messages(
+        k, max_tokens=max_tokens, token_counter=token_counter
+    )
+    assert [m.content for m in recent] == expected
+    assert history.get_message_count() == 4
+    assert await history.aget_message_count() == 4
+
+
+async def test_get_recent_messages_default_implementation() -> None:
+    class BulkAddHistory(BaseChatMessageHistory):
+        def __init__(self) -> None:
+            self.messages = []
+
+        def add_messages(self, message: Sequence[BaseMessage]) -> None:
+            """Add a message to the store."""
+            self.messages.extend(message)
+
+        def clear(self) -> None:
+            """Clear the store."""
+            self.messages.clear()
+
+    chat_history = BulkAddHistory()
+    chat_history.add_messages([HumanMessage(content=str(i)) for i in range(3)])
+
+    assert chat_history.get_recent_messages(2) == [
+        HumanMessage(content="1"),
+        HumanMessage(content="2"),
+    ]
+    assert await chat_history.aget_recent_messages(1) == [HumanMessage(content="2")]
+    # The default token counter is count_tokens_approximately
+    assert len(chat_history.get_recent_messages(max_tokens=10)) == 2
+    assert chat_history.get_message_count() == 3
+    assert await chat_history.aget_message_count() == 3
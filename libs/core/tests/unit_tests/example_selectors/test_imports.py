@@ -3,6 +3,7 @@ from langchain_core.example_selectors import __all__
 EXPECTED_ALL = [
     "BaseExampleSelector",
     "LengthBasedExampleSelector",
+    "LengthBasedSemanticSimilarityExampleSelector",
     "MaxMarginalRelevanceExampleSelector",
     "SemanticSimilarityExampleSelector",
     "sorted_values",
@@ -57,3 +57,26 @@ def test_selector_trims_all_examples(
     super super super super long, this will affect the example right?"""
     output = selector.select_examples({"question": longest_question})
     assert output == []
+
+
+def test_selector_stops_when_no_length_is_left() -> None:
+    """Test LengthBasedExampleSelector stops once the length is used up."""
+    examples = [{"question": "ab"}, {"question": ""}, {"question": "c"}]
+    selector = LengthBasedExampleSelector(
+        examples=examples,
+        example_prompt=PromptTemplate.from_template("{question}"),
+        get_text_length=len,
+        max_length=3,
+    )
+    # The first example uses the remaining length, so the empty one is not added
+    assert selector.select_examples({"question": "x"}) == examples[:1]
+    selector.max_length = 4
+    assert selector.select_examples({"question": "x"}) == examples
+    selector.max_length = 1
+    assert selector.select_examples({"question": "x"}) == []
+    selector.max_length = 5
+    selector.add_example({"question": "d"})
+    assert selector.select_examples({"question": "x"}) == [
+        *examples[:3],
+        {"question": "d"},
+    ]
@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from typing_extensions import override
@@ -6,10 +7,12 @@ from typing_extensions import override
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings, FakeEmbeddings
 from langchain_core.example_selectors import (
+    LengthBasedSemanticSimilarityExampleSelector,
     MaxMarginalRelevanceExampleSelector,
     SemanticSimilarityExampleSelector,
 )
-from langchain_core.vectorstores import VectorStore
+from langchain_core.prompts import PromptTemplate
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
 
 
 class DummyVectorStore(VectorStore):
@@ -245,3 +248,134 @@ async def test_mmr_afrom_examples() -> None:
     assert vector_store.init_arg == "some_init_arg"
     assert vector_store.texts == ["bar"]
     assert vector_store.metadatas == [{"foo": "bar"}]
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    @staticmethod
+    def _embed(text: str) -> list[float]:
+        return [text.count("x"), text.count("y"), 0.1]
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    @override
+    def embed_query(self, text: str) -> list[float]:
+        self.queries.append(text)
+        return self._embed(text)
+
+
+EXAMPLES = [
+    {"input": "x", "output": "short"},
+    {"input": "x x", "output": "a much longer answer with many words"},
+    {"input": "y", "output": "other"},
+]
+
+
+def test_query_cache() -> None:
+    embeddings = CountingEmbeddings()
+    selector = SemanticSimilarityExampleSelector.from_examples(
+        EXAMPLES,
+        embeddings,
+        InMemoryVectorStore,
+        k=1,
+        input_keys=["input"],
+        query_cache_size=2,
+    )
+
+    assert selector.select_examples({"input": "x"}) == [EXAMPLES[0]]
+    assert selector.select_examples({"input": "x"}) == [EXAMPLES[0]]
+    assert selector.select_examples({"input": "y"}) == [EXAMPLES[2]]
+    assert selector.select_examples({"input": "x"}) == [EXAMPLES[0]]
+    # Evicts "y", the least recently used input
+    selector.select_examples({"input": "x x"})
+    selector.select_examples({"input": "y"})
+
+    assert embeddings.queries == ["x", "y", "x x", "y"]
+
+
+def test_query_cache_from_threads() -> None:
+    selector = SemanticSimilarityExampleSelector.from_examples(
+        EXAMPLES,
+        CountingEmbeddings(),
+        InMemoryVectorStore,
+        k=1,
+        input_keys=["input"],
+        query_cache_size=4,
+    )
+    inputs = [{"input": " ".join("xy"[i % 2] * (i % 7 + 1))} for i in range(200)]
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(selector.select_examples, inputs))
+
+    assert len(selector._query_embeddings) == 4
+
+
+async def test_mmr_query_cache() -> None:
+    embeddings = CountingEmbeddings()
+    selector = await MaxMarginalRelevanceExampleSelector.afrom_examples(
+        EXAMPLES,
+        embeddings,
+        InMemoryVectorStore,
+        k=2,
+        fetch_k=3,
+        input_keys=["input"],
+        query_cache_size=4,
+    )
+    expected = selector.model_copy(update={"query_cache_size": 0}).select_examples(
+        {"input": "x"}
+    )
+
+    for _ in range(3):
+        assert await selector.aselect_examples({"input": "x"}) == expected
+        assert selector.select_examples({"input": "x"}) == expected
+
+    # Once for the uncached selection, once for the cached ones
+    assert embeddings.queries == ["x", "x"]
+
+
+def test_length_based_semantic_similarity() -> None:
+    embeddings = CountingEmbeddings()
+    selector = LengthBasedSemanticSimilarityExampleSelector.from_examples(
+        EXAMPLES,
+        embeddings,
+        InMemoryVectorStore,
+        example_prompt=PromptTemplate.from_template("{input}: {output}"),
+        max_length=20,
+        k=2,
+        input_keys=["input"],
+        query_cache_size=8,
+    )
+
+    # Most similar first
+    assert selector.select_examples({"input": "x"}) == EXAMPLES[:2]
+    # The long example does not fit, so shorter less similar ones are picked
+    selector.max_length = 6
+    assert selector.select_examples({"input": "x"}) == [EXAMPLES[0], EXAMPLES[2]]
+    selector.k = 1
+    assert selector.select_examples({"input": "x"}) == [EXAMPLES[0]]
+    selector.max_length = 1
+    assert selector.select_examples({"input": "x"}) == []
+    assert embeddings.queries == ["x"]
+
+
+async def test_length_based_semantic_similarity_add_example() -> None:
+    selector = await LengthBasedSemanticSimilarityExampleSelector.afrom_examples(
+        EXAMPLES[:1],
+        CountingEmbeddings(),
+        InMemoryVectorStore,
+        example_prompt=PromptTemplate.from_template("{input}: {output}"),
+        max_length=6,
+        example_keys=["input", "output"],
+    )
+    example = {"input": "x x", "output": "two", "extra": "not in the prompt"}
+    await selector.aadd_example(example)
+
+    # The length of the added example only counts the keys in the prompt
+    assert await selector.aselect_examples({"input": "x"}) == [
+        EXAMPLES[0],
+        {"input": "x x", "output": "two"},
+    ]
@@ -1,7 +1,9 @@
+import itertools
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import (
     Any,
+    Literal,
 )
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -2940,3 +2942,149 @@ async def test_aindex_with_upsert_kwargs(
         # Check other arguments
         assert kwargs["batch_size"] == 100
         assert kwargs["vector_field"] == "embedding"
+
+
+def _pipelined_runs() -> list[list[Document]]:
+    """Successive loads exercising cross-batch duplicates and shared sources."""
+    first = [
+        Document(page_content=f"doc {i}", metadata={"source": str(i % 3)})
+        for i in range(10)
+    ]
+    # Duplicates across batches, and the same source spread over many batches.
+    first += [first[1], first[4], first[0]]
+    # Source "1" first shows up in the third batch with new documents, so its
+    # incremental cleanup removes "doc 4" right before the next batch re-adds it.
+    docs = {doc.page_content: doc for doc in first}
+    new = [
+        Document(page_content=f"new doc {i}", metadata={"source": str(i % 4)})
+        for i in range(6)
+    ]
+    second = [
+        docs["doc 0"],
+        docs["doc 2"],
+        new[2],
+        new[3],
+        new[1],
+        new[5],
+        docs["doc 4"],
+        docs["doc 6"],
+        new[3],
+        docs["doc 8"],
+        new[0],
+    ]
+    return [first, second, first]
+
+
+def _index_state(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> tuple[dict[str, Any], set[str]]:
+    records = {
+        key: record["group_id"] for key, record in record_manager.records.items()
+    }
+    return records, set(vector_store.store)
+
+
+@pytest.mark.parametrize("cleanup", [None, "incremental", "full", "scoped_full"])
+@pytest.mark.parametrize("force_update", [False, True])
+def test_index_pipelined_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    *,
+    force_update: bool,
+) -> None:
+    """Pipelined indexing gives the same counts and end state as sequential."""
+    states = []
+    for max_concurrency in (None, 3):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        with patch.object(record_manager, "get_time", side_effect=itertools.count(1)):
+            results = [
+                index(
+                    docs,
+                    record_manager,
+                    vector_store,
+                    batch_size=2,
+                    cleanup=cleanup,
+                    source_id_key="source" if cleanup else None,
+                    cleanup_batch_size=2,
+                    force_update=force_update,
+                    key_encoder="sha256",
+                    max_concurrency=max_concurrency,
+                )
+                for docs in _pipelined_runs()
+            ]
+        states.append((results, _index_state(record_manager, vector_store)))
+
+    assert states[0] == states[1]
+
+
+@pytest.mark.parametrize("cleanup", [None, "incremental", "full", "scoped_full"])
+@pytest.mark.parametrize("force_update", [False, True])
+async def test_aindex_pipelined_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    *,
+    force_update: bool,
+) -> None:
+    """Pipelined async indexing gives the same counts and end state as sequential."""
+    states = []
+    for max_concurrency in (None, 3):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        with patch.object(record_manager, "get_time", side_effect=itertools.count(1)):
+            results = [
+                await aindex(
+                    docs,
+                    record_manager,
+                    vector_store,
+                    batch_size=2,
+                    cleanup=cleanup,
+                    source_id_key="source" if cleanup else None,
+                    cleanup_batch_size=2,
+                    force_update=force_update,
+                    key_encoder="sha256",
+                    max_concurrency=max_concurrency,
+                )
+                for docs in _pipelined_runs()
+            ]
+        states.append((results, _index_state(record_manager, vector_store)))
+
+    assert states[0] == states[1]
+
+
+def test_index_pipelined_write_failure(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    """Records are only committed for batches written before the failing one."""
+    docs = [Document(page_content=f"doc {i}") for i in range(6)]
+    add_documents = vector_store.add_documents
+    calls = itertools.count()
+
+    def flaky_add_documents(documents: list[Document], **kwargs: Any) -> list[str]:
+        if next(calls) == 1:
+            msg = "write failed"
+            raise RuntimeError(msg)
+        return add_documents(documents, **kwargs)
+
+    with (
+        patch.object(vector_store, "add_documents", side_effect=flaky_add_documents),
+        pytest.raises(RuntimeError, match="write failed"),
+    ):
+        index(
+            docs,
+            record_manager,
+            vector_store,
+            batch_size=2,
+            key_encoder="sha256",
+            max_concurrency=1,
+        )
+
+    first_batch_ids = [
+        _get_document_with_hash(doc, key_encoder="sha256").id for doc in docs[:2]
+    ]
+    assert sorted(record_manager.records) == sorted(first_batch_ids)
+
+
+def test_index_invalid_max_concurrency(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        index([], record_manager, vector_store, max_concurrency=0)
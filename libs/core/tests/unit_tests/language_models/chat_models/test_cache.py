@@ -1,5 +1,8 @@
 """Module tests interaction of chat model with caching abstraction.."""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -7,13 +10,16 @@ from typing_extensions import override
 
 from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
 from langchain_core.globals import set_llm_cache
-from langchain_core.language_models.chat_models import _cleanup_llm_representation
+from langchain_core.language_models.chat_models import (
+    _CACHE_SINGLE_FLIGHT,
+    _cleanup_llm_representation,
+)
 from langchain_core.language_models.fake_chat_models import (
     FakeListChatModel,
     GenericFakeChatModel,
 )
 from langchain_core.load import dumps
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, BaseMessage
 from langchain_core.outputs import ChatGeneration, Generation
 from langchain_core.outputs.chat_result import ChatResult
 
@@ -475,3 +481,92 @@ def test_token_costs_are_zeroed_out() -> None:
     assert isinstance(second_response, AIMessage)
     assert second_response.usage_metadata
     assert second_response.usage_metadata["total_cost"] == 0  # type: ignore[typeddict-item]
+
+
+def test_concurrent_cache_misses_share_generation_sync() -> None:
+    local_cache = InMemoryCache()
+    chat_model = FakeListChatModel(
+        cache=local_cache, responses=["hello", "goodbye"], sleep=0.1
+    )
+    deduplicated_calls = _CACHE_SINGLE_FLIGHT.deduplicated_calls
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(chat_model.invoke, ["prompt"] * 4))
+
+    assert [result.content for result in results] == ["hello"] * 4
+    assert chat_model.i == 1
+    assert _CACHE_SINGLE_FLIGHT.deduplicated_calls == deduplicated_calls + 3
+    assert len(local_cache._cache) == 1
+
+
+async def test_concurrent_cache_misses_share_generation_async() -> None:
+    local_cache = InMemoryCache()
+    chat_model = FakeListChatModel(
+        cache=local_cache, responses=["hello", "goodbye"], sleep=0.1
+    )
+    deduplicated_calls = _CACHE_SINGLE_FLIGHT.deduplicated_calls
+
+    results = await asyncio.gather(
+        *(chat_model.ainvoke(prompt) for prompt in ["prompt"] * 4 + ["other prompt"])
+    )
+
+    contents = [result.content for result in results]
+    # The two prompts may be generated in any order
+    assert len(set(contents[:4])) == 1
+    assert set(contents) == {"hello", "goodbye"}
+    assert chat_model.i == 0
+    assert _CACHE_SINGLE_FLIGHT.deduplicated_calls == deduplicated_calls + 3
+    assert len(local_cache._cache) == 2
+
+
+class _SlowFakeChatModel(GenericFakeChatModel):
+    """Fake chat model that takes long enough for identical calls to overlap."""
+
+    @override
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        time.sleep(0.1)
+        return super()._generate(*args, **kwargs)
+
+
+def _assert_waiters_get_own_messages(results: list[BaseMessage]) -> None:
+    assert len({id(result) for result in results}) == len(results)
+    assert len({result.id for result in results}) == len(results)
+    costs = [
+        result.usage_metadata.get("total_cost")  # type: ignore[union-attr]
+        for result in results
+        if isinstance(result, AIMessage)
+    ]
+    # Only the call that made the generation counts its cost
+    assert sorted(costs, key=lambda cost: cost is None) == [0, 0, None]
+
+    results[0].content = "changed"
+    assert [result.content for result in results[1:]] == ["hello"] * 2
+
+
+def test_concurrent_cache_misses_get_own_messages_sync() -> None:
+    messages = [
+        AIMessage(
+            content="hello",
+            usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+        ),
+    ]
+    chat_model = _SlowFakeChatModel(messages=iter(messages), cache=InMemoryCache())
+
+    with ThreadPoolExecutor(3) as executor:
+        results = list(executor.map(chat_model.invoke, ["prompt"] * 3))
+
+    _assert_waiters_get_own_messages(results)
+
+
+async def test_concurrent_cache_misses_get_own_messages_async() -> None:
+    messages = [
+        AIMessage(
+            content="hello",
+            usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+        ),
+    ]
+    chat_model = _SlowFakeChatModel(messages=iter(messages), cache=InMemoryCache())
+
+    results = await asyncio.gather(*(chat_model.ainvoke("prompt") for _ in range(3)))
+
+    _assert_waiters_get_own_messages(list(results))
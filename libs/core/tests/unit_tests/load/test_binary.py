@@ -0,0 +1,137 @@
+import io
+from typing import Any
+
+import pytest
+from pydantic import SecretStr
+
+from langchain_core.documents import Document
+from langchain_core.load import Serializable, binary, dumpb, dumps, loadb, loads
+from langchain_core.load.binary import BinaryWriter, iter_loadb
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+class _WithSecret(Serializable):
+    value: int
+    secret: SecretStr
+
+    @classmethod
+    def is_lc_serializable(cls) -> bool:
+        return True
+
+    @property
+    def lc_secrets(self) -> dict[str, str]:
+        return {"secret": "MY_SECRET"}
+
+
+class _NotSerializable:
+    pass
+
+
+OBJECTS: list[Any] = [
+    None,
+    True,
+    -(2**70),
+    3.5,
+    "héllo \U0001f600",
+    {"a": [1, 2.0, "3"], 1: None, 2.5: True, None: False},
+    (1, 2),
+    [0.1, -0.2, 1e300],
+    HumanMessage("hi", id="1", name="user", additional_kwargs={"a": {"b": 1}}),
+    SystemMessage([{"type": "text", "text": "be nice"}]),
+    AIMessage(
+        "",
+        tool_calls=[{"name": "f", "args": {"x": [1.5, 2.5]}, "id": "2"}],
+        usage_metadata={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+    ),
+    AIMessageChunk(content="chunk"),
+    ToolMessage("result", tool_call_id="2", artifact={"rows": [1, 2]}),
+    Document(page_content="text", metadata={"embedding": [0.5, 0.25]}, id="3"),
+    Generation(text="hello", generation_info={"finish_reason": "stop"}),
+    ChatGeneration(message=AIMessage("hello")),
+    {"nested": [ChatGeneration(message=HumanMessage("a")), Document("b")]},
+]
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+def test_round_trip_matches_json(obj: Any) -> None:
+    assert loadb(dumpb(obj)) == loads(dumps(obj))
+
+
+def test_round_trip_secrets_and_unserializable() -> None:
+    obj = [_WithSecret(value=1, secret=SecretStr("s")), _NotSerializable()]
+    kwargs: dict[str, Any] = {
+        "valid_namespaces": ["tests"],
+        "secrets_map": {"MY_SECRET": "s"},
+        "ignore_unserializable_fields": True,
+    }
+
+    revived = loadb(dumpb(obj), **kwargs)
+
+    assert revived == loads(dumps(obj), **kwargs)
+    assert revived[0].secret.get_secret_value() == "s"
+    assert revived[1] is None
+
+
+def test_is_smaller_than_json() -> None:
+    messages = [
+        message
+        for i in range(100)
+        for message in (HumanMessage(f"question {i}"), AIMessage(f"answer {i}"))
+    ]
+    embeddings = [[i / 7 for i in range(1536)]]
+
+    assert len(dumpb(messages)) < len(dumps(messages)) / 3
+    # Raw float64 values, plus the header and the length
+    assert len(dumpb(embeddings)) < 1536 * 8 + 16
+    assert len(dumpb(embeddings)) < len(dumps(embeddings)) / 2
+
+
+def test_compression() -> None:
+    pytest.importorskip("zstandard")
+    messages = [HumanMessage("the same content " * 10) for _ in range(100)]
+
+    data = dumpb(messages, compress=True)
+
+    assert len(data) < len(dumpb(messages)) / 10
+    assert loadb(data) == messages
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_streaming(monkeypatch: pytest.MonkeyPatch, *, compress: bool) -> None:
+    if compress:
+        pytest.importorskip("zstandard")
+    # Values are split across many reads
+    monkeypatch.setattr(binary, "_STREAM_CHUNK_SIZE", 7)
+    objs = [obj for obj in OBJECTS if not isinstance(obj, tuple)] * 3
+    fp = io.BytesIO()
+
+    with BinaryWriter(fp, compress=compress) as writer:
+        for obj in objs:
+            writer.write(obj)
+    fp.seek(0)
+
+    assert list(iter_loadb(fp)) == [loads(dumps(obj)) for obj in objs]
+
+
+def test_invalid_payloads() -> None:
+    data = dumpb([HumanMessage("hi")])
+
+    with pytest.raises(ValueError, match="truncated"):
+        loadb(data[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        list(iter_loadb(io.BytesIO(data[:-1])))
+    with pytest.raises(ValueError, match="trailing data"):
+        loadb(data + data[5:])
+    with pytest.raises(ValueError, match="not a LangChain binary payload"):
+        loadb(b"{}" + data)
+    with pytest.raises(ValueError, match="Unsupported binary payload version"):
+        loadb(data[:3] + b"\x02" + data[4:])
+    with pytest.raises(ValueError, match="Invalid namespace"):
+        loadb(dumpb(_WithSecret(value=1, secret=SecretStr("s"))))
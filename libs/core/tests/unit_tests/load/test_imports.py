@@ -1,6 +1,6 @@
 from langchain_core.load import __all__
 
-EXPECTED_ALL = ["dumpd", "dumps", "load", "loads", "Serializable"]
+EXPECTED_ALL = ["dumpb", "dumpd", "dumps", "load", "loadb", "loads", "Serializable"]
 
 
 def test_all_imports() -> None:
@@ -3,9 +3,17 @@ import json
 import pytest
 from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
-from langchain_core.load import Serializable, dumpd, dumps, load
+from langchain_core.documents import Document
+from langchain_core.load import Serializable, dumpd, dumps, load, loads
+from langchain_core.load.load import Reviver
 from langchain_core.load.serializable import _is_field_useful
-from langchain_core.messages import AIMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from langchain_core.outputs import ChatGeneration, Generation
 
 
@@ -234,6 +242,48 @@ def test_serialization_with_generation() -> None:
     assert dumpd(generation)["kwargs"] == {"text": "hello-world", "type": "Generation"}
 
 
+def test_deserialization_round_trip() -> None:
+    objs = [
+        SystemMessage("be nice"),
+        HumanMessage("hi", id="1", name="user", additional_kwargs={"a": 1}),
+        AIMessage(
+            content=[{"type": "text", "text": "hello"}],
+            response_metadata={"model": "m"},
+            usage_metadata={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+        ),
+        AIMessage("", tool_calls=[{"name": "f", "args": {"x": 1}, "id": "2"}]),
+        AIMessageChunk(content="chunk"),
+        ToolMessage("result", tool_call_id="2"),
+        Document(page_content="text", metadata={"source": "a"}, id="3"),
+        Generation(text="hello"),
+        ChatGeneration(message=AIMessage("hello")),
+    ]
+
+    revived = loads(dumps(objs))
+
+    assert revived == objs
+    assert [type(obj) for obj in revived] == [type(obj) for obj in objs]
+    assert dumpd(revived) == dumpd(objs)
+
+
+def test_reviver_resolves_each_class_once() -> None:
+    reviver = Reviver()
+    payload = dumpd([HumanMessage(str(i)) for i in range(10)])
+
+    assert [m.content for m in load(payload)] == [str(i) for i in range(10)]
+    for message in payload:
+        reviver(message)
+    assert list(reviver._classes) == [
+        ("langchain", "schema", "messages", "HumanMessage")
+    ]
+
+    # Errors are not cached
+    invalid = {"lc": 1, "type": "constructor", "id": ["foo", "Bar"], "kwargs": {}}
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid namespace"):
+            reviver(invalid)
+
+
 def test_serialization_with_ignore_unserializable_fields() -> None:
     data = {
         "messages": [
@@ -0,0 +1,137 @@
+"""Test the weighted rate limiter."""
+
+import asyncio
+import multiprocessing
+import sys
+import time
+from itertools import cycle
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.rate_limiters import (
+    FileRateLimiterBackend,
+    InMemoryRateLimiterBackend,
+    WeightedRateLimiter,
+)
+
+
+def test_requests_and_tokens() -> None:
+    rate_limiter = WeightedRateLimiter(
+        requests_per_second=10,
+        max_bucket_size=2,
+        tokens_per_second=100,
+        max_token_bucket_size=200,
+    )
+    with freeze_time("2023-01-01 00:00:00") as frozen_time:
+        # Both buckets start full
+        assert rate_limiter.acquire(blocking=False, weight=150)
+        assert not rate_limiter.acquire(blocking=False, weight=100)
+        frozen_time.tick(0.5)
+        assert rate_limiter.acquire(blocking=False, weight=100)
+        # Unweighted calls only need a request
+        assert rate_limiter.acquire(blocking=False)
+        assert not rate_limiter.acquire(blocking=False)
+        frozen_time.tick(0.15)
+        assert rate_limiter.acquire(blocking=False, weight=10)
+        # The request bucket is empty, even though there are tokens left
+        assert not rate_limiter.acquire(blocking=False)
+        # Buckets do not grow beyond their maximum size
+        frozen_time.tick(100)
+        assert rate_limiter.acquire(blocking=False, weight=200)
+        assert not rate_limiter.acquire(blocking=False, weight=1)
+
+
+def test_waits_exactly_in_fifo_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    rate_limiter = WeightedRateLimiter(
+        requests_per_second=100, max_bucket_size=100, tokens_per_second=10
+    )
+    with freeze_time("2023-01-01 00:00:00"):
+        for weight in (10, 5, 20, 1):
+            assert rate_limiter.acquire(weight=weight)
+
+    # The first call uses the full token bucket, then each call waits for the
+    # tokens of all the calls before it.
+    assert sleeps == pytest.approx([0.5, 2.5, 2.6])
+
+
+async def test_async_waits_and_refunds_on_cancel() -> None:
+    rate_limiter = WeightedRateLimiter(
+        requests_per_second=1000,
+        max_bucket_size=1000,
+        tokens_per_second=100,
+        max_token_bucket_size=10,
+    )
+    assert await rate_limiter.aacquire(weight=10)
+
+    start = time.monotonic()
+    assert await rate_limiter.aacquire(weight=5)
+    assert time.monotonic() - start >= 0.05
+
+    task = asyncio.create_task(rate_limiter.aacquire(weight=10_000))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The cancelled reservation was given back
+    assert not await rate_limiter.aacquire(blocking=False, weight=10_000)
+    assert await asyncio.wait_for(rate_limiter.aacquire(weight=1), 1)
+
+
+def test_chat_model_is_weighted_by_its_input() -> None:
+    backend = InMemoryRateLimiterBackend()
+    rate_limiter = WeightedRateLimiter(
+        requests_per_second=100,
+        max_bucket_size=10,
+        tokens_per_second=1,
+        max_token_bucket_size=100,
+        token_counter=lambda messages: 7 * len(messages),
+        backend=backend,
+    )
+    model = GenericFakeChatModel(
+        messages=cycle([AIMessage(content="hello")]), rate_limiter=rate_limiter
+    )
+    with freeze_time("2023-01-01 00:00:00"):
+        model.invoke("foo")
+        list(model.stream([("system", "bar"), ("human", "baz")]))
+
+    assert backend._state[:2] == [8, 100 - 7 - 14]
+
+
+def _acquire_from_file(path: Path, results: "multiprocessing.Queue[int]") -> None:
+    rate_limiter = WeightedRateLimiter(
+        requests_per_second=0.001,
+        max_bucket_size=3,
+        backend=FileRateLimiterBackend(path),
+    )
+    results.put(sum(rate_limiter.acquire(blocking=False) for _ in range(2)))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires fcntl.")
+def test_file_backend_shares_budget_across_processes(tmp_path: Path) -> None:
+    path = tmp_path / "limiter"
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_acquire_from_file, args=(path, results))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(10)
+
+    assert sum(results.get(timeout=10) for _ in processes) == 3
+
+    # A limiter in this process sees the same, empty, budget
+    backend = FileRateLimiterBackend(path)
+    rate_limiter = WeightedRateLimiter(
+        requests_per_second=0.001, max_bucket_size=3, backend=backend
+    )
+    assert not rate_limiter.acquire(blocking=False)
+    backend.close()
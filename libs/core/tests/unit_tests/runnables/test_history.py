@@ -879,3 +879,103 @@ def test_get_output_messages_with_value_error() -> None:
         ),
     ):
         with_history.bound.invoke([HumanMessage(content="hello")], config)
+
+
+class _WindowedHistory(InMemoryChatMessageHistory):
+    """History that fails if the full list of messages is read."""
+
+    full_reads: int = 0
+
+    @override
+    def get_recent_messages(
+        self,
+        k: int | None = None,
+        *,
+        max_tokens: int | None = None,
+        token_counter: Callable[[Sequence[BaseMessage]], int] | None = None,
+    ) -> list[BaseMessage]:
+        if k is None and max_tokens is None:
+            self.full_reads += 1
+        return super().get_recent_messages(
+            k, max_tokens=max_tokens, token_counter=token_counter
+        )
+
+
+def _windowed_chain(
+    history_messages_key: str | None,
+) -> tuple[RunnableWithMessageHistory, _WindowedHistory, list[list[str]], Any]:
+    seen: list[list[str]] = []
+
+    def respond(value: Any) -> str:
+        messages = value if isinstance(value, list) else value["history"]
+        seen.append([str(m.content) for m in messages])
+        return "ai"
+
+    history = _WindowedHistory(
+        messages=[HumanMessage(content=str(i)) for i in range(10)]
+    )
+    with_history = RunnableWithMessageHistory(
+        RunnableLambda(respond),
+        lambda: history,
+        input_messages_key="input" if history_messages_key else None,
+        history_messages_key=history_messages_key,
+        max_history_messages=3,
+    )
+    value: Any = (
+        {"input": "new"} if history_messages_key else [HumanMessage(content="new")]
+    )
+    return with_history, history, seen, value
+
+
+def _assert_windowed(
+    history_messages_key: str | None,
+    history: _WindowedHistory,
+    seen: list[list[str]],
+) -> None:
+    window = ["7", "8", "9"] if history_messages_key else ["7", "8", "9", "new"]
+    assert seen[0] == window
+    window = ["new", "ai"] + ([] if history_messages_key else ["new"])
+    assert seen[1] == ["9", *window]
+    # Only the new messages were appended, and the history was never read whole
+    assert [m.content for m in history.messages[10:]] == ["new", "ai"] * 2
+    assert history.full_reads == 0
+
+
+@pytest.mark.parametrize("history_messages_key", [None, "history"])
+def test_max_history_messages(history_messages_key: str | None) -> None:
+    with_history, history, seen, value = _windowed_chain(history_messages_key)
+
+    assert with_history.invoke(value) == "ai"
+    assert with_history.invoke(value) == "ai"
+
+    _assert_windowed(history_messages_key, history, seen)
+
+
+@pytest.mark.parametrize("history_messages_key", [None, "history"])
+async def test_max_history_messages_async(history_messages_key: str | None) -> None:
+    with_history, history, seen, value = _windowed_chain(history_messages_key)
+
+    assert await with_history.ainvoke(value) == "ai"
+    assert await with_history.ainvoke(value) == "ai"
+
+    _assert_windowed(history_messages_key, history, seen)
+
+
+def test_max_history_tokens() -> None:
+    seen: list[list[str]] = []
+
+    def respond(messages: list[BaseMessage]) -> str:
+        seen.append([str(m.content) for m in messages])
+        return "ai"
+
+    history = InMemoryChatMessageHistory(
+        messages=[HumanMessage(content="x" * 100), AIMessage(content="y")]
+    )
+    with_history = RunnableWithMessageHistory(
+        RunnableLambda(respond), lambda: history, max_history_tokens=20
+    )
+
+    with_history.invoke([HumanMessage(content="new")])
+
+    assert seen == [["y", "new"]]
+    assert [m.content for m in history.messages] == ["x" * 100, "y", "new", "ai"]
@@ -46,7 +46,7 @@ from langchain_core.runnables.config import (
 )
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from langchain_core.runnables.schema import StreamEvent
-from langchain_core.runnables.utils import Input, Output
+from langchain_core.runnables.utils import Input, Output, _RootEventFilter
 from langchain_core.tools import tool
 from langchain_core.utils.aiter import aclosing
 from tests.unit_tests.runnables.test_runnable_events_v1 import (
@@ -464,6 +464,47 @@ async def test_event_stream_with_triple_lambda_test_filtering() -> None:
     )
 
 
+async def test_event_stream_filters_are_evaluated_once_per_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that filtered out runs are skipped without building their events."""
+    include_run = _RootEventFilter.include_run
+    calls: list[str] = []
+
+    def counting_include_run(
+        self: _RootEventFilter, name: str, run_type: str, tags: list[str] | None
+    ) -> bool:
+        calls.append(name)
+        return include_run(self, name, run_type, tags)
+
+    monkeypatch.setattr(_RootEventFilter, "include_run", counting_include_run)
+
+    infinite_cycle = cycle([AIMessage(content="hello world goodbye world")])
+    model = GenericFakeChatModel(messages=infinite_cycle).with_config(
+        {"run_name": "model"}
+    )
+    chain = (
+        RunnableLambda(lambda x: x).with_config({"run_name": "before"})
+        | model
+        | RunnableLambda(lambda x: x).with_config({"run_name": "after"})
+    )
+    events = await _collect_events(
+        chain.astream_events("hello", include_names=["model"], version="v2"),
+        with_nulled_ids=False,
+    )
+
+    assert {event["name"] for event in events} == {"model"}
+    assert [event["event"] for event in events] == [
+        "on_chat_model_start",
+        *["on_chat_model_stream"] * 7,
+        "on_chat_model_end",
+    ]
+    # Ancestry is still reported for the included run
+    assert all(len(event["parent_ids"]) == 1 for event in events)
+    # One filter evaluation per run, none per event or streamed chunk
+    assert sorted(calls) == ["RunnableSequence", "after", "before", "model"]
+
+
 async def test_event_stream_with_lambdas_from_lambda() -> None:
     as_lambdas = RunnableLambda(lambda _: {"answer": "goodbye"}).with_config(
         {"run_name": "my_lambda"}
@@ -0,0 +1,143 @@
+import contextlib
+import gc
+import json
+import threading
+import urllib.request
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tracers.batch_export import (
+    BatchExportTracer,
+    HTTPRunSink,
+    JSONLRunSink,
+    RunSink,
+)
+
+
+class _ListSink(RunSink):
+    def __init__(self, *, fail: bool = False) -> None:
+        self.batches: list[list[dict[str, Any]]] = []
+        self.closed = False
+        self.fail = fail
+        self.exported = threading.Event()
+
+    def export(self, runs: Sequence[dict[str, Any]]) -> None:
+        if self.fail:
+            msg = "sink is down"
+            raise RuntimeError(msg)
+        self.batches.append(list(runs))
+        self.exported.set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+_chain = RunnableLambda(lambda x: x + 1).with_config(run_name="add") | RunnableLambda(
+    lambda x: x * 2
+).with_config(run_name="mul")
+
+
+def test_flush_exports_runs_with_children() -> None:
+    sink = _ListSink()
+    tracer = BatchExportTracer(sink, flush_interval=60)
+
+    assert _chain.invoke(1, {"callbacks": [tracer]}) == 4
+    tracer.flush()
+
+    assert len(sink.batches) == 1
+    runs = sink.batches[0]
+    assert [run["name"] for run in runs] == ["RunnableSequence", "add", "mul"]
+    assert runs[1]["parent_run_id"] == runs[0]["id"]
+    assert "child_runs" not in runs[0]
+    assert tracer.exported_runs == 1
+    assert tracer.dropped_runs == 0
+
+    tracer.shutdown()
+    assert sink.closed
+
+
+def test_exports_full_batches_in_background() -> None:
+    sink = _ListSink()
+    tracer = BatchExportTracer(
+        sink, batch_size=2, flush_interval=60, include_child_runs=False
+    )
+
+    _chain.batch([1, 2], {"callbacks": [tracer]})
+
+    assert sink.exported.wait(10)
+    assert [[run["outputs"] for run in batch] for batch in sink.batches] == [
+        [{"output": 4}, {"output": 6}]
+    ]
+    tracer.shutdown()
+
+
+def test_drops_runs_when_queue_is_full() -> None:
+    sink = _ListSink()
+    tracer = BatchExportTracer(sink, max_queue_size=1, flush_interval=60)
+
+    for i in range(3):
+        _chain.invoke(i, {"callbacks": [tracer]})
+    tracer.shutdown()
+    _chain.invoke(3, {"callbacks": [tracer]})
+
+    assert tracer.dropped_runs == 3
+    assert tracer.exported_runs == 1
+    assert sink.batches[0][0]["inputs"] == {"input": 0}
+
+
+def test_failed_exports_are_counted() -> None:
+    sink = _ListSink(fail=True)
+    tracer = BatchExportTracer(sink, flush_interval=60)
+
+    _chain.invoke(1, {"callbacks": [tracer]})
+    tracer.flush()
+
+    assert tracer.failed_runs == 1
+    assert tracer.exported_runs == 0
+    tracer.shutdown()
+
+
+def test_flushes_when_garbage_collected(tmp_path: Path) -> None:
+    path = tmp_path / "runs.jsonl"
+    tracer = BatchExportTracer(JSONLRunSink(path), flush_interval=60)
+
+    _chain.invoke(1, {"callbacks": [tracer]})
+    del tracer
+    gc.collect()
+
+    runs = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [run["name"] for run in runs] == ["RunnableSequence", "add", "mul"]
+    assert runs[0]["outputs"] == {"output": 4}
+
+
+def test_http_sink(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[urllib.request.Request] = []
+
+    def urlopen(
+        request: urllib.request.Request, timeout: float
+    ) -> contextlib.nullcontext[None]:
+        assert timeout == 5
+        requests.append(request)
+        return contextlib.nullcontext()
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+    sink = HTTPRunSink(
+        "http://localhost/runs", headers={"Authorization": "Bearer x"}, timeout=5
+    )
+    tracer = BatchExportTracer(sink, flush_interval=60)
+    _chain.invoke(1, {"callbacks": [tracer]})
+    tracer.shutdown()
+
+    assert tracer.exported_runs == 1
+    (request,) = requests
+    assert request.full_url == "http://localhost/runs"
+    assert request.get_method() == "POST"
+    assert request.get_header("Content-type") == "application/json"
+    assert request.get_header("Authorization") == "Bearer x"
+    assert isinstance(request.data, bytes)
+    received = json.loads(request.data)
+    assert [run["name"] for run in received] == ["RunnableSequence", "add", "mul"]
@@ -0,0 +1,86 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import jsonpatch  # type: ignore[import-untyped]
+import pytest
+
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableGenerator
+from langchain_core.runnables.utils import AddableDict
+from langchain_core.tracers.log_stream import RunLog, RunLogPatch, _append_ops
+
+
+@pytest.mark.parametrize(
+    ("prev", "chunk"),
+    [
+        (None, "hello"),
+        ("hello", " world"),
+        ("hello", ""),
+        ([1], [2, 3]),
+        ([1, 1], [1]),
+        (AddableDict(a="x"), AddableDict(a="y", b=[1])),
+        (AddableDict(a=None, b="x"), AddableDict(a="y", b=None)),
+        (AddableDict(a=AddableDict(b="c")), AddableDict(a=AddableDict(b="d"))),
+        (AddableDict(a=[1]), AddableDict(a=[2])),
+        (AddableDict(a=1), AddableDict(a="x")),
+        (AddableDict({"a/b": "x", "c~d": "y"}), AddableDict({"a/b": "z", "c~d": ""})),
+        (AIMessageChunk(content="a"), AIMessageChunk(content="b")),
+    ],
+)
+def test_append_ops_matches_full_diff(prev: Any, chunk: Any) -> None:
+    new = chunk if prev is None else prev + chunk
+    expected = [
+        {**op, "path": f"/final_output{op['path']}"}
+        for op in jsonpatch.JsonPatch.from_diff(prev, new, dumps=dumps)
+    ]
+
+    ops = _append_ops(prev, chunk, new, "/final_output")
+
+    assert sorted(ops, key=repr) == sorted(expected, key=repr)
+
+
+async def test_run_log_extend_matches_add() -> None:
+    async def split(inputs: AsyncIterator[str]) -> AsyncIterator[AddableDict]:
+        async for x in inputs:
+            for word in x.split():
+                yield AddableDict(words=[word], text=word)
+
+    patches = [
+        patch
+        async for patch in RunnableGenerator(split).astream_log(
+            "the quick brown fox", include_names=["split"]
+        )
+    ]
+
+    added = RunLog(state=None)  # type: ignore[arg-type]
+    for patch in patches:
+        added += patch
+    extended = RunLog(state=None)  # type: ignore[arg-type]
+    for patch in patches:
+        extended.extend(patch)
+
+    assert extended == added
+    assert extended.state["final_output"] == {
+        "words": ["the", "quick", "brown", "fox"],
+        "text": "thequickbrownfox",
+    }
+    # The patches are not modified by applying them in place
+    replayed = RunLog(state=None)  # type: ignore[arg-type]
+    for patch in patches:
+        replayed += patch
+    assert replayed == added
+
+    with pytest.raises(TypeError):
+        extended.extend(added)
+
+
+def test_run_log_patch_add_still_copies() -> None:
+    log = RunLog(state=None)  # type: ignore[arg-type]
+    log.extend(RunLogPatch({"op": "replace", "path": "", "value": {"items": []}}))
+    before = log.state
+
+    after = log + RunLogPatch({"op": "add", "path": "/items/-", "value": 1})
+
+    assert before == {"items": []}
+    assert after.state == {"items": [1]}
@@ -0,0 +1,129 @@
+from itertools import cycle
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.tracers.run_collector import RunCollectorCallbackHandler
+from langchain_core.tracers.sampling import (
+    TRACE_SAMPLE_KEY,
+    TraceSampler,
+    sample_value_from_id,
+)
+from langchain_core.utils.uuid import uuid7
+
+
+class _CountingCollector(RunCollectorCallbackHandler):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.created = 0
+
+    def _on_run_create(self, run: Any) -> None:  # noqa: ARG002
+        self.created += 1
+
+
+def _chain() -> Any:
+    model = GenericFakeChatModel(messages=cycle([AIMessage(content="hello world")]))
+
+    def nested(x: str, config: RunnableConfig) -> list[str]:
+        # Nested calls, including ones run in threads, inherit the decision
+        return RunnableLambda(lambda y: y.upper()).batch([x, x], config)
+
+    return RunnableLambda(nested) | RunnableLambda(lambda x: x[0]) | model
+
+
+def _names(run: Any) -> list[str]:
+    return [run.name] + [name for child in run.child_runs for name in _names(child)]
+
+
+@pytest.mark.parametrize("sample_rate", [0.0, 1.0])
+def test_head_sampling(sample_rate: float) -> None:
+    tracer = _CountingCollector(sampler=TraceSampler(sample_rate))
+
+    list(_chain().stream("hi", {"callbacks": [tracer]}))
+
+    if sample_rate:
+        assert len(tracer.traced_runs) == 1
+        assert tracer.created == len(_names(tracer.traced_runs[0])) == 6
+    else:
+        assert tracer.traced_runs == []
+        assert tracer.created == 0
+    assert tracer.run_map == {}
+    assert tracer._unsampled_runs == set()
+
+
+def test_traces_are_sampled_as_a_whole() -> None:
+    tracer = RunCollectorCallbackHandler(sampler=TraceSampler(0.5))
+
+    _chain().batch(["hi"] * 40, {"callbacks": [tracer]})
+
+    assert 0 < len(tracer.traced_runs) < 40
+    for run in tracer.traced_runs:
+        assert len(_names(run)) == 6
+        sample_value = run.extra["metadata"][TRACE_SAMPLE_KEY]
+        assert sample_value < 0.5
+        assert run.child_runs[0].extra["metadata"][TRACE_SAMPLE_KEY] == sample_value
+
+
+@pytest.mark.parametrize(("sample_value", "sampled"), [(0.1, True), (0.9, False)])
+def test_sample_value_from_config(sample_value: float, *, sampled: bool) -> None:
+    tracer = RunCollectorCallbackHandler(sampler=TraceSampler(0.5))
+
+    _chain().invoke(
+        "hi", {"callbacks": [tracer], "metadata": {TRACE_SAMPLE_KEY: sample_value}}
+    )
+
+    assert len(tracer.traced_runs) == int(sampled)
+
+
+def test_tail_sampling_keeps_errors() -> None:
+    tracer = RunCollectorCallbackHandler(sampler=TraceSampler(0.0, keep_errors=True))
+
+    def fail(x: str) -> str:
+        if x == "fail":
+            msg = "boom"
+            raise ValueError(msg)
+        return x
+
+    chain = RunnableLambda(lambda x: x) | RunnableLambda(fail)
+    chain.invoke("ok", {"callbacks": [tracer]})
+    assert tracer.traced_runs == []
+
+    with pytest.raises(ValueError, match="boom"):
+        chain.invoke("fail", {"callbacks": [tracer]})
+    assert len(tracer.traced_runs) == 1
+    assert _names(tracer.traced_runs[0]) == [
+        "RunnableSequence",
+        "RunnableLambda",
+        "fail",
+    ]
+    assert tracer._tail_sampled_runs == set()
+
+
+def test_tail_sampling_keeps_slow_traces() -> None:
+    chain = RunnableLambda(lambda x: x)
+    fast = RunCollectorCallbackHandler(sampler=TraceSampler(0.0, latency_threshold=60))
+    slow = RunCollectorCallbackHandler(sampler=TraceSampler(0.0, latency_threshold=0))
+
+    chain.invoke("hi", {"callbacks": [fast, slow]})
+
+    assert fast.traced_runs == []
+    assert len(slow.traced_runs) == 1
+
+
+def test_invalid_sample_rate() -> None:
+    with pytest.raises(ValueError, match="sample_rate must be between 0 and 1"):
+        TraceSampler(1.5)
+
+
+def test_sample_value_from_id_spreads_uuid7s() -> None:
+    # uuid7s created in the same millisecond can differ only in their counter bits
+    base = uuid7().int
+    values = [sample_value_from_id(UUID(int=base + i)) for i in range(1000)]
+
+    assert all(0 <= value < 1 for value in values)
+    assert 0.4 < sum(value < 0.5 for value in values) / len(values) < 0.6
+    assert max(values) - min(values) > 0.9
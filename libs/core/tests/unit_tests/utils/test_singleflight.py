@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from langchain_core.utils.singleflight import SingleFlight
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_run_coalesces_threads() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    def func() -> str:
+        nonlocal calls
+        calls += 1
+        # Wait for the other threads to join this call
+        _wait_until(lambda: single_flight.deduplicated_calls == 4)
+        return "result"
+
+    with ThreadPoolExecutor(5) as executor:
+        results = list(executor.map(lambda _: single_flight.run("k", func), range(5)))
+
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert single_flight.deduplicated_calls == 4
+    # The next call is not coalesced with the finished one
+    assert single_flight.run("k", func) == "result"
+    assert calls == 2
+
+
+def test_run_raises_to_all_threads() -> None:
+    single_flight = SingleFlight()
+
+    def func() -> str:
+        _wait_until(lambda: single_flight.deduplicated_calls == 2)
+        msg = "boom"
+        raise ValueError(msg)
+
+    def call(_: int) -> BaseException | str:
+        try:
+            return single_flight.run("k", func)
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(3) as executor:
+        errors = list(executor.map(call, range(3)))
+
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert len({id(error) for error in errors}) == 1
+
+
+def test_run_is_reentrant() -> None:
+    single_flight = SingleFlight()
+
+    assert single_flight.run("k", lambda: single_flight.run("k", lambda: 1)) == 1
+    assert single_flight.deduplicated_calls == 0
+
+
+async def test_arun_coalesces_coroutines() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def func() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(
+        *(single_flight.arun("k", func) for _ in range(5)),
+        single_flight.arun("other", func),
+    )
+
+    assert results == ["result"] * 6
+    assert calls == 2
+    assert single_flight.deduplicated_calls == 4
+
+
+async def test_arun_raises_to_all_coroutines() -> None:
+    single_flight = SingleFlight()
+
+    async def func() -> str:
+        await asyncio.sleep(0.01)
+        msg = "boom"
+        raise ValueError(msg)
+
+    errors = await asyncio.gather(
+        *(single_flight.arun("k", func) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert single_flight.deduplicated_calls == 2
+
+
+async def test_arun_survives_cancelled_callers() -> None:
+    single_flight = SingleFlight()
+
+    async def func() -> str:
+        await asyncio.sleep(0.01)
+        return "result"
+
+    first = asyncio.create_task(single_flight.arun("k", func))
+    second = asyncio.create_task(single_flight.arun("k", func))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == "result"
@@ -6,7 +6,12 @@ from collections.abc import Callable
 from typing import Any, Protocol
 
 from langchain_core._api import deprecated
-from langchain_core.callbacks import Callbacks
+from langchain_core.callbacks import (
+    BaseCallbackManager,
+    Callbacks,
+    adispatch_custom_event,
+    dispatch_custom_event,
+)
 from langchain_core.documents import Document
 from pydantic import ConfigDict
 
@@ -64,6 +69,63 @@ def split_list_of_docs(
     return new_result_doc_list
 
 
+def _split_list_of_docs_by_length(
+    docs: list[Document],
+    lengths: list[int],
+    token_max: int,
+    *,
+    base_length: int = 0,
+    join_length: int = 0,
+) -> list[list[Document]]:
+    """Split `Document` objects into subsets using precomputed lengths.
+
+    Unlike `split_list_of_docs`, the length of a subset is estimated as
+    `base_length` plus the lengths of its documents and of the joins between them,
+    so no subset is measured as a whole.
+
+    Args:
+        docs: The full list of `Document` objects.
+        lengths: The length of each `Document`, excluding the rest of the prompt.
+        token_max: The maximum estimated length of any subset.
+        base_length: The length of the prompt without any `Document`.
+        join_length: The length added between two consecutive `Document` objects.
+
+    Returns:
+        A `list[list[Document]]`.
+    """
+    new_result_doc_list: list[list[Document]] = []
+    _sub_result_docs: list[Document] = []
+    _num_tokens = base_length
+    for doc, length in zip(docs, lengths, strict=True):
+        if base_length + length > token_max:
+            msg = (
+                "A single document was longer than the context length,"
+                " we cannot handle this."
+            )
+            raise ValueError(msg)
+        if _sub_result_docs and _num_tokens + join_length + length > token_max:
+            new_result_doc_list.append(_sub_result_docs)
+            _sub_result_docs = []
+            _num_tokens = base_length
+        if _sub_result_docs:
+            _num_tokens += join_length
+        _num_tokens += length
+        _sub_result_docs.append(doc)
+    new_result_doc_list.append(_sub_result_docs)
+    return new_result_doc_list
+
+
+def _combine_metadata(docs: list[Document]) -> dict[str, str]:
+    combined_metadata = {k: str(v) for k, v in docs[0].metadata.items()}
+    for doc in docs[1:]:
+        for k, v in doc.metadata.items():
+            if k in combined_metadata:
+                combined_metadata[k] += f", {v}"
+            else:
+                combined_metadata[k] = str(v)
+    return combined_metadata
+
+
 def collapse_docs(
     docs: list[Document],
     combine_document_func: CombineDocsProtocol,
@@ -86,14 +148,7 @@ def collapse_docs(
             the values are joined by `', '`.
     """
     result = combine_document_func(docs, **kwargs)
-    combined_metadata = {k: str(v) for k, v in docs[0].metadata.items()}
-    for doc in docs[1:]:
-        for k, v in doc.metadata.items():
-            if k in combined_metadata:
-                combined_metadata[k] += f", {v}"
-            else:
-                combined_metadata[k] = str(v)
-    return Document(page_content=result, metadata=combined_metadata)
+    return Document(page_content=result, metadata=_combine_metadata(docs))
 
 
 async def acollapse_docs(
@@ -118,14 +173,7 @@ async def acollapse_docs(
             the values are joined by `', '`.
     """
     result = await combine_document_func(docs, **kwargs)
-    combined_metadata = {k: str(v) for k, v in docs[0].metadata.items()}
-    for doc in docs[1:]:
-        for k, v in doc.metadata.items():
-            if k in combined_metadata:
-                combined_metadata[k] += f", {v}"
-            else:
-                combined_metadata[k] = str(v)
-    return Document(page_content=result, metadata=combined_metadata)
+    return Document(page_content=result, metadata=_combine_metadata(docs))
 
 
 @deprecated(
@@ -155,6 +203,13 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
     `collapse_documents_chain` is called recursively on as big of groups of documents
     as are allowed.
 
+    The documents are collapsed level by level, as a tree. Each document is measured
+    once, the groups of a level are packed from those lengths, and all groups of a
+    level are collapsed concurrently, up to `collapse_max_concurrency` at a time.
+    After each level, a `"reduce_documents_level"` custom event is dispatched with
+    the `level`, the number of `groups` collapsed, and the `num_documents` and
+    `num_tokens` left.
+
     Example:
         ```python
         from langchain_classic.chains import (
@@ -226,6 +281,11 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
 
     Otherwise, after it reaches the max number, it will throw an error.
     """
+    collapse_max_concurrency: int | None = None
+    """The maximum number of groups of a level that are collapsed concurrently.
+
+    If `None`, the default of `batch` is used.
+    """
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -306,6 +366,23 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
             **kwargs,
         )
 
+    def _measure_docs(
+        self, docs: list[Document], **kwargs: Any
+    ) -> tuple[int, int, list[int]]:
+        """Measure the prompt without documents, the joins and each document."""
+        length_func = self.combine_documents_chain.prompt_length
+        base_length = length_func([], **kwargs) or 0
+        lengths = [(length_func([doc], **kwargs) or 0) - base_length for doc in docs]
+        join_length = 0
+        if docs:
+            join_length = max(
+                0,
+                (length_func([docs[0], docs[0]], **kwargs) or 0)
+                - base_length
+                - 2 * lengths[0],
+            )
+        return base_length, join_length, lengths
+
     def _collapse(
         self,
         docs: list[Document],
@@ -316,29 +393,52 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
         result_docs = docs
         length_func = self.combine_documents_chain.prompt_length
         num_tokens = length_func(result_docs, **kwargs)
-
-        def _collapse_docs_func(docs: list[Document], **kwargs: Any) -> str:
-            return self._collapse_chain.run(
-                input_documents=docs,
-                callbacks=callbacks,
-                **kwargs,
-            )
-
         _token_max = token_max or self.token_max
+        if num_tokens is None or num_tokens <= _token_max:
+            return result_docs, {}
+
+        base_length, join_length, lengths = self._measure_docs(result_docs, **kwargs)
+        collapse_chain = self._collapse_chain
+        output_key = collapse_chain.output_keys[0]
         retries: int = 0
         while num_tokens is not None and num_tokens > _token_max:
-            new_result_doc_list = split_list_of_docs(
+            new_result_doc_list = _split_list_of_docs_by_length(
                 result_docs,
-                length_func,
+                lengths,
                 _token_max,
-                **kwargs,
+                base_length=base_length,
+                join_length=join_length,
+            )
+            outputs = collapse_chain.batch(
+                [{"input_documents": docs_, **kwargs} for docs_ in new_result_doc_list],
+                config={
+                    "callbacks": callbacks,
+                    "max_concurrency": self.collapse_max_concurrency,
+                },
             )
             result_docs = [
-                collapse_docs(docs_, _collapse_docs_func, **kwargs)
-                for docs_ in new_result_doc_list
+                Document(
+                    page_content=output[output_key],
+                    metadata=_combine_metadata(docs_),
+                )
+                for docs_, output in zip(new_result_doc_list, outputs, strict=True)
+            ]
+            lengths = [
+                (length_func([doc], **kwargs) or 0) - base_length for doc in result_docs
             ]
             num_tokens = length_func(result_docs, **kwargs)
             retries += 1
+            if isinstance(callbacks, BaseCallbackManager) and callbacks.parent_run_id:
+                dispatch_custom_event(
+                    "reduce_documents_level",
+                    {
+                        "level": retries,
+                        "groups": len(new_result_doc_list),
+                        "num_documents": len(result_docs),
+                        "num_tokens": num_tokens,
+                    },
+                    config={"callbacks": callbacks},
+                )
             if self.collapse_max_retries and retries == self.collapse_max_retries:
                 msg = f"Exceed {self.collapse_max_retries} tries to \
                         collapse document to {_token_max} tokens."
@@ -355,29 +455,52 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
         result_docs = docs
         length_func = self.combine_documents_chain.prompt_length
         num_tokens = length_func(result_docs, **kwargs)
-
-        async def _collapse_docs_func(docs: list[Document], **kwargs: Any) -> str:
-            return await self._collapse_chain.arun(
-                input_documents=docs,
-                callbacks=callbacks,
-                **kwargs,
-            )
-
         _token_max = token_max or self.token_max
+        if num_tokens is None or num_tokens <= _token_max:
+            return result_docs, {}
+
+        base_length, join_length, lengths = self._measure_docs(result_docs, **kwargs)
+        collapse_chain = self._collapse_chain
+        output_key = collapse_chain.output_keys[0]
         retries: int = 0
         while num_tokens is not None and num_tokens > _token_max:
-            new_result_doc_list = split_list_of_docs(
+            new_result_doc_list = _split_list_of_docs_by_length(
                 result_docs,
-                length_func,
+                lengths,
                 _token_max,
-                **kwargs,
+                base_length=base_length,
+                join_length=join_length,
+            )
+            outputs = await collapse_chain.abatch(
+                [{"input_documents": docs_, **kwargs} for docs_ in new_result_doc_list],
+                config={
+                    "callbacks": callbacks,
+                    "max_concurrency": self.collapse_max_concurrency,
+                },
             )
             result_docs = [
-                await acollapse_docs(docs_, _collapse_docs_func, **kwargs)
-                for docs_ in new_result_doc_list
+                Document(
+                    page_content=output[output_key],
+                    metadata=_combine_metadata(docs_),
+                )
+                for docs_, output in zip(new_result_doc_list, outputs, strict=True)
+            ]
+            lengths = [
+                (length_func([doc], **kwargs) or 0) - base_length for doc in result_docs
             ]
             num_tokens = length_func(result_docs, **kwargs)
             retries += 1
+            if isinstance(callbacks, BaseCallbackManager) and callbacks.parent_run_id:
+                await adispatch_custom_event(
+                    "reduce_documents_level",
+                    {
+                        "level": retries,
+                        "groups": len(new_result_doc_list),
+                        "num_documents": len(result_docs),
+                        "num_tokens": num_tokens,
+                    },
+                    config={"callbacks": callbacks},
+                )
             if self.collapse_max_retries and retries == self.collapse_max_retries:
                 msg = f"Exceed {self.collapse_max_retries} tries to \
                         collapse document to {_token_max} tokens."
@@ -9,16 +9,21 @@ The text is hashed and the hash is used as the key in the cache.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import struct
+import sys
 import uuid
 import warnings
+from array import array
 from collections.abc import Callable, Sequence
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from langchain_core.embeddings import Embeddings
 from langchain_core.stores import BaseStore, ByteStore
 from langchain_core.utils.iter import batch_iterate
+from langchain_core.utils.singleflight import SingleFlight
 
 from langchain_classic.storage.encoder_backed import EncoderBackedStore
 
@@ -57,18 +62,25 @@ def _make_default_key_encoder(namespace: str, algorithm: str) -> Callable[[str],
     if algorithm == "sha1":
         _warn_about_sha1_encoder()
 
-    def _key_encoder(key: str) -> str:
-        """Encode a key using the specified algorithm."""
-        if algorithm == "sha1":
+        def _sha1_key_encoder(key: str) -> str:
             return f"{namespace}{_sha1_hash_to_uuid(key)}"
-        if algorithm == "blake2b":
-            return f"{namespace}{hashlib.blake2b(key.encode('utf-8')).hexdigest()}"
-        if algorithm == "sha256":
-            return f"{namespace}{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
-        if algorithm == "sha512":
-            return f"{namespace}{hashlib.sha512(key.encode('utf-8')).hexdigest()}"
+
+        return _sha1_key_encoder
+
+    # Resolve the hash function once rather than on every key.
+    hash_functions: dict[str, Callable[[bytes], Any]] = {
+        "blake2b": hashlib.blake2b,
+        "sha256": hashlib.sha256,
+        "sha512": hashlib.sha512,
+    }
+    if algorithm not in hash_functions:
         msg = f"Unsupported algorithm: {algorithm}"
         raise ValueError(msg)
+    hash_function = hash_functions[algorithm]
+
+    def _key_encoder(key: str) -> str:
+        """Encode a key using the specified algorithm."""
+        return namespace + hash_function(key.encode("utf-8")).hexdigest()
 
     return _key_encoder
 
@@ -78,9 +90,59 @@ def _value_serializer(value: Sequence[float]) -> bytes:
     return json.dumps(value).encode()
 
 
+# Binary values start with a magic number, the dtype code and the dimension,
+# followed by the little-endian floats. JSON values always start with "[".
+_VECTOR_HEADER = struct.Struct("<4scI")
+_VECTOR_MAGIC = b"LCEV"
+_FLOAT32 = b"f"
+_FLOAT16 = b"e"
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _float32_value_serializer(value: Sequence[float]) -> bytes:
+    """Serialize a value as float32."""
+    floats = array("f", value)
+    if _BIG_ENDIAN:
+        floats.byteswap()
+    return _VECTOR_HEADER.pack(_VECTOR_MAGIC, _FLOAT32, len(floats)) + floats.tobytes()
+
+
+def _float16_value_serializer(value: Sequence[float]) -> bytes:
+    """Serialize a value as float16."""
+    return _VECTOR_HEADER.pack(_VECTOR_MAGIC, _FLOAT16, len(value)) + struct.pack(
+        f"<{len(value)}e", *value
+    )
+
+
+_VALUE_SERIALIZERS: dict[str, Callable[[Sequence[float]], bytes]] = {
+    "float32": _float32_value_serializer,
+    "float16": _float16_value_serializer,
+    "json": _value_serializer,
+}
+
+
 def _value_deserializer(serialized_value: bytes) -> list[float]:
-    """Deserialize a value."""
-    return cast("list[float]", json.loads(serialized_value.decode()))
+    """Deserialize a value written by any of the value serializers."""
+    if not serialized_value.startswith(_VECTOR_MAGIC):
+        return cast("list[float]", json.loads(serialized_value.decode()))
+    _, dtype, size = _VECTOR_HEADER.unpack_from(serialized_value)
+    data = memoryview(serialized_value)[_VECTOR_HEADER.size :]
+    floats: Sequence[float]
+    if dtype == _FLOAT32:
+        float32s = array("f")
+        float32s.frombytes(data)
+        if _BIG_ENDIAN:
+            float32s.byteswap()
+        floats = float32s
+    elif dtype == _FLOAT16:
+        floats = struct.unpack(f"<{size}e", data)
+    else:
+        msg = f"Unsupported embedding dtype: {dtype!r}"
+        raise ValueError(msg)
+    if len(floats) != size:
+        msg = f"Expected an embedding of size {size}, got {len(floats)} values."
+        raise ValueError(msg)
+    return list(floats)
 
 
 # The warning is global; track emission, so it appears only once.
@@ -118,6 +180,16 @@ class CacheBackedEmbeddings(Embeddings):
     Note that by default only document embeddings are cached. To cache query
     embeddings too, pass in a query_embedding_store to constructor.
 
+    Texts repeated within a call are looked up and embedded once. The number of
+    texts found in and missing from the cache are counted in `cache_hits` and
+    `cache_misses`.
+
+    Concurrent calls, from threads or coroutines, that miss the cache for the same
+    batch of texts or the same query share a single call to the underlying
+    embedder. The number of calls saved this way is in `deduplicated_calls`. Only
+    identical batches are shared: texts that are missing from two concurrent
+    batches that merely overlap are embedded by both calls.
+
     Examples:
         ```python
         from langchain_classic.embeddings import CacheBackedEmbeddings
@@ -161,6 +233,69 @@ class CacheBackedEmbeddings(Embeddings):
         self.query_embedding_store = query_embedding_store
         self.underlying_embeddings = underlying_embeddings
         self.batch_size = batch_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._single_flight = SingleFlight()
+
+    @property
+    def deduplicated_calls(self) -> int:
+        """Number of calls to the underlying embedder shared by concurrent calls."""
+        return self._single_flight.deduplicated_calls
+
+    def _lookup(
+        self, texts: list[str], cached: list[list[float] | None]
+    ) -> tuple[dict[str, list[float] | None], list[str]]:
+        """Map unique texts to their cached vectors and list the missing ones."""
+        vectors = dict(zip(texts, cached, strict=True))
+        missing_texts = [text for text, vector in vectors.items() if vector is None]
+        return vectors, missing_texts
+
+    @staticmethod
+    def _in_order(
+        texts: list[str], vectors: dict[str, list[float] | None]
+    ) -> list[list[float]]:
+        """Return the vectors of `texts`, copying those of repeated texts."""
+        seen: set[str] = set()
+        result = []
+        for text in texts:
+            vector = cast("list[float]", vectors[text])
+            if text in seen:
+                vector = list(vector)
+            seen.add(text)
+            result.append(vector)
+        return result
+
+    def _count(self, texts: list[str], missing_texts: list[str]) -> None:
+        missing = set(missing_texts)
+        num_misses = sum(text in missing for text in texts) if missing else 0
+        self.cache_misses += num_misses
+        self.cache_hits += len(texts) - num_misses
+
+    def _embed_and_store(self, texts: list[str]) -> list[list[float]]:
+        vectors = self.underlying_embeddings.embed_documents(texts)
+        self.document_embedding_store.mset(list(zip(texts, vectors, strict=False)))
+        return vectors
+
+    async def _aembed_and_store(self, texts: list[str]) -> list[list[float]]:
+        vectors = await self.underlying_embeddings.aembed_documents(texts)
+        await self.document_embedding_store.amset(
+            list(zip(texts, vectors, strict=False))
+        )
+        return vectors
+
+    def _embed_query_and_store(self, text: str) -> list[float]:
+        vector = self.underlying_embeddings.embed_query(text)
+        cast("BaseStore[str, list[float]]", self.query_embedding_store).mset(
+            [(text, vector)]
+        )
+        return vector
+
+    async def _aembed_query_and_store(self, text: str) -> list[float]:
+        vector = await self.underlying_embeddings.aembed_query(text)
+        await cast("BaseStore[str, list[float]]", self.query_embedding_store).amset(
+            [(text, vector)]
+        )
+        return vector
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed a list of texts.
@@ -175,28 +310,25 @@ class CacheBackedEmbeddings(Embeddings):
         Returns:
             A list of embeddings for the given texts.
         """
-        vectors: list[list[float] | None] = self.document_embedding_store.mget(
-            texts,
+        unique_texts = list(dict.fromkeys(texts))
+        vectors, all_missing_texts = self._lookup(
+            unique_texts, self.document_embedding_store.mget(unique_texts)
         )
-        all_missing_indices: list[int] = [
-            i for i, vector in enumerate(vectors) if vector is None
-        ]
-
-        for missing_indices in batch_iterate(self.batch_size, all_missing_indices):
-            missing_texts = [texts[i] for i in missing_indices]
-            missing_vectors = self.underlying_embeddings.embed_documents(missing_texts)
-            self.document_embedding_store.mset(
-                list(zip(missing_texts, missing_vectors, strict=False)),
+        self._count(texts, all_missing_texts)
+
+        for missing_texts in batch_iterate(self.batch_size, all_missing_texts):
+            # Keyed by the whole batch, so that it stays a single embedder call
+            missing_vectors = self._single_flight.run(
+                ("documents", *missing_texts),
+                functools.partial(self._embed_and_store, missing_texts),
+            )
+            # The vectors may be shared with concurrent calls
+            vectors.update(
+                (text, list(vector))
+                for text, vector in zip(missing_texts, missing_vectors, strict=False)
             )
-            for index, updated_vector in zip(
-                missing_indices, missing_vectors, strict=False
-            ):
-                vectors[index] = updated_vector
 
-        return cast(
-            "list[list[float]]",
-            vectors,
-        )  # Nones should have been resolved by now
+        return self._in_order(texts, vectors)
 
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed a list of texts.
@@ -211,32 +343,27 @@ class CacheBackedEmbeddings(Embeddings):
         Returns:
             A list of embeddings for the given texts.
         """
-        vectors: list[list[float] | None] = await self.document_embedding_store.amget(
-            texts
+        unique_texts = list(dict.fromkeys(texts))
+        vectors, all_missing_texts = self._lookup(
+            unique_texts, await self.document_embedding_store.amget(unique_texts)
         )
-        all_missing_indices: list[int] = [
-            i for i, vector in enumerate(vectors) if vector is None
-        ]
+        self._count(texts, all_missing_texts)
 
         # batch_iterate supports None batch_size which returns all elements at once
         # as a single batch.
-        for missing_indices in batch_iterate(self.batch_size, all_missing_indices):
-            missing_texts = [texts[i] for i in missing_indices]
-            missing_vectors = await self.underlying_embeddings.aembed_documents(
-                missing_texts,
+        for missing_texts in batch_iterate(self.batch_size, all_missing_texts):
+            # Keyed by the whole batch, so that it stays a single embedder call
+            missing_vectors = await self._single_flight.arun(
+                ("documents", *missing_texts),
+                functools.partial(self._aembed_and_store, missing_texts),
             )
-            await self.document_embedding_store.amset(
-                list(zip(missing_texts, missing_vectors, strict=False)),
+            # The vectors may be shared with concurrent calls
+            vectors.update(
+                (text, list(vector))
+                for text, vector in zip(missing_texts, missing_vectors, strict=False)
             )
-            for index, updated_vector in zip(
-                missing_indices, missing_vectors, strict=False
-            ):
-                vectors[index] = updated_vector
 
-        return cast(
-            "list[list[float]]",
-            vectors,
-        )  # Nones should have been resolved by now
+        return self._in_order(texts, vectors)
 
     def embed_query(self, text: str) -> list[float]:
         """Embed query text.
@@ -255,11 +382,15 @@ class CacheBackedEmbeddings(Embeddings):
 
         (cached,) = self.query_embedding_store.mget([text])
         if cached is not None:
+            self.cache_hits += 1
             return cached
 
-        vector = self.underlying_embeddings.embed_query(text)
-        self.query_embedding_store.mset([(text, vector)])
-        return vector
+        self.cache_misses += 1
+        vector = self._single_flight.run(
+            ("query", text), functools.partial(self._embed_query_and_store, text)
+        )
+        # The vector may be shared with concurrent calls
+        return list(vector)
 
     async def aembed_query(self, text: str) -> list[float]:
         """Embed query text.
@@ -278,11 +409,15 @@ class CacheBackedEmbeddings(Embeddings):
 
         (cached,) = await self.query_embedding_store.amget([text])
         if cached is not None:
+            self.cache_hits += 1
             return cached
 
-        vector = await self.underlying_embeddings.aembed_query(text)
-        await self.query_embedding_store.amset([(text, vector)])
-        return vector
+        self.cache_misses += 1
+        vector = await self._single_flight.arun(
+            ("query", text), functools.partial(self._aembed_query_and_store, text)
+        )
+        # The vector may be shared with concurrent calls
+        return list(vector)
 
     @classmethod
     def from_bytes_store(
@@ -295,6 +430,7 @@ class CacheBackedEmbeddings(Embeddings):
         query_embedding_cache: bool | ByteStore = False,
         key_encoder: Callable[[str], str]
         | Literal["sha1", "blake2b", "sha256", "sha512"] = "sha1",
+        value_encoding: Literal["float32", "float16", "json"] = "float32",
     ) -> CacheBackedEmbeddings:
         """On-ramp that adds the necessary serialization and encoding to the store.
 
@@ -321,6 +457,15 @@ class CacheBackedEmbeddings(Embeddings):
                 just creating a new cache, to avoid (the potential for)
                 collisions with existing keys or having duplicate keys
                 for the same text in the cache.
+            value_encoding: How embeddings are written to the cache.
+
+                * `'float32'` - raw float32 values, about 4 bytes per dimension
+                * `'float16'` - raw float16 values, half the size of float32 at a
+                    lower precision
+                * `'json'` - a JSON list of floats, the format of older versions
+
+                Values written with any encoding can be read, so the encoding of an
+                existing cache can be changed.
 
         Returns:
             An instance of CacheBackedEmbeddings that uses the provided cache.
@@ -343,11 +488,18 @@ class CacheBackedEmbeddings(Embeddings):
                 "or a callable that encodes keys."
             )
             raise ValueError(msg)  # noqa: TRY004
+        if value_encoding not in _VALUE_SERIALIZERS:
+            msg = (
+                "value_encoding must be one of 'float32', 'float16' or 'json', "
+                f"got {value_encoding!r}."
+            )
+            raise ValueError(msg)
+        value_serializer = _VALUE_SERIALIZERS[value_encoding]
 
         document_embedding_store = EncoderBackedStore[str, list[float]](
             document_embedding_cache,
             key_encoder,
-            _value_serializer,
+            value_serializer,
             _value_deserializer,
         )
         if query_embedding_cache is True:
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+from collections.abc import Sequence
 from enum import Enum
 from importlib import util
 from typing import Any
@@ -13,8 +14,9 @@ from langchain_core.callbacks.manager import (
 )
 from langchain_core.embeddings import Embeddings
 from langchain_core.utils import pre_init
+from langchain_core.utils.iter import batch_iterate
 from pydantic import ConfigDict, Field
-from typing_extensions import override
+from typing_extensions import assert_never, override
 
 from langchain_classic.chains.base import Chain
 from langchain_classic.evaluation.schema import PairwiseStringEvaluator, StringEvaluator
@@ -90,6 +92,15 @@ class EmbeddingDistance(str, Enum):
     HAMMING = "hamming"
 
 
+def _check_batch_lengths(texts_a: Sequence[str], texts_b: Sequence[str]) -> None:
+    if len(texts_a) != len(texts_b):
+        msg = (
+            "Expected as many predictions as references, "
+            f"got {len(texts_a)} and {len(texts_b)}."
+        )
+        raise ValueError(msg)
+
+
 class _EmbeddingDistanceChainMixin(Chain):
     """Shared functionality for embedding distance evaluators.
 
@@ -342,6 +353,89 @@ class _EmbeddingDistanceChainMixin(Chain):
             score = metric(vectors[0], vectors[1])
         return float(score)
 
+    def _compute_scores(self, a: Any, b: Any) -> list[float]:
+        """Compute the distances between the rows of two matrices.
+
+        Args:
+            a (np.ndarray): The first vectors, one per row.
+            b (np.ndarray): The second vectors, one per row.
+
+        Returns:
+            The distance between each pair of rows.
+        """
+        np = _import_numpy()
+        if self.distance_metric == EmbeddingDistance.COSINE:
+            norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+            dot_products = np.einsum("ij,ij->i", a, b)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                similarities = dot_products / norms
+            # Like `_cosine_similarity`, vectors without a direction are dissimilar
+            similarities[~np.isfinite(similarities)] = 0.0
+            scores = 1.0 - similarities
+        elif self.distance_metric == EmbeddingDistance.EUCLIDEAN:
+            scores = np.linalg.norm(a - b, axis=1)
+        elif self.distance_metric == EmbeddingDistance.MANHATTAN:
+            scores = np.abs(a - b).sum(axis=1)
+        elif self.distance_metric == EmbeddingDistance.CHEBYSHEV:
+            scores = np.abs(a - b).max(axis=1)
+        elif self.distance_metric == EmbeddingDistance.HAMMING:
+            scores = (a != b).mean(axis=1)
+        else:
+            assert_never(self.distance_metric)
+        return scores.astype(float).tolist()
+
+    def _score_pairs(
+        self,
+        texts_a: Sequence[str],
+        texts_b: Sequence[str],
+        unique_texts: list[str],
+        vectors: list[list[float]],
+    ) -> list[dict[str, float]]:
+        """Score pairs of texts given the vectors of the unique texts."""
+        if _check_numpy():
+            np = _import_numpy()
+            matrix = np.asarray(vectors, dtype=float)
+            index = {text: i for i, text in enumerate(unique_texts)}
+            scores = self._compute_scores(
+                matrix[[index[text] for text in texts_a]],
+                matrix[[index[text] for text in texts_b]],
+            )
+        else:
+            vectors_by_text = dict(zip(unique_texts, vectors, strict=True))
+            scores = [
+                self._compute_score([vectors_by_text[a], vectors_by_text[b]])
+                for a, b in zip(texts_a, texts_b, strict=True)
+            ]
+        return [{"score": score} for score in scores]
+
+    def _batch_score(
+        self,
+        texts_a: Sequence[str],
+        texts_b: Sequence[str],
+        batch_size: int | None,
+    ) -> list[dict[str, float]]:
+        """Embed the unique texts in batches and score each pair of texts."""
+        _check_batch_lengths(texts_a, texts_b)
+        unique_texts = list(dict.fromkeys([*texts_a, *texts_b]))
+        vectors: list[list[float]] = []
+        for texts in batch_iterate(batch_size, unique_texts):
+            vectors.extend(self.embeddings.embed_documents(texts))
+        return self._score_pairs(texts_a, texts_b, unique_texts, vectors)
+
+    async def _abatch_score(
+        self,
+        texts_a: Sequence[str],
+        texts_b: Sequence[str],
+        batch_size: int | None,
+    ) -> list[dict[str, float]]:
+        """Embed the unique texts in batches and score each pair of texts."""
+        _check_batch_lengths(texts_a, texts_b)
+        unique_texts = list(dict.fromkeys([*texts_a, *texts_b]))
+        vectors: list[list[float]] = []
+        for texts in batch_iterate(batch_size, unique_texts):
+            vectors.extend(await self.embeddings.aembed_documents(texts))
+        return self._score_pairs(texts_a, texts_b, unique_texts, vectors)
+
 
 class EmbeddingDistanceEvalChain(_EmbeddingDistanceChainMixin, StringEvaluator):
     """Embedding distance evaluation chain.
@@ -502,6 +596,60 @@ class EmbeddingDistanceEvalChain(_EmbeddingDistanceChainMixin, StringEvaluator):
         )
         return self._prepare_output(result)
 
+    def batch_evaluate_strings(
+        self,
+        *,
+        predictions: Sequence[str],
+        references: Sequence[str],
+        batch_size: int | None = None,
+    ) -> list[dict]:
+        """Evaluate the embedding distances of many predictions at once.
+
+        Unlike calling `evaluate_strings` for each example, the unique texts are
+        embedded together and all the distances are computed at once, without
+        running the chain or its callbacks.
+
+        Args:
+            predictions: The output strings to evaluate.
+            references: The reference string of each prediction.
+            batch_size: The number of unique texts to embed per call to the
+                embeddings. If `None`, all of them are embedded in a single call.
+
+        Returns:
+            A `dict` with the `score` of each prediction, in order.
+
+        Raises:
+            ValueError: If there are not as many predictions as references.
+        """
+        return self._batch_score(predictions, references, batch_size)
+
+    async def abatch_evaluate_strings(
+        self,
+        *,
+        predictions: Sequence[str],
+        references: Sequence[str],
+        batch_size: int | None = None,
+    ) -> list[dict]:
+        """Asynchronously evaluate the embedding distances of many predictions.
+
+        Unlike calling `aevaluate_strings` for each example, the unique texts are
+        embedded together and all the distances are computed at once, without
+        running the chain or its callbacks.
+
+        Args:
+            predictions: The output strings to evaluate.
+            references: The reference string of each prediction.
+            batch_size: The number of unique texts to embed per call to the
+                embeddings. If `None`, all of them are embedded in a single call.
+
+        Returns:
+            A `dict` with the `score` of each prediction, in order.
+
+        Raises:
+            ValueError: If there are not as many predictions as references.
+        """
+        return await self._abatch_score(predictions, references, batch_size)
+
 
 class PairwiseEmbeddingDistanceEvalChain(
     _EmbeddingDistanceChainMixin,
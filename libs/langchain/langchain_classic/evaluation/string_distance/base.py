@@ -1,7 +1,8 @@
 """String distance evaluators based on the RapidFuzz library."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import Enum
+from importlib import util
 from typing import Any
 
 from langchain_core.callbacks import Callbacks
@@ -161,6 +162,52 @@ class _RapidFuzzChainMixin(Chain):
         """
         return self.metric(a, b)
 
+    def compute_metrics(
+        self, a: Sequence[str], b: Sequence[str], *, workers: int = 1
+    ) -> list[float]:
+        """Compute the distances between pairs of strings.
+
+        Uses RapidFuzz's `cpdist` to compute all the distances in a single call
+        when it is available.
+
+        Args:
+            a: The first string of each pair.
+            b: The second string of each pair.
+            workers: The number of threads used by `cpdist`, `-1` to use all the
+                CPU cores.
+
+        Returns:
+            The distance between the strings of each pair.
+
+        Raises:
+            ValueError: If `a` and `b` do not have the same length.
+        """
+        if len(a) != len(b):
+            msg = f"Expected as many strings in a as in b, got {len(a)} and {len(b)}."
+            raise ValueError(msg)
+        if util.find_spec("numpy"):
+            try:
+                from rapidfuzz.process import cpdist
+            except ImportError:
+                # cpdist was added in rapidfuzz 3.6
+                pass
+            else:
+                import numpy as np
+
+                # Only the edit distances are integers
+                is_integer = not self.normalize_score and self.distance not in {
+                    StringDistance.JARO,
+                    StringDistance.JARO_WINKLER,
+                }
+                return cpdist(
+                    a,
+                    b,
+                    scorer=self.metric,
+                    dtype=None if is_integer else np.float64,
+                    workers=workers,
+                ).tolist()
+        return [self.metric(a_, b_) for a_, b_ in zip(a, b, strict=True)]
+
 
 class StringDistanceEvalChain(StringEvaluator, _RapidFuzzChainMixin):
     """Compute string distances between the prediction and the reference.
@@ -321,6 +368,61 @@ class StringDistanceEvalChain(StringEvaluator, _RapidFuzzChainMixin):
         )
         return self._prepare_output(result)
 
+    def batch_evaluate_strings(
+        self,
+        *,
+        predictions: Sequence[str],
+        references: Sequence[str],
+        workers: int = 1,
+    ) -> list[dict]:
+        """Evaluate the string distances of many predictions at once.
+
+        Unlike calling `evaluate_strings` for each example, all the distances are
+        computed in a single call, without running the chain or its callbacks.
+
+        Args:
+            predictions: The output strings to evaluate.
+            references: The reference string of each prediction.
+            workers: The number of threads used to compute the distances, `-1` to
+                use all the CPU cores.
+
+        Returns:
+            A `dict` with the `score` of each prediction, in order.
+
+        Raises:
+            ValueError: If there are not as many predictions as references.
+        """
+        scores = self.compute_metrics(references, predictions, workers=workers)
+        return [{"score": score} for score in scores]
+
+    async def abatch_evaluate_strings(
+        self,
+        *,
+        predictions: Sequence[str],
+        references: Sequence[str],
+        workers: int = 1,
+    ) -> list[dict]:
+        """Asynchronously evaluate the string distances of many predictions.
+
+        Unlike calling `aevaluate_strings` for each example, all the distances are
+        computed in a single call, without running the chain or its callbacks.
+
+        Args:
+            predictions: The output strings to evaluate.
+            references: The reference string of each prediction.
+            workers: The number of threads used to compute the distances, `-1` to
+                use all the CPU cores.
+
+        Returns:
+            A `dict` with the `score` of each prediction, in order.
+
+        Raises:
+            ValueError: If there are not as many predictions as references.
+        """
+        return self.batch_evaluate_strings(
+            predictions=predictions, references=references, workers=workers
+        )
+
 
 class PairwiseStringDistanceEvalChain(PairwiseStringEvaluator, _RapidFuzzChainMixin):
     """Compute string edit distances between two predictions."""
@@ -47,6 +47,9 @@ run_on_dataset(
     component over a dataset.
 - `run_on_dataset`: Function to evaluate a chain or other LangChain component over a
     dataset.
+- `run_on_dataset_streaming`, `arun_on_dataset_streaming`: Functions to evaluate a
+    chain or other LangChain component over a large or local dataset, writing the
+    results to a JSONL file as they complete.
 - `RunEvalConfig`: Class representing the configuration for running evaluation.
 - `StringRunEvaluatorChain`: Class representing a string run evaluator chain.
 - `InputFormatError`: Exception raised when the input format is incorrect.
@@ -57,7 +60,9 @@ from langchain_classic.smith.evaluation.config import RunEvalConfig
 from langchain_classic.smith.evaluation.runner_utils import (
     InputFormatError,
     arun_on_dataset,
+    arun_on_dataset_streaming,
     run_on_dataset,
+    run_on_dataset_streaming,
 )
 from langchain_classic.smith.evaluation.string_run_evaluator import (
     StringRunEvaluatorChain,
@@ -68,5 +73,7 @@ __all__ = [
     "RunEvalConfig",
     "StringRunEvaluatorChain",
     "arun_on_dataset",
+    "arun_on_dataset_streaming",
     "run_on_dataset",
+    "run_on_dataset_streaming",
 ]
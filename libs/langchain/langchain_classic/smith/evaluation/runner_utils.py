@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
+import contextlib
 import dataclasses
 import functools
 import inspect
+import itertools
+import json
 import logging
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     cast,
@@ -19,6 +25,7 @@ from typing import (
 from langchain_core._api import warn_deprecated
 from langchain_core.callbacks import Callbacks
 from langchain_core.language_models import BaseLanguageModel
+from langchain_core.load import dumpd
 from langchain_core.messages import BaseMessage, messages_from_dict
 from langchain_core.outputs import ChatResult, LLMResult
 from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
@@ -29,10 +36,12 @@ from langchain_core.tracers.evaluation import (
     wait_for_all_evaluators,
 )
 from langchain_core.tracers.langchain import LangChainTracer
+from langchain_core.tracers.run_collector import RunCollectorCallbackHandler
 from langsmith.client import Client
 from langsmith.env import get_git_info, get_langchain_env_var_metadata
 from langsmith.evaluation import (
     EvaluationResult,
+    EvaluationResults,
     RunEvaluator,
 )
 from langsmith.evaluation import (
@@ -1696,3 +1705,458 @@ def run_on_dataset(
             )
 
     return container.finish(batch_results, verbose=verbose)
+
+
+## Streaming
+
+_LOCAL_DATASET_NAMESPACE = uuid.UUID("5d2d4b8e-3c54-4d38-9d8b-6a0f5c0c7e21")
+
+
+def _iter_examples(dataset: str | Path | Iterable[Example]) -> Iterator[Example]:
+    """Iterate over the examples of a dataset, reading local files lazily.
+
+    A local dataset is a JSONL file with one `{"inputs": ..., "outputs": ...}`
+    object per line and an optional `id`. Examples without an `id` are identified
+    by their line number, so resumed runs can recognize them. An `id` that is not
+    a UUID is mapped to one, and kept in the `local_id` metadata of the example.
+    """
+    if not isinstance(dataset, (str, Path)):
+        yield from dataset
+        return
+    with Path(dataset).open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            metadata = row.get("metadata")
+            if row.get("id") is None:
+                id_ = uuid.uuid5(_LOCAL_DATASET_NAMESPACE, str(line_number))
+            else:
+                try:
+                    id_ = uuid.UUID(str(row["id"]))
+                except ValueError:
+                    id_ = uuid.uuid5(_LOCAL_DATASET_NAMESPACE, str(row["id"]))
+                    metadata = {**(metadata or {}), "local_id": row["id"]}
+            yield Example(
+                id=id_,
+                inputs=row.get("inputs"),
+                outputs=row.get("outputs"),
+                metadata=metadata,
+            )
+
+
+def _read_completed_example_ids(path: Path) -> set[str]:
+    """Read the IDs of the examples already completed in a results file.
+
+    The rows of examples that failed, and a last line left incomplete by a crash,
+    are removed from the file, so that those examples are run again.
+    """
+    completed: set[str] = set()
+    if not path.exists():
+        return completed
+    with path.open("rb+") as f:
+        kept: list[bytes] = []
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            row = json.loads(line)
+            if "Error" not in row:
+                completed.add(row["example_id"])
+                kept.append(line)
+        f.seek(0)
+        f.writelines(kept)
+        f.truncate()
+    return completed
+
+
+def _last_traced_run(run_collector: RunCollectorCallbackHandler) -> Run | None:
+    if not run_collector.traced_runs:
+        return None
+    # The collected runs are core runs, which the evaluators and the LangSmith
+    # client accept in place of `langsmith.schemas.Run`
+    return cast("Run", run_collector.traced_runs[-1])
+
+
+@dataclasses.dataclass
+class _StreamingRunContainer:
+    """Run and evaluate examples one at a time and write their results."""
+
+    wrapped_model: MCF
+    run_evaluators: list[RunEvaluator]
+    results_file: IO[str]
+    client: Client | None = None
+    project_name: str | None = None
+    tags: list[str] = dataclasses.field(default_factory=list)
+    num_completed: int = 0
+    num_skipped: int = 0
+    num_errors: int = 0
+    feedback_totals: dict[str, list[float]] = dataclasses.field(default_factory=dict)
+
+    def _prepare_run(
+        self, example: Example
+    ) -> tuple[RunnableConfig, RunCollectorCallbackHandler]:
+        run_collector = RunCollectorCallbackHandler(example_id=example.id)
+        callbacks: list = [run_collector]
+        if self.client is not None and self.project_name is not None:
+            callbacks.append(
+                LangChainTracer(
+                    project_name=self.project_name,
+                    client=self.client,
+                    example_id=example.id,
+                )
+            )
+        return RunnableConfig(callbacks=callbacks, tags=self.tags), run_collector
+
+    def _log_feedback(
+        self, results: EvaluationResult | EvaluationResults, run: Run
+    ) -> list[EvaluationResult]:
+        results_ = (
+            [results] if isinstance(results, EvaluationResult) else results["results"]
+        )
+        if self.client is not None:
+            for result in results_:
+                try:
+                    self.client.create_feedback(
+                        run.id,
+                        result.key,
+                        score=result.score,
+                        value=result.value,
+                        comment=result.comment,
+                        correction=result.correction,
+                    )
+                except Exception:
+                    logger.exception("Error logging feedback for run %s", run.id)
+        return results_
+
+    def _row(
+        self,
+        example: Example,
+        output: Any,
+        run: Run | None,
+        feedback: list[EvaluationResult],
+    ) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "example_id": str(example.id),
+            "input": example.inputs,
+            "feedback": [
+                {
+                    "key": result.key,
+                    "score": result.score,
+                    "value": result.value,
+                    "comment": result.comment,
+                }
+                for result in feedback
+            ],
+            "execution_time": (
+                (run.end_time - run.start_time).total_seconds()
+                if run and run.end_time
+                else None
+            ),
+            "run_id": str(run.id) if run else None,
+        }
+        if isinstance(output, EvalError):
+            row["Error"] = repr(output.Error)
+        else:
+            row["output"] = dumpd(output)
+        if example.outputs:
+            row["reference"] = example.outputs
+        if example.metadata and "local_id" in example.metadata:
+            row["local_id"] = example.metadata["local_id"]
+        return row
+
+    def run_example(self, example: Example) -> dict[str, Any]:
+        config, run_collector = self._prepare_run(example)
+        output = _run_llm_or_chain(
+            example, config, llm_or_chain_factory=self.wrapped_model
+        )
+        run = _last_traced_run(run_collector)
+        feedback: list[EvaluationResult] = []
+        if run is not None:
+            for evaluator in self.run_evaluators:
+                try:
+                    result = evaluator.evaluate_run(run, example)
+                except Exception:
+                    logger.exception("Error evaluating run %s", run.id)
+                    continue
+                feedback.extend(self._log_feedback(result, run))
+        return self._row(example, output, run, feedback)
+
+    async def arun_example(self, example: Example) -> dict[str, Any]:
+        config, run_collector = self._prepare_run(example)
+        output = await _arun_llm_or_chain(
+            example, config, llm_or_chain_factory=self.wrapped_model
+        )
+        run = _last_traced_run(run_collector)
+        feedback: list[EvaluationResult] = []
+        if run is not None:
+            for evaluator in self.run_evaluators:
+                try:
+                    result = await evaluator.aevaluate_run(run, example)
+                except Exception:
+                    logger.exception("Error evaluating run %s", run.id)
+                    continue
+                feedback.extend(self._log_feedback(result, run))
+        return self._row(example, output, run, feedback)
+
+    def write(self, row: dict[str, Any]) -> None:
+        # Flushed so that a crashed run can be resumed from this row
+        self.results_file.write(json.dumps(row, default=str) + "\n")
+        self.results_file.flush()
+        self.num_completed += 1
+        if "Error" in row:
+            self.num_errors += 1
+        for feedback in row["feedback"]:
+            if isinstance(feedback["score"], (int, float)):
+                total = self.feedback_totals.setdefault(feedback["key"], [0.0, 0])
+                total[0] += feedback["score"]
+                total[1] += 1
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "results_path": self.results_file.name,
+            "num_completed": self.num_completed,
+            "num_skipped": self.num_skipped,
+            "num_errors": self.num_errors,
+            "aggregate_feedback": {
+                key: total / count
+                for key, (total, count) in self.feedback_totals.items()
+            },
+        }
+
+    @classmethod
+    @contextlib.contextmanager
+    def prepare(
+        cls,
+        dataset: str | Path | Iterable[Example],
+        llm_or_chain_factory: MODEL_OR_CHAIN_FACTORY,
+        results_path: str | Path,
+        *,
+        evaluation: smith_eval.RunEvalConfig | None,
+        client: Client | None,
+        project_name: str | None,
+        tags: list[str] | None,
+        resume: bool,
+    ) -> Iterator[tuple[_StreamingRunContainer, Iterator[Example]]]:
+        if evaluation and evaluation.batch_evaluators:
+            msg = (
+                "Batch evaluators need the runs of all the examples and are not"
+                " supported when streaming. Use run_on_dataset instead."
+            )
+            raise ValueError(msg)
+        examples = _iter_examples(dataset)
+        first_example = next(examples, None)
+        if first_example is None:
+            msg = "The dataset has no example rows."
+            raise ValueError(msg)
+        wrapped_model = _wrap_in_chain_factory(llm_or_chain_factory)
+        run_evaluators = _setup_evaluation(
+            wrapped_model, [first_example], evaluation, DataType.kv
+        )
+        _validate_example_inputs(first_example, wrapped_model, None)
+
+        results_path = Path(results_path)
+        completed = _read_completed_example_ids(results_path) if resume else set()
+        with results_path.open("a" if resume else "w", encoding="utf-8") as f:
+            container = cls(
+                wrapped_model=wrapped_model,
+                run_evaluators=run_evaluators or [],
+                results_file=f,
+                client=client,
+                project_name=project_name,
+                tags=tags or [],
+            )
+
+            def remaining_examples() -> Iterator[Example]:
+                for example in itertools.chain([first_example], examples):
+                    if str(example.id) in completed:
+                        container.num_skipped += 1
+                    else:
+                        yield example
+
+            yield container, remaining_examples()
+
+
+def run_on_dataset_streaming(
+    dataset: str | Path | Iterable[Example],
+    llm_or_chain_factory: MODEL_OR_CHAIN_FACTORY,
+    results_path: str | Path,
+    *,
+    evaluation: smith_eval.RunEvalConfig | None = None,
+    concurrency_level: int = 5,
+    client: Client | None = None,
+    project_name: str | None = None,
+    tags: list[str] | None = None,
+    resume: bool = True,
+) -> dict[str, Any]:
+    """Run and evaluate the Chain or language model over a dataset as a stream.
+
+    Unlike `run_on_dataset`, each example is evaluated as soon as its prediction
+    finishes, and its result is appended to a local JSONL file instead of being
+    kept in memory. At most `2 * concurrency_level` examples are in progress at
+    any time, so memory does not grow with the size of the dataset, and a slow
+    example does not hold back the others.
+
+    If the run is interrupted, calling this function again with the same
+    `results_path` only runs the examples that are not in the file yet, or that
+    failed.
+
+    Args:
+        dataset: A local JSONL dataset file, with one
+            `{"inputs": ..., "outputs": ...}` object per line and an optional
+            `id`, or an iterable of examples, e.g. from `Client.list_examples`.
+            An `id` that is not a UUID is written to the results as `local_id`.
+        llm_or_chain_factory: Language model or Chain constructor to run
+            over the dataset. The Chain constructor is used to permit
+            independent calls on each example without carrying over state.
+        results_path: The JSONL file the result of each example is written to.
+        evaluation: Configuration for the evaluators to run on each example.
+            Batch evaluators are not supported.
+        concurrency_level: The number of examples to run concurrently, or `0` to
+            run them one after the other in the calling thread.
+        client: Optional LangSmith client to trace the runs and log the feedback
+            to `project_name`. If `None`, nothing is sent to LangSmith.
+        project_name: The LangSmith project to trace the runs to.
+        tags: Tags to add to each run.
+        resume: Whether to skip the examples already completed in
+            `results_path`. If `False`, the file is overwritten.
+
+    Returns:
+        `dict` with the path of the results file, the number of examples
+            completed, skipped and failed, and the mean of each numeric feedback.
+
+    Raises:
+        ValueError: If the dataset is empty, `evaluation` has batch evaluators or
+            `concurrency_level` is negative.
+
+    Example:
+        ```python
+        from langchain_classic.smith import RunEvalConfig
+        from langchain_classic.smith.evaluation import run_on_dataset_streaming
+
+        summary = run_on_dataset_streaming(
+            "dataset.jsonl",
+            construct_chain,
+            "results.jsonl",
+            evaluation=RunEvalConfig(evaluators=["exact_match"]),
+        )
+        ```
+    """
+    if concurrency_level < 0:
+        msg = f"concurrency_level must be at least 0, got {concurrency_level}."
+        raise ValueError(msg)
+    with _StreamingRunContainer.prepare(
+        dataset,
+        llm_or_chain_factory,
+        results_path,
+        evaluation=evaluation,
+        client=client,
+        project_name=project_name,
+        tags=tags,
+        resume=resume,
+    ) as (container, examples):
+        if concurrency_level == 0:
+            for example in examples:
+                container.write(container.run_example(example))
+            return container.summary()
+
+        config = RunnableConfig(max_concurrency=concurrency_level)
+        with runnable_config.get_executor_for_config(config) as executor:
+            pending: set[concurrent.futures.Future] = set()
+            for example in examples:
+                if len(pending) >= 2 * concurrency_level:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        container.write(future.result())
+                pending.add(executor.submit(container.run_example, example))
+            for future in concurrent.futures.as_completed(pending):
+                container.write(future.result())
+        return container.summary()
+
+
+async def arun_on_dataset_streaming(
+    dataset: str | Path | Iterable[Example],
+    llm_or_chain_factory: MODEL_OR_CHAIN_FACTORY,
+    results_path: str | Path,
+    *,
+    evaluation: smith_eval.RunEvalConfig | None = None,
+    concurrency_level: int = 5,
+    client: Client | None = None,
+    project_name: str | None = None,
+    tags: list[str] | None = None,
+    resume: bool = True,
+) -> dict[str, Any]:
+    """Asynchronously run and evaluate the Chain or language model as a stream.
+
+    Examples flow through bounded queues from the dataset to
+    `concurrency_level` workers, which run and evaluate them, and on to the
+    results file. See `run_on_dataset_streaming` for details.
+
+    Args:
+        dataset: A local JSONL dataset file, with one
+            `{"inputs": ..., "outputs": ...}` object per line and an optional
+            `id`, or an iterable of examples, e.g. from `Client.list_examples`.
+            An `id` that is not a UUID is written to the results as `local_id`.
+        llm_or_chain_factory: Language model or Chain constructor to run
+            over the dataset. The Chain constructor is used to permit
+            independent calls on each example without carrying over state.
+        results_path: The JSONL file the result of each example is written to.
+        evaluation: Configuration for the evaluators to run on each example.
+            Batch evaluators are not supported.
+        concurrency_level: The number of examples to run concurrently.
+        client: Optional LangSmith client to trace the runs and log the feedback
+            to `project_name`. If `None`, nothing is sent to LangSmith.
+        project_name: The LangSmith project to trace the runs to.
+        tags: Tags to add to each run.
+        resume: Whether to skip the examples already completed in
+            `results_path`. If `False`, the file is overwritten.
+
+    Returns:
+        `dict` with the path of the results file, the number of examples
+            completed, skipped and failed, and the mean of each numeric feedback.
+
+    Raises:
+        ValueError: If the dataset is empty, `evaluation` has batch evaluators or
+            `concurrency_level` is less than 1.
+    """
+    if concurrency_level < 1:
+        msg = f"concurrency_level must be at least 1, got {concurrency_level}."
+        raise ValueError(msg)
+    with _StreamingRunContainer.prepare(
+        dataset,
+        llm_or_chain_factory,
+        results_path,
+        evaluation=evaluation,
+        client=client,
+        project_name=project_name,
+        tags=tags,
+        resume=resume,
+    ) as (container, examples):
+        example_queue: asyncio.Queue[Example | None] = asyncio.Queue(concurrency_level)
+        row_queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(
+            concurrency_level
+        )
+
+        async def produce() -> None:
+            for example in examples:
+                await example_queue.put(example)
+            for _ in range(concurrency_level):
+                await example_queue.put(None)
+
+        async def work() -> None:
+            while (example := await example_queue.get()) is not None:
+                await row_queue.put(await container.arun_example(example))
+
+        async def write() -> None:
+            while (row := await row_queue.get()) is not None:
+                container.write(row)
+
+        writer = asyncio.create_task(write())
+        try:
+            await asyncio.gather(produce(), *(work() for _ in range(concurrency_level)))
+            await row_queue.put(None)
+            await writer
+        finally:
+            writer.cancel()
+        return container.summary()
@@ -1,16 +1,23 @@
 """Test functionality related to combining documents."""
 
 import re
+import time
 from typing import Any
 
 import pytest
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.documents import Document
 from langchain_core.prompts import PromptTemplate, aformat_document, format_document
+from typing_extensions import override
 
 from langchain_classic.chains.combine_documents.reduce import (
+    ReduceDocumentsChain,
+    _split_list_of_docs_by_length,
     collapse_docs,
     split_list_of_docs,
 )
+from langchain_classic.chains.combine_documents.stuff import StuffDocumentsChain
+from langchain_classic.chains.llm import LLMChain
 from langchain_classic.chains.qa_with_sources import load_qa_with_sources_chain
 from tests.unit_tests.llms.fake_llm import FakeLLM
 
@@ -77,6 +84,94 @@ def test__split_list_works_correctly() -> None:
     assert doc_list == expected_result
 
 
+def test__split_list_by_length() -> None:
+    """Test splitting with precomputed lengths matches measuring each subset."""
+    docs = [Document(page_content=c) for c in ["foo", "bar", "baz", "foo" * 2]]
+    lengths = [len(d.page_content) for d in docs]
+    doc_list = _split_list_of_docs_by_length(
+        docs, lengths, 10, base_length=1, join_length=1
+    )
+    assert doc_list == [docs[:2], docs[2:3], docs[3:]]
+
+    with pytest.raises(
+        ValueError, match="A single document was longer than the context length"
+    ):
+        _split_list_of_docs_by_length(docs, lengths, 6, base_length=1)
+
+
+class _SlowLLM(FakeLLM):
+    calls: list[tuple[float, float]] = []
+
+    @override
+    def _call(self, prompt: str, *args: Any, **kwargs: Any) -> str:
+        start = time.monotonic()
+        time.sleep(0.05)
+        self.calls.append((start, time.monotonic()))
+        return "foo"
+
+    @property
+    def max_concurrency(self) -> int:
+        return max(
+            sum(start <= s < end for start, end in self.calls) for s, _ in self.calls
+        )
+
+
+class _LevelHandler(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.levels: list[Any] = []
+
+    @override
+    def on_custom_event(self, name: str, data: Any, **kwargs: Any) -> None:
+        if name == "reduce_documents_level":
+            self.levels.append(data)
+
+
+def _reduce_chain(llm: FakeLLM) -> ReduceDocumentsChain:
+    return ReduceDocumentsChain(
+        combine_documents_chain=StuffDocumentsChain(
+            llm_chain=LLMChain(
+                llm=llm, prompt=PromptTemplate.from_template("Summarize: {context}")
+            ),
+            document_variable_name="context",
+        ),
+        token_max=35,
+        collapse_max_concurrency=2,
+    )
+
+
+_EXPECTED_LEVELS = [{"level": 1, "groups": 3, "num_documents": 3, "num_tokens": 4}]
+
+
+def test_reduce_documents_collapses_levels_concurrently() -> None:
+    llm = _SlowLLM()
+    handler = _LevelHandler()
+    docs = [Document(page_content="word " * 10, metadata={"page": i}) for i in range(8)]
+
+    output = _reduce_chain(llm).invoke(
+        {"input_documents": docs}, {"callbacks": [handler]}
+    )
+
+    assert output["output_text"] == "foo"
+    # Three collapses of at most three documents, then the final combine
+    assert len(llm.calls) == 4
+    assert llm.max_concurrency == 2
+    assert handler.levels == _EXPECTED_LEVELS
+
+
+async def test_reduce_documents_collapses_levels_concurrently_async() -> None:
+    llm = _SlowLLM()
+    handler = _LevelHandler()
+    docs = [Document(page_content="word " * 10, metadata={"page": i}) for i in range(8)]
+
+    output = await _reduce_chain(llm).ainvoke(
+        {"input_documents": docs}, {"callbacks": [handler]}
+    )
+
+    assert output["output_text"] == "foo"
+    assert len(llm.calls) == 4
+    assert handler.levels == _EXPECTED_LEVELS
+
+
 def test__collapse_docs_no_metadata() -> None:
     """Test collapse documents functionality when no metadata."""
     docs = [
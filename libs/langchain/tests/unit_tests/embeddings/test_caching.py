@@ -1,9 +1,12 @@
 """Embeddings tests."""
 
+import asyncio
 import contextlib
 import hashlib
 import importlib
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from langchain_core.embeddings import Embeddings
@@ -251,3 +254,143 @@ def test_custom_encoder() -> None:
     cbe.embed_documents([txt])
 
     assert list(cbe.document_embedding_store.yield_keys()) == ["CUSTOM_X"]
+
+
+class CountingEmbeddings(MockEmbeddings):
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[len(text) / 3, 0.1, -2.5] for text in texts]
+
+
+@pytest.mark.parametrize(
+    ("value_encoding", "size"), [("float32", 9 + 3 * 4), ("float16", 9 + 3 * 2)]
+)
+def test_binary_value_encoding(value_encoding: str, size: int) -> None:
+    store = InMemoryStore()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        CountingEmbeddings(),
+        store,
+        key_encoder="sha256",
+        value_encoding=value_encoding,  # type: ignore[arg-type]
+    )
+
+    vectors = embeddings.embed_documents(["a", "bb"])
+    cached = embeddings.embed_documents(["a", "bb"])
+
+    assert [len(value) for value in store.store.values()] == [size, size]
+    for cached_vector, vector in zip(cached, vectors, strict=True):
+        assert cached_vector == pytest.approx(vector, rel=1e-3)
+    assert cached[1][0] != 2 / 3
+
+
+def test_reads_json_values() -> None:
+    store = InMemoryStore()
+    json_embeddings = CacheBackedEmbeddings.from_bytes_store(
+        CountingEmbeddings(), store, key_encoder="sha256", value_encoding="json"
+    )
+    vectors = json_embeddings.embed_documents(["a"])
+    assert next(iter(store.store.values())).startswith(b"[")
+
+    underlying = CountingEmbeddings()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        underlying, store, key_encoder="sha256"
+    )
+
+    assert embeddings.embed_documents(["a"]) == vectors
+    assert underlying.embedded == []
+
+
+def test_repeated_texts_and_counts() -> None:
+    underlying = CountingEmbeddings()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        underlying,
+        InMemoryStore(),
+        key_encoder="sha256",
+        query_embedding_cache=True,
+    )
+
+    vectors = embeddings.embed_documents(["a", "b", "a"])
+
+    assert underlying.embedded == ["a", "b"]
+    assert vectors[0] == vectors[2]
+    assert vectors[0] is not vectors[2]
+    assert (embeddings.cache_hits, embeddings.cache_misses) == (0, 3)
+
+    embeddings.embed_documents(["a", "c"])
+    embeddings.embed_query("b")
+    embeddings.embed_query("q")
+    assert underlying.embedded == ["a", "b", "c"]
+    assert (embeddings.cache_hits, embeddings.cache_misses) == (2, 5)
+
+
+async def test_arepeated_texts_and_counts() -> None:
+    underlying = CountingEmbeddings()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        underlying, InMemoryStore(), key_encoder="sha256"
+    )
+
+    await embeddings.aembed_documents(["a", "b", "a"])
+    await embeddings.aembed_documents(["b"])
+
+    assert underlying.embedded == ["a", "b"]
+    assert (embeddings.cache_hits, embeddings.cache_misses) == (1, 3)
+
+
+class SlowEmbeddings(CountingEmbeddings):
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(0.1)
+        if "RAISE_EXCEPTION" in texts:
+            msg = "Simulated embedding failure"
+            raise ValueError(msg)
+        return super().embed_documents(texts)
+
+    @override
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def test_concurrent_misses_share_a_call() -> None:
+    underlying = SlowEmbeddings()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        underlying, InMemoryStore(), key_encoder="sha256", query_embedding_cache=True
+    )
+
+    with ThreadPoolExecutor(4) as executor:
+        vectors = list(executor.map(embeddings.embed_documents, [["a", "b"]] * 4))
+        queries = list(executor.map(embeddings.embed_query, ["q"] * 4))
+        errors = [
+            future.exception()
+            for future in [
+                executor.submit(embeddings.embed_documents, ["RAISE_EXCEPTION"])
+                for _ in range(4)
+            ]
+        ]
+
+    assert underlying.embedded == ["a", "b", "q"]
+    assert all(vector == vectors[0] for vector in vectors)
+    assert vectors[0] is not vectors[1]
+    assert all(query == queries[0] for query in queries)
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert embeddings.deduplicated_calls == 9
+
+
+async def test_aconcurrent_misses_share_a_call() -> None:
+    underlying = SlowEmbeddings()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        underlying, InMemoryStore(), key_encoder="sha256", query_embedding_cache=True
+    )
+
+    vectors = await asyncio.gather(
+        *(embeddings.aembed_documents(["a", "b"]) for _ in range(4))
+    )
+    queries = await asyncio.gather(*(embeddings.aembed_query("q") for _ in range(4)))
+
+    assert underlying.embedded == ["a", "b", "q"]
+    assert all(vector == vectors[0] for vector in vectors)
+    assert all(query == queries[0] for query in queries)
+    assert embeddings.deduplicated_calls == 6
@@ -0,0 +1,59 @@
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from typing_extensions import override
+
+from langchain_classic.evaluation.embedding_distance import (
+    EmbeddingDistance,
+    EmbeddingDistanceEvalChain,
+)
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    calls: list[list[str]] = []
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        return super().embed_documents(texts)
+
+
+@pytest.mark.requires("numpy")
+@pytest.mark.parametrize("distance_metric", list(EmbeddingDistance))
+def test_batch_evaluate_strings(distance_metric: EmbeddingDistance) -> None:
+    embeddings = CountingEmbeddings(size=8, calls=[])
+    eval_chain = EmbeddingDistanceEvalChain(
+        embeddings=embeddings, distance_metric=distance_metric
+    )
+    predictions = ["a", "b", "c", "a"]
+    references = ["b", "b", "a", "d"]
+
+    results = eval_chain.batch_evaluate_strings(
+        predictions=predictions, references=references, batch_size=3
+    )
+
+    # The unique texts are embedded in batches
+    assert embeddings.calls == [["a", "b", "c"], ["d"]]
+    expected = [
+        eval_chain.evaluate_strings(prediction=prediction, reference=reference)
+        for prediction, reference in zip(predictions, references, strict=True)
+    ]
+    assert [result["score"] for result in results] == pytest.approx(
+        [result["score"] for result in expected]
+    )
+    assert results[1]["score"] == pytest.approx(0)
+
+
+@pytest.mark.requires("numpy")
+async def test_abatch_evaluate_strings() -> None:
+    embeddings = CountingEmbeddings(size=8, calls=[])
+    eval_chain = EmbeddingDistanceEvalChain(embeddings=embeddings)
+
+    results = await eval_chain.abatch_evaluate_strings(
+        predictions=["a", "b"], references=["b", "b"]
+    )
+
+    assert embeddings.calls == [["a", "b"]]
+    assert results[0]["score"] > 0
+    assert results[1]["score"] == pytest.approx(0)
+    with pytest.raises(ValueError, match="Expected as many predictions"):
+        await eval_chain.abatch_evaluate_strings(predictions=["a"], references=[])
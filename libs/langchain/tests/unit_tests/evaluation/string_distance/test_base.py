@@ -120,3 +120,29 @@ async def test_non_zero_distance_pairwise_async(distance: StringDistance) -> Non
     )
     assert "score" in result
     assert 0 < result["score"] < 1.0
+
+
+@pytest.mark.requires("rapidfuzz")
+@pytest.mark.parametrize("distance", list(StringDistance))
+@pytest.mark.parametrize("normalize_score", [True, False])
+def test_batch_evaluate_strings(
+    *,
+    distance: StringDistance,
+    normalize_score: bool,
+) -> None:
+    eval_chain = StringDistanceEvalChain(
+        distance=distance, normalize_score=normalize_score
+    )
+    predictions = ["I like to eat apples.", "三人行则必有我师", "abcd", ""]
+    references = ["I like apples.", "三人行则必有我师", "abce", "x"]
+
+    results = eval_chain.batch_evaluate_strings(
+        predictions=predictions, references=references
+    )
+
+    assert results == [
+        eval_chain.evaluate_strings(prediction=prediction, reference=reference)
+        for prediction, reference in zip(predictions, references, strict=True)
+    ]
+    with pytest.raises(ValueError, match="Expected as many strings"):
+        eval_chain.batch_evaluate_strings(predictions=predictions, references=[])
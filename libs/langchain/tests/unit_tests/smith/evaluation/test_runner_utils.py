@@ -1,17 +1,22 @@
 """Test the LangSmith evaluation helpers."""
 
+import json
 import uuid
 from collections.abc import Iterator
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 from unittest import mock
 
 import pytest
 from freezegun import freeze_time
+from langchain_core.callbacks import CallbackManagerForLLMRun
 from langsmith.client import Client
 from langsmith.schemas import Dataset, Example
+from typing_extensions import override
 
 from langchain_classic.chains.transform import TransformChain
+from langchain_classic.smith import RunEvalConfig
 from langchain_classic.smith.evaluation.runner_utils import (
     InputFormatError,
     _get_messages,
@@ -21,6 +26,8 @@ from langchain_classic.smith.evaluation.runner_utils import (
     _validate_example_inputs_for_chain,
     _validate_example_inputs_for_language_model,
     arun_on_dataset,
+    arun_on_dataset_streaming,
+    run_on_dataset_streaming,
 )
 from tests.unit_tests.llms.fake_chat_model import FakeChatModel
 from tests.unit_tests.llms.fake_llm import FakeLLM
@@ -352,3 +359,222 @@ async def test_arun_on_dataset() -> None:
             for example in examples
         }
         assert results["results"] == expected
+
+
+class _Crash(BaseException):
+    pass
+
+
+class _CrashingLLM(FakeLLM):
+    crash_on: str
+
+    @override
+    def _call(
+        self,
+        prompt: str,
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        if prompt == self.crash_on:
+            raise _Crash
+        return super()._call(prompt, stop, run_manager, **kwargs)
+
+
+def _write_dataset(path: Path, size: int) -> None:
+    with path.open("w") as f:
+        for i in range(size):
+            example = {"inputs": {"input": f"q{i}"}, "outputs": {"output": f"a{i}"}}
+            f.write(json.dumps(example) + "\n")
+
+
+def _read_results(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+# Every third answer is wrong
+_QUERIES = {f"q{i}": f"a{i}" if i % 3 else "wrong" for i in range(10)}
+
+
+@pytest.mark.parametrize("concurrency_level", [0, 3])
+def test_run_on_dataset_streaming(tmp_path: Path, concurrency_level: int) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+    results_path = tmp_path / "results.jsonl"
+    _write_dataset(dataset_path, 10)
+
+    summary = run_on_dataset_streaming(
+        dataset_path,
+        FakeLLM(queries=_QUERIES),
+        results_path,
+        evaluation=RunEvalConfig(evaluators=["exact_match"]),
+        concurrency_level=concurrency_level,
+    )
+
+    assert summary == {
+        "results_path": str(results_path),
+        "num_completed": 10,
+        "num_skipped": 0,
+        "num_errors": 0,
+        "aggregate_feedback": {"exact_match": pytest.approx(0.6)},
+    }
+    results = _read_results(results_path)
+    assert len({result["example_id"] for result in results}) == 10
+    for result in results:
+        prompt = result["input"]["input"]
+        assert result["output"] == _QUERIES[prompt]
+        assert result["feedback"][0]["score"] == (_QUERIES[prompt] != "wrong")
+        assert result["run_id"] is not None
+
+
+def test_run_on_dataset_streaming_resumes(tmp_path: Path) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+    results_path = tmp_path / "results.jsonl"
+    _write_dataset(dataset_path, 10)
+
+    with pytest.raises(_Crash):
+        run_on_dataset_streaming(
+            dataset_path,
+            _CrashingLLM(queries=_QUERIES, crash_on="q6"),
+            results_path,
+            concurrency_level=0,
+        )
+    # Simulate a result that was only partially written
+    with results_path.open("a") as f:
+        f.write('{"example_id": ')
+    assert results_path.read_text().count("\n") == 6
+
+    summary = run_on_dataset_streaming(
+        dataset_path, FakeLLM(queries=_QUERIES), results_path, concurrency_level=2
+    )
+
+    assert summary["num_completed"] == 4
+    assert summary["num_skipped"] == 6
+    results = _read_results(results_path)
+    assert sorted(result["input"]["input"] for result in results) == sorted(_QUERIES)
+
+
+class _FailingLLM(FakeLLM):
+    fail_on: str
+
+    @override
+    def _call(
+        self,
+        prompt: str,
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        if prompt == self.fail_on:
+            msg = "Failed"
+            raise ValueError(msg)
+        return super()._call(prompt, stop, run_manager, **kwargs)
+
+
+def test_run_on_dataset_streaming_retries_failed_examples(tmp_path: Path) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+    results_path = tmp_path / "results.jsonl"
+    _write_dataset(dataset_path, 10)
+
+    summary = run_on_dataset_streaming(
+        dataset_path,
+        _FailingLLM(queries=_QUERIES, fail_on="q6"),
+        results_path,
+        concurrency_level=0,
+    )
+    assert (summary["num_completed"], summary["num_errors"]) == (10, 1)
+
+    summary = run_on_dataset_streaming(
+        dataset_path, FakeLLM(queries=_QUERIES), results_path, concurrency_level=2
+    )
+
+    assert summary["num_completed"] == 1
+    assert summary["num_skipped"] == 9
+    assert summary["num_errors"] == 0
+    results = _read_results(results_path)
+    assert not any("Error" in result for result in results)
+    assert sorted(result["input"]["input"] for result in results) == sorted(_QUERIES)
+
+
+async def test_run_on_dataset_streaming_rejects_bad_concurrency(
+    tmp_path: Path,
+) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+    _write_dataset(dataset_path, 1)
+
+    with pytest.raises(ValueError, match="concurrency_level"):
+        run_on_dataset_streaming(
+            dataset_path,
+            FakeLLM(queries=_QUERIES),
+            tmp_path / "results.jsonl",
+            concurrency_level=-1,
+        )
+    with pytest.raises(ValueError, match="concurrency_level"):
+        await arun_on_dataset_streaming(
+            dataset_path,
+            FakeLLM(queries=_QUERIES),
+            tmp_path / "results.jsonl",
+            concurrency_level=0,
+        )
+
+
+async def test_arun_on_dataset_streaming(tmp_path: Path) -> None:
+    results_path = tmp_path / "results.jsonl"
+    examples = [
+        Example(id=uuid.uuid4(), inputs={"input": f"q{i}"}, outputs={"output": f"a{i}"})
+        for i in range(10)
+    ]
+
+    summary = await arun_on_dataset_streaming(
+        examples,
+        FakeLLM(queries=_QUERIES),
+        results_path,
+        evaluation=RunEvalConfig(evaluators=["exact_match"]),
+        concurrency_level=3,
+    )
+
+    assert summary["num_completed"] == 10
+    assert summary["aggregate_feedback"] == {"exact_match": pytest.approx(0.6)}
+    results = _read_results(results_path)
+    assert {result["example_id"] for result in results} == {
+        str(example.id) for example in examples
+    }
+
+    # Everything was already done
+    summary = await arun_on_dataset_streaming(
+        examples, FakeLLM(queries=_QUERIES), results_path
+    )
+    assert (summary["num_completed"], summary["num_skipped"]) == (0, 10)
+
+
+def test_run_on_dataset_streaming_resumes_with_local_ids(tmp_path: Path) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+    results_path = tmp_path / "results.jsonl"
+    with dataset_path.open("w") as f:
+        for i in range(10):
+            example = {
+                "id": f"ex-{i}",
+                "inputs": {"input": f"q{i}"},
+                "outputs": {"output": f"a{i}"},
+            }
+            f.write(json.dumps(example) + "\n")
+
+    with pytest.raises(_Crash):
+        run_on_dataset_streaming(
+            dataset_path,
+            _CrashingLLM(queries=_QUERIES, crash_on="q6"),
+            results_path,
+            concurrency_level=0,
+        )
+    summary = run_on_dataset_streaming(
+        dataset_path, FakeLLM(queries=_QUERIES), results_path, concurrency_level=2
+    )
+
+    assert summary["num_completed"] == 4
+    assert summary["num_skipped"] == 6
+    results = _read_results(results_path)
+    assert sorted(result["local_id"] for result in results) == sorted(
+        f"ex-{i}" for i in range(10)
+    )
+    for result in results:
+        assert result["local_id"] == "ex-" + result["input"]["input"][1:]
+        assert uuid.UUID(result["example_id"])
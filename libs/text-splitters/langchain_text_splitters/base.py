@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import copy
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,11 +20,20 @@ from typing import (
 )
 
 from langchain_core.documents import BaseDocumentTransformer, Document
+from langchain_core.runnables.config import run_in_executor
 from typing_extensions import Self, override
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable, Sequence
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Collection,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
     from collections.abc import Set as AbstractSet
+    from concurrent.futures import Future
 
 
 try:
@@ -39,6 +53,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 TS = TypeVar("TS", bound="TextSplitter")
+T = TypeVar("T")
 
 
 class TextSplitter(BaseDocumentTransformer, ABC):
@@ -93,28 +108,171 @@ class TextSplitter(BaseDocumentTransformer, ABC):
     ) -> list[Document]:
         """Create a list of `Document` objects from a list of texts."""
         metadatas_ = metadatas or [{}] * len(texts)
-        documents = []
-        for i, text in enumerate(texts):
-            index = 0
-            previous_chunk_len = 0
-            for chunk in self.split_text(text):
-                metadata = copy.deepcopy(metadatas_[i])
-                if self._add_start_index:
-                    offset = index + previous_chunk_len - self._chunk_overlap
-                    index = text.find(chunk, max(0, offset))
-                    metadata["start_index"] = index
-                    previous_chunk_len = len(chunk)
-                new_doc = Document(page_content=chunk, metadata=metadata)
-                documents.append(new_doc)
+        if len(metadatas_) < len(texts):
+            msg = (
+                f"Got fewer metadatas ({len(metadatas_)}) than texts ({len(texts)}), "
+                "should have one metadata per text."
+            )
+            raise ValueError(msg)
+        documents: list[Document] = []
+        for text, metadata in zip(texts, metadatas_, strict=False):
+            documents.extend(self._split_to_documents(text, metadata))
         return documents
 
-    def split_documents(self, documents: Iterable[Document]) -> list[Document]:
-        """Split documents."""
-        texts, metadatas = [], []
-        for doc in documents:
-            texts.append(doc.page_content)
-            metadatas.append(doc.metadata)
-        return self.create_documents(texts, metadatas=metadatas)
+    def _split_to_documents(
+        self, text: str, metadata: dict[Any, Any]
+    ) -> Iterator[Document]:
+        """Split one text and yield its chunks as `Document` objects.
+
+        Each chunk gets its own copy of `metadata`. When every metadata value is
+        immutable, a shallow copy is equivalent to a deep copy and is used instead.
+        """
+        copy_metadata = (
+            dict if all(map(_is_immutable, metadata.values())) else copy.deepcopy
+        )
+        index = 0
+        previous_chunk_len = 0
+        for chunk in self.split_text(text):
+            chunk_metadata = copy_metadata(metadata)
+            if self._add_start_index:
+                offset = index + previous_chunk_len - self._chunk_overlap
+                index = text.find(chunk, max(0, offset))
+                chunk_metadata["start_index"] = index
+                previous_chunk_len = len(chunk)
+            yield Document(page_content=chunk, metadata=chunk_metadata)
+
+    def split_documents(
+        self,
+        documents: Iterable[Document],
+        *,
+        n_jobs: int | None = None,
+        chunksize: int = 16,
+    ) -> list[Document]:
+        """Split documents.
+
+        Args:
+            documents: Documents to split.
+            n_jobs: Number of worker processes to split with. `None` or `1` splits
+                in the current process, `-1` uses all CPUs.
+                See `split_documents_iter`.
+            chunksize: Number of documents sent to a worker at a time when
+                `n_jobs` is set.
+
+        Returns:
+            The chunks of all documents, in order.
+        """
+        return list(
+            self.split_documents_iter(documents, n_jobs=n_jobs, chunksize=chunksize)
+        )
+
+    def split_documents_iter(
+        self,
+        documents: Iterable[Document],
+        *,
+        n_jobs: int | None = None,
+        chunksize: int = 16,
+    ) -> Iterator[Document]:
+        """Lazily split documents, yielding chunks as they are produced.
+
+        Only the documents currently being split and their chunks are held in
+        memory, so a `BaseLoader.lazy_load()` iterator can be split and indexed at
+        constant memory:
+
+        ```python
+        index(
+            splitter.split_documents_iter(loader.lazy_load()),
+            record_manager,
+            vector_store,
+        )
+        ```
+
+        With `n_jobs`, documents are sent in groups of `chunksize` to a pool of
+        worker processes. The splitter is pickled once per worker, so tokenizers
+        are only initialized once per process. A bounded number of groups is in
+        flight at a time and the output order (including `start_index`) is the
+        same as when splitting in the current process. The splitter and its
+        length function must be picklable.
+
+        Args:
+            documents: Documents to split.
+            n_jobs: Number of worker processes to split with. `None` or `1` splits
+                in the current process, `-1` uses all CPUs.
+            chunksize: Number of documents sent to a worker at a time when
+                `n_jobs` is set.
+
+        Yields:
+            The chunks of each document, in order.
+
+        Raises:
+            ValueError: If `n_jobs` is `0` or lower than `-1`, or if `chunksize` is
+                lower than `1`.
+        """
+        if n_jobs is not None and (n_jobs == 0 or n_jobs < -1):
+            msg = f"n_jobs must be a positive integer or -1, got {n_jobs}"
+            raise ValueError(msg)
+        if chunksize < 1:
+            msg = f"chunksize must be >= 1, got {chunksize}"
+            raise ValueError(msg)
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs is None or n_jobs == 1:
+            for doc in documents:
+                yield from self._split_to_documents(doc.page_content, doc.metadata)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_split_worker,
+            initargs=(self,),
+        ) as executor:
+            futures: deque[Future[list[tuple[str, dict[Any, Any]]]]] = deque()
+            groups = _group(
+                ((doc.page_content, doc.metadata) for doc in documents), chunksize
+            )
+            try:
+                for group in groups:
+                    futures.append(executor.submit(_split_in_worker, group))
+                    # Keep every worker busy without reading the whole input.
+                    if len(futures) > 2 * n_jobs:
+                        for text, metadata in futures.popleft().result():
+                            yield Document(page_content=text, metadata=metadata)
+                while futures:
+                    for text, metadata in futures.popleft().result():
+                        yield Document(page_content=text, metadata=metadata)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    async def alazy_transform_documents(
+        self, documents: Iterable[Document] | AsyncIterable[Document]
+    ) -> AsyncIterator[Document]:
+        """Lazily split documents from a sync or async iterable.
+
+        Each document is split in the default executor so the event loop is not
+        blocked. The result can be passed directly to `aindex`:
+
+        ```python
+        await aindex(
+            splitter.alazy_transform_documents(loader.alazy_load()),
+            record_manager,
+            vector_store,
+        )
+        ```
+
+        Args:
+            documents: Documents to split.
+
+        Yields:
+            The chunks of each document, in order.
+        """
+        if not isinstance(documents, AsyncIterable):
+            documents = _to_async_iterable(documents)
+        async for doc in documents:
+            chunks = await run_in_executor(
+                None, list, self._split_to_documents(doc.page_content, doc.metadata)
+            )
+            for chunk in chunks:
+                yield chunk
 
     def _join_docs(self, docs: list[str], separator: str) -> str | None:
         text = separator.join(docs)
@@ -122,16 +280,47 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             text = text.strip()
         return text or None
 
-    def _merge_splits(self, splits: Iterable[str], separator: str) -> list[str]:
+    def _lengths(self, texts: Sequence[str]) -> list[int]:
+        """Compute the length of each text.
+
+        Uses the length function's `batch` method when it has one, so tokenizer
+        based lengths are encoded in a single batch call.
+        """
+        batch = getattr(self._length_function, "batch", None)
+        if batch is not None:
+            return list(batch(texts))
+        return [self._length_function(text) for text in texts]
+
+    def _merge_splits(
+        self,
+        splits: Iterable[str],
+        separator: str,
+        lengths: Sequence[int] | None = None,
+    ) -> list[str]:
+        """Combine splits into chunks of at most `chunk_size` with overlap.
+
+        Args:
+            splits: Pieces of text to merge.
+            separator: Separator inserted between merged pieces.
+            lengths: Precomputed length of each split. Computed with `_lengths`
+                when not provided.
+
+        Returns:
+            The merged chunks.
+        """
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
+        splits = list(splits)
+        if lengths is None:
+            lengths = self._lengths(splits)
         separator_len = self._length_function(separator)
 
         docs = []
-        current_doc: list[str] = []
+        # Window of (split, length) pairs in the current chunk. Each length is
+        # computed once, and popping from the left does not copy the window.
+        current_doc: deque[tuple[str, int]] = deque()
         total = 0
-        for d in splits:
-            len_ = self._length_function(d)
+        for d, len_ in zip(splits, lengths, strict=True):
             if (
                 total + len_ + (separator_len if len(current_doc) > 0 else 0)
                 > self._chunk_size
@@ -144,7 +333,9 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         self._chunk_size,
                     )
                 if len(current_doc) > 0:
-                    doc = self._join_docs(current_doc, separator)
+                    doc = self._join_docs(
+                        [split for split, _ in current_doc], separator
+                    )
                     if doc is not None:
                         docs.append(doc)
                     # Keep on popping if:
@@ -155,13 +346,12 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         > self._chunk_size
                         and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (
-                            separator_len if len(current_doc) > 1 else 0
+                        total -= current_doc.popleft()[1] + (
+                            separator_len if len(current_doc) > 0 else 0
                         )
-                        current_doc = current_doc[1:]
-            current_doc.append(d)
+            current_doc.append((d, len_))
             total += len_ + (separator_len if len(current_doc) > 1 else 0)
-        doc = self._join_docs(current_doc, separator)
+        doc = self._join_docs([split for split, _ in current_doc], separator)
         if doc is not None:
             docs.append(doc)
         return docs
@@ -182,10 +372,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             msg = "Tokenizer received was not an instance of PreTrainedTokenizerBase"  # type: ignore[unreachable]
             raise ValueError(msg)  # noqa: TRY004
 
-        def _huggingface_tokenizer_length(text: str) -> int:
-            return len(tokenizer.tokenize(text))
-
-        return cls(length_function=_huggingface_tokenizer_length, **kwargs)
+        return cls(length_function=_HuggingFaceTokenizerLength(tokenizer), **kwargs)
 
     @classmethod
     def from_tiktoken_encoder(
@@ -210,15 +397,6 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         else:
             enc = tiktoken.get_encoding(encoding_name)
 
-        def _tiktoken_encoder(text: str) -> int:
-            return len(
-                enc.encode(
-                    text,
-                    allowed_special=allowed_special,
-                    disallowed_special=disallowed_special,
-                )
-            )
-
         if issubclass(cls, TokenTextSplitter):
             extra_kwargs = {
                 "encoding_name": encoding_name,
@@ -228,7 +406,8 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             }
             kwargs = {**kwargs, **extra_kwargs}
 
-        return cls(length_function=_tiktoken_encoder, **kwargs)
+        length_function = _TiktokenLength(enc, allowed_special, disallowed_special)
+        return cls(length_function=length_function, **kwargs)
 
     @override
     def transform_documents(
@@ -238,6 +417,108 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         return self.split_documents(list(documents))
 
 
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _is_immutable(value: object) -> bool:
+    """Whether `value` is a scalar (or tuple of scalars) that cannot be mutated."""
+    if isinstance(value, tuple):
+        return all(map(_is_immutable, value))
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+async def _to_async_iterable(iterable: Iterable[Document]) -> AsyncIterator[Document]:
+    for item in iterable:
+        yield item
+
+
+class _HuggingFaceTokenizerLength:
+    """Length function counting Hugging Face tokens.
+
+    A class rather than a closure so splitters using it can be pickled and sent to
+    worker processes.
+    """
+
+    def __init__(self, tokenizer: PreTrainedTokenizerBase) -> None:
+        self.tokenizer = tokenizer
+
+    def __call__(self, text: str) -> int:
+        return len(self.tokenizer.tokenize(text))
+
+    def batch(self, texts: Sequence[str]) -> list[int]:
+        if not texts or not getattr(self.tokenizer, "is_fast", False):
+            return [self(text) for text in texts]
+        # Same encoding path as `tokenize` for fast tokenizers, in one call.
+        encoding = self.tokenizer(list(texts), add_special_tokens=False)
+        return [len(encoding.tokens(i)) for i in range(len(texts))]
+
+
+class _TiktokenLength:
+    """Length function counting `tiktoken` tokens.
+
+    A class rather than a closure so splitters using it can be pickled and sent to
+    worker processes.
+    """
+
+    def __init__(
+        self,
+        encoding: tiktoken.Encoding,
+        allowed_special: Literal["all"] | AbstractSet[str],
+        disallowed_special: Literal["all"] | Collection[str],
+    ) -> None:
+        self.encoding = encoding
+        self.allowed_special = allowed_special
+        self.disallowed_special = disallowed_special
+
+    def __call__(self, text: str) -> int:
+        return len(
+            self.encoding.encode(
+                text,
+                allowed_special=self.allowed_special,
+                disallowed_special=self.disallowed_special,
+            )
+        )
+
+    def batch(self, texts: Sequence[str]) -> list[int]:
+        return [
+            len(tokens)
+            for tokens in self.encoding.encode_batch(
+                list(texts),
+                allowed_special=self.allowed_special,
+                disallowed_special=self.disallowed_special,
+            )
+        ]
+
+
+# Splitter of the current worker process, set once by `_init_split_worker`.
+_worker_splitter: TextSplitter | None = None
+
+
+def _init_split_worker(splitter: TextSplitter) -> None:
+    global _worker_splitter  # noqa: PLW0603
+    _worker_splitter = splitter
+
+
+def _split_in_worker(
+    group: list[tuple[str, dict[Any, Any]]],
+) -> list[tuple[str, dict[Any, Any]]]:
+    """Split a group of `(text, metadata)` pairs in a worker process."""
+    if _worker_splitter is None:
+        msg = "Split worker was not initialized."
+        raise RuntimeError(msg)
+    return [
+        (doc.page_content, doc.metadata)
+        for text, metadata in group
+        for doc in _worker_splitter._split_to_documents(text, metadata)  # noqa: SLF001
+    ]
+
+
+def _group(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    it = iter(iterable)
+    while group := list(islice(it, size)):
+        yield group
+
+
 class TokenTextSplitter(TextSplitter):
     """Splitting text to tokens using model tokenizer."""
 
@@ -119,23 +119,29 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         )
 
         # Now go merging things, recursively splitting longer texts.
-        good_splits = []
+        # Lengths are computed once and reused when merging.
+        good_splits: list[str] = []
+        good_lengths: list[int] = []
         separator_ = "" if self._keep_separator else separator
-        for s in splits:
-            if self._length_function(s) < self._chunk_size:
+        for s, length in zip(splits, self._lengths(splits), strict=True):
+            if length < self._chunk_size:
                 good_splits.append(s)
+                good_lengths.append(length)
             else:
                 if good_splits:
-                    merged_text = self._merge_splits(good_splits, separator_)
+                    merged_text = self._merge_splits(
+                        good_splits, separator_, good_lengths
+                    )
                     final_chunks.extend(merged_text)
                     good_splits = []
+                    good_lengths = []
                 if not new_separators:
                     final_chunks.append(s)
                 else:
                     other_info = self._split_text(s, new_separators)
                     final_chunks.extend(other_info)
         if good_splits:
-            merged_text = self._merge_splits(good_splits, separator_)
+            merged_text = self._merge_splits(good_splits, separator_, good_lengths)
             final_chunks.extend(merged_text)
         return final_chunks
 
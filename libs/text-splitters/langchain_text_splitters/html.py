@@ -5,6 +5,8 @@ from __future__ import annotations
 import copy
 import pathlib
 import re
+from collections import deque
+from html.parser import HTMLParser
 from io import StringIO
 from typing import (
     IO,
@@ -80,6 +82,217 @@ def _find_all_tags(
     return tag.find_all(name, recursive=recursive)
 
 
+def _read_chunks(file: str | IO[str], chunk_size: int) -> Iterator[str]:
+    if isinstance(file, str):
+        with pathlib.Path(file).open(encoding="utf-8") as f:
+            yield from _read_chunks(f, chunk_size)
+        return
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+# Elements that never have children; mirrors bs4's empty-element tags for HTML.
+_VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "basefont",
+        "bgsound",
+        "br",
+        "col",
+        "command",
+        "embed",
+        "frame",
+        "hr",
+        "image",
+        "img",
+        "input",
+        "isindex",
+        "keygen",
+        "link",
+        "menuitem",
+        "meta",
+        "nextid",
+        "param",
+        "source",
+        "spacer",
+        "track",
+        "wbr",
+    }
+)
+
+
+class _TextSlot:
+    """A run of direct text of one element, in DOM (pre-)order."""
+
+    __slots__ = ("depth", "done", "parts", "tag")
+
+    def __init__(self, tag: str, depth: int) -> None:
+        self.tag = tag
+        self.depth = depth
+        self.parts: list[str] = []
+        self.done = False
+
+
+class _OpenElement:
+    """An element whose end tag has not been seen yet."""
+
+    __slots__ = ("depth", "exact", "slot", "tag")
+
+    def __init__(self, tag: str, depth: int, slot: _TextSlot, *, exact: bool) -> None:
+        self.tag = tag
+        self.depth = depth
+        # Header subtrees are buffered until they close, so their text is exactly
+        # what the DOM traversal sees; other elements are emitted as they stream.
+        self.exact = exact
+        self.slot: _TextSlot | None = slot
+
+
+class _HTMLElementStream(HTMLParser):
+    """Incremental tokenizer yielding `(tag, text, dom_depth)` elements.
+
+    Builds the same element nesting as `BeautifulSoup(..., "html.parser")` (only
+    `<body>` is considered when present, void elements never nest, unmatched end
+    tags are ignored) without keeping the tree: an element's text is released as
+    soon as a descendant produces text, so memory stays bounded by the currently
+    open elements. Text an element has *after* a nested child with text is emitted
+    at its position in the document rather than together with the text before the
+    child; header elements are always buffered whole.
+    """
+
+    def __init__(self, header_tags: Iterable[str]) -> None:
+        super().__init__(convert_charrefs=True)
+        self._header_tags = frozenset(header_tags)
+        self._queue: deque[_TextSlot] = deque()
+        root = _TextSlot("[document]", 0)
+        self._queue.append(root)
+        self._open = [_OpenElement("[document]", 0, root, exact=False)]
+        self._data: list[str] = []
+        # "head" until <body> is seen, then "body", then "after" once it closes
+        self._state = "head"
+
+    def feed_iter(self, data: str) -> Iterator[tuple[str, str, int]]:
+        """Feed `data` and yield the elements it completed."""
+        self.feed(data)
+        return self._drain()
+
+    def close_iter(self) -> Iterator[tuple[str, str, int]]:
+        """Flush the parser and yield the remaining elements."""
+        self.close()
+        if self._state != "after":
+            self._flush_data()
+            while self._open:
+                self._pop()
+        return self._drain(final=True)
+
+    def _drain(self, *, final: bool = False) -> Iterator[tuple[str, str, int]]:
+        # Without a <body> the whole document is used, so nothing can be released
+        # until either the body starts or the input ends.
+        if self._state == "head" and not final:
+            return
+        queue = self._queue
+        while queue and (queue[0].done or final):
+            slot = queue.popleft()
+            if slot.parts:
+                yield slot.tag, " ".join(slot.parts), slot.depth
+
+    def _add_text(self, text: str) -> None:
+        text = text.strip()
+        if not text or self._state == "after":
+            return
+        element = self._open[-1]
+        if element.slot is None:
+            element.slot = _TextSlot(element.tag, element.depth)
+            self._queue.append(element.slot)
+        element.slot.parts.append(text)
+        # Release the text of enclosing elements so this text can be emitted.
+        for ancestor in reversed(self._open[:-1]):
+            if ancestor.exact:
+                continue
+            if ancestor.slot is None:
+                break
+            ancestor.slot.done = True
+            ancestor.slot = None
+
+    def _flush_data(self) -> None:
+        if self._data:
+            self._add_text("".join(self._data))
+            self._data.clear()
+
+    def _pop(self) -> None:
+        element = self._open.pop()
+        if element.slot is not None:
+            element.slot.done = True
+        if (
+            element.tag == "body"
+            and self._state == "body"
+            and not any(e.tag == "body" for e in self._open)
+        ):
+            self._state = "after"
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # noqa: ARG002
+        self._flush_data()
+        if self._state == "after":
+            return
+        if tag == "body" and self._state == "head":
+            # Only the body is split; drop what was buffered before it.
+            self._state = "body"
+            self._queue.clear()
+        if tag in _VOID_ELEMENTS:
+            return
+        parent = self._open[-1]
+        slot = _TextSlot(tag, parent.depth + 1)
+        self._queue.append(slot)
+        self._open.append(
+            _OpenElement(
+                tag,
+                parent.depth + 1,
+                slot,
+                exact=parent.exact or tag in self._header_tags,
+            )
+        )
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_data()
+        if self._state == "after":
+            return
+        # Close everything up to the most recent matching open element, if any.
+        for i in range(len(self._open) - 1, 0, -1):
+            if self._open[i].tag == tag:
+                while len(self._open) > i:
+                    self._pop()
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def _handle_string(self, text: str) -> None:
+        # Comments, declarations, etc. are separate strings in the DOM.
+        self._flush_data()
+        self._add_text(text)
+
+    def handle_comment(self, data: str) -> None:
+        self._handle_string(data)
+
+    def handle_decl(self, decl: str) -> None:
+        if decl[:8].upper() == "DOCTYPE ":
+            decl = decl[8:]
+        self._handle_string(decl)
+
+    def handle_pi(self, data: str) -> None:
+        self._handle_string(data)
+
+    def unknown_decl(self, data: str) -> None:
+        if data[:6].upper() == "CDATA[":
+            data = data[6:]
+        self._handle_string(data)
+
+
 class HTMLHeaderTextSplitter:
     """Split HTML content into structured Documents based on specified headers.
 
@@ -220,6 +433,52 @@ class HTMLHeaderTextSplitter:
             html_content = file.read()
         return list(self._generate_documents(html_content))
 
+    def split_text_iter(self, text: str | Iterable[str]) -> Iterator[Document]:
+        """Lazily split HTML in a single streaming pass.
+
+        Unlike `split_text`, no DOM tree is built: the HTML is tokenized
+        incrementally and each `Document` is yielded as soon as its section is
+        complete, so only the current section is held in memory and BeautifulSoup
+        is not required. The output matches `split_text` except for mixed content:
+        text an element has *after* a nested child with text is emitted in
+        document order instead of being joined with the text before the child
+        (which, as with any text, ends the scope of headers nested deeper).
+
+        As with `split_text`, only the `<body>` is split when there is one, so
+        for HTML without a `<body>` tag nothing is yielded before the input ends.
+
+        Args:
+            text: The HTML text, or an iterable of consecutive pieces of it (e.g.
+                blocks read from a file or a network response).
+
+        Yields:
+            Split Document objects, in document order.
+        """
+        chunks = [text] if isinstance(text, str) else text
+        return self._documents_from_elements(self._stream_elements(chunks))
+
+    def split_text_from_file_iter(
+        self, file: str | IO[str], chunk_size: int = 1 << 16
+    ) -> Iterator[Document]:
+        """Lazily split an HTML file in a single streaming pass.
+
+        See `split_text_iter`.
+
+        Args:
+            file: A file path or a file-like object containing HTML content.
+            chunk_size: Number of characters read from the file at a time.
+
+        Yields:
+            Split Document objects, in document order.
+        """
+        return self.split_text_iter(_read_chunks(file, chunk_size))
+
+    def _stream_elements(self, chunks: Iterable[str]) -> Iterator[tuple[str, str, int]]:
+        parser = _HTMLElementStream(self.header_tags)
+        for chunk in chunks:
+            yield from parser.feed_iter(chunk)
+        yield from parser.close_iter()
+
     def _generate_documents(self, html_content: str) -> Iterator[Document]:
         """Private method that performs a DFS traversal over the DOM and yields.
 
@@ -242,6 +501,45 @@ class HTMLHeaderTextSplitter:
         soup = BeautifulSoup(html_content, "html.parser")
         body = soup.body or soup
 
+        def iter_elements() -> Iterator[tuple[str, str, int]]:
+            # We'll use a stack for DFS traversal
+            stack = [body]
+            while stack:
+                node = stack.pop()
+                children = list(node.children)
+
+                stack.extend(
+                    child for child in reversed(children) if isinstance(child, Tag)
+                )
+
+                tag = getattr(node, "name", None)
+                if not tag:
+                    continue
+
+                text_elements = [
+                    str(child).strip()
+                    for child in _find_all_strings(node, recursive=False)
+                ]
+                node_text = " ".join(elem for elem in text_elements if elem)
+                if not node_text:
+                    continue
+
+                yield tag, node_text, len(list(node.parents))
+
+        return self._documents_from_elements(iter_elements())
+
+    def _documents_from_elements(
+        self, elements: Iterable[tuple[str, str, int]]
+    ) -> Iterator[Document]:
+        """Turn `(tag, text, dom_depth)` elements into header-scoped Documents.
+
+        Args:
+            elements: The non-empty elements of the document in DOM order, each
+                with its tag name, direct text and depth in the DOM tree.
+
+        Yields:
+            Document objects as they are created.
+        """
         # Dictionary of active headers:
         #   key = user-defined header name (e.g. "Header 1")
         #   value = tuple of header_text, level, dom_depth
@@ -261,29 +559,7 @@ class HTMLHeaderTextSplitter:
             final_meta = {k: v[0] for k, v in active_headers.items()}
             return Document(page_content=final_text, metadata=final_meta)
 
-        # We'll use a stack for DFS traversal
-        stack = [body]
-        while stack:
-            node = stack.pop()
-            children = list(node.children)
-
-            stack.extend(
-                child for child in reversed(children) if isinstance(child, Tag)
-            )
-
-            tag = getattr(node, "name", None)
-            if not tag:
-                continue
-
-            text_elements = [
-                str(child).strip() for child in _find_all_strings(node, recursive=False)
-            ]
-            node_text = " ".join(elem for elem in text_elements if elem)
-            if not node_text:
-                continue
-
-            dom_depth = len(list(node.parents))
-
+        for tag, node_text, dom_depth in elements:
             # If this node is one of our headers
             if tag in self.header_tags:
                 # If we're aggregating, finalize whatever chunk we had
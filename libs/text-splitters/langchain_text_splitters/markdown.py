@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import re
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from langchain_core.documents import Document
 
 from langchain_text_splitters.base import Language
 from langchain_text_splitters.character import RecursiveCharacterTextSplitter
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 class MarkdownTextSplitter(RecursiveCharacterTextSplitter):
     """Attempts to split the text along Markdown-formatted headings."""
@@ -89,23 +92,28 @@ class MarkdownHeaderTextSplitter:
         Args:
             lines: Line of text / associated header metadata
         """
-        aggregated_chunks: list[LineType] = []
+        return list(self._aggregate_lines(lines))
+
+    def _aggregate_lines(self, lines: Iterable[LineType]) -> Iterator[Document]:
+        """Lazily combine lines with common metadata into chunks.
+
+        Only the chunk currently being built is held; it is yielded as soon as a
+        line with different metadata starts the next one.
+        """
+        last: LineType | None = None
 
         for line in lines:
-            if (
-                aggregated_chunks
-                and aggregated_chunks[-1]["metadata"] == line["metadata"]
-            ):
+            if last is not None and last["metadata"] == line["metadata"]:
                 # If the last line in the aggregated list
                 # has the same metadata as the current line,
                 # append the current content to the last lines's content
-                aggregated_chunks[-1]["content"] += "  \n" + line["content"]
+                last["content"] += "  \n" + line["content"]
             elif (
-                aggregated_chunks
-                and aggregated_chunks[-1]["metadata"] != line["metadata"]
+                last is not None
+                and last["metadata"] != line["metadata"]
                 # may be issues if other metadata is present
-                and len(aggregated_chunks[-1]["metadata"]) < len(line["metadata"])
-                and aggregated_chunks[-1]["content"].split("\n")[-1][0] == "#"
+                and len(last["metadata"]) < len(line["metadata"])
+                and last["content"].split("\n")[-1][0] == "#"
                 and not self.strip_headers
             ):
                 # If the last line in the aggregated list
@@ -114,17 +122,19 @@ class MarkdownHeaderTextSplitter:
                 # and the last line is a header,
                 # and we are not stripping headers,
                 # append the current content to the last line's content
-                aggregated_chunks[-1]["content"] += "  \n" + line["content"]
+                last["content"] += "  \n" + line["content"]
                 # and update the last line's metadata
-                aggregated_chunks[-1]["metadata"] = line["metadata"]
+                last["metadata"] = line["metadata"]
             else:
-                # Otherwise, append the current line to the aggregated list
-                aggregated_chunks.append(line)
+                # Otherwise, the last chunk is complete
+                if last is not None:
+                    yield Document(
+                        page_content=last["content"], metadata=last["metadata"]
+                    )
+                last = line
 
-        return [
-            Document(page_content=chunk["content"], metadata=chunk["metadata"])
-            for chunk in aggregated_chunks
-        ]
+        if last is not None:
+            yield Document(page_content=last["content"], metadata=last["metadata"])
 
     def split_text(self, text: str) -> list[Document]:
         """Split markdown file.
@@ -132,10 +142,44 @@ class MarkdownHeaderTextSplitter:
         Args:
             text: Markdown file
         """
+        return list(self.split_text_iter(text))
+
+    def split_text_iter(self, text: str | Iterable[str]) -> Iterator[Document]:
+        """Lazily split markdown text, reading it line by line.
+
+        Produces the same `Document` objects as `split_text`, but yields each chunk
+        as soon as the next section starts, so only the current section is held in
+        memory. Pass an open file (or any iterable of lines) to split large markdown
+        files without reading them whole.
+
+        Args:
+            text: Markdown text, or an iterable of its lines (trailing newlines are
+                allowed).
+
+        Yields:
+            Chunks of the markdown text with their header metadata.
+        """
         # Split the input text by newline character ("\n").
-        lines = text.split("\n")
-        # Final output
-        lines_with_metadata: list[LineType] = []
+        lines = text.split("\n") if isinstance(text, str) else text
+        lines_with_metadata = self._iter_lines_with_metadata(lines)
+
+        # lines_with_metadata has each line with associated header metadata
+        # aggregate these into chunks based on common metadata
+        if not self.return_each_line:
+            yield from self._aggregate_lines(lines_with_metadata)
+            return
+        for chunk in lines_with_metadata:
+            yield Document(page_content=chunk["content"], metadata=chunk["metadata"])
+
+    def _iter_lines_with_metadata(self, lines: Iterable[str]) -> Iterator[LineType]:
+        """Run the header state machine over `lines`, yielding content blocks.
+
+        Args:
+            lines: Lines of the markdown file.
+
+        Yields:
+            Blocks of consecutive content lines with their header metadata.
+        """
         # Content and metadata of the chunk currently being processed
         current_content: list[str] = []
         current_metadata: dict[str, str] = {}
@@ -219,15 +263,13 @@ class MarkdownHeaderTextSplitter:
                         # Update initial_metadata with the current header
                         initial_metadata[name] = header["data"]
 
-                    # Add the previous line to the lines_with_metadata
+                    # Yield the previous block of lines
                     # only if current_content is not empty
                     if current_content:
-                        lines_with_metadata.append(
-                            {
-                                "content": "\n".join(current_content),
-                                "metadata": current_metadata.copy(),
-                            }
-                        )
+                        yield {
+                            "content": "\n".join(current_content),
+                            "metadata": current_metadata.copy(),
+                        }
                         current_content.clear()
 
                     if not self.strip_headers:
@@ -238,32 +280,19 @@ class MarkdownHeaderTextSplitter:
                 if stripped_line:
                     current_content.append(stripped_line)
                 elif current_content:
-                    lines_with_metadata.append(
-                        {
-                            "content": "\n".join(current_content),
-                            "metadata": current_metadata.copy(),
-                        }
-                    )
+                    yield {
+                        "content": "\n".join(current_content),
+                        "metadata": current_metadata.copy(),
+                    }
                     current_content.clear()
 
             current_metadata = initial_metadata.copy()
 
         if current_content:
-            lines_with_metadata.append(
-                {
-                    "content": "\n".join(current_content),
-                    "metadata": current_metadata,
-                }
-            )
-
-        # lines_with_metadata has each line with associated header metadata
-        # aggregate these into chunks based on common metadata
-        if not self.return_each_line:
-            return self.aggregate_lines_to_chunks(lines_with_metadata)
-        return [
-            Document(page_content=chunk["content"], metadata=chunk["metadata"])
-            for chunk in lines_with_metadata
-        ]
+            yield {
+                "content": "\n".join(current_content),
+                "metadata": current_metadata,
+            }
 
 
 class LineType(TypedDict):
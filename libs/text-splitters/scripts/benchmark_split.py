@@ -0,0 +1,62 @@
+"""Compare single-process and multi-process `split_documents` throughput.
+
+Usage:
+    python scripts/benchmark_split.py [--docs 2000] [--n-jobs 8]
+"""
+
+import argparse
+import os
+import random
+import string
+import time
+
+from langchain_core.documents import Document
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+
+def _make_docs(n_docs: int) -> list[Document]:
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 9)))
+        for _ in range(5_000)
+    ]
+    return [
+        Document(
+            page_content="\n\n".join(
+                " ".join(rng.choices(words, k=80)) + "." for _ in range(60)
+            ),
+            metadata={"source": f"doc-{i}"},
+        )
+        for i in range(n_docs)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2_000)
+    parser.add_argument("--n-jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    docs = _make_docs(args.docs)
+    size_mb = sum(len(doc.page_content) for doc in docs) / 1e6
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=1_000, chunk_overlap=200, add_start_index=True
+    )
+
+    results = {}
+    for n_jobs in (None, args.n_jobs):
+        start = time.perf_counter()
+        results[n_jobs] = splitter.split_documents(docs, n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+        print(  # noqa: T201
+            f"n_jobs={n_jobs}: {elapsed:.2f}s, {size_mb / elapsed:.1f} MB/s, "
+            f"{len(results[n_jobs])} chunks"
+        )
+    if results[None] != results[args.n_jobs]:
+        msg = "Parallel output differs from single-process output"
+        raise AssertionError(msg)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import random
 import re
 import string
@@ -33,7 +34,7 @@ from langchain_text_splitters.markdown import (
 from langchain_text_splitters.python import PythonCodeTextSplitter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Iterator
 
     from bs4 import Tag
 
@@ -276,6 +277,13 @@ def test_create_documents_with_metadata() -> None:
     assert docs == expected_docs
 
 
+def test_create_documents_with_too_few_metadatas() -> None:
+    """Test create documents raises when a text has no metadata."""
+    splitter = CharacterTextSplitter(separator=" ", chunk_size=3, chunk_overlap=0)
+    with pytest.raises(ValueError, match="fewer metadatas"):
+        splitter.create_documents(["foo bar", "baz"], [{"source": "1"}])
+
+
 @pytest.mark.parametrize(
     ("splitter", "text", "expected_docs"),
     [
@@ -431,6 +439,127 @@ def test_split_documents() -> None:
     assert splitter.split_documents(docs) == expected_output
 
 
+def test_split_documents_iter_is_lazy() -> None:
+    """Test that split_documents_iter only pulls documents as chunks are consumed."""
+    splitter = CharacterTextSplitter(separator=" ", chunk_size=3, chunk_overlap=0)
+    pulled = []
+
+    def load() -> Iterator[Document]:
+        for i in range(3):
+            pulled.append(i)
+            yield Document(page_content="foo bar", metadata={"source": str(i)})
+
+    chunks = splitter.split_documents_iter(load())
+    assert next(chunks) == Document(page_content="foo", metadata={"source": "0"})
+    assert pulled == [0]
+    assert list(chunks) == [
+        Document(page_content="bar", metadata={"source": "0"}),
+        Document(page_content="foo", metadata={"source": "1"}),
+        Document(page_content="bar", metadata={"source": "1"}),
+        Document(page_content="foo", metadata={"source": "2"}),
+        Document(page_content="bar", metadata={"source": "2"}),
+    ]
+
+
+def test_split_documents_iter_copies_nested_metadata() -> None:
+    """Test that chunks never share mutable metadata values."""
+    splitter = CharacterTextSplitter(separator=" ", chunk_size=3, chunk_overlap=0)
+    doc = Document(page_content="foo bar", metadata={"tags": ["a"], "source": "1"})
+    first, second = splitter.split_documents_iter([doc])
+    first.metadata["tags"].append("b")
+    first.metadata["source"] = "2"
+    assert second.metadata == {"tags": ["a"], "source": "1"}
+    assert doc.metadata == {"tags": ["a"], "source": "1"}
+
+
+@pytest.mark.parametrize(
+    "splitter",
+    [
+        RecursiveCharacterTextSplitter(
+            chunk_size=20, chunk_overlap=5, add_start_index=True
+        ),
+        CharacterTextSplitter(
+            separator=" ", chunk_size=10, chunk_overlap=4, add_start_index=True
+        ),
+    ],
+)
+def test_split_documents_n_jobs(splitter: TextSplitter) -> None:
+    """Test that splitting in worker processes preserves order and start_index."""
+    rng = random.Random(0)
+    docs = [
+        Document(
+            page_content=" ".join(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+                for _ in range(rng.randint(0, 40))
+            ),
+            metadata={"source": str(i), "tags": [i]},
+        )
+        for i in range(25)
+    ]
+    expected = splitter.split_documents(docs)
+    assert splitter.split_documents(docs, n_jobs=2, chunksize=3) == expected
+    assert list(splitter.split_documents_iter(docs, n_jobs=2)) == expected
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2])
+def test_split_documents_invalid_n_jobs(n_jobs: int) -> None:
+    splitter = CharacterTextSplitter(separator=" ", chunk_size=3, chunk_overlap=0)
+    with pytest.raises(ValueError, match="n_jobs"):
+        splitter.split_documents([Document(page_content="foo bar")], n_jobs=n_jobs)
+
+
+async def test_alazy_transform_documents() -> None:
+    """Test lazily splitting an async stream of documents."""
+    splitter = CharacterTextSplitter(
+        separator=" ", chunk_size=3, chunk_overlap=0, add_start_index=True
+    )
+    docs = [
+        Document(page_content="foo bar", metadata={"source": "1"}),
+        Document(page_content="baz", metadata={"source": "2"}),
+    ]
+
+    async def aload() -> AsyncIterator[Document]:
+        for doc in docs:
+            yield doc
+
+    expected = splitter.split_documents(docs)
+    assert [doc async for doc in splitter.alazy_transform_documents(aload())] == (
+        expected
+    )
+    assert [doc async for doc in splitter.alazy_transform_documents(docs)] == expected
+
+
+def test_recursive_splitter_computes_each_length_once() -> None:
+    """Test that split lengths are computed once, through the batch method."""
+
+    class CountingLength:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+            self.batches: list[list[str]] = []
+
+        def __call__(self, text: str) -> int:
+            self.calls.append(text)
+            return len(text.split())
+
+        def batch(self, texts: list[str]) -> list[int]:
+            self.batches.append(list(texts))
+            return [len(text.split()) for text in texts]
+
+    text = "\n\n".join(" ".join(f"w{i}{j}" for j in range(7)) for i in range(6))
+    length_function = CountingLength()
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=5, chunk_overlap=2, length_function=length_function
+    )
+    expected = RecursiveCharacterTextSplitter(
+        chunk_size=5, chunk_overlap=2, length_function=lambda t: len(t.split())
+    ).split_text(text)
+
+    assert splitter.split_text(text) == expected
+    # Pieces are only measured in batches; only separators are measured alone.
+    assert length_function.batches
+    assert set(length_function.calls) <= {"", " "}
+
+
 def test_python_text_splitter() -> None:
     splitter = PythonCodeTextSplitter(chunk_size=30, chunk_overlap=0)
     splits = splitter.split_text(FAKE_PYTHON_TEXT)
@@ -1630,6 +1759,55 @@ Content under custom header 2.
     assert output == expected_output
 
 
+@pytest.mark.parametrize("return_each_line", [False, True])
+@pytest.mark.parametrize("strip_headers", [True, False])
+def test_md_header_text_splitter_iter(
+    *, return_each_line: bool, strip_headers: bool
+) -> None:
+    """Test that splitting lines lazily matches `split_text`."""
+    markdown_document = (
+        "# Foo\n\n"
+        "    ## Bar\n\n"
+        "Hi this is Jim\n\n"
+        "Hi this is Joe\n\n"
+        "```\n"
+        "# Not a header\n"
+        "```\n\n"
+        " ### Boo \n\n"
+        " Hi this is Lance \n\n"
+        " ## Baz\n\n"
+        " Hi this is Molly"
+    )
+    splitter = MarkdownHeaderTextSplitter(
+        headers_to_split_on=[("#", "Header 1"), ("##", "Header 2"), ("###", "H3")],
+        return_each_line=return_each_line,
+        strip_headers=strip_headers,
+    )
+    expected = splitter.split_text(markdown_document)
+
+    assert list(splitter.split_text_iter(markdown_document)) == expected
+    # Lines read from a file keep their trailing newline.
+    lines = io.StringIO(markdown_document)
+    assert list(splitter.split_text_iter(lines)) == expected
+
+
+def test_md_header_text_splitter_iter_is_lazy() -> None:
+    """Test that each section is yielded before the following lines are read."""
+    consumed: list[str] = []
+
+    def lines() -> Iterator[str]:
+        for line in ["# Foo", "foo", "# Bar", "bar", "# Baz", "baz"]:
+            consumed.append(line)
+            yield line
+
+    splitter = MarkdownHeaderTextSplitter(headers_to_split_on=[("#", "Header 1")])
+    docs = splitter.split_text_iter(lines())
+
+    assert next(docs) == Document(page_content="foo", metadata={"Header 1": "Foo"})
+    assert consumed == ["# Foo", "foo", "# Bar", "bar", "# Baz"]
+    assert [doc.page_content for doc in docs] == ["bar", "baz"]
+
+
 EXPERIMENTAL_MARKDOWN_DOCUMENT = (
     "# My Header 1\n"
     "Content for header 1\n"
@@ -2872,6 +3050,119 @@ def test_html_no_headers_with_multiple_splitters(
         )
 
 
+def test_html_header_text_splitter_iter() -> None:
+    """Test streaming HTML splitting, which does not need BeautifulSoup."""
+    html_content = """
+    <!DOCTYPE html>
+    <html>
+        <head><title>Ignored</title></head>
+        <body>
+            <h1>Introduction</h1>
+            <p>Welcome &amp; hello.</p>
+            <div>
+                <h2>Background</h2>
+                <p>Some details.<br>More: <b>background</b></p>
+            </div>
+            <p>Back at the top level.<!-- note --></p>
+            <h1>Conclusion</h1>
+            <p>Final thoughts.</p>
+        </body>
+    </html>
+    """
+    splitter = HTMLHeaderTextSplitter(
+        headers_to_split_on=[("h1", "Header 1"), ("h2", "Header 2")]
+    )
+    # Feed the HTML in small pieces that cut through tags and entities.
+    pieces = [html_content[i : i + 7] for i in range(0, len(html_content), 7)]
+    docs = list(splitter.split_text_iter(pieces))
+
+    assert docs == [
+        Document(page_content="Introduction", metadata={"Header 1": "Introduction"}),
+        Document(
+            page_content="Welcome & hello.", metadata={"Header 1": "Introduction"}
+        ),
+        Document(
+            page_content="Background",
+            metadata={"Header 1": "Introduction", "Header 2": "Background"},
+        ),
+        Document(
+            page_content=(
+                "Some details. More:  \nbackground  \nBack at the top level. note"
+            ),
+            metadata={"Header 1": "Introduction"},
+        ),
+        Document(page_content="Conclusion", metadata={"Header 1": "Conclusion"}),
+        Document(page_content="Final thoughts.", metadata={"Header 1": "Conclusion"}),
+    ]
+    assert list(splitter.split_text_from_file_iter(io.StringIO(html_content))) == docs
+
+
+def test_html_header_text_splitter_iter_is_lazy() -> None:
+    """Test that sections are yielded before the rest of the HTML is read."""
+    consumed: list[str] = []
+
+    def pieces() -> Iterator[str]:
+        for piece in [
+            "<body><h1>One</h1><p>first</p>",
+            "<h1>Two</h1><p>second</p>",
+            "<h1>Three</h1><p>third</p></body>",
+        ]:
+            consumed.append(piece)
+            yield piece
+
+    splitter = HTMLHeaderTextSplitter(
+        headers_to_split_on=[("h1", "Header 1")], return_each_element=True
+    )
+    docs = splitter.split_text_iter(pieces())
+
+    assert next(docs) == Document(page_content="One", metadata={"Header 1": "One"})
+    assert next(docs) == Document(page_content="first", metadata={"Header 1": "One"})
+    assert len(consumed) == 1
+    assert [doc.page_content for doc in docs] == [
+        "Two",
+        "second",
+        "Three",
+        "third",
+    ]
+
+
+@pytest.mark.requires("bs4")
+@pytest.mark.parametrize("return_each_element", [False, True])
+def test_html_header_text_splitter_iter_matches_split_text(
+    *, return_each_element: bool
+) -> None:
+    """Test that streaming splitting matches the DOM-based splitter."""
+    html_content = """
+    <html>
+        <body>
+            <div>
+                <h1>Main Title</h1>
+                <p>Intro <b>bold</b></p>
+                <section>
+                    <h2>Section <em>A</em></h2>
+                    <ul><li>one</li><li>two<br>lines</li></ul>
+                    <h3>Deep</h3>
+                    <p>Deep content</p>
+                </section>
+                <h2>Section B</h2>
+                <p>B content</p>
+            </div>
+            <p>Outside the div</p>
+            <h1>Another</h1>
+            <script>var x = 1;</script>
+        </body>
+    </html>
+    """
+    splitter = HTMLHeaderTextSplitter(
+        headers_to_split_on=[("h1", "H1"), ("h2", "H2"), ("h3", "H3")],
+        return_each_element=return_each_element,
+    )
+
+    assert list(splitter.split_text_iter(html_content)) == splitter.split_text(
+        html_content
+    )
+
+
 def test_split_text_on_tokens() -> None:
     """Test splitting by tokens per chunk."""
     text = "foo bar baz 123"